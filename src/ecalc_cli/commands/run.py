@@ -3,29 +3,12 @@ from pathlib import Path
 
 import typer
 
-import libecalc.common.time_utils
-import libecalc.version
-from ecalc_cli.emission_intensity import EmissionIntensityCalculator
 from ecalc_cli.errors import EcalcCLIError
-from ecalc_cli.infrastructure.file_resource_service import FileResourceService
-from ecalc_cli.io.output import (
-    emission_intensity_to_csv,
-    write_flow_diagram,
-    write_json,
-    write_ltp_export,
-    write_output,
-    write_stp_export,
-)
 from ecalc_cli.logger import logger
-from ecalc_cli.types import DateFormat, Frequency
-from ecalc_neqsim_wrapper import CacheConfig, NeqSimFluidService, NeqsimService
-from libecalc.common.datetime.utils import DateTimeFormats
-from libecalc.common.math.numbers import Numbers
-from libecalc.common.run_info import RunInfo
-from libecalc.infrastructure.file_utils import OutputFormat, get_result_output, to_json
-from libecalc.presentation.json_result.mapper import get_asset_result
-from libecalc.presentation.yaml.file_configuration_service import FileConfigurationService
-from libecalc.presentation.yaml.model import YamlModel
+from ecalc_cli.types import DateFormat, Frequency, ParallelEvaluation
+
+# NOTE: libecalc and the NeqSim wrapper are imported when the command is run, not when the CLI starts. They depend
+# on pandas, scipy and the JVM bridge, which makes the other commands (and --help, --version, shell completion) slow.
 
 
 def run(
@@ -35,7 +18,7 @@ def run(
         " facility inputs and the relationship between energy consumers.",
     ),
     output_frequency: Frequency = typer.Option(
-        libecalc.common.time_utils.Frequency.NONE.name,
+        Frequency.NONE.name,
         "--output-frequency",
         "-f",
         "--outputfrequency",
@@ -54,6 +37,18 @@ def run(
         "--json",
         help="Toggle output of json output.",
     ),
+    columnar: bool = typer.Option(
+        False,
+        "--columnar",
+        help="Toggle output of results as typed columns in a folder, with one numpy npy file per component time series "
+        "and a metadata.json file naming the columns. Faster to load than csv and json, and can be memory-mapped, use "
+        "libecalc.infrastructure.columnar_result.ColumnarResult or numpy.load.",
+    ),
+    compact_json: bool = typer.Option(
+        False,
+        "--compact-json",
+        help="Write json output without indentation and newlines, giving smaller files.",
+    ),
     output_folder: Path = typer.Option(
         None,
         "--output-folder",
@@ -109,14 +104,82 @@ def run(
         help="Max entries in flash results cache (note: default covers most use cases). "
         "Increase for large models with many flash calculations. Set to 0 to disable.",
     ),
+    shared_flash_cache: Path | None = typer.Option(
+        None,
+        "--shared-flash-cache",
+        help="Database file for flash results shared between the worker processes of --parallel-evaluation "
+        "PROCESSES, letting each worker use the flash results of the others. Created if it does not exist, and "
+        "can be reused between runs of the same eCalc version.",
+        dir_okay=False,
+        resolve_path=True,
+    ),
     use_experimental_neqsim: bool = typer.Option(
         False,
         "--use-experimental-neqsim",
         help="An improved implementation of Neqsim is available, but still experimental. After a short testing period "
         "this will be made default and not possible to change.",
     ),
+    parallel_evaluation: ParallelEvaluation = typer.Option(
+        ParallelEvaluation.SERIAL.value,
+        "--parallel-evaluation",
+        help="Evaluate the operational settings of consumer systems concurrently. THREADS is suited for sampled "
+        "and tabular models, PROCESSES also for compressor trains using NeqSim, but starts NeqSim in each worker.",
+    ),
+    max_workers: int | None = typer.Option(
+        None,
+        "--max-workers",
+        min=1,
+        help="Max number of workers used with --parallel-evaluation. Defaults to the number of CPUs, max 8.",
+    ),
+    compressor_train_surrogates: Path | None = typer.Option(
+        None,
+        "--compressor-train-surrogates",
+        help="Folder with surrogates fitted by fit-surrogates, used in place of the compressor trains they are fitted "
+        "for, for fast screening runs. A surrogate is not used if the train or fluid of the model has changed since it "
+        "was fitted. Points not covered by a surrogate are evaluated by the train.",
+        file_okay=False,
+        resolve_path=True,
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Profile the run, writing the wall time, number of time steps, root finder iterations, NeqSim flash "
+        "calls and cache hits and misses of each component and model to a json file next to the results. Work done "
+        "in worker processes with --parallel-evaluation PROCESSES is not counted.",
+    ),
 ):
     """CLI command to run a ecalc model."""
+    import libecalc.common.time_utils
+    import libecalc.version
+    from ecalc_cli.commands.surrogates import load_surrogates
+    from ecalc_cli.emission_intensity import EmissionIntensityCalculator
+    from ecalc_cli.infrastructure.file_resource_service import FileResourceService
+    from ecalc_cli.io.output import (
+        emission_intensity_to_csv,
+        write_columnar,
+        write_csv,
+        write_flow_diagram,
+        write_json,
+        write_ltp_export,
+        write_output,
+        write_profile_report,
+        write_stp_export,
+    )
+    from ecalc_neqsim_wrapper import CacheConfig, NeqSimFluidService, NeqsimService, NeqsimWorkerInitializer
+    from libecalc.common.datetime.utils import DateTimeFormats
+    from libecalc.common.math.numbers import Numbers
+    from libecalc.common.parallel_evaluation import (
+        ParallelEvaluationConfig,
+        ParallelEvaluationMode,
+        ParallelEvaluator,
+    )
+    from libecalc.common.profiling import Profiler
+    from libecalc.common.run_info import RunInfo
+    from libecalc.infrastructure.file_utils import dump_json
+    from libecalc.presentation.json_result.mapper import get_asset_result
+    from libecalc.presentation.yaml.file_configuration_service import FileConfigurationService
+    from libecalc.presentation.yaml.model import YamlModel
+
     if output_folder is None:
         output_folder = model_file.parent / "output"
 
@@ -129,14 +192,33 @@ def run(
     logger.info(f"eCalc™ simulation starting. Running {run_info}")
     validate_arguments(model_file=model_file, output_folder=output_folder)
 
-    # Configure cache sizes if specified
-    if reference_cache_size is not None or flash_cache_size is not None:
+    # Configure caches if specified
+    cache_config = None
+    if reference_cache_size is not None or flash_cache_size is not None or shared_flash_cache is not None:
         defaults = CacheConfig.default()
-        config = CacheConfig(
+        cache_config = CacheConfig(
             reference_fluid_max_size=reference_cache_size or defaults.reference_fluid_max_size,
             flash_max_size=flash_cache_size or defaults.flash_max_size,
+            shared_flash_cache_path=shared_flash_cache,
         )
-        NeqSimFluidService.configure(config)
+        NeqSimFluidService.configure(cache_config)
+
+    if parallel_evaluation != ParallelEvaluation.SERIAL:
+        defaults = ParallelEvaluationConfig.default()
+        ParallelEvaluator.configure(
+            ParallelEvaluationConfig(
+                mode=ParallelEvaluationMode[parallel_evaluation.name],
+                max_workers=max_workers or defaults.max_workers,
+                worker_initializer=NeqsimWorkerInitializer(
+                    use_jpype=use_experimental_neqsim, cache_config=cache_config
+                ),
+            )
+        )
+
+    surrogates = load_surrogates(compressor_train_surrogates) if compressor_train_surrogates is not None else None
+
+    if profile:
+        Profiler.enable()
 
     with NeqsimService.factory(use_jpype=use_experimental_neqsim).initialize():
         configuration_service = FileConfigurationService(configuration_path=model_file)
@@ -145,6 +227,7 @@ def run(
         model = YamlModel(
             configuration=configuration,
             resource_service=resource_service,
+            compressor_train_surrogates=surrogates,
         ).validate_for_run()
 
         if (flow_diagram or ltp_export) and (model.start is None or model.end is None):
@@ -160,10 +243,19 @@ def run(
                 name_prefix=name_prefix,
             )
 
-        model.evaluate_energy_usage()
+        with Profiler.measure(name="evaluate_energy_usage", type="RUN"):
+            model.evaluate_energy_usage()
 
         run_info.end = datetime.now()
 
+        if profile:
+            write_profile_report(
+                report=Profiler.get_report(),
+                output_file=output_folder / f"{name_prefix}_profile.json",
+                run_info=run_info,
+            )
+            Profiler.reset()
+
         output_prefix: Path = output_folder / name_prefix
 
         results_dto = get_asset_result(model)
@@ -199,13 +291,11 @@ def run(
         )
 
         if csv:
-            csv_data = get_result_output(
+            write_csv(
                 results=results_resampled,
-                output_format=OutputFormat.CSV,
-                simple_output=not detailed_output,
+                output_file=output_prefix.with_suffix(".csv"),
                 date_format_option=int(date_format_option.value),
             )
-            write_output(output=csv_data, output_file=output_prefix.with_suffix(".csv"))
 
             # Emission intensity CSV
             intensity_csv_data = emission_intensity_to_csv(
@@ -216,6 +306,12 @@ def run(
                 output=intensity_csv_data, output_file=output_prefix.with_name(f"{output_prefix.stem}_intensity.csv")
             )
 
+        if columnar:
+            write_columnar(
+                results=results_resampled,
+                output_folder=output_prefix.with_name(f"{output_prefix.stem}_columns"),
+            )
+
         if json:
             write_json(
                 results=results_resampled,
@@ -224,15 +320,17 @@ def run(
                 run_info=run_info,
                 date_format_option=int(date_format_option.value),
                 simple_output=not detailed_output,
+                compact=compact_json,
             )
             # Emission intensity JSON
             intensity_json_path = output_prefix.with_name(f"{output_prefix.stem}_intensity.json")
-            json_intensity_data = to_json(
-                emission_intensity_results_resampled,
-                date_format_option=int(date_format_option.value),
-            )
             with open(intensity_json_path, "w") as f:
-                f.write(json_intensity_data)
+                dump_json(
+                    emission_intensity_results_resampled,
+                    fp=f,
+                    date_format_option=int(date_format_option.value),
+                    compact=compact_json,
+                )
 
         if ltp_export:
             write_ltp_export(
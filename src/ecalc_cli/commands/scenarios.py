@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import typer
+
+from ecalc_cli.errors import EcalcCLIError
+from ecalc_cli.logger import logger
+from ecalc_cli.types import DateFormat, Frequency, ParallelEvaluation
+
+if TYPE_CHECKING:
+    import libecalc.common.time_utils
+    from libecalc.presentation.yaml.model import YamlModel
+    from libecalc.presentation.yaml.scenario_runner import Scenario
+
+# NOTE: libecalc and the NeqSim wrapper are imported when the command is run, not when the CLI starts. See run.py.
+
+
+def run_scenarios(
+    model_file: Path = typer.Argument(
+        ...,
+        help="The Model YAML-file specifying time series inputs,"
+        " facility inputs and the relationship between energy consumers.",
+    ),
+    scenarios_folder: Path = typer.Argument(
+        ...,
+        help="Folder with one sub folder per scenario, the scenario is named after the sub folder. Time series files"
+        " in a scenario folder replace the time series files of the model with the same path, relative to the model"
+        " file. Other input is the same for all scenarios.",
+    ),
+    output_frequency: Frequency = typer.Option(
+        Frequency.NONE.name,
+        "--output-frequency",
+        "-f",
+        help="Frequency of output. Options are DAY, MONTH, YEAR. If not specified, it will give"
+        " time steps equal to the union of all input given with INFLUENCE_TIME_VECTOR set to True.",
+    ),
+    csv: bool = typer.Option(
+        True,
+        "--csv/--no-csv",
+        "-c",
+        help="Toggle output of csv data.",
+    ),
+    json: bool = typer.Option(
+        False,
+        "--json",
+        help="Toggle output of json output.",
+    ),
+    output_folder: Path = typer.Option(
+        None,
+        "--output-folder",
+        "-o",
+        help="Outputfolder, the results of each scenario are written to a sub folder named after the scenario."
+        " Defaults to output/ relative to the yml setup file",
+        show_default=False,
+    ),
+    name_prefix: str = typer.Option(
+        None,
+        "--name-prefix",
+        "-n",
+        help="Name prefix for output data. Defaults to name of setup file.",
+    ),
+    detailed_output: bool = typer.Option(
+        False,
+        "--detailed-output",
+        help="Output detailed output. When False you will get basic results such as energy usage, power, time vector.",
+    ),
+    date_format_option: DateFormat = typer.Option(
+        DateFormat.ISO_8601.value,
+        "--date-format-option",
+        help='Date format option. 0: "YYYY-MM-DD HH:MM:SS" (Accepted variant of ISO8601), 1: "YYYYMMDD HH:MM:SS" (ISO8601), 2: "DD.MM.YYYY HH:MM:SS". Default 0 (ISO 8601)',
+    ),
+    use_experimental_neqsim: bool = typer.Option(
+        False,
+        "--use-experimental-neqsim",
+        help="An improved implementation of Neqsim is available, but still experimental.",
+    ),
+    parallel_evaluation: ParallelEvaluation = typer.Option(
+        ParallelEvaluation.SERIAL.value,
+        "--parallel-evaluation",
+        help="Run the scenarios concurrently. PROCESSES runs the scenarios in worker processes, each parsing the model"
+        " and starting NeqSim once. THREADS is not supported, the scenarios would share NeqSim and its caches.",
+    ),
+    max_workers: int | None = typer.Option(
+        None,
+        "--max-workers",
+        min=1,
+        help="Max number of workers used with --parallel-evaluation. Defaults to the number of CPUs, max 8.",
+    ),
+    shared_flash_cache: Path | None = typer.Option(
+        None,
+        "--shared-flash-cache",
+        help="Database file for flash results shared between the scenarios, and the worker processes of "
+        "--parallel-evaluation PROCESSES. Created if it does not exist, and can be reused between runs of the same "
+        "eCalc version.",
+        dir_okay=False,
+        resolve_path=True,
+    ),
+):
+    """CLI command to run a ecalc model for many scenarios, i.e. variations of the time series input of the model."""
+    from functools import partial
+
+    import libecalc.common.time_utils
+    from ecalc_cli.infrastructure.file_resource_service import FileResourceService
+    from ecalc_neqsim_wrapper import CacheConfig, NeqSimFluidService, NeqsimService, NeqsimWorkerInitializer
+    from libecalc.common.parallel_evaluation import ParallelEvaluationConfig, ParallelEvaluationMode
+    from libecalc.presentation.yaml.file_configuration_service import FileConfigurationService
+    from libecalc.presentation.yaml.scenario_runner import ScenarioRunner
+
+    if output_folder is None:
+        output_folder = model_file.parent / "output"
+
+    if name_prefix is None:
+        name_prefix = model_file.stem
+
+    if not model_file.is_file():
+        raise EcalcCLIError(f"Setup file: {model_file.absolute()}: no such file")
+
+    if not scenarios_folder.is_dir():
+        raise EcalcCLIError(f"Scenarios folder: {scenarios_folder.absolute()}: no such folder")
+
+    if not output_folder.parent.is_dir():
+        raise EcalcCLIError(
+            f"Output path {output_folder} not valid. Please specify an existing path or the name of a new folder in an existing path"
+        )
+    if parallel_evaluation == ParallelEvaluation.THREADS:
+        raise EcalcCLIError(
+            "--parallel-evaluation THREADS is not supported for run-scenarios, since the scenarios would share NeqSim"
+            " and its caches. Use PROCESSES instead."
+        )
+
+    output_folder.mkdir(exist_ok=True)
+
+    cache_config = None
+    if shared_flash_cache is not None:
+        cache_config = CacheConfig(shared_flash_cache_path=shared_flash_cache)
+        NeqSimFluidService.configure(cache_config)
+
+    defaults = ParallelEvaluationConfig.default()
+    parallel_evaluation_config = ParallelEvaluationConfig(
+        mode=ParallelEvaluationMode[parallel_evaluation.name],
+        max_workers=max_workers or defaults.max_workers,
+        worker_initializer=NeqsimWorkerInitializer(use_jpype=use_experimental_neqsim, cache_config=cache_config),
+    )
+
+    with NeqsimService.factory(use_jpype=use_experimental_neqsim).initialize():
+        runner = ScenarioRunner(
+            configuration_service=FileConfigurationService(configuration_path=model_file),
+            resource_service_factory=lambda configuration: FileResourceService(
+                working_directory=model_file.parent, configuration=configuration
+            ),
+            parallel_evaluation_config=parallel_evaluation_config,
+        )
+        scenarios = get_scenarios(
+            scenarios_folder=scenarios_folder,
+            time_series_resource_names=runner.configuration.timeseries_resource_names,
+        )
+        logger.info(f"Running {len(scenarios)} scenarios of '{model_file.name}'")
+
+        runner.run(
+            scenarios,
+            evaluate=partial(
+                write_scenario_results,
+                output_folder=output_folder,
+                name_prefix=name_prefix,
+                frequency=libecalc.common.time_utils.Frequency[output_frequency.name],
+                csv=csv,
+                json=json,
+                detailed_output=detailed_output,
+                date_format_option=int(date_format_option.value),
+            ),
+        )
+
+    logger.info(f"eCalc™ scenarios successful. Results written to {output_folder}")
+
+
+def get_scenarios(scenarios_folder: Path, time_series_resource_names: list[str]) -> list[Scenario]:
+    """Get one scenario per sub folder of the scenarios folder, replacing the time series resources found in the
+    sub folder.
+
+    Raises:
+        EcalcCLIError: If there are no scenarios, or a time series file can not be read
+    """
+    from libecalc.common.errors.exceptions import InvalidResourceException
+    from libecalc.presentation.yaml.scenario_runner import Scenario
+    from libecalc.presentation.yaml.yaml_entities import MemoryResource
+
+    scenarios = []
+    for scenario_folder in sorted(path for path in scenarios_folder.iterdir() if path.is_dir()):
+        time_series_resources = {}
+        for resource_name in time_series_resource_names:
+            resource_path = scenario_folder / resource_name
+            if not resource_path.is_file():
+                continue
+            try:
+                time_series_resources[resource_name] = MemoryResource.from_path(resource_path, allow_nans=True)
+            except InvalidResourceException as e:
+                raise EcalcCLIError(f"Invalid time series file {resource_path}: {e}") from e
+
+        if len(time_series_resources) == 0:
+            logger.warning(f"No time series files of the model found in {scenario_folder}, using the model input")
+        scenarios.append(Scenario(name=scenario_folder.name, time_series_resources=time_series_resources))
+
+    if len(scenarios) == 0:
+        raise EcalcCLIError(f"No scenarios found in {scenarios_folder.absolute()}, expected one folder per scenario")
+    return scenarios
+
+
+def write_scenario_results(
+    model: YamlModel,
+    scenario: Scenario,
+    output_folder: Path,
+    name_prefix: str,
+    frequency: libecalc.common.time_utils.Frequency,
+    csv: bool,
+    json: bool,
+    detailed_output: bool,
+    date_format_option: int,
+) -> None:
+    """Evaluate the model of a scenario, and write the results to a sub folder of the output folder named after the
+    scenario. Module level function, since it is run in the worker processes with --parallel-evaluation PROCESSES.
+    """
+    from datetime import datetime
+
+    import libecalc.version
+    from ecalc_cli.io.output import write_csv, write_json
+    from libecalc.common.math.numbers import Numbers
+    from libecalc.common.run_info import RunInfo
+    from libecalc.presentation.json_result.mapper import get_asset_result
+
+    run_info = RunInfo(version=libecalc.version.current_version(), start=datetime.now())
+    model.evaluate_energy_usage()
+    run_info.end = datetime.now()
+
+    results = get_asset_result(model)
+    if frequency != frequency.NONE:
+        results = results.resample(frequency)
+    results = Numbers.format_results_to_precision(result=results, precision=6)
+
+    scenario_output_folder = output_folder / scenario.name
+    scenario_output_folder.mkdir(exist_ok=True)
+    if csv:
+        write_csv(
+            results=results,
+            output_file=scenario_output_folder / f"{name_prefix}.csv",
+            date_format_option=date_format_option,
+        )
+    if json:
+        write_json(
+            results=results,
+            output_folder=scenario_output_folder,
+            name_prefix=name_prefix,
+            run_info=run_info,
+            date_format_option=date_format_option,
+            simple_output=not detailed_output,
+        )
+    logger.info(f"Scenario '{scenario.name}' done. Duration: {run_info.end - run_info.start}")
@@ -1,6 +1,5 @@
 import libecalc.version
 from ecalc_cli.logger import logger
-from ecalc_neqsim_wrapper import NeqsimService
 
 
 def selftest_java() -> bool:
@@ -10,6 +9,8 @@ def selftest_java() -> bool:
         bool: True if Java is installed correctly, False otherwise.
 
     """
+    from ecalc_neqsim_wrapper import NeqsimService
+
     try:
         with NeqsimService.factory(use_jpype=False).initialize():
             logger.debug("SUCCESS: Java seems to be correctly installed!")
@@ -3,10 +3,7 @@ from pathlib import Path
 
 import typer
 
-from ecalc_cli.io.output import write_output
-from libecalc.presentation.yaml.yaml_entities import ResourceStream
-from libecalc.presentation.yaml.yaml_models.pyyaml_yaml_model import PyYamlYamlModel
-from libecalc.presentation.yaml.yaml_types.components.yaml_asset import YamlAsset
+# NOTE: libecalc is imported when a command is run, not when the CLI starts, see ecalc_cli.commands.run
 
 app = typer.Typer()
 
@@ -24,6 +21,10 @@ def show_yaml(
     ),
 ):
     """Show yaml model. This will show the yaml after processing !include."""
+    from ecalc_cli.io.output import write_output
+    from libecalc.presentation.yaml.yaml_entities import ResourceStream
+    from libecalc.presentation.yaml.yaml_models.pyyaml_yaml_model import PyYamlYamlModel
+
     with open(model_file) as f:
         read_model = PyYamlYamlModel.dump_and_load_yaml(
             ResourceStream(
@@ -43,4 +44,7 @@ def show_schema(
         help="Write the schema to a file with the specified name. If not specified, it will print to stdout.",
     ),
 ):
+    from ecalc_cli.io.output import write_output
+    from libecalc.presentation.yaml.yaml_types.components.yaml_asset import YamlAsset
+
     write_output(json.dumps(YamlAsset.model_json_schema(by_alias=True), indent=2), output_file)
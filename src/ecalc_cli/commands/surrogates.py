@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import typer
+
+from ecalc_cli.errors import EcalcCLIError
+from ecalc_cli.logger import logger
+
+if TYPE_CHECKING:
+    from libecalc.domain.process.compressor.core.train.surrogate import CompressorTrainSurrogate
+
+# NOTE: libecalc and the NeqSim wrapper are imported when the command is run, not when the CLI starts. See run.py.
+
+SURROGATE_FILE_SUFFIX = ".npz"
+
+
+def fit_surrogates(
+    model_file: Path = typer.Argument(
+        ...,
+        help="The Model YAML-file specifying time series inputs,"
+        " facility inputs and the relationship between energy consumers.",
+    ),
+    output_folder: Path = typer.Option(
+        None,
+        "--output-folder",
+        "-o",
+        help="Folder to save the surrogates in, one file per compressor train model named after the model. Defaults to"
+        " surrogates/ relative to the yml setup file. Use the folder with --compressor-train-surrogates when running"
+        " the model.",
+        show_default=False,
+    ),
+    number_of_points: int = typer.Option(
+        10,
+        "--number-of-points",
+        min=2,
+        help="Number of grid points along each of the rate, suction pressure and discharge pressure axes. The train is"
+        " evaluated at all grid points, and at the center of each grid cell to measure the error of the surrogate.",
+    ),
+    relative_error_tolerance: float | None = typer.Option(
+        None,
+        "--relative-error-tolerance",
+        min=0,
+        help="Max relative error at the center of a grid cell for the cell to be used. Points in other cells are"
+        " evaluated by the train. Defaults to using all cells where the train is valid.",
+    ),
+    use_experimental_neqsim: bool = typer.Option(
+        False,
+        "--use-experimental-neqsim",
+        help="An improved implementation of Neqsim is available, but still experimental.",
+    ),
+):
+    """CLI command to fit surrogates for the compressor trains of a ecalc model, for fast screening runs.
+
+    The surrogates span the rates and pressures of the trains in the model, and are only used for the same trains and
+    fluids.
+    """
+    from ecalc_cli.infrastructure.file_resource_service import FileResourceService
+    from ecalc_neqsim_wrapper import NeqsimService
+    from libecalc.presentation.yaml.file_configuration_service import FileConfigurationService
+    from libecalc.presentation.yaml.model import YamlModel
+
+    if output_folder is None:
+        output_folder = model_file.parent / "surrogates"
+
+    if not model_file.is_file():
+        raise EcalcCLIError(f"Setup file: {model_file.absolute()}: no such file")
+
+    if not output_folder.parent.is_dir():
+        raise EcalcCLIError(
+            f"Output path {output_folder} not valid. Please specify an existing path or the name of a new folder in an existing path"
+        )
+
+    with NeqsimService.factory(use_jpype=use_experimental_neqsim).initialize():
+        configuration = FileConfigurationService(configuration_path=model_file).get_configuration()
+        model = YamlModel(
+            configuration=configuration,
+            resource_service=FileResourceService(working_directory=model_file.parent, configuration=configuration),
+        ).validate_for_run()
+        surrogates = model.fit_compressor_train_surrogates(
+            number_of_points=number_of_points, relative_error_tolerance=relative_error_tolerance
+        )
+
+    if not surrogates:
+        raise EcalcCLIError(f"No compressor trains in '{model_file.name}' are supported by surrogates")
+
+    output_folder.mkdir(exist_ok=True)
+    for name, surrogate in surrogates.items():
+        surrogate.save(output_folder / f"{name}{SURROGATE_FILE_SUFFIX}")
+        logger.info(
+            f"Fitted surrogate for compressor train '{name}', using {surrogate.usable_cells.mean():.0%} of the grid "
+            f"cells, with max relative error {surrogate.max_relative_error:.2%}"
+        )
+
+    logger.info(f"Surrogates written to {output_folder}")
+
+
+def load_surrogates(surrogates_folder: Path) -> dict[str, CompressorTrainSurrogate]:
+    """Load the surrogates saved by fit-surrogates, by compressor train model name.
+
+    Raises:
+        EcalcCLIError: If the folder does not exist, or a surrogate can not be loaded
+    """
+    from libecalc.domain.process.compressor.core.train.surrogate import CompressorTrainSurrogate
+
+    if not surrogates_folder.is_dir():
+        raise EcalcCLIError(f"Surrogates folder: {surrogates_folder.absolute()}: no such folder")
+
+    surrogates = {}
+    for path in sorted(surrogates_folder.glob(f"*{SURROGATE_FILE_SUFFIX}")):
+        try:
+            surrogates[path.stem] = CompressorTrainSurrogate.load(path)
+        except ValueError as e:
+            raise EcalcCLIError(f"Could not load surrogate '{path.name}': {e}") from e
+    return surrogates
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from libecalc.common.errors.exceptions import InvalidResourceException
+from libecalc.common.time_utils import Period
 from libecalc.domain.resource import Resource
 from libecalc.presentation.yaml.domain.time_series_resource import TimeSeriesResource
 from libecalc.presentation.yaml.file_context import FileContext, FileMark
@@ -10,9 +11,17 @@ from libecalc.presentation.yaml.yaml_models.yaml_model import YamlValidator
 
 
 class FileResourceService(ResourceService):
-    def __init__(self, working_directory: Path, configuration: YamlValidator):
+    def __init__(self, working_directory: Path, configuration: YamlValidator, period: Period | None = None):
+        """
+        Args:
+            working_directory: Directory the resource names are relative to.
+            configuration: The configuration referring to the resources.
+            period: Only read the time series rows needed to evaluate this period, see
+                TimeSeriesResource.from_path_in_period. Defaults to reading all rows.
+        """
         self._working_directory = working_directory
         self._configuration = configuration
+        self._period = period
 
     def get_time_series_resources(self) -> TupleWithError[dict[str, TimeSeriesResource]]:
         resources: dict[str, TimeSeriesResource] = {}
@@ -23,8 +32,11 @@ class FileResourceService(ResourceService):
                 if not resource_path.is_file():
                     # Skip non-existing resources, that is handled in yaml validation
                     continue
-                resource = MemoryResource.from_path(self._working_directory / timeseries_resource_name, allow_nans=True)
-                resources[timeseries_resource_name] = TimeSeriesResource(resource).validate()
+                if self._period is not None:
+                    time_series_resource = TimeSeriesResource.from_path_in_period(resource_path, period=self._period)
+                else:
+                    time_series_resource = TimeSeriesResource(MemoryResource.from_path(resource_path, allow_nans=True))
+                resources[timeseries_resource_name] = time_series_resource.validate()
             except InvalidResourceException as e:
                 if e.file_mark is not None:
                     start_file_mark = FileMark(
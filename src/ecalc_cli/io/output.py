@@ -7,10 +7,12 @@ import pandas as pd
 import libecalc.common.time_utils
 from ecalc_cli.emission_intensity import EmissionIntensityResults
 from ecalc_cli.errors import EcalcCLIError
+from ecalc_cli.logger import logger
 from libecalc.common.run_info import RunInfo
 from libecalc.common.time_utils import Period
 from libecalc.domain.energy import EnergyModel
-from libecalc.infrastructure.file_utils import OutputFormat, dataframe_to_csv, get_result_output
+from libecalc.infrastructure.columnar_result import ColumnarResult
+from libecalc.infrastructure.file_utils import OutputFormat, dataframe_to_csv, dump_result_output
 from libecalc.presentation.exporter.configs.configs import LTPConfig, ResultConfig, STPConfig
 from libecalc.presentation.exporter.configs.formatter_config import PeriodFormatterConfig
 from libecalc.presentation.exporter.exporter import Exporter
@@ -39,6 +41,47 @@ def write_output(output: str, output_file: Path | None = None):
         sys.stdout.write(output)
 
 
+def write_csv(
+    results: EcalcModelResultDTO,
+    output_file: Path,
+    date_format_option: int,
+):
+    """Create csv of eCalc run results and write it to file as it is created.
+
+    Args:
+        results: eCalc run results
+        output_file: Path to output file
+        date_format_option: Date format, see DateFormat class for valid options
+
+    Returns:
+
+    """
+    with open(output_file, "w") as outfile:
+        dump_result_output(
+            results=results,
+            fp=outfile,
+            output_format=OutputFormat.CSV,
+            simple_output=False,
+            date_format_option=date_format_option,
+        )
+
+
+def write_columnar(
+    results: EcalcModelResultDTO,
+    output_folder: Path,
+):
+    """Write eCalc run results as typed columns to a folder with one numpy npy file per column, see ColumnarResult.
+
+    Args:
+        results: eCalc run results
+        output_folder: Path to output folder, created if it does not exist
+
+    Returns:
+
+    """
+    ColumnarResult.from_result(results).save(output_folder)
+
+
 def write_json(
     results: EcalcModelResultDTO,
     output_folder: Path,
@@ -46,8 +89,9 @@ def write_json(
     run_info: RunInfo,
     date_format_option: int,
     simple_output: bool,
+    compact: bool = False,
 ):
-    """Create json of eCalc run results and write to file.
+    """Create json of eCalc run results and write it to file as it is created.
 
     Args:
         results: eCalc run results
@@ -56,24 +100,53 @@ def write_json(
         run_info: Metadata about eCalc run
         date_format_option: Date format, see DateFormat class for valid options
         simple_output: If true will create simple results, else full results are stored
+        compact: If true the json is written without indentation and newlines
 
     Returns:
 
     """
     json_v3_path = output_folder / f"{name_prefix}_v3.json"
-    json_v3 = get_result_output(
-        results=results,
-        output_format=OutputFormat.JSON,
-        simple_output=simple_output,
-        date_format_option=date_format_option,
-    )
-    write_output(output=json_v3, output_file=json_v3_path)
+    with open(json_v3_path, "w") as outfile:
+        dump_result_output(
+            results=results,
+            fp=outfile,
+            output_format=OutputFormat.JSON,
+            simple_output=simple_output,
+            date_format_option=date_format_option,
+            compact=compact,
+        )
 
     run_info_path = output_folder / f"{name_prefix}_run_info.json"
     run_info_json = run_info.model_dump_json()
     write_output(output=run_info_json, output_file=run_info_path)
 
 
+def write_profile_report(report: dict, output_file: Path, run_info: RunInfo):
+    """Write the profile of an eCalc run to a json file, and log the components and models taking the most time.
+
+    Args:
+        report: The profile report, see Profiler.get_report
+        output_file: Path to output file
+        run_info: Metadata about eCalc run
+
+    Returns:
+
+    """
+    write_output(
+        output=json.dumps({"run_info": json.loads(run_info.model_dump_json()), **report}, indent=2),
+        output_file=output_file,
+    )
+
+    records = sorted(report["records"], key=lambda record: record["wall_time_seconds"], reverse=True)
+    for record in records[:10]:
+        component = f" in '{record['component']}'" if record["component"] is not None else ""
+        logger.info(
+            f"Profile: {record['type']} '{record['name']}'{component} took {record['wall_time_seconds']:.3f}s, "
+            f"{record['number_of_time_steps']} time steps"
+        )
+    logger.info(f"Profile written to {output_file}")
+
+
 def write_ltp_export(
     model: YamlModel,
     frequency: libecalc.common.time_utils.Frequency,
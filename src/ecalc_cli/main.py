@@ -5,13 +5,17 @@ import typer
 import libecalc.version
 from ecalc_cli.commands import show
 from ecalc_cli.commands.run import run
+from ecalc_cli.commands.scenarios import run_scenarios
 from ecalc_cli.commands.selftest import selftest
+from ecalc_cli.commands.surrogates import fit_surrogates
 from ecalc_cli.logger import CLILogConfigurator, LogLevel, logger
 from libecalc.common.errors.exceptions import EcalcError, EcalcErrorType
 
 app = typer.Typer(name="ecalc")
 
 app.command()(run)
+app.command()(run_scenarios)
+app.command()(fit_surrogates)
 app.add_typer(show.app, name="show", help="Command to show information in the model or results.")
 app.command(help="Test that eCalc has been successfully installed")(selftest)
 
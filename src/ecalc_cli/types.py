@@ -19,3 +19,9 @@ class Frequency(enum.StrEnum):
     YEAR = "YEAR"
     MONTH = "MONTH"
     DAY = "DAY"
+
+
+class ParallelEvaluation(enum.StrEnum):
+    SERIAL = "SERIAL"
+    THREADS = "THREADS"
+    PROCESSES = "PROCESSES"
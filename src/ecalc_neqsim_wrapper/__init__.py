@@ -1,9 +1,28 @@
-from ecalc_neqsim_wrapper.cache_service import CacheConfig, CacheService, LRUCache
+import importlib
+from typing import TYPE_CHECKING
 
-# Import last to avoid circular import (fluid_service depends on thermo)
-from ecalc_neqsim_wrapper.fluid_service import NeqSimFluidService
-from ecalc_neqsim_wrapper.java_service import NeqsimService, Py4JConfig
-from ecalc_neqsim_wrapper.thermo import NeqsimFluid
+if TYPE_CHECKING:
+    from ecalc_neqsim_wrapper.cache_service import CacheConfig, CacheService, LRUCache, SharedLRUCache
+    from ecalc_neqsim_wrapper.fluid_service import NeqSimFluidService
+    from ecalc_neqsim_wrapper.java_service import NeqsimService, NeqsimWorkerInitializer, Py4JConfig
+    from ecalc_neqsim_wrapper.shared_cache_store import SharedCacheCodec, SharedCacheStore
+    from ecalc_neqsim_wrapper.thermo import NeqsimFluid
+
+# The exported names are imported from their modules on first access, since the JVM bridge (jpype, py4j) and the
+# fluid service (libecalc, pydantic) are slow to import, and not needed for e.g. the cache configuration.
+_EXPORTS = {
+    "CacheConfig": "ecalc_neqsim_wrapper.cache_service",
+    "CacheService": "ecalc_neqsim_wrapper.cache_service",
+    "LRUCache": "ecalc_neqsim_wrapper.cache_service",
+    "NeqSimFluidService": "ecalc_neqsim_wrapper.fluid_service",
+    "NeqsimFluid": "ecalc_neqsim_wrapper.thermo",
+    "NeqsimService": "ecalc_neqsim_wrapper.java_service",
+    "NeqsimWorkerInitializer": "ecalc_neqsim_wrapper.java_service",
+    "Py4JConfig": "ecalc_neqsim_wrapper.java_service",
+    "SharedCacheCodec": "ecalc_neqsim_wrapper.shared_cache_store",
+    "SharedCacheStore": "ecalc_neqsim_wrapper.shared_cache_store",
+    "SharedLRUCache": "ecalc_neqsim_wrapper.cache_service",
+}
 
 __all__ = [
     "CacheConfig",
@@ -12,10 +31,27 @@ __all__ = [
     "NeqSimFluidService",
     "NeqsimFluid",
     "NeqsimService",
+    "NeqsimWorkerInitializer",
     "Py4JConfig",
+    "SharedCacheCodec",
+    "SharedCacheStore",
+    "SharedLRUCache",
 ]
 
 
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 def methods(check_class):
     """
     Print list of available methods for a java class
@@ -11,8 +11,12 @@ import threading
 from collections import OrderedDict
 from dataclasses import dataclass
 from enum import StrEnum
+from pathlib import Path
 from typing import TypeVar
 
+from ecalc_neqsim_wrapper.shared_cache_store import SharedCacheCodec, SharedCacheStore
+from libecalc.common.profiling import CacheCounts, Profiler
+
 _logger = logging.getLogger(__name__)
 
 K = TypeVar("K")
@@ -40,10 +44,16 @@ class CacheConfig:
             Stores FluidProperties for TP/PH flash operations.
             Using a default max size that covers use cases seen so far.
             Default: 100_000
+
+        shared_flash_cache_path: Database file for flash results shared between processes, see SharedCacheStore.
+            Lets worker processes of a parallel run use the flash results of the other workers.
+            The reference fluid cache holds JVM objects and is never shared.
+            Default: None, i.e. flash results are only cached within each process
     """
 
     reference_fluid_max_size: int = 512
     flash_max_size: int = 100_000
+    shared_flash_cache_path: Path | None = None
 
     @classmethod
     def default(cls) -> CacheConfig:
@@ -115,6 +125,64 @@ class LRUCache[K, V]:
             return len(self._cache)
 
 
+class SharedLRUCache(LRUCache[K, V]):
+    """LRU cache backed by a store shared between processes.
+
+    Entries not found in the local cache are looked up in the shared store, and added entries are written to both,
+    to the shared store in batches, see SharedCacheStore. Hits in the shared store are counted as hits, and also as
+    shared_hits in the statistics. Entries in the shared store that can not be decoded are treated as misses.
+    """
+
+    def __init__(self, name: str, shared_store: SharedCacheStore, codec: SharedCacheCodec[K, V], max_size: int = 10000):
+        super().__init__(max_size)
+        self._name = name
+        self._shared_store = shared_store
+        self._codec = codec
+        self._stats["shared_hits"] = 0
+
+    @property
+    def shared_store(self) -> SharedCacheStore:
+        return self._shared_store
+
+    def get(self, key: K) -> V | None:
+        """Get value from the local cache or the shared store, returns None if not found in either."""
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self._stats["hits"] += 1
+                return self._cache[key]
+        value = self._get_shared(key)
+        with self._lock:
+            if value is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            self._stats["shared_hits"] += 1
+        super().put(key, value)
+        return value
+
+    def _get_shared(self, key: K) -> V | None:
+        data = self._shared_store.get(self._name, self._codec.encode_key(key))
+        if data is None:
+            return None
+        try:
+            return self._codec.decode_value(data)
+        except ValueError:
+            _logger.warning(f"Invalid entry in shared cache '{self._shared_store.path}'", exc_info=True)
+            return None
+
+    def put(self, key: K, value: V) -> None:
+        """Add value to the local cache and the shared store."""
+        super().put(key, value)
+        self._shared_store.put(self._name, self._codec.encode_key(key), self._codec.encode_value(value))
+
+    def clear(self) -> None:
+        """Clear the local cache and reset statistics. Entries in the shared store are kept."""
+        with self._lock:
+            super().clear()
+            self._stats["shared_hits"] = 0
+
+
 class CacheService:
     """Central registry for application caches.
 
@@ -133,12 +201,26 @@ class CacheService:
     _lock: threading.RLock = threading.RLock()
 
     @classmethod
-    def create_cache(cls, name: str, max_size: int = 10000) -> LRUCache:
+    def create_cache(
+        cls,
+        name: str,
+        max_size: int = 10000,
+        shared_store: SharedCacheStore | None = None,
+        shared_codec: SharedCacheCodec | None = None,
+    ) -> LRUCache:
         """Create and register a named cache.
 
         If a cache with this name already exists, returns the existing cache.
-        Note: The existing cache retains its original max_size (logs warning if different).
+        Note: The existing cache retains its original max_size and shared store (logs warning if different).
+
+        Args:
+            name: Name of the cache, also used for its entries in the shared store.
+            max_size: Max entries in the cache of this process.
+            shared_store: Store shared with other processes, see SharedLRUCache. Only for values without JVM references.
+            shared_codec: Encoding of the keys and values in the shared store. Required with a shared store.
         """
+        if shared_store is not None and shared_codec is None:
+            raise ValueError(f"Cache '{name}' needs a codec to use a shared store.")
         with cls._lock:
             if name in cls._caches:
                 existing = cls._caches[name]
@@ -150,8 +232,17 @@ class CacheService:
                     )
                 else:
                     _logger.debug(f"Returning existing cache '{name}' (max_size={existing._max_size})")
+                if shared_store is not None and getattr(existing, "shared_store", None) is not shared_store:
+                    _logger.warning(
+                        f"Cache '{name}' already exists, ignoring requested shared store '{shared_store.path}'. "
+                        f"Configure caches before first use."
+                    )
                 return existing
-            cache: LRUCache = LRUCache(max_size)
+            cache: LRUCache
+            if shared_store is not None:
+                cache = SharedLRUCache(name=name, shared_store=shared_store, codec=shared_codec, max_size=max_size)
+            else:
+                cache = LRUCache(max_size)
             cls._caches[name] = cache
             return cache
 
@@ -180,3 +271,13 @@ class CacheService:
         """Get stats from all caches for monitoring."""
         with cls._lock:
             return {name: cache.get_stats() for name, cache in cls._caches.items()}
+
+    @classmethod
+    def get_cache_counts(cls) -> dict[str, CacheCounts]:
+        """Get the hits and misses of all caches, used when profiling."""
+        with cls._lock:
+            cache_stats = {name: cache.get_stats() for name, cache in cls._caches.items()}
+        return {name: CacheCounts(hits=stats["hits"], misses=stats["misses"]) for name, stats in cache_stats.items()}
+
+
+Profiler.register_cache_counts_provider(CacheService.get_cache_counts)
@@ -11,10 +11,12 @@ from __future__ import annotations
 
 import dataclasses
 import logging
+import struct
 from typing import ClassVar
 
 from ecalc_neqsim_wrapper.cache_service import CacheConfig, CacheName, CacheService, LRUCache
 from ecalc_neqsim_wrapper.exceptions import NeqsimFlashCalculationError
+from ecalc_neqsim_wrapper.shared_cache_store import SharedCacheCodec, SharedCacheStore
 from ecalc_neqsim_wrapper.thermo import NeqsimFluid
 from libecalc.process.fluid_stream.constants import ThermodynamicConstants
 from libecalc.process.fluid_stream.fluid import Fluid
@@ -49,6 +51,32 @@ def _make_composition_key(composition: FluidComposition) -> tuple:
     return tuple((k, round(v, _COMPOSITION_DECIMALS)) for k, v in sorted(dataclasses.asdict(composition).items()))
 
 
+class FlashCacheCodec(SharedCacheCodec[tuple, FluidProperties]):
+    """Encoding of flash cache entries in a shared store.
+
+    Keys, see _make_pt_cache_key and _make_ph_cache_key, are encoded as text. Floats are written with repr, which
+    gives the same text for equal floats in all processes. Values are the FluidProperties floats packed in field order.
+    """
+
+    _FIELD_NAMES = tuple(field.name for field in dataclasses.fields(FluidProperties))
+    _VALUE_FORMAT = struct.Struct(f"<{len(_FIELD_NAMES)}d")
+
+    def encode_key(self, key: tuple) -> str:
+        flash_type, composition_key, eos_model, pressure, state = key
+        composition = ",".join(f"{component}={float(fraction)!r}" for component, fraction in composition_key)
+        return f"{flash_type}|{EoSModel(eos_model).value}|{composition}|{float(pressure)!r}|{float(state)!r}"
+
+    def encode_value(self, value: FluidProperties) -> bytes:
+        return self._VALUE_FORMAT.pack(*(float(getattr(value, name)) for name in self._FIELD_NAMES))
+
+    def decode_value(self, data: bytes) -> FluidProperties:
+        try:
+            values = self._VALUE_FORMAT.unpack(data)
+        except struct.error as e:
+            raise ValueError(f"Invalid flash cache value: {e}") from e
+        return FluidProperties(**dict(zip(self._FIELD_NAMES, values, strict=True)))
+
+
 class NeqSimFluidService(FluidService):
     """Centralized service for all thermodynamic operations with global caching.
 
@@ -138,9 +166,16 @@ class NeqSimFluidService(FluidService):
         self._reference_cache: LRUCache = CacheService.create_cache(
             CacheName.REFERENCE_FLUID, max_size=config.reference_fluid_max_size
         )
-        # Flash cache: stores FluidProperties for TP/PH flash results
+        # Flash cache: stores FluidProperties for TP/PH flash results, optionally shared with other processes
+        shared_flash_store = None
+        if config.shared_flash_cache_path is not None:
+            _logger.info(f"Sharing flash results between processes using '{config.shared_flash_cache_path}'")
+            shared_flash_store = SharedCacheStore(config.shared_flash_cache_path)
         self._flash_cache: LRUCache = CacheService.create_cache(
-            CacheName.FLUID_SERVICE_FLASH, max_size=config.flash_max_size
+            CacheName.FLUID_SERVICE_FLASH,
+            max_size=config.flash_max_size,
+            shared_store=shared_flash_store,
+            shared_codec=FlashCacheCodec() if shared_flash_store is not None else None,
         )
 
     @classmethod
@@ -150,6 +185,13 @@ class NeqSimFluidService(FluidService):
             cls._instance = cls()
         return cls._instance
 
+    def __reduce__(self):
+        """Unpickle as the singleton of the receiving process, e.g. when models are sent to worker processes.
+
+        The caches hold JVM references, which are only valid in the process that created them.
+        """
+        return NeqSimFluidService.instance, ()
+
     @classmethod
     def reset_instance(cls) -> None:
         """Reset the singleton instance and configuration. Useful for testing.
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from os import path
 from typing import ClassVar, Optional, Self
 
-from ecalc_neqsim_wrapper.cache_service import CacheService
+from ecalc_neqsim_wrapper.cache_service import CacheConfig, CacheService
 from ecalc_neqsim_wrapper.exceptions import NeqsimError
 from libecalc.common.errors.exceptions import ProgrammingError
 
@@ -298,3 +298,32 @@ class NeqsimPy4JService(NeqsimService):
             _logger.exception("Java gateway close failed")
         finally:
             _neqsim_service = None
+
+
+@dataclass(frozen=True)
+class NeqsimWorkerInitializer:
+    """Start a NeqSim service in a worker process, to be used as initializer for process pools.
+
+    The service is shut down when the worker process exits.
+
+    Attributes:
+        use_jpype: If True, use the JPype implementation, otherwise the Py4J implementation.
+        py4j_config: Configuration for the Py4J JVM process in the worker, see Py4JConfig.
+        cache_config: Configuration for the NeqSimFluidService caches in the worker, see CacheConfig.
+    """
+
+    use_jpype: bool = False
+    py4j_config: Py4JConfig | None = None
+    cache_config: CacheConfig | None = None
+
+    def __call__(self) -> None:
+        from multiprocessing.util import Finalize
+
+        from ecalc_neqsim_wrapper.fluid_service import NeqSimFluidService
+
+        if self.cache_config is not None:
+            NeqSimFluidService.configure(self.cache_config)
+        if self.py4j_config is not None:
+            NeqsimService.configure_py4j(self.py4j_config)
+        service = NeqsimService.factory(use_jpype=self.use_jpype).initialize()
+        Finalize(service, service.shutdown, exitpriority=10)
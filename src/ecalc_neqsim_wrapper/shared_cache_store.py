@@ -0,0 +1,205 @@
+"""Cache entries shared between the processes on one machine, e.g. the worker processes of a parallel run.
+
+The entries are kept in a local SQLite database file, which handles concurrent reads and writes from many
+processes. Only for caches of pure data, e.g. flash results. Entries holding JVM references are only valid in the
+process that created them.
+
+Keys and values are stored in an explicit encoding given by a SharedCacheCodec for each cache, never pickled, so that
+reading a database file written by others can at most give wrong cache entries, not run code.
+"""
+
+from __future__ import annotations
+
+import abc
+import logging
+import os
+import sqlite3
+import threading
+from multiprocessing.util import Finalize
+from pathlib import Path
+from typing import Any
+
+_logger = logging.getLogger(__name__)
+
+# Version of the layout of the database file, entries written with another layout are removed
+_STORE_FORMAT = "2"
+
+
+def _get_version() -> str:
+    from libecalc.version import current_version
+
+    return str(current_version())
+
+
+class SharedCacheCodec[K, V](abc.ABC):
+    """Encoding of the keys and values of a cache in a SharedCacheStore.
+
+    Keys must be encoded canonically, i.e. equal keys give equal encoded keys in all processes.
+    """
+
+    @abc.abstractmethod
+    def encode_key(self, key: K) -> str: ...
+
+    @abc.abstractmethod
+    def encode_value(self, value: V) -> bytes: ...
+
+    @abc.abstractmethod
+    def decode_value(self, data: bytes) -> V:
+        """Decode a value written by encode_value.
+
+        Raises:
+            ValueError: If the data is not a valid encoded value.
+        """
+        ...
+
+
+class SharedCacheStore:
+    """Cache entries in a SQLite database file, shared by all processes using the same file.
+
+    Each process opens its own connection to the file. Reads do not block writes, and writes from different processes
+    are serialized by SQLite. Entries are never evicted, and are removed when the file is opened by another eCalc
+    version, as the results could differ between versions.
+
+    Added entries are kept in the process, and written in one transaction when batch_size entries are pending, on flush
+    and close, and when the process exits. Other processes only see the entries once written.
+
+    Failing to read or write the file is logged, and treated as a cache miss, i.e. the shared store never fails a run.
+
+    Keys and values are stored as encoded by the cache using the store, see SharedCacheCodec.
+    """
+
+    def __init__(self, path: Path, timeout_seconds: float = 30.0, batch_size: int = 100):
+        """
+        Args:
+            path: The database file, created if it does not exist.
+            timeout_seconds: Max time to wait for other processes writing to the file.
+            batch_size: Number of added entries written in one transaction.
+        """
+        self._path = Path(path)
+        self._timeout_seconds = timeout_seconds
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._connection_pid: int | None = None
+        self._pending: dict[tuple[str, str], bytes] = {}
+        self._pending_pid: int | None = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Connections and pending entries can not be shared between processes, the receiving process opens its own
+        return {"_path": self._path, "_timeout_seconds": self._timeout_seconds, "_batch_size": self._batch_size}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(path=state["_path"], timeout_seconds=state["_timeout_seconds"], batch_size=state["_batch_size"])
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # A forked process inherits the connection of the parent, which must not be used
+        if self._connection is None or self._connection_pid != os.getpid():
+            self._connection = self._connect()
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    def _get_pending(self) -> dict[tuple[str, str], bytes]:
+        # A forked process inherits the pending entries of the parent, which are written by the parent
+        if self._pending_pid != os.getpid():
+            self._pending = {}
+            self._pending_pid = os.getpid()
+            # Keeps the store until the process exits, to write the pending entries. Stores live as long as the caches.
+            Finalize(self, self.close, exitpriority=10)
+        return self._pending
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._path,
+            timeout=self._timeout_seconds,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        # Write-ahead logging lets readers and a writer work concurrently. Durability is not needed for a cache.
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=OFF")
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute("CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            version = f"{_get_version()}/{_STORE_FORMAT}"
+            row = connection.execute("SELECT value FROM metadata WHERE name = 'version'").fetchone()
+            if row is None or row[0] != version:
+                connection.execute("DROP TABLE IF EXISTS entries")
+                connection.execute("INSERT OR REPLACE INTO metadata (name, value) VALUES ('version', ?)", (version,))
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " cache TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, PRIMARY KEY (cache, key)"
+                ") WITHOUT ROWID"
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            connection.close()
+            raise
+        return connection
+
+    def get(self, cache_name: str, key: str) -> bytes | None:
+        """Get the encoded value of the encoded key in the named cache, returns None if not found."""
+        try:
+            with self._lock:
+                value = self._get_pending().get((cache_name, key))
+                if value is not None:
+                    return value
+                row = (
+                    self._get_connection()
+                    .execute("SELECT value FROM entries WHERE cache = ? AND key = ?", (cache_name, key))
+                    .fetchone()
+                )
+        except sqlite3.Error:
+            _logger.warning(f"Could not read shared cache '{self._path}'", exc_info=True)
+            return None
+        return bytes(row[0]) if row is not None else None
+
+    def put(self, cache_name: str, key: str, value: bytes) -> None:
+        """Add the encoded value of the encoded key to the named cache. An existing value is kept, as equal keys give
+        equal values."""
+        with self._lock:
+            pending = self._get_pending()
+            pending.setdefault((cache_name, key), value)
+            if len(pending) >= self._batch_size:
+                self._write_pending()
+
+    def flush(self) -> None:
+        """Write the pending entries, so that other processes can use them."""
+        with self._lock:
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        pending = self._get_pending()
+        if not pending:
+            return
+        entries = [(cache_name, key, value) for (cache_name, key), value in pending.items()]
+        pending.clear()
+        try:
+            connection = self._get_connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany("INSERT OR IGNORE INTO entries (cache, key, value) VALUES (?, ?, ?)", entries)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        except sqlite3.Error:
+            _logger.warning(f"Could not write to shared cache '{self._path}'", exc_info=True)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._write_pending()
+            return self._get_connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def close(self) -> None:
+        """Write the pending entries and close the connection of this process."""
+        with self._lock:
+            self._write_pending()
+            if self._connection is not None and self._connection_pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+            self._connection_pid = None
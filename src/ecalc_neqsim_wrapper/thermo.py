@@ -26,6 +26,7 @@ from ecalc_neqsim_wrapper.mappings import (
 )
 from libecalc.common.decorators.capturer import Capturer
 from libecalc.common.logger import logger
+from libecalc.common.profiling import ProfileCounter, Profiler
 from libecalc.process.fluid_stream.fluid_model import EoSModel, FluidComposition
 
 _logger = logging.getLogger(__name__)
@@ -315,6 +316,7 @@ class NeqsimFluid:
             .thermodynamicoperations.ThermodynamicOperations(thermodynamic_system)
         )
         thermodynamic_operations.TPflash()
+        Profiler.count(ProfileCounter.NEQSIM_FLASH_CALLS)
 
         thermodynamic_system.init(3)
         thermodynamic_system.initProperties()
@@ -340,6 +342,7 @@ class NeqsimFluid:
             thermodynamic_operations.PHflashGERG2008(float(enthalpy_joule))
         else:
             thermodynamic_operations.PHflash(float(enthalpy), "J/kg")
+        Profiler.count(ProfileCounter.NEQSIM_FLASH_CALLS)
 
         thermodynamic_system.init(3)
         thermodynamic_system.initProperties()
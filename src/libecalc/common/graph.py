@@ -5,6 +5,8 @@ from uuid import UUID
 
 import networkx as nx
 
+from libecalc.common.errors.exceptions import ProgrammingError
+
 NodeID = str | UUID
 
 
@@ -17,21 +19,57 @@ TNode = TypeVar("TNode", bound=NodeWithID | UUID)
 
 
 class Graph[TNode: NodeWithID | UUID]:
+    """
+    A directed graph of nodes. The graph can be frozen when it is built, after which the topology (sorted nodes,
+    successors, predecessors and subtrees) is computed once and reused by all queries.
+    """
+
     def __init__(self):
         self.graph: nx.DiGraph = nx.DiGraph()
         self.nodes: dict[NodeID, TNode] = {}
+        self._is_frozen = False
+        self._sorted_node_ids: list[NodeID] = []
+        self._successors: dict[NodeID, list[NodeID]] = {}
+        self._predecessors: dict[NodeID, list[NodeID]] = {}
+        self._recursive_successors: dict[NodeID, list[NodeID]] = {}
 
     def _get_node_id(self, node: TNode) -> NodeID:
         if isinstance(node, UUID):
             return node
         return node.id
 
+    def _assert_not_frozen(self):
+        if self._is_frozen:
+            raise ProgrammingError("Can not change a frozen graph.")
+
+    @property
+    def is_frozen(self) -> bool:
+        return self._is_frozen
+
+    def freeze(self) -> Self:
+        """
+        Freeze the graph, i.e. no more nodes or edges can be added. Precomputes the topology of the graph.
+
+        Returns: the frozen graph
+        """
+        self._sorted_node_ids = list(nx.topological_sort(self.graph))
+        self._successors = {node_id: list(self.graph.successors(node_id)) for node_id in self._sorted_node_ids}
+        self._predecessors = {node_id: list(self.graph.predecessors(node_id)) for node_id in self._sorted_node_ids}
+        # Reverse topological order, such that the subtrees of the successors are known
+        for node_id in reversed(self._sorted_node_ids):
+            self._recursive_successors[node_id] = self._get_subtree(node_id)
+        nx.freeze(self.graph)
+        self._is_frozen = True
+        return self
+
     def add_node(self, node: TNode) -> Self:
+        self._assert_not_frozen()
         self.graph.add_node(self._get_node_id(node))
         self.nodes[self._get_node_id(node)] = node
         return self
 
     def add_edge(self, from_id: NodeID, to_id: NodeID) -> Self:
+        self._assert_not_frozen()
         if from_id not in self.nodes or to_id not in self.nodes:
             raise ValueError("Add node before adding edges")
 
@@ -39,11 +77,29 @@ class Graph[TNode: NodeWithID | UUID]:
         return self
 
     def add_subgraph(self, subgraph: Graph) -> Self:
+        self._assert_not_frozen()
         self.nodes.update(subgraph.nodes)
         self.graph = nx.compose(self.graph, subgraph.graph)
         return self
 
+    def _get_subtree(self, node_id: NodeID) -> list[NodeID]:
+        """
+        Get all nodes reachable from the given node in depth first order, excluding the node itself, given the
+        subtrees of its successors.
+        """
+        subtree: dict[NodeID, None] = {}
+        for successor_id in self._successors[node_id]:
+            # Nodes reachable through several successors are only included once, where first visited
+            subtree[successor_id] = None
+            subtree.update(dict.fromkeys(self._recursive_successors[successor_id]))
+        return list(subtree)
+
     def get_successors(self, node_id: NodeID, recursively=False) -> list[NodeID]:
+        if self._is_frozen:
+            if recursively:
+                return list(self._recursive_successors[node_id])
+            return list(self._successors[node_id])
+
         if recursively:
             return [
                 successor_id
@@ -54,7 +110,10 @@ class Graph[TNode: NodeWithID | UUID]:
             return list(self.graph.successors(node_id))
 
     def get_predecessor(self, node_id: NodeID) -> NodeID:
-        predecessors = list(self.graph.predecessors(node_id))
+        if self._is_frozen:
+            predecessors = self._predecessors[node_id]
+        else:
+            predecessors = list(self.graph.predecessors(node_id))
         if len(predecessors) > 1:
             raise ValueError(
                 f"Tried to get a single predecessor of node with several predecessors. NodeID: {node_id}, "
@@ -64,13 +123,15 @@ class Graph[TNode: NodeWithID | UUID]:
 
     @property
     def root(self) -> NodeID:
-        return list(nx.topological_sort(self.graph))[0]
+        return self.sorted_node_ids[0]
 
     def get_node(self, node_id: NodeID) -> TNode:
         return self.nodes[node_id]
 
     @property
     def sorted_node_ids(self) -> list[NodeID]:
+        if self._is_frozen:
+            return list(self._sorted_node_ids)
         return list(nx.topological_sort(self.graph))
 
     def breadth_first_search_tree(self, source_id: NodeID) -> list[NodeID]:
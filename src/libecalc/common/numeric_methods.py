@@ -2,9 +2,11 @@ from collections.abc import Callable
 from dataclasses import dataclass
 
 import numpy as np
+from numpy.typing import NDArray
 from scipy.optimize import root_scalar
 
 from libecalc.common.logger import logger
+from libecalc.common.profiling import ProfileCounter, Profiler
 
 # Constants
 CONVERGENCE_TOLERANCE = 1e-5
@@ -101,6 +103,7 @@ def find_root(
             method="brenth",
             rtol=relative_convergence_tolerance,
         )
+        Profiler.count(ProfileCounter.ROOT_FINDER_ITERATIONS, result.iterations)
         if not result.converged:
             msg = (
                 f"Did not reach convergence after maximum number of iterations: {maximum_number_of_iterations}."
@@ -126,6 +129,133 @@ def find_root(
     )
 
 
+def find_roots(
+    lower_bounds: NDArray[np.float64],
+    upper_bounds: NDArray[np.float64],
+    func: Callable[[NDArray[np.float64], NDArray[np.intp]], NDArray[np.float64]],
+    relative_convergence_tolerance: float = CONVERGENCE_TOLERANCE,
+    maximum_number_of_iterations: int = MAXIMUM_NUMBER_OF_ITERATIONS,
+) -> NDArray[np.float64]:
+    """Batched version of find_root, solving f_i(x_i) = 0 on [lower_bounds[i], upper_bounds[i]] for all i at once.
+
+    Use this instead of calling find_root in a loop when evaluating the function for many x values in one call is
+    cheaper than evaluating them one by one, e.g. for models evaluating arrays of rates.
+
+    Each problem is iterated exactly as scipy's brenth method does, so the roots are the same as given by find_root,
+    but each iteration evaluates the function once for all problems that have not yet converged. Problems where
+    Brent's method fails, i.e. the function does not change sign on the interval or evaluates to NaN, are passed on to
+    find_root one by one.
+
+    :param lower_bounds: Lower bound of solution per problem
+    :param upper_bounds: Upper bound of solution per problem
+    :param func: The function to solve, f(x, indices). Evaluates f for the problems given by indices at the x values.
+    :param relative_convergence_tolerance: The tolerance of convergence that will be used to exit the iteration
+    :param maximum_number_of_iterations: The maximum number of iterations that will be used to find the roots.
+    """
+    absolute_convergence_tolerance = 2e-12  # scipy default
+
+    x_previous = np.array(lower_bounds, dtype=np.float64)
+    x_current = np.array(upper_bounds, dtype=np.float64)
+    all_indices = np.arange(len(x_current))
+    roots = np.full_like(x_current, fill_value=np.nan)
+    if len(x_current) == 0:
+        return roots
+
+    f_previous = np.asarray(func(x_previous, all_indices), dtype=np.float64)
+    f_current = np.asarray(func(x_current, all_indices), dtype=np.float64)
+
+    roots = np.where(f_current == 0, x_current, roots)
+    roots = np.where(f_previous == 0, x_previous, roots)
+    is_solved = (f_previous == 0) | (f_current == 0)
+    is_bracketed = (np.signbit(f_previous) != np.signbit(f_current)) & ~np.isnan(f_previous) & ~np.isnan(f_current)
+    active = is_bracketed & ~is_solved
+    # Problems find_root would fail to solve with Brent's method, i.e. without sign change or with NaN values
+    is_failed = ~is_bracketed & ~is_solved
+
+    # The point bracketing the root together with x_current, and the previous steps
+    x_block = np.zeros_like(x_current)
+    f_block = np.zeros_like(x_current)
+    step_previous = np.zeros_like(x_current)
+    step_current = np.zeros_like(x_current)
+
+    for _ in range(maximum_number_of_iterations):
+        indices = np.flatnonzero(active)
+        if len(indices) == 0:
+            break
+        Profiler.count(ProfileCounter.ROOT_FINDER_ITERATIONS, len(indices))
+        x_pre, x_cur, x_blk = x_previous[indices], x_current[indices], x_block[indices]
+        f_pre, f_cur, f_blk = f_previous[indices], f_current[indices], f_block[indices]
+        s_pre, s_cur = step_previous[indices], step_current[indices]
+
+        new_bracket = (f_pre != 0) & (f_cur != 0) & (np.signbit(f_pre) != np.signbit(f_cur))
+        x_blk = np.where(new_bracket, x_pre, x_blk)
+        f_blk = np.where(new_bracket, f_pre, f_blk)
+        s_pre = np.where(new_bracket, x_cur - x_pre, s_pre)
+        s_cur = np.where(new_bracket, x_cur - x_pre, s_cur)
+
+        # Make x_cur the best estimate of the root
+        swap = np.abs(f_blk) < np.abs(f_cur)
+        x_pre, x_cur, x_blk = np.where(swap, x_cur, x_pre), np.where(swap, x_blk, x_cur), np.where(swap, x_cur, x_blk)
+        f_pre, f_cur, f_blk = np.where(swap, f_cur, f_pre), np.where(swap, f_blk, f_cur), np.where(swap, f_cur, f_blk)
+
+        delta = (absolute_convergence_tolerance + relative_convergence_tolerance * np.abs(x_cur)) / 2
+        s_bisect = (x_blk - x_cur) / 2
+        converged = (f_cur == 0) | (np.abs(s_bisect) < delta)
+        roots[indices[converged]] = x_cur[converged]
+        active[indices[converged]] = False
+
+        # Interpolate (or extrapolate hyperbolically) if it is expected to converge faster than bisection
+        with np.errstate(divide="ignore", invalid="ignore"):
+            s_interpolate = -f_cur * (x_cur - x_pre) / (f_cur - f_pre)
+            d_pre = (f_pre - f_cur) / (x_pre - x_cur)
+            d_blk = (f_blk - f_cur) / (x_blk - x_cur)
+            s_extrapolate = -f_cur * (f_blk - f_pre) / (f_blk * d_pre - f_pre * d_blk)
+        s_try = np.where(x_pre == x_blk, s_interpolate, s_extrapolate)
+        accept_step = (
+            (np.abs(s_pre) > delta)
+            & (np.abs(f_cur) < np.abs(f_pre))
+            & (2 * np.abs(s_try) < np.minimum(np.abs(s_pre), 3 * np.abs(s_bisect) - delta))
+        )
+        s_pre = np.where(accept_step, s_cur, s_bisect)
+        s_cur = np.where(accept_step, s_try, s_bisect)
+
+        x_pre, f_pre = x_cur, f_cur
+        x_cur = x_cur + np.where(np.abs(s_cur) > delta, s_cur, np.where(s_bisect > 0, delta, -delta))
+
+        x_previous[indices], f_previous[indices] = x_pre, f_pre
+        x_block[indices], f_block[indices] = x_blk, f_blk
+        step_previous[indices], step_current[indices] = s_pre, s_cur
+        x_current[indices] = x_cur
+
+        evaluate = ~converged
+        if np.any(evaluate):
+            evaluate_indices = indices[evaluate]
+            f_current[evaluate_indices] = np.asarray(func(x_cur[evaluate], evaluate_indices), dtype=np.float64)
+            failed_indices = evaluate_indices[np.isnan(f_current[evaluate_indices])]
+            is_failed[failed_indices] = True
+            active[failed_indices] = False
+
+    if np.any(active):
+        logger.error(
+            f"Did not reach convergence after maximum number of iterations: {maximum_number_of_iterations}"
+            f" for {np.count_nonzero(active)} of {len(x_current)} roots. convergence_tolerance: "
+            f"{relative_convergence_tolerance}. func: {func}"
+        )
+        roots[active] = x_current[active]
+
+    for i in np.flatnonzero(is_failed):
+        # Let find_root handle (and report) these one by one
+        roots[i] = find_root(
+            lower_bound=lower_bounds[i],
+            upper_bound=upper_bounds[i],
+            func=lambda x, i=i: float(np.asarray(func(np.asarray([x], dtype=np.float64), np.asarray([i])))[0]),
+            relative_convergence_tolerance=relative_convergence_tolerance,
+            maximum_number_of_iterations=maximum_number_of_iterations,
+        )
+
+    return roots
+
+
 def secant_method(
     x0: float,
     x1: float,
@@ -171,6 +301,7 @@ def secant_method(
         # Avoid division by zero: https://en.wikipedia.org/wiki/Relative_change_and_difference
         rel_diff = 0 if x0 == x1 else abs(x1 - x0) / max(abs(x0), abs(x1))
 
+    Profiler.count(ProfileCounter.ROOT_FINDER_ITERATIONS, i)
     if i > maximum_number_of_iterations:
         msg = (
             f"Did not reach convergence after maximum number of iterations: {maximum_number_of_iterations}."
@@ -214,6 +345,7 @@ def maximize_x_given_boolean_condition_function(
         rel_diff = 0 if x0 == x1 else abs(x1 - x0) / max(abs(x0), abs(x1))
         i += 1
 
+    Profiler.count(ProfileCounter.ROOT_FINDER_ITERATIONS, i)
     if i > maximum_number_of_iterations:
         msg = (
             f"Did not reach convergence after maximum number of iterations: {maximum_number_of_iterations}."
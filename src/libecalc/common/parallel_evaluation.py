@@ -0,0 +1,162 @@
+"""Concurrent evaluation of independent tasks, e.g. the operational settings of a consumer system.
+
+Evaluation is serial unless configured otherwise. Concurrent evaluation is opt-in since the speedup depends on the
+models involved:
+
+- Threads work well for NumPy-heavy models (sampled compressors, pumps), where most time is spent outside the GIL.
+  NeqSim is not thread-safe, so callers must not run tasks using NeqSim concurrently in threads.
+- Processes work for any picklable task, including NeqSim-backed compressor trains. Each worker process needs its
+  own NeqSim service, which is started by the configured worker initializer.
+
+Executors are created on first use and reused for the lifetime of the process, so worker processes (and their JVMs)
+are only started once.
+"""
+
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import os
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import ClassVar
+
+
+class ParallelEvaluationMode(StrEnum):
+    SERIAL = "SERIAL"
+    THREADS = "THREADS"
+    PROCESSES = "PROCESSES"
+
+
+def _default_max_workers() -> int:
+    return min(8, os.cpu_count() or 1)
+
+
+@dataclass(frozen=True)
+class ParallelEvaluationConfig:
+    """Configuration for concurrent evaluation.
+
+    Attributes:
+        mode: How to evaluate independent tasks. Default: SERIAL
+
+        max_workers: Maximum number of worker threads or processes. At most this many tasks are in flight at any
+            time, which bounds the memory held by pending inputs and results. Default: number of CPUs, max 8
+
+        worker_initializer: Called once in each worker process before any task is evaluated, e.g. to start the
+            NeqSim service. Only used in PROCESSES mode. Must be picklable.
+    """
+
+    mode: ParallelEvaluationMode = ParallelEvaluationMode.SERIAL
+    max_workers: int = _default_max_workers()
+    worker_initializer: Callable[[], None] | None = None
+
+    def __post_init__(self):
+        if self.max_workers < 1:
+            raise ValueError(f"Invalid max_workers '{self.max_workers}'. Must be at least 1.")
+
+    @classmethod
+    def default(cls) -> ParallelEvaluationConfig:
+        """Return default configuration, i.e. serial evaluation."""
+        return cls()
+
+    @property
+    def is_concurrent(self) -> bool:
+        return self.mode != ParallelEvaluationMode.SERIAL and self.max_workers > 1
+
+
+class ParallelEvaluator:
+    """Evaluate independent tasks according to the configured ParallelEvaluationConfig.
+
+    Usage:
+        ParallelEvaluator.configure(ParallelEvaluationConfig(mode=ParallelEvaluationMode.THREADS))
+        results = ParallelEvaluator.map(evaluate_task, tasks)
+    """
+
+    _config: ClassVar[ParallelEvaluationConfig] = ParallelEvaluationConfig.default()
+    _executors: ClassVar[dict[ParallelEvaluationConfig, Executor]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def configure(cls, config: ParallelEvaluationConfig) -> None:
+        """Set the configuration used when no explicit configuration is given."""
+        cls._config = config
+
+    @classmethod
+    def get_config(cls) -> ParallelEvaluationConfig:
+        return cls._config
+
+    @classmethod
+    def reset(cls) -> None:
+        """Shut down all executors and restore serial evaluation. Useful for testing."""
+        cls.shutdown()
+        cls._config = ParallelEvaluationConfig.default()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        with cls._lock:
+            for executor in cls._executors.values():
+                executor.shutdown(wait=True, cancel_futures=True)
+            cls._executors.clear()
+
+    @classmethod
+    def _get_executor(cls, config: ParallelEvaluationConfig) -> Executor:
+        with cls._lock:
+            executor = cls._executors.get(config)
+            if executor is None:
+                if config.mode == ParallelEvaluationMode.PROCESSES:
+                    # Spawn rather than fork, a forked worker would share the parent's JVM connection and caches
+                    executor = ProcessPoolExecutor(
+                        max_workers=config.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=config.worker_initializer,
+                    )
+                else:
+                    executor = ThreadPoolExecutor(
+                        max_workers=config.max_workers,
+                        thread_name_prefix="ecalc-evaluation",
+                    )
+                cls._executors[config] = executor
+            return executor
+
+    @classmethod
+    def map[TTask, TResult](
+        cls,
+        func: Callable[[TTask], TResult],
+        tasks: Iterable[TTask],
+        config: ParallelEvaluationConfig | None = None,
+    ) -> list[TResult]:
+        """Evaluate func for each task, returning the results in the same order as the tasks.
+
+        The result is the same as ``[func(task) for task in tasks]``, exceptions raised by func are re-raised.
+
+        Args:
+            func: The function to evaluate. Must be picklable (i.e. a module level function) in PROCESSES mode.
+            tasks: The tasks to evaluate. Must be picklable in PROCESSES mode.
+            config: Configuration to use, defaults to the configured ParallelEvaluationConfig.
+        """
+        config = config or cls._config
+        tasks = list(tasks)
+        if not config.is_concurrent or len(tasks) <= 1:
+            return [func(task) for task in tasks]
+
+        executor = cls._get_executor(config)
+        results: list[TResult] = []
+        in_flight: deque[Future[TResult]] = deque()
+        try:
+            for task in tasks:
+                if len(in_flight) >= config.max_workers:
+                    results.append(in_flight.popleft().result())
+                in_flight.append(executor.submit(func, task))
+            while in_flight:
+                results.append(in_flight.popleft().result())
+        finally:
+            for future in in_flight:
+                future.cancel()
+        return results
+
+
+atexit.register(ParallelEvaluator.shutdown)
@@ -0,0 +1,179 @@
+"""Opt-in profiling of model runs, i.e. where the time of a run is spent.
+
+When enabled, Profiler.measure records the wall time of a block of work, e.g. the evaluation of a component or a
+model, together with the counters incremented while the block runs (root finder iterations, NeqSim flashes) and the
+cache hits and misses of the registered caches.
+
+Profiling is disabled by default, and counting is then a single check of a flag. Counters are process wide, work done
+in worker processes (see ParallelEvaluationMode.PROCESSES) is not counted.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import ClassVar
+
+
+class ProfileCounter(StrEnum):
+    ROOT_FINDER_ITERATIONS = "root_finder_iterations"
+    NEQSIM_FLASH_CALLS = "neqsim_flash_calls"
+
+
+@dataclass(frozen=True)
+class CacheCounts:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float | None:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else None
+
+    def __sub__(self, other: CacheCounts) -> CacheCounts:
+        return CacheCounts(hits=self.hits - other.hits, misses=self.misses - other.misses)
+
+
+CacheCountsProvider = Callable[[], dict[str, CacheCounts]]
+
+
+@dataclass
+class ProfileRecord:
+    """Profile of a block of work, counters and cache counts include everything done while the block runs."""
+
+    name: str
+    type: str
+    component: str | None = None
+    wall_time_seconds: float = 0.0
+    number_of_time_steps: int | None = None
+    counters: dict[str, int] = field(default_factory=dict)
+    caches: dict[str, CacheCounts] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "type": self.type,
+            "component": self.component,
+            "wall_time_seconds": self.wall_time_seconds,
+            "number_of_time_steps": self.number_of_time_steps,
+            **{str(counter): self.counters.get(counter, 0) for counter in ProfileCounter},
+            "caches": {
+                cache_name: {
+                    "hits": cache_counts.hits,
+                    "misses": cache_counts.misses,
+                    "hit_rate": cache_counts.hit_rate,
+                }
+                for cache_name, cache_counts in self.caches.items()
+            },
+        }
+
+
+class Profiler:
+    """Record where the time of a run is spent.
+
+    Usage:
+        Profiler.enable()
+        with Profiler.measure(name="compressor", type="COMPRESSOR") as record:
+            result = model.evaluate()
+            record.number_of_time_steps = len(result.periods)
+        report = Profiler.get_report()
+
+    Code doing expensive work counts it with Profiler.count, e.g. Profiler.count(ProfileCounter.NEQSIM_FLASH_CALLS).
+    """
+
+    _is_enabled: ClassVar[bool] = False
+    _counters: ClassVar[Counter[str]] = Counter()
+    _records: ClassVar[list[ProfileRecord]] = []
+    _cache_counts_providers: ClassVar[list[CacheCountsProvider]] = []
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def enable(cls) -> None:
+        cls._is_enabled = True
+
+    @classmethod
+    def disable(cls) -> None:
+        cls._is_enabled = False
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._is_enabled
+
+    @classmethod
+    def reset(cls) -> None:
+        """Disable profiling and remove all records and counts. Useful for testing."""
+        with cls._lock:
+            cls._is_enabled = False
+            cls._counters = Counter()
+            cls._records = []
+
+    @classmethod
+    def register_cache_counts_provider(cls, provider: CacheCountsProvider) -> None:
+        """Register a function giving the cumulative hits and misses per cache name, e.g. for the NeqSim caches."""
+        with cls._lock:
+            if provider not in cls._cache_counts_providers:
+                cls._cache_counts_providers.append(provider)
+
+    @classmethod
+    def count(cls, counter: ProfileCounter, increment: int = 1) -> None:
+        if not cls._is_enabled:
+            return
+        with cls._lock:
+            cls._counters[counter] += increment
+
+    @classmethod
+    def _get_cache_counts(cls) -> dict[str, CacheCounts]:
+        cache_counts: dict[str, CacheCounts] = {}
+        for provider in cls._cache_counts_providers:
+            cache_counts.update(provider())
+        return cache_counts
+
+    @classmethod
+    @contextmanager
+    def measure(cls, name: str, type: str, component: str | None = None) -> Iterator[ProfileRecord]:
+        """Measure the block, adding a record when profiling is enabled. The record is yielded so that the block can
+        set the number of time steps.
+
+        Args:
+            name: Name of the measured work, e.g. the name of a component or model
+            type: Type of the measured work, e.g. the component type or model type
+            component: Name of the component a model is evaluated for, if any
+        """
+        record = ProfileRecord(name=name, type=type, component=component)
+        if not cls._is_enabled:
+            yield record
+            return
+
+        with cls._lock:
+            counters_before = cls._counters.copy()
+        cache_counts_before = cls._get_cache_counts()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.wall_time_seconds = time.perf_counter() - start
+            with cls._lock:
+                record.counters = dict(cls._counters - counters_before)
+            record.caches = {
+                cache_name: cache_counts - cache_counts_before.get(cache_name, CacheCounts())
+                for cache_name, cache_counts in cls._get_cache_counts().items()
+            }
+            with cls._lock:
+                cls._records.append(record)
+
+    @classmethod
+    def get_records(cls) -> list[ProfileRecord]:
+        with cls._lock:
+            return list(cls._records)
+
+    @classmethod
+    def get_report(cls) -> dict:
+        """Get all records as a json serializable dict, in the order the measured blocks finished."""
+        return {
+            "records": [record.to_dict() for record in cls.get_records()],
+        }
@@ -1,9 +1,10 @@
+from bisect import bisect_right
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Self, TypeVar
 
-from libecalc.common.time_utils import Period, define_time_model_for_period
+from libecalc.common.time_utils import Period, Periods, define_time_model_for_period
 
 ModelType = TypeVar("ModelType")
 
@@ -84,6 +85,12 @@ class TemporalModel[ModelType]:
         if not (list(self._periods) == sorted(self._periods)):
             raise UnsortedKeys(keys=list(data.keys()))
 
+        # Sorted start dates, used to look up models by bisection
+        self._start_dates: list[datetime] = [period.start for period in self._periods]
+        self._has_overlapping_periods = any(
+            previous.end > current.start for previous, current in zip(self._periods[:-1], self._periods[1:])
+        )
+
     def get_models(self) -> Iterable[ModelType]:
         for model in self._models:
             yield model.model
@@ -100,12 +107,51 @@ class TemporalModel[ModelType]:
     def items(self) -> Iterator[tuple[Period, ModelType]]:
         return ((model.period, model.model) for model in self._models)
 
-    def get_model(self, period: Period | datetime) -> ModelType:
-        for model in self._models:
-            if period in model.period:
-                return model.model
+    def _get_model_index(self, period: Period | datetime, start_index: int = 0) -> int | None:
+        if self._has_overlapping_periods:
+            # Keep first match
+            return next((index for index, model in enumerate(self._models) if period in model.period), None)
+
+        start = period if isinstance(period, datetime) else period.start
+        # The model starting closest before (or at) the given start is the only candidate, since periods don't overlap
+        index = bisect_right(self._start_dates, start, lo=start_index) - 1
+        if index >= 0 and period in self._periods[index]:
+            return index
+        return None
 
-        raise ValueError(f"Model for timestep '{period}' not found in Temporal model")
+    def get_model(self, period: Period | datetime) -> ModelType:
+        index = self._get_model_index(period)
+        if index is None:
+            raise ValueError(f"Model for timestep '{period}' not found in Temporal model")
+        return self._models[index].model
+
+    def get_model_indices(self, periods: Periods) -> list[int | None]:
+        """Get the index of the model for each of the given periods, None if no model is defined for the period.
+
+        The periods are expected to be sorted, which allows finding all indices in a single pass.
+        """
+        indices: list[int | None] = []
+        start_index = 0
+        previous_start: datetime | None = None
+        for period in periods:
+            if previous_start is not None and period.start < previous_start:
+                start_index = 0  # Not sorted, search from the beginning
+            index = self._get_model_index(period, start_index=start_index)
+            indices.append(index)
+            if index is not None:
+                start_index = index
+            previous_start = period.start
+        return indices
+
+    def get_models_for_periods[DefaultType](
+        self, periods: Periods, default: DefaultType = None
+    ) -> list[ModelType | DefaultType]:
+        """Get the model for each of the given periods, default if no model is defined for the period.
+
+        Use a default that is not a model, e.g. a sentinel object, to tell periods without a model from models that
+        are None.
+        """
+        return [default if index is None else self._models[index].model for index in self.get_model_indices(periods)]
 
     @classmethod
     def create(cls, data: ModelType | dict[datetime, ModelType], target_period: Period) -> Self | None:
@@ -3,9 +3,11 @@ from __future__ import annotations
 import math
 from abc import ABC
 from collections import defaultdict
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
 from datetime import datetime
 from enum import StrEnum
+from functools import lru_cache
 from typing import Any, Self, TypeVar, Union
 
 import numpy as np
@@ -119,6 +121,144 @@ class Rates:
         return Rates.compute_cumulative(volumes)
 
 
+@dataclass(frozen=True)
+class Resampling:
+    """The mapping from a vector of periods to the periods at a given frequency.
+
+    The mapping only depends on the periods, not the values, and is computed once per unique vector of periods and
+    frequency (see get_resampling). Time series sharing the same periods are stacked as rows in a 2D array and resampled
+    with one array operation, see TimeSeries.resample_stacked.
+    """
+
+    new_periods: tuple[Period, ...]
+    """The periods at the given frequency."""
+
+    start_date_indices: NDArray[np.intp]
+    """For each new start date, the index of the original period starting at that date, -1 if there is none."""
+
+    date_indices: NDArray[np.intp]
+    """For each new date, the index of that date in the original dates (including the end date), -1 if not found."""
+
+    left_date_indices: NDArray[np.intp]
+    """For each new date, the index of the last original date before it, -1 if it is before the first date."""
+
+    left_date_offsets: NDArray[np.float64]
+    """For each new date, the time since the last original date before it."""
+
+    interval_lengths: NDArray[np.float64]
+    """For each new date, the time between the original dates surrounding it."""
+
+    period_start_indices: NDArray[np.intp]
+    """For each new period, the index of the first original period overlapping it."""
+
+    period_end_indices: NDArray[np.intp]
+    """For each new period, the index after the last original period overlapping it."""
+
+    includes_end_date: bool
+    """Whether the original end date is one of the new dates."""
+
+    @property
+    def periods(self) -> Periods:
+        """The periods at the given frequency, as a new Periods for each time series since the resampling is shared."""
+        return Periods(list(self.new_periods))
+
+    def forward_fill(self, values: NDArray) -> NDArray:
+        """Resample values using forward-fill, along the last axis. Also forward-fills nan values, as pandas does."""
+        values = np.asarray(values, dtype=np.float64)
+        is_matched = self.start_date_indices >= 0
+        resampled = np.where(is_matched, values[..., self.start_date_indices], np.nan)
+        positions = np.arange(resampled.shape[-1])
+        last_valid_positions = np.maximum.accumulate(np.where(np.isnan(resampled), -1, positions), axis=-1)
+        filled = np.take_along_axis(resampled, np.maximum(last_valid_positions, 0), axis=-1)
+        return np.where(last_valid_positions >= 0, filled, np.nan)
+
+    def interpolate(self, values: NDArray) -> NDArray:
+        """Resample values defined at each of the original dates by linear interpolation in time, along the last axis.
+
+        Returns the value at each of the new dates, using the same arithmetic as pandas' time interpolation
+        (numpy.interp), i.e. values are kept at the original dates and extrapolated as the last value after the end
+        date. The values must be finite.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        is_original_date = self.date_indices >= 0
+        is_after_end = self.left_date_indices == values.shape[-1] - 1
+        is_between = ~is_original_date & ~is_after_end & (self.left_date_indices >= 0)
+
+        resampled = np.full((*values.shape[:-1], len(self.date_indices)), np.nan)
+        resampled[..., is_original_date] = values[..., self.date_indices[is_original_date]]
+        resampled[..., is_after_end & ~is_original_date] = values[..., -1:]
+
+        left_indices = self.left_date_indices[is_between]
+        left_values = values[..., left_indices]
+        slopes = (values[..., left_indices + 1] - left_values) / self.interval_lengths[is_between]
+        resampled[..., is_between] = slopes * self.left_date_offsets[is_between] + left_values
+        return resampled
+
+    def all(self, values: NDArray[np.bool_]) -> NDArray[np.bool_]:
+        """For each new period, check if all the values of the original periods overlapping it are True, along the last
+        axis."""
+        values = np.asarray(values, dtype=np.bool_)
+        false_counts = np.cumsum(~values, axis=-1)
+        false_counts = np.concatenate(
+            (np.zeros((*values.shape[:-1], 1), dtype=false_counts.dtype), false_counts), axis=-1
+        )
+        return false_counts[..., self.period_end_indices] == false_counts[..., self.period_start_indices]
+
+
+@lru_cache(maxsize=128)
+def _get_resampling(
+    periods: tuple[Period, ...], freq: Frequency, include_start_date: bool, include_end_date: bool
+) -> Resampling:
+    original_periods = Periods(list(periods))
+    new_periods = resample_periods(
+        original_periods, frequency=freq, include_start_date=include_start_date, include_end_date=include_end_date
+    )
+
+    # Dates as used by pandas, i.e. microseconds since epoch, converted to float as in numpy.interp
+    original_dates = pd.DatetimeIndex(original_periods.all_dates).asi8
+    new_dates = pd.DatetimeIndex(new_periods.all_dates).asi8
+    original_start_dates = original_dates[:-1]
+    new_start_dates = new_dates[:-1]
+    new_end_dates = new_dates[1:]
+
+    def get_exact_indices(dates: NDArray[np.int64], candidates: NDArray[np.int64]) -> NDArray[np.intp]:
+        indices = np.searchsorted(dates, candidates, side="left")
+        is_found = indices < len(dates)
+        is_found[is_found] = dates[indices[is_found]] == candidates[is_found]
+        return np.where(is_found, indices, -1)
+
+    left_date_indices = np.searchsorted(original_dates, new_dates, side="right") - 1
+    right_date_indices = np.minimum(left_date_indices + 1, len(original_dates) - 1)
+    original_dates_as_float = original_dates.astype(np.float64)
+    safe_left_date_indices = np.maximum(left_date_indices, 0)
+
+    # Python slicing of the period values, as in values[start_index : end_index + 1], where start_index is the last date
+    # at or before the new period start, and end_index is the last date before the new period end.
+    period_start_indices = np.searchsorted(original_dates, new_start_dates, side="right") - 1
+    period_end_indices = np.searchsorted(original_dates, new_end_dates, side="left")
+    period_start_indices = np.clip(period_start_indices, 0, len(periods))
+    period_end_indices = np.clip(period_end_indices, period_start_indices, len(periods))
+
+    return Resampling(
+        new_periods=tuple(new_periods.periods),
+        start_date_indices=get_exact_indices(original_start_dates, new_start_dates),
+        date_indices=get_exact_indices(original_dates, new_dates),
+        left_date_indices=left_date_indices,
+        left_date_offsets=new_dates.astype(np.float64) - original_dates_as_float[safe_left_date_indices],
+        interval_lengths=original_dates_as_float[right_date_indices] - original_dates_as_float[safe_left_date_indices],
+        period_start_indices=period_start_indices,
+        period_end_indices=period_end_indices,
+        includes_end_date=bool(np.isin(original_dates[-1], new_dates)),
+    )
+
+
+def get_resampling(
+    periods: Periods, freq: Frequency, include_start_date: bool = True, include_end_date: bool = True
+) -> Resampling:
+    """Get the mapping from the given periods to the periods at the given frequency, cached per unique periods."""
+    return _get_resampling(tuple(periods.periods), freq, include_start_date, include_end_date)
+
+
 class TimeSeries[TimeSeriesValue](BaseModel, ABC):
     periods: Periods
     values: list[TimeSeriesValue]
@@ -191,21 +331,61 @@ class TimeSeries[TimeSeriesValue](BaseModel, ABC):
         Returns:
             TimeSeries resampled to the given frequency
         """
-        if freq is Frequency.NONE:
-            return self.model_copy()
+        return self.resample_stacked(
+            [self], freq=freq, include_start_date=include_start_date, include_end_date=include_end_date
+        )[0]
 
-        ds = pd.Series(index=self.start_dates, data=self.values)
-        new_periods = resample_periods(
-            self.periods, frequency=freq, include_start_date=include_start_date, include_end_date=include_end_date
-        )
-        new_time_steps = new_periods.start_dates
-        ds_resampled = ds.reindex(new_time_steps).ffill()
+    @classmethod
+    def resample_stacked(
+        cls,
+        time_series: Sequence[Self],
+        freq: Frequency,
+        include_start_date: bool = True,
+        include_end_date: bool = True,
+    ) -> list[Self]:
+        """
+        Resample time series with the same periods as resample does one by one, with the values stacked as rows in a
+        2D array so that the resampling is applied once for all of them.
 
-        return self.__class__(
-            periods=new_periods,
-            values=ds_resampled.values.tolist(),
-            unit=self.unit,
+        Args:
+            time_series: The time series to resample, all with the same periods
+            freq: The frequency the time series should be resampled to
+            include_start_date: Whether to include the start date if it is not part of the requested reporting frequency
+            include_end_date: Whether to include the end date if it is not part of the requested reporting frequency
+
+        Returns:
+            The time series resampled to the given frequency, in the given order
+        """
+        if freq is Frequency.NONE:
+            return [item.model_copy() for item in time_series]
+        if len(time_series) == 0:
+            return []
+
+        resampling = get_resampling(
+            time_series[0].periods, freq=freq, include_start_date=include_start_date, include_end_date=include_end_date
         )
+        values = [np.asarray(item.values) for item in time_series]
+        resampled_values: list[list] = [[] for _ in time_series]
+
+        float_indices = [index for index, item_values in enumerate(values) if item_values.dtype.kind == "f"]
+        if float_indices:
+            stacked = resampling.forward_fill(np.stack([values[index] for index in float_indices]))
+            for index, row in zip(float_indices, stacked):
+                resampled_values[index] = row.tolist()
+
+        for index, item in enumerate(time_series):
+            if values[index].dtype.kind != "f":
+                ds = pd.Series(index=item.start_dates, data=item.values)
+                resampled_values[index] = ds.reindex(resampling.periods.start_dates).ffill().values.tolist()
+
+        return [
+            item.__class__(
+                periods=resampling.periods,
+                values=item_values,
+                unit=item.unit,
+            )
+            for item, item_values in zip(time_series, resampled_values)
+        ]
 
     def extend(self, other: TimeSeries) -> Self:
         """Extend the time series with another time series.
@@ -433,25 +613,35 @@ class TimeSeriesBoolean(TimeSeries[bool]):
         Returns:
             TimeSeriesBoolean resampled to the given frequency
         """
-        if freq is Frequency.NONE:
-            return self.model_copy()
-
-        new_periods = resample_periods(
-            self.periods, frequency=freq, include_start_date=include_start_date, include_end_date=include_end_date
-        )
-        resampled = []
+        return self.resample_stacked(
+            [self], freq=freq, include_start_date=include_start_date, include_end_date=include_end_date
+        )[0]
 
-        # Iterate over all pairs of subsequent dates in the new time vector
-        for period in new_periods:
-            start_index = self.all_dates.index(max([date for date in self.all_dates if date <= period.start]))
-            end_index = self.all_dates.index(max([date for date in self.all_dates if date < period.end]))
-            resampled.append(all(self.values[start_index : end_index + 1]))
+    @classmethod
+    def resample_stacked(
+        cls,
+        time_series: Sequence[Self],
+        freq: Frequency,
+        include_start_date: bool = True,
+        include_end_date: bool = True,
+    ) -> list[Self]:
+        if freq is Frequency.NONE:
+            return [item.model_copy() for item in time_series]
+        if len(time_series) == 0:
+            return []
 
-        return TimeSeriesBoolean(
-            periods=new_periods,
-            values=resampled,
-            unit=self.unit,
+        resampling = get_resampling(
+            time_series[0].periods, freq=freq, include_start_date=include_start_date, include_end_date=include_end_date
         )
+        resampled_values = resampling.all([item.values for item in time_series])
+        return [
+            TimeSeriesBoolean(
+                periods=resampling.periods,
+                values=item_values.tolist(),
+                unit=item.unit,
+            )
+            for item, item_values in zip(time_series, resampled_values)
+        ]
 
     def __mul__(self, other: object) -> Self:
         if not isinstance(other, TimeSeriesBoolean):
@@ -507,36 +697,60 @@ class TimeSeriesVolumesCumulative(TimeSeries[float]):
         Returns:
             TimeSeriesVolumesCumulative resampled to the given frequency or given Periods
         """
+        return self.resample_stacked(
+            [self], freq=freq, include_start_date=include_start_date, include_end_date=include_end_date
+        )[0]
+
+    @classmethod
+    def resample_stacked(
+        cls,
+        time_series: Sequence[TimeSeriesVolumesCumulative],
+        freq: Frequency,
+        include_start_date: bool = True,
+        include_end_date: bool = True,
+    ) -> list[TimeSeriesVolumesCumulative]:
         if freq is Frequency.NONE:
-            return self.model_copy()
+            return [item.model_copy() for item in time_series]
+        if len(time_series) == 0:
+            return []
 
-        ds = pd.Series(index=self.all_dates, data=[0] + self.values)  # cumulative volume always zero at start date
-        new_periods = resample_periods(
-            self.periods, frequency=freq, include_start_date=include_start_date, include_end_date=include_end_date
+        resampling = get_resampling(
+            time_series[0].periods, freq=freq, include_start_date=include_start_date, include_end_date=include_end_date
         )
-        new_dates = new_periods.all_dates
-        if ds.index[-1] not in new_dates:
+        if not resampling.includes_end_date:
             logger.warning(
-                f"The final date in the rate input ({ds.index[-1].strftime('%m/%d/%Y')}) does not "
+                f"The final date in the rate input ({time_series[0].last_date.strftime('%m/%d/%Y')}) does not "
                 f"correspond to the end of a period with the requested output frequency. There is a "
                 f"possibility that the resampling will drop volumes."
             )
-        ds_interpolated = ds.reindex(ds.index.union(new_dates)).interpolate("time")
 
-        # New resampled pd.Series
-        resampled: list[float] = ds_interpolated.reindex(new_dates).values.tolist()
+        # cumulative volume always zero at start date
+        values = np.asarray([[0] + item.values for item in time_series], dtype=np.float64)
+        is_finite = np.all(np.isfinite(values), axis=-1)
+        resampled = np.empty((len(time_series), len(resampling.new_periods) + 1))
+        resampled[is_finite] = resampling.interpolate(values[is_finite])
+        if not np.all(is_finite):
+            # Interpolate across the missing values
+            dates = time_series[0].all_dates
+            new_dates = resampling.periods.all_dates
+            for index in np.flatnonzero(~is_finite):
+                ds = pd.Series(index=dates, data=values[index])
+                resampled[index] = ds.reindex(ds.index.union(new_dates)).interpolate("time").reindex(new_dates).values
 
         if not include_start_date:
-            dropped_cumulative_volume = resampled[0]
-            resampled = [value - dropped_cumulative_volume for value in resampled[1:]]
+            # Subtract the dropped cumulative volume
+            resampled = resampled[:, 1:] - resampled[:, :1]
         else:
-            resampled = resampled[1:]
+            resampled = resampled[:, 1:]
 
-        return TimeSeriesVolumesCumulative(
-            periods=new_periods,
-            values=resampled,
-            unit=self.unit,
-        )
+        return [
+            TimeSeriesVolumesCumulative(
+                periods=resampling.periods,
+                values=item_values.tolist(),
+                unit=item.unit,
+            )
+            for item, item_values in zip(time_series, resampled)
+        ]
 
     def __truediv__(self, other: object) -> TimeSeriesCalendarDayRate:
         if not isinstance(other, TimeSeriesVolumesCumulative):
@@ -600,7 +814,22 @@ class TimeSeriesVolumes(TimeSeries[float]):
         Returns:
             TimeSeriesVolumes: The resampled time series as period volumes.
         """
-        return self.cumulative().resample(freq, include_start_date, include_end_date).to_volumes()
+        return self.resample_stacked([self], freq, include_start_date, include_end_date)[0]
+
+    @classmethod
+    def resample_stacked(
+        cls,
+        time_series: Sequence[TimeSeriesVolumes],
+        freq: Frequency,
+        include_start_date: bool = True,
+        include_end_date: bool = True,
+    ) -> list[TimeSeriesVolumes]:
+        return [
+            cumulative.to_volumes()
+            for cumulative in TimeSeriesVolumesCumulative.resample_stacked(
+                [item.cumulative() for item in time_series], freq, include_start_date, include_end_date
+            )
+        ]
 
     def cumulative(self) -> TimeSeriesVolumesCumulative:
         """
@@ -747,41 +976,69 @@ class TimeSeriesRate(TimeSeries[float]):
         return regularity
 
     def __add__(self, other: TimeSeriesRate) -> TimeSeriesRate:
-        # Check for same unit
-        if not self.unit == other.unit:
-            raise ValueError(f"Mismatching units: '{self.unit}' != `{other.unit}`")
+        return TimeSeriesRate.sum([self, other])
 
-        if not self.rate_type == other.rate_type:
-            raise ValueError(
-                "Mismatching rate type. Currently you can not add stream day rates and calendar day rates."
-            )
+    @staticmethod
+    def sum(rates: Sequence[TimeSeriesRate]) -> TimeSeriesRate:
+        """Sum the rates, the same as adding them one by one, i.e. rates[0] + rates[1] + ..., but without creating
+        the intermediate time series.
 
-        if isinstance(other, TimeSeriesRate):
-            if self.regularity == other.regularity:
-                # Adding TimeSeriesRate with same regularity -> New TimeSeriesRate with same regularity
-                return self.__class__(
-                    periods=self.periods,
-                    values=elementwise_sum(self.values, other.values).tolist(),
-                    unit=self.unit,
-                    regularity=self.regularity,
-                    rate_type=self.rate_type,
+        Adding rates with the same regularity keeps the regularity, otherwise the regularity is recalculated from the
+        summed calendar day and stream day rates.
+
+        Args:
+            rates: The rates to sum, at least one
+
+        Returns:
+            The sum of the rates
+        """
+        first, *others = rates
+        if len(others) == 0:
+            return first
+
+        time_series_type: type[TimeSeriesRate] = first.__class__
+        values: list[float] | NDArray[np.float64] = first.values
+        regularity = first.regularity
+        for other in others:
+            # Check for same unit
+            if not first.unit == other.unit:
+                raise ValueError(f"Mismatching units: '{first.unit}' != `{other.unit}`")
+
+            if not first.rate_type == other.rate_type:
+                raise ValueError(
+                    "Mismatching rate type. Currently you can not add stream day rates and calendar day rates."
                 )
-            else:
-                # Adding two TimeSeriesRate with different regularity -> New TimeSeriesRate with new regularity
-                sum_calendar_day = elementwise_sum(self.to_calendar_day().values, other.to_calendar_day().values)
-                sum_stream_day = elementwise_sum(self.to_stream_day().values, other.to_stream_day().values)
 
-                return TimeSeriesRate(
-                    periods=self.periods,
-                    values=elementwise_sum(self.values, other.values).tolist(),
-                    unit=self.unit,
-                    regularity=(sum_calendar_day / sum_stream_day).tolist(),
-                    rate_type=self.rate_type,
+            if not isinstance(other, TimeSeriesRate):
+                raise TypeError(
+                    f"TimeSeriesRate can only be added to another TimeSeriesRate. Received type '{str(other.__class__)}'."
                 )
-        else:
-            raise TypeError(
-                f"TimeSeriesRate can only be added to another TimeSeriesRate. Received type '{str(other.__class__)}'."
-            )
+
+            if regularity == other.regularity:
+                # Adding TimeSeriesRate with same regularity -> New TimeSeriesRate with same regularity
+                values = elementwise_sum(values, other.values)
+            else:
+                # Adding two TimeSeriesRate with different regularity -> New TimeSeriesRate with new regularity
+                if first.rate_type == RateType.CALENDAR_DAY:
+                    calendar_day_values = values
+                    stream_day_values = Rates.to_stream_day(np.asarray(values, dtype=np.float64), regularity)
+                else:
+                    calendar_day_values = Rates.to_calendar_day(values, regularity)
+                    stream_day_values = values
+                sum_calendar_day = elementwise_sum(calendar_day_values, other.to_calendar_day().values)
+                sum_stream_day = elementwise_sum(stream_day_values, other.to_stream_day().values)
+
+                time_series_type = TimeSeriesRate
+                values = elementwise_sum(values, other.values)
+                regularity = (sum_calendar_day / sum_stream_day).tolist()
+
+        return time_series_type(
+            periods=first.periods,
+            values=np.asarray(values).tolist(),
+            unit=first.unit,
+            regularity=regularity,
+            rate_type=first.rate_type,
+        )
 
     def extend(self, other: TimeSeries) -> Self:
         if not isinstance(other, TimeSeriesRate):
@@ -940,49 +1197,60 @@ class TimeSeriesRate(TimeSeries[float]):
         Returns:
             TimeSeriesRate resampled to the given frequency
         """
+        return self.resample_stacked(
+            [self], freq=freq, include_start_date=include_start_date, include_end_date=include_end_date
+        )[0]
+
+    @classmethod
+    def resample_stacked(
+        cls,
+        time_series: Sequence[TimeSeriesRate],
+        freq: Frequency,
+        include_start_date: bool = True,
+        include_end_date: bool = True,
+    ) -> list[TimeSeriesRate]:
         if freq is Frequency.NONE:
-            return self.model_copy()
+            return [item.model_copy() for item in time_series]
 
-        # make resampled calendar day volumes via cumulative calendar day volumes
-        calendar_day_volumes = (
+        # make resampled calendar day volumes and stream day volumes via cumulative volumes, all resampled at once
+        calendar_day_rates = [item.to_calendar_day() for item in time_series]
+        stream_day_rates = [item.to_stream_day() for item in time_series]
+        cumulative_volumes = [
             TimeSeriesVolumesCumulative(
                 values=Rates.compute_cumulative_volumes_from_daily_rates(
-                    rates=self.to_calendar_day().values,
-                    periods=self.periods,
+                    rates=rates.values,
+                    periods=rates.periods,
                 ).tolist(),
-                periods=self.periods,
-                unit=self.to_volumes().unit,
+                periods=rates.periods,
+                unit=rates.unit.rate_to_volume(),
             )
-            .resample(freq=freq, include_start_date=include_start_date, include_end_date=include_end_date)
-            .to_volumes()
-        )
-        # make resampled stream day volumes via cumulative "stream-day-volumes"
-        stream_day_volumes = (
-            TimeSeriesVolumesCumulative(
-                values=Rates.compute_cumulative_volumes_from_daily_rates(
-                    rates=self.to_stream_day().values,
-                    periods=self.periods,
-                ).tolist(),
-                periods=self.periods,
-                unit=self.to_volumes().unit,
+            for rates in [*calendar_day_rates, *stream_day_rates]
+        ]
+        volumes = [
+            cumulative.to_volumes()
+            for cumulative in TimeSeriesVolumesCumulative.resample_stacked(
+                cumulative_volumes, freq=freq, include_start_date=include_start_date, include_end_date=include_end_date
             )
-            .resample(freq=freq, include_start_date=include_start_date, include_end_date=include_end_date)
-            .to_volumes()
-        )
-
-        # the ratio between calendar day and stream day volumes for a period gives the regularity for that period
-        new_regularity = [
-            float(cal_day) / float(stream_day) if stream_day != 0.0 else 0.0
-            for cal_day, stream_day in zip(calendar_day_volumes.values, stream_day_volumes.values)
         ]
 
-        # go from period volumes to average rate in period (regularity assumed to be 1 if not provided)
-        new_time_series = calendar_day_volumes.to_rate(regularity=new_regularity)
+        resampled = []
+        for item, calendar_day_volumes, stream_day_volumes in zip(
+            time_series, volumes[: len(time_series)], volumes[len(time_series) :]
+        ):
+            # the ratio between calendar day and stream day volumes for a period gives the regularity for that period
+            new_regularity = [
+                float(cal_day) / float(stream_day) if stream_day != 0.0 else 0.0
+                for cal_day, stream_day in zip(calendar_day_volumes.values, stream_day_volumes.values)
+            ]
 
-        if self.rate_type == RateType.CALENDAR_DAY:
-            return new_time_series
-        else:
-            return new_time_series.to_stream_day()
+            # go from period volumes to average rate in period (regularity assumed to be 1 if not provided)
+            new_time_series = calendar_day_volumes.to_rate(regularity=new_regularity)
+
+            if item.rate_type == RateType.CALENDAR_DAY:
+                resampled.append(new_time_series)
+            else:
+                resampled.append(new_time_series.to_stream_day())
+        return resampled
 
     def __getitem__(self, indices: slice | int | list[int] | NDArray[np.float64]) -> TimeSeriesRate:
         if isinstance(indices, slice):
@@ -2,6 +2,7 @@ import abc
 from uuid import UUID
 
 import numpy as np
+from numpy.typing import NDArray
 
 from libecalc.common.component_type import ComponentType
 from libecalc.common.time_utils import Periods
@@ -21,6 +22,44 @@ class VentingType:
     OIL_VOLUME = "OIL_VOLUME"
 
 
+def _to_stream_day_values(
+    rates: NDArray[np.float64], rate_types: list[RateType], regularity: list[float]
+) -> NDArray[np.float64]:
+    """
+    Converts the rows of rates given in calendar day rates to stream day rates, using the regularity of the emitter.
+
+    Args:
+        rates: The rates with one row per rate, and one column per period
+        rate_types: The rate type of each row
+        regularity: The regularity of each period
+
+    Returns:
+        The stream day rates. Calendar day rates are set to zero where the regularity is zero.
+    """
+    is_calendar_day = np.asarray([rate_type == RateType.CALENDAR_DAY for rate_type in rate_types], dtype=bool)
+    if not is_calendar_day.any():
+        return rates
+
+    stream_day_rates = np.array(rates, dtype=np.float64)
+    stream_day_rates[is_calendar_day] = Rates.to_stream_day(
+        calendar_day_rates=stream_day_rates[is_calendar_day],
+        regularity=regularity,
+    )
+    return stream_day_rates
+
+
+def _to_tons_per_day(rates: NDArray[np.float64], units: list[Unit]) -> NDArray[np.float64]:
+    """
+    Converts the rows of rates to tons per day, converting all rows given in the same unit at once.
+    """
+    tons_per_day = np.array(rates, dtype=np.float64)
+    units_array = np.asarray(units, dtype=object)
+    for unit in dict.fromkeys(units):
+        rows = units_array == unit
+        tons_per_day[rows] = unit.to(Unit.TONS_PER_DAY)(tons_per_day[rows])
+    return tons_per_day
+
+
 # Direct emitter classes
 class EmissionRate:
     def __init__(
@@ -30,34 +69,24 @@ class EmissionRate:
         self.unit = unit
         self.rate_type = rate_type
         self._regularity = regularity
-        self._rate_values = self._get_stream_day_values()
+        self._values = np.asarray(self._time_series_expression.get_masked_values(), dtype=np.float64)
 
-    def _get_stream_day_values(self) -> list[float]:
+    def get_values(self) -> NDArray[np.float64]:
         """
-        Returns the stream day emission rate values.
-
-        The values are calculated by converting calendar day rates to stream day rates
-        using the specified regularity, and then applying the given condition expression.
+        Returns the emission rate values with the condition applied, given in the rate type of the rate.
         """
-
-        # if regularity is 0 for a calendar day rate, set stream day rate to 0 for that step
-        rate = self._time_series_expression.get_masked_values()
-        rate_array = np.asarray(rate, dtype=np.float64)
-
-        if self.rate_type == RateType.CALENDAR_DAY:
-            rate_array = Rates.to_stream_day(
-                calendar_day_rates=rate_array,
-                regularity=self._regularity.values,
-            )
-
-        return rate_array.tolist()
+        return self._values
 
     def get_stream_day_values(self) -> list[float]:
         """
         Returns the emission rate values as a list in stream day units.
 
         """
-        return self._rate_values
+        return _to_stream_day_values(
+            rates=self._values[np.newaxis, :],
+            rate_types=[self.rate_type],
+            regularity=self._regularity.values,
+        )[0].tolist()
 
     def get_periods(self) -> Periods:
         return self._time_series_expression.expression_evaluator.get_periods()
@@ -78,34 +107,24 @@ class OilVolumeRate:
         self.unit = unit
         self.rate_type = rate_type
         self._regularity = regularity
-        self._rate_values = self._get_stream_day_values()
+        self._values = np.asarray(self._time_series_expression.get_masked_values(), dtype=np.float64)
 
-    def _get_stream_day_values(self) -> list[float]:
+    def get_values(self) -> NDArray[np.float64]:
         """
-        Returns the stream day oil volume rate values.
-
-        The values are calculated by converting calendar day rates to stream day rates
-        using the specified regularity, and then applying the given condition expression.
+        Returns the oil volume rate values with the condition applied, given in the rate type of the rate.
         """
-
-        # if regularity is 0 for a calendar day rate, set stream day rate to 0 for that step
-        rate = self._time_series_expression.get_masked_values()
-        rate_array = np.asarray(rate, dtype=np.float64)
-
-        if self.rate_type == RateType.CALENDAR_DAY:
-            rate_array = Rates.to_stream_day(
-                calendar_day_rates=rate_array,
-                regularity=self._regularity.values,
-            )
-
-        return rate_array.tolist()
+        return self._values
 
     def get_stream_day_values(self) -> list[float]:
         """
         Returns the oil volume rate values as a list in stream day units.
 
         """
-        return self._rate_values
+        return _to_stream_day_values(
+            rates=self._values[np.newaxis, :],
+            rate_types=[self.rate_type],
+            regularity=self._regularity.values,
+        )[0].tolist()
 
     def get_periods(self) -> Periods:
         return self._time_series_expression.expression_evaluator.get_periods()
@@ -177,17 +196,28 @@ class DirectVentingEmitter(VentingEmitter):
         self.emitter_type = VentingType.DIRECT_EMISSION
 
     def _get_emissions(self) -> dict[str, TimeSeriesStreamDayRate]:
-        emissions = {}
-        for emission in self.emissions:
-            emission_rate = emission.emission_rate.get_stream_day_values()
-            unit = emission.emission_rate.unit
-            emission_rate = unit.to(Unit.TONS_PER_DAY)(emission_rate)
-            emissions[emission.name] = TimeSeriesStreamDayRate(
+        if not self.emissions:
+            return {}
+
+        emission_rates = [emission.emission_rate for emission in self.emissions]
+        # One row per emission, one column per period
+        stream_day_rates = _to_stream_day_values(
+            rates=np.stack([emission_rate.get_values() for emission_rate in emission_rates]),
+            rate_types=[emission_rate.rate_type for emission_rate in emission_rates],
+            regularity=self.regularity.values,
+        )
+        tons_per_day = _to_tons_per_day(
+            rates=stream_day_rates,
+            units=[emission_rate.unit for emission_rate in emission_rates],
+        )
+        return {
+            emission.name: TimeSeriesStreamDayRate(
                 periods=emission.emission_rate.get_periods(),
-                values=emission_rate,
+                values=values,
                 unit=Unit.TONS_PER_DAY,
             )
-        return emissions
+            for emission, values in zip(self.emissions, tons_per_day.tolist(), strict=True)
+        }
 
 
 class OilVentingEmitter(VentingEmitter, StorageContainer):
@@ -197,29 +227,42 @@ class OilVentingEmitter(VentingEmitter, StorageContainer):
         self.emitter_type = VentingType.OIL_VOLUME
 
     def _get_emissions(self) -> dict[str, TimeSeriesStreamDayRate]:
-        oil_rates = self.get_oil_rates()
-
-        emissions = {}
-        for emission in self.volume.emissions:
-            factors = self.volume.oil_volume_rate._time_series_expression.expression_evaluator.evaluate(
-                Expression.setup_from_expression(value=emission.emission_factor)
-            )
-
-            emission_rate = [oil_rate * factor for oil_rate, factor in zip(oil_rates, factors)]
-            emission_rate = Unit.KILO_PER_DAY.to(Unit.TONS_PER_DAY)(emission_rate)
-            emissions[emission.name] = TimeSeriesStreamDayRate(
-                periods=self.volume.oil_volume_rate.get_periods(),
-                values=emission_rate,
+        if not self.volume.emissions:
+            return {}
+
+        expression_evaluator = self.volume.oil_volume_rate._time_series_expression.expression_evaluator
+        # One row per emission, one column per period
+        emission_factors = np.stack(
+            [
+                np.asarray(
+                    expression_evaluator.evaluate(Expression.setup_from_expression(value=emission.emission_factor)),
+                    dtype=np.float64,
+                )
+                for emission in self.volume.emissions
+            ]
+        )
+        emission_rates = Unit.KILO_PER_DAY.to(Unit.TONS_PER_DAY)(emission_factors * self._get_oil_rates())
+        periods = self.volume.oil_volume_rate.get_periods()
+        return {
+            emission.name: TimeSeriesStreamDayRate(
+                periods=periods,
+                values=values,
                 unit=Unit.TONS_PER_DAY,
             )
-        return emissions
+            for emission, values in zip(self.volume.emissions, emission_rates.tolist(), strict=True)
+        }
 
-    def get_oil_rates(self) -> list[float]:
-        oil_rates = self.volume.oil_volume_rate.get_stream_day_values()
-        unit = self.volume.oil_volume_rate.unit
-        oil_rates = unit.to(Unit.STANDARD_CUBIC_METER_PER_DAY)(oil_rates)
+    def _get_oil_rates(self) -> NDArray[np.float64]:
+        oil_volume_rate = self.volume.oil_volume_rate
+        stream_day_rates = _to_stream_day_values(
+            rates=oil_volume_rate.get_values()[np.newaxis, :],
+            rate_types=[oil_volume_rate.rate_type],
+            regularity=self.regularity.values,
+        )[0]
+        return oil_volume_rate.unit.to(Unit.STANDARD_CUBIC_METER_PER_DAY)(stream_day_rates)
 
-        return oil_rates
+    def get_oil_rates(self) -> list[float]:
+        return np.asarray(self._get_oil_rates(), dtype=np.float64).tolist()
 
     def get_storage_rates(self) -> TimeSeriesRate:
         return TimeSeriesRate(
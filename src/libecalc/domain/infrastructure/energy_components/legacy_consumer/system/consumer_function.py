@@ -1,10 +1,12 @@
 import abc
+from dataclasses import dataclass
 
 import numpy as np
 from numpy.typing import NDArray
 
 from libecalc.common.errors.ecalc_validation_error import EcalcValidationException
 from libecalc.common.logger import logger
+from libecalc.common.parallel_evaluation import ParallelEvaluationConfig, ParallelEvaluationMode, ParallelEvaluator
 from libecalc.domain.infrastructure.energy_components.legacy_consumer.consumer_function import ConsumerFunction
 from libecalc.domain.infrastructure.energy_components.legacy_consumer.system.operational_setting import (
     ConsumerSystemOperationalSettingExpressions,
@@ -43,6 +45,47 @@ class SystemComponent(abc.ABC):
         fluid_density: NDArray[np.float64] = None,
     ) -> EnergyFunctionResult: ...
 
+    @property
+    def is_thread_safe(self) -> bool:
+        """Whether the component can be evaluated concurrently with other components in threads."""
+        return False
+
+
+@dataclass(frozen=True)
+class SystemComponentEvaluationInput:
+    rate: NDArray[np.float64]
+    suction_pressure: NDArray[np.float64]
+    discharge_pressure: NDArray[np.float64]
+    fluid_density: NDArray[np.float64] | float | None
+
+
+@dataclass(frozen=True)
+class SystemComponentEvaluationTask:
+    """Evaluate the given components, each for all its inputs (one input per operational setting)."""
+
+    consumer_indices: list[int]
+    consumers: list[SystemComponent]
+    evaluation_inputs: list[list[SystemComponentEvaluationInput]]
+
+
+def evaluate_system_components(task: SystemComponentEvaluationTask) -> list[list[EnergyFunctionResult]]:
+    """Evaluate a task, giving the results per component per operational setting.
+
+    Module level function to be picklable when evaluated in a worker process.
+    """
+    return [
+        [
+            consumer.evaluate(
+                rate=evaluation_input.rate,
+                suction_pressure=evaluation_input.suction_pressure,
+                discharge_pressure=evaluation_input.discharge_pressure,
+                fluid_density=evaluation_input.fluid_density,
+            )
+            for evaluation_input in evaluation_inputs
+        ]
+        for consumer, evaluation_inputs in zip(task.consumers, task.evaluation_inputs, strict=True)
+    ]
+
 
 class ConsumerSystemConsumerFunction(ConsumerFunction):
     def __init__(
@@ -50,14 +93,19 @@ class ConsumerSystemConsumerFunction(ConsumerFunction):
         consumer_components: list[SystemComponent],
         operational_settings_expressions: list[ConsumerSystemOperationalSettingExpressions],
         power_loss_factor: TimeSeriesPowerLossFactor | None,
+        parallel_evaluation: ParallelEvaluationConfig | None = None,
     ):
         """operational_settings_expressions, condition_expression and power_loss_factor_expression
         defines one expression per time-step.
         NOTE: Only used for pumps, therefore explicit use of fluid density in operational settings.
+
+        parallel_evaluation decides how the operational settings are evaluated, defaults to the configuration
+        given to ParallelEvaluator.
         """
         self.consumers = consumer_components
         self._operational_settings_expressions = operational_settings_expressions
         self.power_loss_factor = power_loss_factor
+        self._parallel_evaluation = parallel_evaluation
         self.validate()
 
     def validate(self):
@@ -103,19 +151,13 @@ class ConsumerSystemConsumerFunction(ConsumerFunction):
                     operational_setting=operational_setting,
                 )
 
-        consumer_system_operational_settings_results = []
-        for i, operational_setting in enumerate(self.operational_settings):
-            logger.debug(f"Evaluating operational setting #{i}")
+        consumer_results_per_setting = self._evaluate_operational_settings()
 
+        consumer_system_operational_settings_results = []
+        for i in range(len(self.operational_settings)):
             consumer_results: dict[str, EnergyFunctionResult] = {}
             for consumer_index, consumer in enumerate(self.consumers):
-                consumer_result: EnergyFunctionResult = consumer.evaluate(
-                    rate=operational_setting.get_rate_after_crossover(consumer_index),
-                    suction_pressure=operational_setting.get_suction_pressure(consumer_index),
-                    discharge_pressure=operational_setting.get_discharge_pressure(consumer_index),
-                    fluid_density=operational_setting.get_fluid_density(consumer_index),
-                )
-                consumer_results[consumer.name] = consumer_result
+                consumer_results[consumer.name] = consumer_results_per_setting[consumer_index][i]
 
             consumer_system_operational_settings_results.append(
                 ConsumerSystemOperationalSettingResult(
@@ -190,6 +232,58 @@ class ConsumerSystemConsumerFunction(ConsumerFunction):
             power_loss_factor=self.power_loss_factor,
         )
 
+    def _evaluate_operational_settings(self) -> list[list[EnergyFunctionResult]]:
+        """Evaluate all consumers for all operational settings, giving the results per consumer per setting.
+
+        All settings are evaluated, so the evaluations are independent and can run concurrently. A task evaluates
+        one or more consumers for all settings, so a (stateful) consumer model is never used by two workers at once.
+        In THREADS mode all consumers that are not thread-safe (i.e. using NeqSim) are evaluated in the same task.
+        """
+        config = self._parallel_evaluation or ParallelEvaluator.get_config()
+
+        evaluation_inputs = [
+            [
+                SystemComponentEvaluationInput(
+                    rate=operational_setting.get_rate_after_crossover(consumer_index),
+                    suction_pressure=operational_setting.get_suction_pressure(consumer_index),
+                    discharge_pressure=operational_setting.get_discharge_pressure(consumer_index),
+                    fluid_density=operational_setting.get_fluid_density(consumer_index),
+                )
+                for operational_setting in self.operational_settings
+            ]
+            for consumer_index in range(len(self.consumers))
+        ]
+
+        if not config.is_concurrent:
+            task_consumer_indices = [list(range(len(self.consumers)))]
+        elif config.mode == ParallelEvaluationMode.THREADS:
+            thread_unsafe_indices = [index for index, c in enumerate(self.consumers) if not c.is_thread_safe]
+            task_consumer_indices = [[index] for index, c in enumerate(self.consumers) if c.is_thread_safe]
+            if thread_unsafe_indices:
+                task_consumer_indices.append(thread_unsafe_indices)
+        else:
+            task_consumer_indices = [[index] for index in range(len(self.consumers))]
+
+        tasks = [
+            SystemComponentEvaluationTask(
+                consumer_indices=consumer_indices,
+                consumers=[self.consumers[index] for index in consumer_indices],
+                evaluation_inputs=[evaluation_inputs[index] for index in consumer_indices],
+            )
+            for consumer_indices in task_consumer_indices
+        ]
+        logger.debug(
+            f"Evaluating {len(self.operational_settings)} operational settings for {len(self.consumers)} consumers "
+            f"in {len(tasks)} task(s), mode {config.mode}"
+        )
+        task_results = ParallelEvaluator.map(evaluate_system_components, tasks, config=config)
+
+        consumer_results_per_setting: list[list[EnergyFunctionResult]] = [[] for _ in self.consumers]
+        for task, results in zip(tasks, task_results, strict=True):
+            for consumer_index, consumer_results in zip(task.consumer_indices, results, strict=True):
+                consumer_results_per_setting[consumer_index] = consumer_results
+        return consumer_results_per_setting
+
     def calculate_operational_settings_after_cross_over(
         self,
         operational_setting: ConsumerSystemOperationalSettingExpressions,
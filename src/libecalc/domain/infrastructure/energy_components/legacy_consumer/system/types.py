@@ -27,6 +27,11 @@ class ConsumerSystemComponent(SystemComponent):
     def name(self) -> str:
         return self._name
 
+    @property
+    def is_thread_safe(self) -> bool:
+        # Models with a fluid model use NeqSim, which is not thread-safe
+        return self._fluid_model is None
+
     def get_max_standard_rate(
         self,
         suction_pressure: NDArray[np.float64],
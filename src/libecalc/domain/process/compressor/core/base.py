@@ -1,13 +1,11 @@
 from __future__ import annotations
 
-from functools import partial
-
 import numpy as np
 from numpy.typing import NDArray
 
 from libecalc.common.consumption_type import ConsumptionType
 from libecalc.common.logger import logger
-from libecalc.common.numeric_methods import find_root
+from libecalc.common.numeric_methods import find_roots
 from libecalc.domain.infrastructure.energy_components.turbine.turbine import Turbine
 from libecalc.domain.process.compressor.core.sampled import CompressorModelSampled
 from libecalc.domain.process.compressor.core.train.base import CompressorTrainModel
@@ -68,22 +66,26 @@ class CompressorWithTurbineModel:
 
         return compressor_energy_function_result
 
-    def _calculate_remaining_capacity_in_train_given_standard_rate(
-        self, standard_rate: float, suction_pressure: float, discharge_pressure: float, max_power: float
-    ) -> float:
-        """Expression used in optimization to find the rate that utilizes the compressor trains capacity."""
+    def _calculate_remaining_capacity_in_train_given_standard_rates(
+        self,
+        standard_rates: NDArray[np.float64],
+        suction_pressures: NDArray[np.float64],
+        discharge_pressures: NDArray[np.float64],
+        max_power: float,
+    ) -> NDArray[np.float64]:
+        """Expression used in optimization to find the rates that utilize the compressor trains capacity."""
 
         self.compressor_model.set_evaluation_input(
             fluid_model=self.compressor_model._fluid_model,
-            rate=np.asarray([standard_rate]),
-            suction_pressure=np.asarray([suction_pressure]),
-            discharge_pressure=np.asarray([discharge_pressure]),
+            rate=standard_rates,
+            suction_pressure=suction_pressures,
+            discharge_pressure=discharge_pressures,
         )
         result = self.compressor_model.evaluate()
         energy_result = result.get_energy_result()
         if energy_result.power is None or len(energy_result.power.values) == 0:
-            return 0.0  # Return 0 if no power value available
-        return float(energy_result.power.values[0]) - (max_power - POWER_CALCULATION_TOLERANCE)
+            return np.zeros_like(standard_rates)  # Return 0 if no power value available
+        return np.asarray(energy_result.power.values, dtype=np.float64) - (max_power - POWER_CALCULATION_TOLERANCE)
 
     def get_max_standard_rate(
         self,
@@ -114,21 +116,25 @@ class CompressorWithTurbineModel:
         max_power = self.turbine_model.max_power
 
         if energy_result.power is not None:
-            powers = np.asarray(energy_result.power.values)
-            for i, (power, suction_pressure, discharge_pressure) in enumerate(
-                zip(powers, suction_pressures, discharge_pressures)
-            ):
-                if not np.isnan(power) and power > max_power:
-                    max_standard_rate[i] = find_root(
-                        lower_bound=0,
-                        upper_bound=max_standard_rate[i],
-                        func=partial(
-                            self._calculate_remaining_capacity_in_train_given_standard_rate,
-                            suction_pressure=suction_pressure,
-                            discharge_pressure=discharge_pressure,
+            powers = np.asarray(energy_result.power.values, dtype=np.float64)
+            # Search all time steps exceeding the turbine capacity at once, evaluating the compressor model once per
+            # iteration for all of them rather than once per iteration per time step.
+            exceeding_indices = np.flatnonzero(~np.isnan(powers) & (powers > max_power))
+            if len(exceeding_indices) > 0:
+                exceeding_suction_pressures = np.asarray(suction_pressures)[exceeding_indices]
+                exceeding_discharge_pressures = np.asarray(discharge_pressures)[exceeding_indices]
+                max_standard_rate[exceeding_indices] = find_roots(
+                    lower_bounds=np.zeros(len(exceeding_indices)),
+                    upper_bounds=max_standard_rate[exceeding_indices],
+                    func=lambda standard_rates, indices: (
+                        self._calculate_remaining_capacity_in_train_given_standard_rates(
+                            standard_rates=standard_rates,
+                            suction_pressures=exceeding_suction_pressures[indices],
+                            discharge_pressures=exceeding_discharge_pressures[indices],
                             max_power=max_power,  # type: ignore[arg-type]
-                        ),
-                    )
+                        )
+                    ),
+                )
 
         return max_standard_rate
 
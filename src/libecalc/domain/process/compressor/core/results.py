@@ -198,6 +198,7 @@ class CompressorTrainResultSingleTimeStep:
         compressor_charts: list[Chart] | None,
     ) -> tuple[CompressorStreamCondition, CompressorStreamCondition, list[CompressorStageResult]]:
         number_of_stages = max([len(t.stage_results) for t in result_list])
+        number_of_periods = len(result_list)
 
         def get_or_fill(property_name: str, obj: object | None, fill: float = np.nan) -> float:
             if obj is None:
@@ -205,140 +206,126 @@ class CompressorTrainResultSingleTimeStep:
             else:
                 return getattr(obj, property_name)
 
+        def to_array(values, dtype: type = float) -> np.ndarray:
+            return np.fromiter(values, dtype=dtype, count=number_of_periods)
+
+        def to_stream_condition(streams: list[FluidStream | None], **rates: np.ndarray) -> CompressorStreamCondition:
+            # Streams may not exist, e.g. in case of zero rate etc. In this case, nan should be set, to ensure match
+            # between periods and values.
+            return CompressorStreamCondition(
+                pressure=to_array(get_or_fill("pressure_bara", stream) for stream in streams),
+                density_kg_per_m3=to_array(get_or_fill("density", stream) for stream in streams),
+                kappa=to_array(get_or_fill("kappa", stream) for stream in streams),
+                z=to_array(get_or_fill("z", stream) for stream in streams),
+                temperature_kelvin=to_array(get_or_fill("temperature_kelvin", stream) for stream in streams),
+                **rates,
+            )
+
+        speed = to_array(single_train_result.speed for single_train_result in result_list)
+
+        # Build each time series of each stage in one go, column by column
         compressor_stage_results: list[CompressorStageResult] = []
         for i in range(number_of_stages):
-            list_stage_result = CompressorStageResult.create_empty(len(result_list))
-            list_stage_result.energy_usage_unit = Unit.MEGA_WATT
-            list_inlet_stream = CompressorStreamCondition.create_empty(len(result_list))
-            list_outlet_stream = CompressorStreamCondition.create_empty(len(result_list))
-
-            for t in range(len(result_list)):
-                single_train_result = result_list[t]
-                single_stage_result = single_train_result.stage_results[i]
-
-                list_stage_result.energy_usage[t] = single_stage_result.power_megawatt
-                list_stage_result.power[t] = single_stage_result.power_megawatt
-
-                list_stage_result.mass_rate_kg_per_hr[t] = single_stage_result.mass_rate_asv_corrected_kg_per_hour
-                list_stage_result.mass_rate_before_asv_kg_per_hr[t] = single_stage_result.mass_rate_kg_per_hour
-
-                # For inlet- and outlet stream condition it is necessary to check if inlet- or outlet
-                # streams exist. They may not exist, e.g. in case of zero rate etc. In this case, nan should
-                # be set, to ensure match between periods and values.
-                list_inlet_stream.pressure[t] = get_or_fill("pressure_bara", single_stage_result.inlet_stream)
-                # Note: Here we reverse the lingo from "before ASV" to "ASV corrected"
-                list_inlet_stream.actual_rate_m3_per_hr[t] = (
-                    single_stage_result.inlet_actual_rate_asv_corrected_m3_per_hour
-                )
-                list_inlet_stream.actual_rate_before_asv_m3_per_hr[t] = (
-                    single_stage_result.inlet_actual_rate_m3_per_hour
-                )
-                list_inlet_stream.standard_rate_sm3_per_day[t] = (
-                    single_stage_result.standard_rate_asv_corrected_sm3_per_day
-                )
-                list_inlet_stream.standard_rate_before_asv_sm3_per_day[t] = (
-                    single_stage_result.standard_rate_sm3_per_day
-                )
-                list_inlet_stream.density_kg_per_m3[t] = get_or_fill("density", single_stage_result.inlet_stream)
-                list_inlet_stream.kappa[t] = get_or_fill("kappa", single_stage_result.inlet_stream)
-                list_inlet_stream.z[t] = get_or_fill("z", single_stage_result.inlet_stream)
-                list_inlet_stream.temperature_kelvin[t] = get_or_fill(
-                    "temperature_kelvin", single_stage_result.inlet_stream
-                )
-                list_outlet_stream.pressure[t] = get_or_fill("pressure_bara", single_stage_result.outlet_stream)
-                list_outlet_stream.actual_rate_m3_per_hr[t] = (
-                    single_stage_result.outlet_actual_rate_asv_corrected_m3_per_hour
-                )
-                list_outlet_stream.actual_rate_before_asv_m3_per_hr[t] = (
-                    single_stage_result.outlet_actual_rate_m3_per_hour
-                )
-                list_outlet_stream.standard_rate_sm3_per_day[t] = (
-                    single_stage_result.standard_rate_asv_corrected_sm3_per_day
-                )
-
-                list_outlet_stream.standard_rate_before_asv_sm3_per_day[t] = (
-                    single_stage_result.standard_rate_sm3_per_day
-                )
-                list_outlet_stream.density_kg_per_m3[t] = get_or_fill("density", single_stage_result.outlet_stream)
-                list_outlet_stream.kappa[t] = get_or_fill("kappa", single_stage_result.outlet_stream)
-                list_outlet_stream.z[t] = get_or_fill("z", single_stage_result.outlet_stream)
-                list_outlet_stream.temperature_kelvin[t] = get_or_fill(
-                    "temperature_kelvin", single_stage_result.outlet_stream
-                )
+            single_stage_results = [single_train_result.stage_results[i] for single_train_result in result_list]
+            power_megawatt = to_array(stage.power_megawatt for stage in single_stage_results)
+            standard_rate_sm3_per_day = to_array(stage.standard_rate_sm3_per_day for stage in single_stage_results)
+            standard_rate_asv_corrected_sm3_per_day = to_array(
+                stage.standard_rate_asv_corrected_sm3_per_day for stage in single_stage_results
+            )
 
-                # stage again
-                list_stage_result.polytropic_enthalpy_change_kJ_per_kg[t] = (
-                    single_stage_result.polytropic_enthalpy_change_kJ_per_kg
-                )
-                list_stage_result.polytropic_head_kJ_per_kg[t] = single_stage_result.polytropic_head_kJ_per_kg
-                list_stage_result.polytropic_efficiency[t] = single_stage_result.polytropic_efficiency
-                list_stage_result.polytropic_enthalpy_change_before_choke_kJ_per_kg[t] = (
-                    single_stage_result.polytropic_enthalpy_change_before_choke_kJ_per_kg
+            compressor_stage_results.append(
+                CompressorStageResult(
+                    energy_usage=power_megawatt,
+                    energy_usage_unit=Unit.MEGA_WATT,
+                    power=power_megawatt,
+                    power_unit=Unit.MEGA_WATT,
+                    mass_rate_kg_per_hr=to_array(
+                        stage.mass_rate_asv_corrected_kg_per_hour for stage in single_stage_results
+                    ),
+                    mass_rate_before_asv_kg_per_hr=to_array(
+                        stage.mass_rate_kg_per_hour for stage in single_stage_results
+                    ),
+                    # Note: Here we reverse the lingo from "before ASV" to "ASV corrected"
+                    inlet_stream_condition=to_stream_condition(
+                        [stage.inlet_stream for stage in single_stage_results],
+                        actual_rate_m3_per_hr=to_array(
+                            stage.inlet_actual_rate_asv_corrected_m3_per_hour for stage in single_stage_results
+                        ),
+                        actual_rate_before_asv_m3_per_hr=to_array(
+                            stage.inlet_actual_rate_m3_per_hour for stage in single_stage_results
+                        ),
+                        standard_rate_sm3_per_day=standard_rate_asv_corrected_sm3_per_day,
+                        standard_rate_before_asv_sm3_per_day=standard_rate_sm3_per_day,
+                    ),
+                    outlet_stream_condition=to_stream_condition(
+                        [stage.outlet_stream for stage in single_stage_results],
+                        actual_rate_m3_per_hr=to_array(
+                            stage.outlet_actual_rate_asv_corrected_m3_per_hour for stage in single_stage_results
+                        ),
+                        actual_rate_before_asv_m3_per_hr=to_array(
+                            stage.outlet_actual_rate_m3_per_hour for stage in single_stage_results
+                        ),
+                        standard_rate_sm3_per_day=standard_rate_asv_corrected_sm3_per_day,
+                        standard_rate_before_asv_sm3_per_day=standard_rate_sm3_per_day,
+                    ),
+                    polytropic_enthalpy_change_kJ_per_kg=to_array(
+                        stage.polytropic_enthalpy_change_kJ_per_kg for stage in single_stage_results
+                    ),
+                    polytropic_head_kJ_per_kg=to_array(
+                        stage.polytropic_head_kJ_per_kg for stage in single_stage_results
+                    ),
+                    polytropic_efficiency=to_array(stage.polytropic_efficiency for stage in single_stage_results),
+                    polytropic_enthalpy_change_before_choke_kJ_per_kg=to_array(
+                        stage.polytropic_enthalpy_change_before_choke_kJ_per_kg for stage in single_stage_results
+                    ),
+                    speed=speed,
+                    asv_recirculation_loss_mw=to_array(
+                        stage.asv_recirculation_loss_mw for stage in single_stage_results
+                    ),
+                    fluid_composition={},
+                    is_valid=to_array((stage.is_valid for stage in single_stage_results), dtype=bool),
+                    chart_area_flags=[stage.chart_area_flag for stage in single_stage_results],
+                    # Flags might be None, converted to False
+                    rate_has_recirculation=to_array(
+                        (bool(stage.rate_has_recirculation) for stage in single_stage_results), dtype=bool
+                    ),
+                    rate_exceeds_maximum=to_array(
+                        (bool(stage.rate_exceeds_maximum) for stage in single_stage_results), dtype=bool
+                    ),
+                    pressure_is_choked=to_array(
+                        (bool(stage.pressure_is_choked) for stage in single_stage_results), dtype=bool
+                    ),
+                    head_exceeds_maximum=to_array(
+                        (bool(stage.head_exceeds_maximum) for stage in single_stage_results), dtype=bool
+                    ),
+                    chart=compressor_charts[i].chart_data if compressor_charts is not None else None,
                 )
-                list_stage_result.speed[t] = single_train_result.speed
-                list_stage_result.asv_recirculation_loss_mw[t] = single_stage_result.asv_recirculation_loss_mw
-                list_stage_result.is_valid[t] = single_stage_result.is_valid
-                list_stage_result.chart_area_flags[t] = single_stage_result.chart_area_flag
-                list_stage_result.rate_has_recirculation[t] = bool(
-                    single_stage_result.rate_has_recirculation
-                )  # Might be None, convert to bool
-                list_stage_result.rate_exceeds_maximum[t] = bool(
-                    single_stage_result.rate_exceeds_maximum
-                )  # Might be None, convert to bool
-                list_stage_result.pressure_is_choked[t] = bool(
-                    single_stage_result.pressure_is_choked
-                )  # Might be None, convert to bool
-                list_stage_result.head_exceeds_maximum[t] = bool(
-                    single_stage_result.head_exceeds_maximum
-                )  # Might be None, convert to bool
-
-            list_stage_result.inlet_stream_condition = list_inlet_stream
-            list_stage_result.outlet_stream_condition = list_outlet_stream
-
-            list_stage_result.fluid_composition = {}
-            list_stage_result.chart = compressor_charts[i].chart_data if compressor_charts is not None else None
-
-            compressor_stage_results.append(list_stage_result)
-
-        inlet_stream_condition_for_train = CompressorStreamCondition.create_empty(len(result_list))
-        outlet_stream_condition_for_train = CompressorStreamCondition.create_empty(len(result_list))
-        for t in range(len(result_list)):
-            single_train_result = result_list[t]
-            single_inlet_stream = single_train_result.inlet_stream
-            single_outlet_stream = single_train_result.outlet_stream
-            inlet_stream_condition_for_train.pressure[t] = get_or_fill("pressure_bara", single_inlet_stream)
-
-            # Note: Here we reverse the lingo from "before ASV" to "ASV corrected"
-
-            inlet_stream_condition_for_train.actual_rate_m3_per_hr[t] = single_train_result.inlet_actual_rate
-            inlet_stream_condition_for_train.density_kg_per_m3[t] = get_or_fill("density", single_inlet_stream)
-            inlet_stream_condition_for_train.kappa[t] = get_or_fill("kappa", single_inlet_stream)
-            inlet_stream_condition_for_train.z[t] = get_or_fill("z", single_inlet_stream)
-            inlet_stream_condition_for_train.temperature_kelvin[t] = get_or_fill(
-                "temperature_kelvin", single_inlet_stream
             )
 
-            # not relevant for train
-            inlet_stream_condition_for_train.actual_rate_before_asv_m3_per_hr[t] = np.nan
-            inlet_stream_condition_for_train.standard_rate_before_asv_sm3_per_day[t] = np.nan
-
-            outlet_stream_condition_for_train.pressure[t] = get_or_fill("pressure_bara", single_outlet_stream)
-            outlet_stream_condition_for_train.actual_rate_m3_per_hr[t] = single_train_result.outlet_actual_rate
-
-            outlet_stream_condition_for_train.density_kg_per_m3[t] = get_or_fill("density", single_outlet_stream)
-            outlet_stream_condition_for_train.kappa[t] = get_or_fill("kappa", single_outlet_stream)
-            outlet_stream_condition_for_train.z[t] = get_or_fill("z", single_outlet_stream)
-            outlet_stream_condition_for_train.temperature_kelvin[t] = get_or_fill(
-                "temperature_kelvin", single_outlet_stream
-            )
-            # not relevant for train
-            outlet_stream_condition_for_train.actual_rate_before_asv_m3_per_hr[t] = np.nan
-            outlet_stream_condition_for_train.standard_rate_before_asv_sm3_per_day[t] = np.nan
-
-            inlet_rates = compressor_stage_results[0].inlet_stream_condition.standard_rate_before_asv_sm3_per_day
-            inlet_stream_condition_for_train.standard_rate_sm3_per_day[t] = inlet_rates[t]
-            outlet_rates = compressor_stage_results[-1].outlet_stream_condition.standard_rate_before_asv_sm3_per_day
-            outlet_stream_condition_for_train.standard_rate_sm3_per_day[t] = outlet_rates[t]
+        not_relevant_for_train = np.full(number_of_periods, fill_value=np.nan)
+        inlet_stream_condition_for_train = to_stream_condition(
+            [single_train_result.inlet_stream for single_train_result in result_list],
+            # Note: Here we reverse the lingo from "before ASV" to "ASV corrected"
+            actual_rate_m3_per_hr=to_array(
+                single_train_result.inlet_actual_rate for single_train_result in result_list
+            ),
+            actual_rate_before_asv_m3_per_hr=not_relevant_for_train,
+            standard_rate_sm3_per_day=compressor_stage_results[
+                0
+            ].inlet_stream_condition.standard_rate_before_asv_sm3_per_day,
+            standard_rate_before_asv_sm3_per_day=not_relevant_for_train,
+        )
+        outlet_stream_condition_for_train = to_stream_condition(
+            [single_train_result.outlet_stream for single_train_result in result_list],
+            actual_rate_m3_per_hr=to_array(
+                single_train_result.outlet_actual_rate for single_train_result in result_list
+            ),
+            actual_rate_before_asv_m3_per_hr=not_relevant_for_train,
+            standard_rate_sm3_per_day=compressor_stage_results[
+                -1
+            ].outlet_stream_condition.standard_rate_before_asv_sm3_per_day,
+            standard_rate_before_asv_sm3_per_day=not_relevant_for_train,
+        )
 
         return inlet_stream_condition_for_train, outlet_stream_condition_for_train, compressor_stage_results
 
@@ -267,12 +267,12 @@ class CompressorModelSampled:
 
         inlet_stream_condition = CompressorStreamCondition.create_empty(number_of_periods=number_of_data_points)
         inlet_stream_condition.pressure = (
-            array_to_list(suction_pressure) if suction_pressure is not None else [np.nan] * number_of_data_points
+            suction_pressure if suction_pressure is not None else np.full(number_of_data_points, fill_value=np.nan)
         )
 
         outlet_stream_condition = CompressorStreamCondition.create_empty(number_of_periods=number_of_data_points)
         outlet_stream_condition.pressure = (
-            array_to_list(discharge_pressure) if discharge_pressure is not None else [np.nan] * number_of_data_points
+            discharge_pressure if discharge_pressure is not None else np.full(number_of_data_points, fill_value=np.nan)
         )
 
         compressor_stage_result = CompressorStageResult.create_empty(number_of_periods=number_of_data_points)
@@ -282,24 +282,20 @@ class CompressorModelSampled:
             Unit.MEGA_WATT if self.function_values_are_power else Unit.STANDARD_CUBIC_METER_PER_DAY
         )
         compressor_stage_result.power = (
-            array_to_list(interpolated_consumer_values) if self.function_values_are_power else turbine_power
+            interpolated_consumer_values if self.function_values_are_power else turbine_power
         )
         compressor_stage_result.power_unit = Unit.MEGA_WATT
         compressor_stage_result.inlet_stream_condition = inlet_stream_condition
         compressor_stage_result.outlet_stream_condition = outlet_stream_condition
         compressor_stage_result.fluid_composition = {}
         compressor_stage_result.chart = None
-        compressor_stage_result.is_valid = array_to_list(
+        compressor_stage_result.is_valid = (
             np.logical_and(~np.isnan(energy_usage), turbine_energy_result.is_valid)
             if turbine_energy_result is not None
             else ~np.isnan(energy_usage)
         )
         compressor_stage_result.chart_area_flags = [ChartAreaFlag.NOT_CALCULATED] * len(energy_usage)
-        compressor_stage_result.rate_has_recirculation = [False] * len(energy_usage)
-        compressor_stage_result.rate_exceeds_maximum = [False] * len(energy_usage)
-        compressor_stage_result.pressure_is_choked = [False] * len(energy_usage)
-        compressor_stage_result.head_exceeds_maximum = [False] * len(energy_usage)
-        compressor_stage_result.asv_recirculation_loss_mw = [0.0] * len(energy_usage)
+        compressor_stage_result.asv_recirculation_loss_mw = np.zeros(len(energy_usage))
 
         # Returning a result as if the sampled compressor is a train with a single stage.
         # Note that actual rates are not available since it is not possible to convert from standard rates to
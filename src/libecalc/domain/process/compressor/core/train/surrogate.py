@@ -0,0 +1,471 @@
+"""Surrogate models for compressor trains, for fast screening runs.
+
+For a given train and fluid, the power as a function of rate, suction pressure and discharge pressure is smooth, and
+can be interpolated from rigorous evaluations on a grid covering the operating envelope of the train. The
+CompressorTrainSurrogate holds such a grid, fitted once and saved next to the model, and the
+CompressorTrainSurrogateModel uses it in place of the train, evaluating the train itself where the surrogate can not
+be trusted.
+
+A surrogate holds a fingerprint of the train and fluid it was fitted for, see get_fingerprint, and is only used for a
+train and fluid with the same fingerprint. YamlModel uses surrogates for the compressor train models they are given
+for, see YamlModel.fit_compressor_train_surrogates, and the fit-surrogates command and --compressor-train-surrogates
+option of ecalc run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import BinaryIO, Self
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from scipy.interpolate import RegularGridInterpolator
+
+from libecalc.common.consumption_type import ConsumptionType
+from libecalc.common.errors.ecalc_validation_error import EcalcValidationException
+from libecalc.common.list.list_utils import array_to_list
+from libecalc.common.logger import logger
+from libecalc.common.units import Unit
+from libecalc.domain.process.compressor.core.train.base import CompressorTrainModel
+from libecalc.domain.process.compressor.core.train.train_evaluation_input import CompressorTrainEvaluationInput
+from libecalc.domain.process.core.results import CompressorStageResult, CompressorStreamCondition, CompressorTrainResult
+from libecalc.domain.process.core.results.compressor import CompressorTrainCommonShaftFailureStatus
+from libecalc.process.fluid_stream.fluid_model import FluidModel
+from libecalc.version import current_version
+
+
+def supports_surrogate(compressor_train: CompressorTrainModel) -> bool:
+    """Check if surrogates are supported for the train, i.e. if it has a single stream and no interstage pressure."""
+    return len(compressor_train.ports) == 1 and not any(
+        stage.interstage_pressure_control is not None for stage in compressor_train.stages
+    )
+
+
+def _validate_single_stream_train(compressor_train: CompressorTrainModel) -> None:
+    if len(compressor_train.ports) > 1:
+        raise EcalcValidationException(
+            "Surrogate models are not supported for compressor trains with multiple streams."
+        )
+    if any(stage.interstage_pressure_control is not None for stage in compressor_train.stages):
+        raise EcalcValidationException(
+            "Surrogate models are not supported for compressor trains with interstage pressure."
+        )
+
+
+def get_fingerprint(compressor_train: CompressorTrainModel, fluid_model: FluidModel) -> str:
+    """Get a hash of the fluid composition, stage charts, pressure limits and power adjustments of a train, i.e. what
+    the power of the train depends on for given rates and pressures.
+    """
+    stages = [
+        {
+            "inlet_temperature_kelvin": stage.inlet_temperature_kelvin,
+            "pressure_drop_ahead_of_stage": stage.pressure_drop_ahead_of_stage,
+            "remove_liquid_after_cooling": stage.remove_liquid_after_cooling,
+            "chart": [
+                [
+                    curve.speed_rpm,
+                    curve.rate_actual_m3_hour,
+                    curve.polytropic_head_joule_per_kg,
+                    curve.efficiency_fraction,
+                ]
+                for curve in stage.compressor.compressor_chart.curves
+            ],
+        }
+        for stage in compressor_train.stages
+    ]
+    fingerprint = {
+        "fluid_model": {"eos_model": str(fluid_model.eos_model), "composition": fluid_model.composition.items()},
+        "train": type(compressor_train).__name__,
+        "stages": stages,
+        "pressure_control": str(compressor_train.pressure_control),
+        "maximum_discharge_pressure": compressor_train.maximum_discharge_pressure,
+        "maximum_power": compressor_train.maximum_power,
+        "energy_usage_adjustment_constant": compressor_train.energy_usage_adjustment_constant,
+        "energy_usage_adjustment_factor": compressor_train.energy_usage_adjustment_factor,
+    }
+    return hashlib.sha256(json.dumps(fingerprint, default=float).encode()).hexdigest()
+
+
+def _evaluate_train(
+    compressor_train: CompressorTrainModel,
+    fluid_model: FluidModel,
+    rates: NDArray[np.float64],
+    suction_pressures: NDArray[np.float64],
+    discharge_pressures: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """Evaluate the adjusted power [MW] of the train at each point, NaN where the train is not valid."""
+    compressor_train.set_evaluation_input(
+        rate=rates,
+        fluid_model=fluid_model,
+        suction_pressure=suction_pressures,
+        discharge_pressure=discharge_pressures,
+    )
+    power_mw = np.full(len(rates), np.nan)
+    for index, (rate, suction_pressure, discharge_pressure) in enumerate(
+        zip(rates, suction_pressures, discharge_pressures)
+    ):
+        compressor_train.reset_rate_modifiers()
+        result = compressor_train.evaluate_given_constraints(
+            constraints=CompressorTrainEvaluationInput(
+                suction_pressure=float(suction_pressure),
+                discharge_pressure=float(discharge_pressure),
+                rates=[float(rate)],
+            )
+        )
+        if result.is_valid:
+            power_mw[index] = result.power_megawatt
+    # Same adjustment as in CompressorTrainModel.evaluate
+    return np.where(
+        power_mw > 0,
+        power_mw * compressor_train.energy_usage_adjustment_factor + compressor_train.energy_usage_adjustment_constant,
+        power_mw,
+    )
+
+
+class CompressorTrainSurrogate:
+    """Power of a compressor train, interpolated linearly from rigorous evaluations on a regular grid of rates,
+    suction pressures and discharge pressures.
+
+    A surrogate is only valid for the train and fluid model it was fitted for, identified by the fingerprint, and must
+    be fitted again when either changes. Points are only interpolated within usable grid cells, i.e. cells where the train is valid at all corners
+    and, if a tolerance is given when fitting, where the relative error measured at the cell center is within the
+    tolerance. All other points, including points outside the grid or in cells at the edge of the valid operating
+    envelope, are not covered by the surrogate and should be evaluated by the train itself.
+
+    Attributes:
+        rate_values: Increasing rates of the grid [Sm3/day]
+        suction_pressure_values: Increasing suction pressures of the grid [bara]
+        discharge_pressure_values: Increasing discharge pressures of the grid [bara]
+        power_megawatt: Power at each grid point [MW], NaN where the train is not valid
+        usable_cells: If each grid cell, indexed by its lowest corner, is used for interpolation
+        max_absolute_error_megawatt: Max absolute error measured at the centers of the usable cells [MW]
+        max_relative_error: Max relative error measured at the centers of the usable cells [-]
+        fingerprint: Fingerprint of the train and fluid model the surrogate is fitted for, see get_fingerprint
+    """
+
+    def __init__(
+        self,
+        rate_values: ArrayLike,
+        suction_pressure_values: ArrayLike,
+        discharge_pressure_values: ArrayLike,
+        power_megawatt: ArrayLike,
+        usable_cells: ArrayLike,
+        max_absolute_error_megawatt: float,
+        max_relative_error: float,
+        fingerprint: str,
+    ):
+        self.rate_values = np.asarray(rate_values, dtype=np.float64)
+        self.suction_pressure_values = np.asarray(suction_pressure_values, dtype=np.float64)
+        self.discharge_pressure_values = np.asarray(discharge_pressure_values, dtype=np.float64)
+        self.power_megawatt = np.asarray(power_megawatt, dtype=np.float64)
+        self.usable_cells = np.asarray(usable_cells, dtype=bool)
+        self.max_absolute_error_megawatt = float(max_absolute_error_megawatt)
+        self.max_relative_error = float(max_relative_error)
+        self.fingerprint = fingerprint
+
+        for name, axis in zip(("rate", "suction pressure", "discharge pressure"), self._axes):
+            if axis.ndim != 1 or len(axis) < 2 or np.any(np.diff(axis) <= 0):
+                raise ValueError(f"Surrogate {name} values must be at least two increasing values, got {axis}")
+        grid_shape = tuple(len(axis) for axis in self._axes)
+        if self.power_megawatt.shape != grid_shape:
+            raise ValueError(
+                f"Surrogate power values must have the shape {grid_shape}, got {self.power_megawatt.shape}"
+            )
+        cells_shape = tuple(length - 1 for length in grid_shape)
+        if self.usable_cells.shape != cells_shape:
+            raise ValueError(f"Surrogate usable cells must have the shape {cells_shape}, got {self.usable_cells.shape}")
+
+        self._interpolator = RegularGridInterpolator(
+            self._axes, self.power_megawatt, method="linear", bounds_error=False, fill_value=np.nan
+        )
+
+    @property
+    def _axes(self) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+        return self.rate_values, self.suction_pressure_values, self.discharge_pressure_values
+
+    @classmethod
+    def fit(
+        cls,
+        compressor_train: CompressorTrainModel,
+        fluid_model: FluidModel,
+        rate_values: ArrayLike,
+        suction_pressure_values: ArrayLike,
+        discharge_pressure_values: ArrayLike,
+        relative_error_tolerance: float | None = None,
+    ) -> Self:
+        """Fit a surrogate by evaluating the train at all grid points, and at the center of each grid cell to measure
+        the interpolation error.
+
+        Args:
+            compressor_train: Train with a single stream, and without interstage pressure
+            fluid_model: Fluid model of the inlet stream
+            rate_values: Increasing rates of the grid [Sm3/day]
+            suction_pressure_values: Increasing suction pressures of the grid [bara]
+            discharge_pressure_values: Increasing discharge pressures of the grid [bara]
+            relative_error_tolerance: Max relative error at the cell centers for a cell to be used, None to use all
+                cells where the train is valid
+
+        Returns:
+            The fitted surrogate, with the error bound measured over the usable cells
+        """
+        _validate_single_stream_train(compressor_train)
+        axes = [
+            np.asarray(values, dtype=np.float64)
+            for values in (rate_values, suction_pressure_values, discharge_pressure_values)
+        ]
+        grid_shape = tuple(len(axis) for axis in axes)
+        logger.debug(f"Fitting compressor train surrogate on grid of shape {grid_shape}")
+
+        grid_points = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 3)
+        power_megawatt = _evaluate_train(compressor_train, fluid_model, *grid_points.T).reshape(grid_shape)
+
+        # A cell can only be used if the train is valid at all its corners
+        cells_shape = tuple(length - 1 for length in grid_shape)
+        usable_cells = np.ones(cells_shape, dtype=bool)
+        for rate_offset in (0, 1):
+            for suction_pressure_offset in (0, 1):
+                for discharge_pressure_offset in (0, 1):
+                    usable_cells &= ~np.isnan(
+                        power_megawatt[
+                            rate_offset : rate_offset + cells_shape[0],
+                            suction_pressure_offset : suction_pressure_offset + cells_shape[1],
+                            discharge_pressure_offset : discharge_pressure_offset + cells_shape[2],
+                        ]
+                    )
+
+        surrogate = cls(
+            *axes,
+            power_megawatt=power_megawatt,
+            usable_cells=usable_cells,
+            max_absolute_error_megawatt=np.nan,
+            max_relative_error=np.nan,
+            fingerprint=get_fingerprint(compressor_train, fluid_model),
+        )
+
+        # Measure the interpolation error at the cell centers, furthest from the rigorously evaluated grid points
+        cell_indices = np.argwhere(usable_cells)
+        cell_centers = np.stack(
+            [(axis[cell_indices[:, i]] + axis[cell_indices[:, i] + 1]) / 2 for i, axis in enumerate(axes)], axis=-1
+        )
+        center_power_megawatt = _evaluate_train(compressor_train, fluid_model, *cell_centers.T)
+        absolute_error = np.abs(surrogate._interpolator(cell_centers) - center_power_megawatt)
+        relative_error = np.divide(
+            absolute_error,
+            np.abs(center_power_megawatt),
+            out=np.where(absolute_error > 0, np.inf, 0.0),
+            where=center_power_megawatt != 0,
+        )
+        cell_is_accurate = ~np.isnan(absolute_error)
+        if relative_error_tolerance is not None:
+            cell_is_accurate &= relative_error <= relative_error_tolerance
+        usable_cells[tuple(cell_indices[~cell_is_accurate].T)] = False
+
+        return cls(
+            *axes,
+            power_megawatt=power_megawatt,
+            usable_cells=usable_cells,
+            max_absolute_error_megawatt=float(np.max(absolute_error[cell_is_accurate], initial=0.0)),
+            max_relative_error=float(np.max(relative_error[cell_is_accurate], initial=0.0)),
+            fingerprint=surrogate.fingerprint,
+        )
+
+    def is_fitted_for(self, compressor_train: CompressorTrainModel, fluid_model: FluidModel) -> bool:
+        """Check if the surrogate is fitted for the train and fluid model, by comparing their fingerprint."""
+        return self.fingerprint == get_fingerprint(compressor_train, fluid_model)
+
+    def is_covered(
+        self, rate: ArrayLike, suction_pressure: ArrayLike, discharge_pressure: ArrayLike
+    ) -> NDArray[np.bool_]:
+        """Check if each point is within a usable cell of the surrogate."""
+        points = [np.asarray(values, dtype=np.float64) for values in (rate, suction_pressure, discharge_pressure)]
+        is_covered = np.ones(np.broadcast_shapes(*(values.shape for values in points)), dtype=bool)
+        cell_indices = []
+        for values, axis in zip(points, self._axes):
+            is_covered &= (values >= axis[0]) & (values <= axis[-1])
+            cell_indices.append(np.clip(np.searchsorted(axis, values, side="right") - 1, 0, len(axis) - 2))
+        return is_covered & self.usable_cells[tuple(np.broadcast_arrays(*cell_indices))]
+
+    def evaluate(
+        self, rate: ArrayLike, suction_pressure: ArrayLike, discharge_pressure: ArrayLike
+    ) -> NDArray[np.float64]:
+        """Interpolate the power [MW] at each point, NaN for points not covered by the surrogate."""
+        points = np.stack(
+            np.broadcast_arrays(
+                *(np.asarray(values, dtype=np.float64) for values in (rate, suction_pressure, discharge_pressure))
+            ),
+            axis=-1,
+        )
+        is_covered = self.is_covered(*np.moveaxis(points, -1, 0))
+        power_megawatt = np.full(is_covered.shape, np.nan)
+        power_megawatt[is_covered] = self._interpolator(points[is_covered])
+        return power_megawatt
+
+    def save(self, file: str | Path | BinaryIO) -> None:
+        """Save the surrogate as a numpy npz archive, e.g. next to the model file."""
+        np.savez(
+            file,
+            rate_values=self.rate_values,
+            suction_pressure_values=self.suction_pressure_values,
+            discharge_pressure_values=self.discharge_pressure_values,
+            power_megawatt=self.power_megawatt,
+            usable_cells=self.usable_cells,
+            max_absolute_error_megawatt=self.max_absolute_error_megawatt,
+            max_relative_error=self.max_relative_error,
+            fingerprint=self.fingerprint,
+            version=str(current_version()),
+        )
+
+    @classmethod
+    def load(cls, file: str | Path | BinaryIO) -> Self:
+        """Load a surrogate saved with CompressorTrainSurrogate.save.
+
+        Raises:
+            ValueError: If the surrogate was saved without a fingerprint, and must be fitted again.
+        """
+        with np.load(file, allow_pickle=False) as npz_file:
+            if "fingerprint" not in npz_file:
+                raise ValueError(
+                    "Compressor train surrogate was saved without the fingerprint of its train and fluid model, fit "
+                    "it again with the current eCalc version."
+                )
+            version = str(npz_file["version"])
+            if version != str(current_version()):
+                logger.warning(
+                    f"Compressor train surrogate was fitted with eCalc {version}, consider fitting it again with the "
+                    f"current version {current_version()}."
+                )
+            return cls(
+                rate_values=npz_file["rate_values"],
+                suction_pressure_values=npz_file["suction_pressure_values"],
+                discharge_pressure_values=npz_file["discharge_pressure_values"],
+                power_megawatt=npz_file["power_megawatt"],
+                usable_cells=npz_file["usable_cells"],
+                max_absolute_error_megawatt=float(npz_file["max_absolute_error_megawatt"]),
+                max_relative_error=float(npz_file["max_relative_error"]),
+                fingerprint=str(npz_file["fingerprint"]),
+            )
+
+
+class CompressorTrainSurrogateModel:
+    """Compressor train model using a surrogate for the points it covers, and the train itself for all other points.
+
+    Meant for fast screening runs. Results only contain the power and validity of the train, as for sampled
+    compressor models, and max standard rates are only calculated for the points evaluated by the train.
+    """
+
+    def __init__(self, compressor_train: CompressorTrainModel, surrogate: CompressorTrainSurrogate):
+        _validate_single_stream_train(compressor_train)
+        self.compressor_train = compressor_train
+        self.surrogate = surrogate
+
+    def get_consumption_type(self) -> ConsumptionType:
+        return self.compressor_train.get_consumption_type()
+
+    def set_evaluation_input(
+        self,
+        rate: NDArray[np.float64],
+        fluid_model: FluidModel | list[FluidModel | None] | None,
+        suction_pressure: NDArray[np.float64] | None,
+        discharge_pressure: NDArray[np.float64] | None,
+        intermediate_pressure: NDArray[np.float64] | None = None,
+    ):
+        fluid_models = fluid_model if isinstance(fluid_model, list) else [fluid_model]
+        if fluid_models[0] is None or not self.surrogate.is_fitted_for(self.compressor_train, fluid_models[0]):
+            raise EcalcValidationException(
+                "Compressor train surrogate is not fitted for this compressor train and fluid model, fit it again."
+            )
+        # Validates the input
+        self.compressor_train.set_evaluation_input(
+            rate=rate,
+            fluid_model=fluid_model,
+            suction_pressure=suction_pressure,
+            discharge_pressure=discharge_pressure,
+            intermediate_pressure=intermediate_pressure,
+        )
+        self._rate = np.asarray(rate, dtype=np.float64)
+        self._fluid_model = fluid_model
+        self._suction_pressure = np.asarray(suction_pressure, dtype=np.float64)
+        self._discharge_pressure = np.asarray(discharge_pressure, dtype=np.float64)
+
+    def evaluate(self) -> CompressorTrainResult:
+        # Rates of a single stream train may be given per stream, i.e. as [[t1, t2, ...]]
+        rate = self._rate.reshape(-1)
+        number_of_periods = len(rate)
+
+        power_mw = self.surrogate.evaluate(rate, self._suction_pressure, self._discharge_pressure)
+        is_valid = np.ones(number_of_periods, dtype=bool)
+        failure_status = [CompressorTrainCommonShaftFailureStatus.NO_FAILURE] * number_of_periods
+        max_standard_rate = np.full(number_of_periods, np.nan)
+
+        # Zero rates are quick to evaluate by the train, which also handles them consistently with other models
+        train_indices = np.flatnonzero(np.isnan(power_mw) | (rate <= 0))
+        logger.debug(
+            f"Compressor train surrogate covers {number_of_periods - len(train_indices)} of {number_of_periods} points"
+        )
+        if len(train_indices) > 0:
+            self.compressor_train.set_evaluation_input(
+                rate=self._rate[..., train_indices],
+                fluid_model=self._fluid_model,
+                suction_pressure=self._suction_pressure[train_indices],
+                discharge_pressure=self._discharge_pressure[train_indices],
+            )
+            train_result = self.compressor_train.evaluate()
+            train_energy_result = train_result.get_energy_result()
+            power_mw[train_indices] = train_energy_result.power.values
+            is_valid[train_indices] = train_energy_result.is_valid
+            for train_index, status in zip(train_indices, train_result.failure_status):
+                failure_status[train_index] = status
+            max_standard_rate[train_indices] = train_result.max_standard_rate
+            # Leave the input of all points on the train, as the results of the train are mapped from its input
+            self.compressor_train.set_evaluation_input(
+                rate=self._rate,
+                fluid_model=self._fluid_model,
+                suction_pressure=self._suction_pressure,
+                discharge_pressure=self._discharge_pressure,
+            )
+
+        inlet_stream_condition = CompressorStreamCondition.create_empty(number_of_periods=number_of_periods)
+        inlet_stream_condition.pressure = self._suction_pressure
+        outlet_stream_condition = CompressorStreamCondition.create_empty(number_of_periods=number_of_periods)
+        outlet_stream_condition.pressure = self._discharge_pressure
+
+        # Returning a result as if the train is a single stage, as for sampled compressor models
+        stage_result = CompressorStageResult.create_empty(number_of_periods=number_of_periods)
+        stage_result.energy_usage = power_mw
+        stage_result.energy_usage_unit = Unit.MEGA_WATT
+        stage_result.power = power_mw
+        stage_result.inlet_stream_condition = inlet_stream_condition
+        stage_result.outlet_stream_condition = outlet_stream_condition
+        stage_result.is_valid = is_valid
+
+        return CompressorTrainResult(
+            inlet_stream_condition=inlet_stream_condition,
+            outlet_stream_condition=outlet_stream_condition,
+            energy_usage=array_to_list(power_mw),
+            energy_usage_unit=Unit.MEGA_WATT,
+            power=array_to_list(power_mw),
+            power_unit=Unit.MEGA_WATT,
+            rate_sm3_day=array_to_list(rate),
+            max_standard_rate=array_to_list(max_standard_rate),
+            stage_results=[stage_result],
+            failure_status=failure_status,
+            turbine_result=None,
+        )
+
+    def get_max_standard_rate(
+        self,
+        suction_pressures: NDArray[np.float64],
+        discharge_pressures: NDArray[np.float64],
+        fluid_model: FluidModel | None = None,
+    ) -> NDArray[np.float64]:
+        return self.compressor_train.get_max_standard_rate(
+            suction_pressures=suction_pressures, discharge_pressures=discharge_pressures, fluid_model=fluid_model
+        )
+
+    def get_requested_inlet_pressure(self) -> NDArray[np.float64]:
+        return self._suction_pressure
+
+    def get_requested_outlet_pressure(self) -> NDArray[np.float64]:
+        return self._discharge_pressure
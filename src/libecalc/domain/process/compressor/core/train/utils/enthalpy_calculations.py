@@ -15,15 +15,16 @@ from numpy.typing import NDArray
 
 from libecalc.common.logger import logger
 from libecalc.common.units import UnitConstants
-from libecalc.process.fluid_stream.fluid import Fluid
+from libecalc.process.fluid_stream.fluid_model import FluidModel
 from libecalc.process.fluid_stream.fluid_service import FluidService
 from libecalc.process.fluid_stream.fluid_stream import FluidStream
+from libecalc.process.fluid_stream.fluid_stream_batch import FluidPropertiesBatch, FluidStreamBatch
 
 
 def calculate_enthalpy_change_head_iteration(
     outlet_pressure: NDArray[np.float64] | float,
     polytropic_efficiency_vs_rate_and_head_function: Callable,
-    inlet_streams: list[FluidStream] | FluidStream,
+    inlet_streams: FluidStreamBatch | list[FluidStream] | FluidStream,
     fluid_service: FluidService,
 ) -> tuple[NDArray[np.float64], NDArray[np.float64]] | tuple[float, float]:
     """
@@ -34,20 +35,32 @@ def calculate_enthalpy_change_head_iteration(
     Args:
         outlet_pressure: Outlet pressure array [bara] or scalar.
         polytropic_efficiency_vs_rate_and_head_function: Callable for efficiency calculation.
-        inlet_streams: List of FluidStream objects or a single FluidStream.
+        inlet_streams: Batch or list of FluidStream objects of the same fluid model, or a single FluidStream.
         fluid_service: Service for performing flash operations.
 
     Returns:
         Tuple of enthalpy changes [J/kg] and polytropic efficiencies [-].
     """
 
-    # Ensure inputs are numpy arrays for consistent operations
-    single_input = False
     if isinstance(inlet_streams, FluidStream):
-        single_input = True
-        inlet_streams = [inlet_streams]
-        if isinstance(outlet_pressure, float):
-            outlet_pressure = np.array([outlet_pressure])
+        # Single time step, e.g. evaluating a compressor stage. Avoids the overhead of creating a batch.
+        if isinstance(outlet_pressure, np.ndarray) and len(outlet_pressure) != 1:
+            raise ValueError("Length of outlet pressures does not match length of inlet streams")
+
+        enthalpy_change_joule_per_kg, polytropic_efficiency = _calculate_enthalpy_change_head_iteration(
+            outlet_pressure=np.atleast_1d(outlet_pressure),
+            polytropic_efficiency_vs_rate_and_head_function=polytropic_efficiency_vs_rate_and_head_function,
+            fluid_model=inlet_streams.fluid_model,
+            inlet_pressure=np.array([inlet_streams.pressure_bara]),
+            inlet_temperature_kelvin=np.array([inlet_streams.temperature_kelvin]),
+            inlet_actual_rate_m3_per_hour=np.array([inlet_streams.volumetric_rate_m3_per_hour]),
+            inlet_enthalpy_joule_per_kg=np.array([inlet_streams.enthalpy_joule_per_kg]),
+            inlet_kappa=np.array([inlet_streams.kappa]),
+            inlet_z=np.array([inlet_streams.z]),
+            molar_mass=inlet_streams.molar_mass,
+            fluid_service=fluid_service,
+        )
+        return float(enthalpy_change_joule_per_kg[0]), float(polytropic_efficiency[0])
 
     if (
         isinstance(outlet_pressure, float)
@@ -57,16 +70,39 @@ def calculate_enthalpy_change_head_iteration(
     ):
         raise ValueError("Length of outlet pressures does not match length of inlet streams")
 
-    inlet_pressure = np.asarray([stream.pressure_bara for stream in inlet_streams])
-    outlet_pressure = np.atleast_1d(outlet_pressure)
-    inlet_temperature_kelvin = np.asarray([stream.temperature_kelvin for stream in inlet_streams])
-    inlet_actual_rate_m3_per_hour = np.asarray([stream.volumetric_rate_m3_per_hour for stream in inlet_streams])
+    if not isinstance(inlet_streams, FluidStreamBatch):
+        inlet_streams = FluidStreamBatch.from_streams(inlet_streams)
+
+    return _calculate_enthalpy_change_head_iteration(
+        outlet_pressure=np.atleast_1d(outlet_pressure),
+        polytropic_efficiency_vs_rate_and_head_function=polytropic_efficiency_vs_rate_and_head_function,
+        fluid_model=inlet_streams.fluid_model,
+        inlet_pressure=inlet_streams.pressure_bara,
+        inlet_temperature_kelvin=inlet_streams.temperature_kelvin,
+        inlet_actual_rate_m3_per_hour=inlet_streams.volumetric_rate_m3_per_hour,
+        inlet_enthalpy_joule_per_kg=inlet_streams.enthalpy_joule_per_kg,
+        inlet_kappa=inlet_streams.kappa,
+        inlet_z=inlet_streams.z,
+        molar_mass=inlet_streams.molar_mass[0],
+        fluid_service=fluid_service,
+    )
 
-    molar_mass = inlet_streams[0].molar_mass
 
+def _calculate_enthalpy_change_head_iteration(
+    outlet_pressure: NDArray[np.float64],
+    polytropic_efficiency_vs_rate_and_head_function: Callable,
+    fluid_model: FluidModel,
+    inlet_pressure: NDArray[np.float64],
+    inlet_temperature_kelvin: NDArray[np.float64],
+    inlet_actual_rate_m3_per_hour: NDArray[np.float64],
+    inlet_enthalpy_joule_per_kg: NDArray[np.float64],
+    inlet_kappa: NDArray[np.float64],
+    inlet_z: NDArray[np.float64],
+    molar_mass: float,
+    fluid_service: FluidService,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """The head iteration of calculate_enthalpy_change_head_iteration, for inlet states given as arrays."""
     pressure_ratios = np.divide(outlet_pressure, inlet_pressure)
-    inlet_kappa = np.asarray([stream.kappa for stream in inlet_streams])
-    inlet_z = np.asarray([stream.z for stream in inlet_streams])
 
     polytropic_heads = np.full_like(inlet_actual_rate_m3_per_hour, 0.0)
     z = deepcopy(inlet_z)
@@ -98,22 +134,28 @@ def calculate_enthalpy_change_head_iteration(
         )
         enthalpy_change_joule_per_kg = polytropic_heads / polytropic_efficiency
 
-        # Update outlet streams using fluid_service
-        outlet_streams = []
-        for stream, pressure, enthalpy_change in zip(inlet_streams, outlet_pressure, enthalpy_change_joule_per_kg):
-            target_enthalpy_joule_per_kg = stream.enthalpy_joule_per_kg + enthalpy_change
-            props = fluid_service.flash_ph(
-                fluid_model=stream.fluid_model,
+        # Update outlet states using fluid_service
+        target_enthalpy_joule_per_kg = inlet_enthalpy_joule_per_kg + enthalpy_change_joule_per_kg
+        outlet_properties = [
+            fluid_service.flash_ph(
+                fluid_model=fluid_model,
                 pressure_bara=pressure,
-                target_enthalpy_joule_per_kg=target_enthalpy_joule_per_kg,
-                temperature_guess_kelvin=stream.temperature_kelvin,
+                target_enthalpy_joule_per_kg=target_enthalpy,
+                temperature_guess_kelvin=temperature_guess,
+            )
+            for pressure, target_enthalpy, temperature_guess in zip(
+                outlet_pressure, target_enthalpy_joule_per_kg, inlet_temperature_kelvin
             )
-            outlet_fluid = Fluid(fluid_model=stream.fluid_model, properties=props)
-            outlet_streams.append(stream.with_new_fluid(outlet_fluid))
+        ]
 
         # Update z and kappa estimates
-        outlet_kappa = np.asarray([stream.kappa for stream in outlet_streams])
-        outlet_z = np.asarray([stream.z for stream in outlet_streams])
+        if len(outlet_properties) == 1:
+            outlet_kappa = np.array([outlet_properties[0].kappa])
+            outlet_z = np.array([outlet_properties[0].z])
+        else:
+            outlet_properties_batch = FluidPropertiesBatch.from_properties(outlet_properties)
+            outlet_kappa = outlet_properties_batch.kappa
+            outlet_z = outlet_properties_batch.z
         z = (inlet_z + outlet_z) / 2
         kappa = (inlet_kappa + outlet_kappa) / 2
 
@@ -136,11 +178,7 @@ def calculate_enthalpy_change_head_iteration(
                 rel_diff,
             )
 
-    # If inputs were scalars, return scalars
-    if not single_input:
-        return enthalpy_change_joule_per_kg, polytropic_efficiency
-
-    return float(enthalpy_change_joule_per_kg[0]), float(polytropic_efficiency[0])
+    return enthalpy_change_joule_per_kg, polytropic_efficiency
 
 
 def calculate_polytropic_head_campbell(
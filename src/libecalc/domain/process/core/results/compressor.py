@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 from enum import StrEnum
+from functools import cached_property
 from math import isnan
 
 import numpy as np
+from numpy.typing import NDArray
 
-from libecalc.common.list.list_utils import elementwise_sum
 from libecalc.common.units import Unit
 from libecalc.domain.process.core.results.base import EnergyFunctionResult, EnergyResult, Quantity
 from libecalc.domain.process.core.results.turbine import TurbineResult
@@ -43,18 +44,49 @@ class TargetPressureStatus(StrEnum):
     TARGET_PRESSURES_MET = "TARGET_PRESSURES_MET"
 
 
+class _ArrayAttribute:
+    """Attribute holding a time series as a numpy array of the given dtype.
+
+    Values are converted once when assigned, so reading the attribute never copies or checks the values.
+    """
+
+    def __init__(self, dtype: type):
+        self._dtype = dtype
+
+    def __set_name__(self, owner, name: str):
+        self._attribute_name = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return instance.__dict__[self._attribute_name]
+
+    def __set__(self, instance, value):
+        instance.__dict__[self._attribute_name] = None if value is None else np.asarray(value, dtype=self._dtype)
+
+
 class CompressorStreamCondition:
+    pressure = _ArrayAttribute(float)
+    actual_rate_m3_per_hr = _ArrayAttribute(float)
+    actual_rate_before_asv_m3_per_hr = _ArrayAttribute(float)
+    standard_rate_sm3_per_day = _ArrayAttribute(float)
+    standard_rate_before_asv_sm3_per_day = _ArrayAttribute(float)
+    density_kg_per_m3 = _ArrayAttribute(float)
+    kappa = _ArrayAttribute(float)
+    z = _ArrayAttribute(float)
+    temperature_kelvin = _ArrayAttribute(float)
+
     def __init__(
         self,
-        pressure: list[float],
-        actual_rate_m3_per_hr: list[float],
-        actual_rate_before_asv_m3_per_hr: list[float],
-        standard_rate_sm3_per_day: list[float],
-        standard_rate_before_asv_sm3_per_day: list[float],
-        density_kg_per_m3: list[float],
-        kappa: list[float],
-        z: list[float],
-        temperature_kelvin: list[float],
+        pressure: Sequence[float] | NDArray[np.float64],
+        actual_rate_m3_per_hr: Sequence[float] | NDArray[np.float64],
+        actual_rate_before_asv_m3_per_hr: Sequence[float] | NDArray[np.float64],
+        standard_rate_sm3_per_day: Sequence[float] | NDArray[np.float64],
+        standard_rate_before_asv_sm3_per_day: Sequence[float] | NDArray[np.float64],
+        density_kg_per_m3: Sequence[float] | NDArray[np.float64],
+        kappa: Sequence[float] | NDArray[np.float64],
+        z: Sequence[float] | NDArray[np.float64],
+        temperature_kelvin: Sequence[float] | NDArray[np.float64],
     ):
         self.pressure = pressure
         self.actual_rate_m3_per_hr = actual_rate_m3_per_hr
@@ -68,43 +100,64 @@ class CompressorStreamCondition:
 
     @classmethod
     def create_empty(cls, number_of_periods) -> CompressorStreamCondition:
+        def create_nans():
+            return np.full(number_of_periods, fill_value=np.nan)
+
         return cls(
-            pressure=[np.nan] * number_of_periods,
-            actual_rate_m3_per_hr=[np.nan] * number_of_periods,
-            actual_rate_before_asv_m3_per_hr=[np.nan] * number_of_periods,
-            standard_rate_sm3_per_day=[np.nan] * number_of_periods,
-            standard_rate_before_asv_sm3_per_day=[np.nan] * number_of_periods,
-            density_kg_per_m3=[np.nan] * number_of_periods,
-            kappa=[np.nan] * number_of_periods,
-            z=[np.nan] * number_of_periods,
-            temperature_kelvin=[np.nan] * number_of_periods,
+            pressure=create_nans(),
+            actual_rate_m3_per_hr=create_nans(),
+            actual_rate_before_asv_m3_per_hr=create_nans(),
+            standard_rate_sm3_per_day=create_nans(),
+            standard_rate_before_asv_sm3_per_day=create_nans(),
+            density_kg_per_m3=create_nans(),
+            kappa=create_nans(),
+            z=create_nans(),
+            temperature_kelvin=create_nans(),
         )
 
 
 class CompressorStageResult:
+    energy_usage = _ArrayAttribute(float)
+    power = _ArrayAttribute(float)
+    mass_rate_kg_per_hr = _ArrayAttribute(float)  # The gross mass rate passing through a compressor stage
+    mass_rate_before_asv_kg_per_hr = _ArrayAttribute(float)  # The net mass rate through a compressor stage
+    polytropic_enthalpy_change_kJ_per_kg = _ArrayAttribute(float)
+    polytropic_head_kJ_per_kg = _ArrayAttribute(float)
+    polytropic_efficiency = _ArrayAttribute(float)
+    polytropic_enthalpy_change_before_choke_kJ_per_kg = _ArrayAttribute(float)
+    speed = _ArrayAttribute(float)
+    asv_recirculation_loss_mw = _ArrayAttribute(float)
+
+    # Validity flags
+    is_valid = _ArrayAttribute(bool)
+    rate_has_recirculation = _ArrayAttribute(bool)
+    rate_exceeds_maximum = _ArrayAttribute(bool)
+    pressure_is_choked = _ArrayAttribute(bool)
+    head_exceeds_maximum = _ArrayAttribute(bool)
+
     def __init__(
         self,
-        energy_usage: list[float],
+        energy_usage: Sequence[float] | NDArray[np.float64],
         energy_usage_unit: Unit,
-        power: list[float],
+        power: Sequence[float] | NDArray[np.float64] | None,
         power_unit: Unit,
-        mass_rate_kg_per_hr: list[float],
-        mass_rate_before_asv_kg_per_hr: list[float],
+        mass_rate_kg_per_hr: Sequence[float] | NDArray[np.float64],
+        mass_rate_before_asv_kg_per_hr: Sequence[float] | NDArray[np.float64],
         inlet_stream_condition: CompressorStreamCondition,
         outlet_stream_condition: CompressorStreamCondition,
-        polytropic_enthalpy_change_kJ_per_kg: list[float],
-        polytropic_head_kJ_per_kg: list[float],
-        polytropic_efficiency: list[float],
-        polytropic_enthalpy_change_before_choke_kJ_per_kg: list[float],
-        speed: list[float],
-        asv_recirculation_loss_mw: list[float],
+        polytropic_enthalpy_change_kJ_per_kg: Sequence[float] | NDArray[np.float64],
+        polytropic_head_kJ_per_kg: Sequence[float] | NDArray[np.float64],
+        polytropic_efficiency: Sequence[float] | NDArray[np.float64],
+        polytropic_enthalpy_change_before_choke_kJ_per_kg: Sequence[float] | NDArray[np.float64],
+        speed: Sequence[float] | NDArray[np.float64],
+        asv_recirculation_loss_mw: Sequence[float] | NDArray[np.float64],
         fluid_composition: dict[str, float | None],
-        is_valid: list[bool],
+        is_valid: Sequence[bool] | NDArray[np.bool_],
         chart_area_flags: list[str],
-        rate_has_recirculation: list[bool],
-        rate_exceeds_maximum: list[bool],
-        pressure_is_choked: list[bool],
-        head_exceeds_maximum: list[bool],
+        rate_has_recirculation: Sequence[bool] | NDArray[np.bool_],
+        rate_exceeds_maximum: Sequence[bool] | NDArray[np.bool_],
+        pressure_is_choked: Sequence[bool] | NDArray[np.bool_],
+        head_exceeds_maximum: Sequence[bool] | NDArray[np.bool_],
         chart: ChartData | None = None,
     ):
         assert chart is None or isinstance(chart, ChartData)
@@ -113,10 +166,8 @@ class CompressorStageResult:
         self.power = power
         self.power_unit = power_unit
 
-        self.mass_rate_kg_per_hr = mass_rate_kg_per_hr  # The gross mass rate passing through a compressor stage
-        self.mass_rate_before_asv_kg_per_hr = (
-            mass_rate_before_asv_kg_per_hr  # The net mass rate through a compressor stage
-        )
+        self.mass_rate_kg_per_hr = mass_rate_kg_per_hr
+        self.mass_rate_before_asv_kg_per_hr = mass_rate_before_asv_kg_per_hr
 
         self.inlet_stream_condition = inlet_stream_condition
         self.outlet_stream_condition = outlet_stream_condition
@@ -129,7 +180,6 @@ class CompressorStageResult:
         self.asv_recirculation_loss_mw = asv_recirculation_loss_mw
         self.fluid_composition = fluid_composition
 
-        # Validity flags
         self.is_valid = is_valid
         self.chart_area_flags = chart_area_flags
         self.rate_has_recirculation = rate_has_recirculation
@@ -147,18 +197,15 @@ class CompressorStageResult:
         assert chart is None or isinstance(chart, ChartData)
         self._chart = chart
 
-    # Validate polytropic_efficiency, ensure list of floats and not arrays
-    def __setattr__(self, name, value):
-        if name == "polytropic_efficiency" and value is not None:
-            value = [float(item) if isinstance(item, np.ndarray) and item.size == 1 else item for item in value]
-        super().__setattr__(name, value)
-
     @classmethod
     def create_empty(cls, number_of_periods: int) -> CompressorStageResult:
         """Create empty CompressorStageResult"""
 
         def create_nans():
-            return [np.nan] * number_of_periods
+            return np.full(number_of_periods, fill_value=np.nan)
+
+        def create_flags(value: bool):
+            return np.full(number_of_periods, fill_value=value)
 
         return cls(
             energy_usage=create_nans(),
@@ -176,12 +223,12 @@ class CompressorStageResult:
             speed=create_nans(),
             asv_recirculation_loss_mw=create_nans(),
             fluid_composition={},
-            is_valid=[True] * number_of_periods,
+            is_valid=create_flags(True),
             chart_area_flags=[ChartAreaFlag.NOT_CALCULATED] * number_of_periods,
-            rate_has_recirculation=[False] * number_of_periods,
-            rate_exceeds_maximum=[False] * number_of_periods,
-            pressure_is_choked=[False] * number_of_periods,
-            head_exceeds_maximum=[False] * number_of_periods,
+            rate_has_recirculation=create_flags(False),
+            rate_exceeds_maximum=create_flags(False),
+            pressure_is_choked=create_flags(False),
+            head_exceeds_maximum=create_flags(False),
             chart=None,
         )
 
@@ -293,14 +340,15 @@ class CompressorTrainResult(EnergyFunctionResult):
         """Returns: The net mass rate that enters the compressor train at the first stage."""
         return self.stage_results[0].mass_rate_before_asv_kg_per_hr
 
-    @property
+    @cached_property
     def pressure_is_choked(self) -> list[bool]:
         return np.any([stage.pressure_is_choked for stage in self.stage_results], axis=0).tolist()
 
-    @property
+    @cached_property
     def recirculation_loss(self) -> list[float]:
-        return list(elementwise_sum(*[stage.asv_recirculation_loss_mw for stage in self.stage_results]))
+        # Stages without a recirculation loss, e.g. empty results, have NaN loss and do not contribute
+        return np.nansum([stage.asv_recirculation_loss_mw for stage in self.stage_results], axis=0).tolist()
 
-    @property
+    @cached_property
     def rate_exceeds_maximum(self) -> list[bool]:
         return np.any([stage.rate_exceeds_maximum for stage in self.stage_results], axis=0).tolist()
@@ -1,9 +1,11 @@
 import numpy as np
+from numpy.typing import NDArray
 
 from libecalc.common.time_utils import Periods
 from libecalc.domain.process.compressor.core.base import CompressorWithTurbineModel
 from libecalc.domain.process.compressor.core.sampled import CompressorModelSampled
 from libecalc.domain.process.compressor.core.train.base import CompressorTrainModel
+from libecalc.domain.process.compressor.core.train.surrogate import CompressorTrainSurrogateModel
 from libecalc.domain.process.pump.pump import PumpModel
 from libecalc.domain.time_series_flow_rate import TimeSeriesFlowRate
 from libecalc.domain.time_series_fluid_density import TimeSeriesFluidDensity
@@ -51,18 +53,31 @@ class CompressorEvaluationInput:
             return self._rate[0].get_periods()
         return self._rate.get_periods()
 
-    def apply_to_model(self, compressor_model: CompressorTrainModel | CompressorWithTurbineModel):
+    @property
+    def fluid_model(self) -> FluidModel | list[FluidModel | None]:
+        return self._fluid_model
+
+    def get_operating_points(
+        self,
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+        """Get the stream day rate of each stream, and the suction and discharge pressure, for each period."""
         rate_expr = self._rate if isinstance(self._rate, list) else [self._rate]
 
         stream_day_rate = np.array([rate.get_stream_day_values() for rate in rate_expr], dtype=np.float64)
+        suction_pressure = np.asarray(self._suction_pressure.get_values(), dtype=np.float64)
+        discharge_pressure = np.asarray(self._discharge_pressure.get_values(), dtype=np.float64)
+        return stream_day_rate, suction_pressure, discharge_pressure
+
+    def apply_to_model(
+        self, compressor_model: CompressorTrainModel | CompressorWithTurbineModel | CompressorTrainSurrogateModel
+    ):
+        stream_day_rate, suction_pressure, discharge_pressure = self.get_operating_points()
 
         intermediate_pressure = (
             np.asarray(self._intermediate_pressure.get_values(), dtype=np.float64)
             if self._intermediate_pressure is not None
             else None
         )
-        suction_pressure = np.asarray(self._suction_pressure.get_values(), dtype=np.float64)
-        discharge_pressure = np.asarray(self._discharge_pressure.get_values(), dtype=np.float64)
 
         compressor_model.set_evaluation_input(
             rate=stream_day_rate,
@@ -54,16 +54,14 @@ class PumpModel:
 
         assert len(suction_pressures) == len(discharge_pressures) == len(fluid_densities)
 
-        max_rates = []
-        for suction_pressure, discharge_pressure, density in zip(
-            suction_pressures, discharge_pressures, fluid_densities
-        ):
-            max_rate = self.get_max_standard_rate(
-                suction_pressure=suction_pressure, discharge_pressure=discharge_pressure, fluid_density=density
-            )
-            max_rates.append(max_rate)
-
-        return np.asarray(max_rates)
+        heads = self._calculate_head(
+            suction_pressure=np.asarray(suction_pressures),
+            discharge_pressure=np.asarray(discharge_pressures),
+            density=np.asarray(fluid_densities),
+        )
+        return np.asarray(
+            self._pump_chart.maximum_rate_as_function_of_head(heads) * UnitConstants.HOURS_PER_DAY, dtype=np.float64
+        )
 
     def get_max_standard_rate(
         self,
@@ -90,22 +88,22 @@ class PumpModel:
         return max_rate
 
     @staticmethod
-    def _calculate_head(
-        suction_pressure: float,
-        discharge_pressure: float,
-        density: float,
-    ) -> float:
+    def _calculate_head[TValue: (float, NDArray[np.float64])](
+        suction_pressure: TValue,
+        discharge_pressure: TValue,
+        density: TValue,
+    ) -> TValue:
         """:return: Head in joule per kg [J/kg]"""
 
         return Unit.BARA.to(Unit.PASCAL)(discharge_pressure - suction_pressure) / density
 
     @staticmethod
-    def _calculate_power(
-        density: float,
-        head_joule_per_kg: float,
-        efficiency: float,
-        rate: float,
-    ) -> float:
+    def _calculate_power[TValue: (float, NDArray[np.float64])](
+        density: TValue,
+        head_joule_per_kg: TValue,
+        efficiency: TValue | float,
+        rate: TValue,
+    ) -> TValue:
         """Calculate pump power in MW from densitiy, head, rate and efficiency
         head [J/kg].
         """
@@ -138,32 +136,23 @@ class PumpModel:
         """
         assert len(rates) == len(suction_pressures) == len(discharge_pressures) == len(fluid_densities)
 
-        power_out_array = []
-        operational_heads = []
-        failure_statuses = []
-        for rate, suction_pressure, discharge_pressure, density in zip(
-            rates, suction_pressures, discharge_pressures, fluid_densities
-        ):
-            power_out, operational_head, failure_status = self.simulate(
-                rate=rate,
-                suction_pressure=suction_pressure,
-                discharge_pressure=discharge_pressure,
-                fluid_density=density,
-            )
-            power_out_array.append(power_out)
-            operational_heads.append(operational_head)
-            failure_statuses.append(failure_status)
+        power_out_array, operational_heads, failure_statuses = self._simulate(
+            rates=np.asarray(rates, dtype=np.float64),
+            suction_pressures=np.asarray(suction_pressures, dtype=np.float64),
+            discharge_pressures=np.asarray(discharge_pressures, dtype=np.float64),
+            fluid_densities=np.asarray(fluid_densities, dtype=np.float64),
+        )
 
         return PumpModelResult(
-            energy_usage=power_out_array,
+            energy_usage=power_out_array.tolist(),
             energy_usage_unit=Unit.MEGA_WATT,
-            power=power_out_array,
+            power=power_out_array.tolist(),
             power_unit=Unit.MEGA_WATT,
             rate=list(rates),
             suction_pressure=list(suction_pressures),
             discharge_pressure=list(discharge_pressures),
             fluid_density=list(fluid_densities),
-            operational_head=operational_heads,
+            operational_head=operational_heads.tolist(),
             failure_status=failure_statuses,
         )
 
@@ -192,30 +181,59 @@ class PumpModel:
 
         :return: power [MW], head [J/kg], failure status
         """
-        if rate <= 0:
-            return 0.0, 0.0, PumpFailureStatus.NO_FAILURE
+        power, operational_head, failure_status = self._simulate(
+            rates=np.asarray([rate], dtype=np.float64),
+            suction_pressures=np.asarray([suction_pressure], dtype=np.float64),
+            discharge_pressures=np.asarray([discharge_pressure], dtype=np.float64),
+            fluid_densities=np.asarray([fluid_density], dtype=np.float64),
+        )
+        return float(power[0]), float(operational_head[0]), failure_status[0]
+
+    def _simulate(
+        self,
+        rates: NDArray[np.float64],
+        suction_pressures: NDArray[np.float64],
+        discharge_pressures: NDArray[np.float64],
+        fluid_densities: NDArray[np.float64],
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64], list[PumpFailureStatus]]:
+        """Simulate the pump for all time steps at once, see simulate.
+
+        :return: power [MW], head [J/kg] and failure status per time step
+        """
+        power = np.zeros_like(rates)
+        operational_heads = np.zeros_like(rates)
+        failure_statuses = [PumpFailureStatus.NO_FAILURE] * len(rates)
+
+        # Not running if rate is less than or equal to zero
+        is_running = ~(rates <= 0)
+        if not np.any(is_running):
+            return power, operational_heads, failure_statuses
+
+        densities = fluid_densities[is_running]
 
         # Reservoir rates: m3/day, pumpchart rates: m3/h
-        rate_m3_per_hour = rate / UnitConstants.HOURS_PER_DAY
+        rates_m3_per_hour = rates[is_running] / UnitConstants.HOURS_PER_DAY
 
         # Head [J/kg] calculation (for pump  with density).
         operational_head = self._calculate_head(
-            suction_pressure=suction_pressure, discharge_pressure=discharge_pressure, density=fluid_density
+            suction_pressure=suction_pressures[is_running],
+            discharge_pressure=discharge_pressures[is_running],
+            density=densities,
         )
 
         # Adjust rates according to minimum flow line (recirc left of this line)
-        minimum_flow_at_head = float(self._pump_chart.minimum_rate_as_function_of_head(operational_head))
-        rate_m3_per_hour = max(rate_m3_per_hour, minimum_flow_at_head + EPSILON)
+        minimum_flow_at_head = self._pump_chart.minimum_rate_as_function_of_head(operational_head) + EPSILON
+        rates_m3_per_hour = np.where(minimum_flow_at_head > rates_m3_per_hour, minimum_flow_at_head, rates_m3_per_hour)
 
         # Adjust head according to minimum head line (choking below this line)
-        minimum_head_at_rate = float(self._pump_chart.minimum_head_as_function_of_rate(rate_m3_per_hour))
-        head = max(operational_head, minimum_head_at_rate + EPSILON)
+        minimum_head_at_rate = self._pump_chart.minimum_head_as_function_of_rate(rates_m3_per_hour) + EPSILON
+        heads = np.where(minimum_head_at_rate > operational_head, minimum_head_at_rate, operational_head)
 
-        maximum_head_at_rate = self._pump_chart.maximum_head_as_function_of_rate(rate_m3_per_hour)
+        maximum_head_at_rate = self._pump_chart.maximum_head_as_function_of_rate(rates_m3_per_hour)
 
-        head = _adjust_for_head_margin(
-            head=head,
-            maximum_head=maximum_head_at_rate,
+        heads = _adjust_heads_for_head_margin(
+            heads=heads,
+            maximum_heads=maximum_head_at_rate,
             head_margin=self._head_margin,
         )
 
@@ -224,36 +242,41 @@ class PumpModel:
         and can be calculated) Those that fall outside the working area, means that this pump(s) is not able to handle
         those rates/heads (alone)
         """
-        failure_status = (
-            PumpFailureStatus.ABOVE_MAXIMUM_PUMP_RATE_AND_MAXIMUM_HEAD_AT_RATE
-            if (head > maximum_head_at_rate and rate_m3_per_hour > self._pump_chart.maximum_rate)
-            else PumpFailureStatus.ABOVE_MAXIMUM_HEAD_AT_RATE
-            if head > maximum_head_at_rate
-            else PumpFailureStatus.ABOVE_MAXIMUM_PUMP_RATE
-            if rate_m3_per_hour > self._pump_chart.maximum_rate
-            else PumpFailureStatus.NO_FAILURE
-        )
+        is_above_maximum_head = heads > maximum_head_at_rate
+        is_above_maximum_rate = rates_m3_per_hour > self._pump_chart.maximum_rate
+        for index, above_maximum_head, above_maximum_rate in zip(
+            np.flatnonzero(is_running), is_above_maximum_head, is_above_maximum_rate
+        ):
+            failure_statuses[index] = (
+                PumpFailureStatus.ABOVE_MAXIMUM_PUMP_RATE_AND_MAXIMUM_HEAD_AT_RATE
+                if (above_maximum_head and above_maximum_rate)
+                else PumpFailureStatus.ABOVE_MAXIMUM_HEAD_AT_RATE
+                if above_maximum_head
+                else PumpFailureStatus.ABOVE_MAXIMUM_PUMP_RATE
+                if above_maximum_rate
+                else PumpFailureStatus.NO_FAILURE
+            )
 
         logger.debug("Calculating power and efficiency.")
         # Calculate power for points within working area of pump(s)
-        power_before_efficiency_is_applied = self._calculate_power(
-            density=fluid_density,
-            head_joule_per_kg=head,
-            rate=rate_m3_per_hour,
+        power_running = self._calculate_power(
+            density=densities,
+            head_joule_per_kg=heads,
+            rate=rates_m3_per_hour,
             efficiency=1,
         )
 
-        power = power_before_efficiency_is_applied
         if not self._pump_chart.is_100_percent_efficient:
             efficiency = self._pump_chart.efficiency_as_function_of_rate_and_head(
-                rates=np.asarray([rate_m3_per_hour]),
-                heads=np.asarray([head]),
+                rates=rates_m3_per_hour,
+                heads=heads,
             )
-            power = power_before_efficiency_is_applied / efficiency[0]
+            power_running = power_running / efficiency
 
-        power_out = power
+        power[is_running] = power_running
+        operational_heads[is_running] = operational_head
 
-        return power_out, operational_head, failure_status
+        return power, operational_heads, failure_statuses
 
     def set_evaluation_input(
         self,
@@ -290,24 +313,8 @@ def _adjust_heads_for_head_margin(
     """
     assert len(heads) == len(maximum_heads)
 
-    heads_adjusted = []
-    for head, maximum_head in zip(heads, maximum_heads):
-        adjusted_head = _adjust_for_head_margin(head, maximum_head, head_margin)
-        heads_adjusted.append(adjusted_head)
-
-    return np.asarray(heads_adjusted)
-
-
-def _adjust_for_head_margin(head: float, maximum_head: float, head_margin: float) -> float:
-    """A method which adjust head and set head equal to maximum head if head is above maximum
-    but below maximum + head margin.
-
-    :param head: head value [J/kg]
-    :param maximum_head: maximum head value [J/kg]
-    :param head_margin: the margin for how much above maximum the head value are set equal to maximum [J/kg]
-    """
+    if not head_margin:
+        return heads
 
-    if head_margin:
-        if (head > maximum_head) and (head <= maximum_head + head_margin):
-            head = maximum_head
-    return head
+    is_within_head_margin = (heads > maximum_heads) & (heads <= maximum_heads + head_margin)
+    return np.where(is_within_head_margin, maximum_heads, heads)
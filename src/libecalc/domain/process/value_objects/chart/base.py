@@ -3,9 +3,10 @@ from copy import deepcopy
 from typing import Self
 
 import numpy as np
+import shapely
 from numpy.typing import NDArray
 from scipy.interpolate import interp1d
-from shapely.geometry import LineString, Point
+from shapely.geometry import LineString
 
 from libecalc.common.errors.ecalc_validation_error import EcalcValidationException
 
@@ -164,15 +165,30 @@ class ChartCurve:
         """Compute the closest distance from a point (rate,head) to the (interpolated) curve and corresponding
         efficiency for that closest point.
         """
+        distances, efficiencies = self.get_distances_and_efficiencies_from_closest_points_on_curve(
+            rates=np.asarray([rate], dtype=np.float64),
+            heads=np.asarray([head], dtype=np.float64),
+        )
+        return float(distances[0]), float(efficiencies[0])
+
+    def get_distances_and_efficiencies_from_closest_points_on_curve(
+        self, rates: NDArray[np.float64], heads: NDArray[np.float64]
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Compute the closest distance from each point (rate,head) to the (interpolated) curve and corresponding
+        efficiency for that closest point. Distances are negative for points above the curve.
+        """
         head_linestring = LineString(list(zip(self.rate_values, self.head_values)))
-        p = Point(rate, head)
-
-        distance = p.distance(head_linestring)
-        closest_interpolated_point = head_linestring.interpolate(head_linestring.project(p))
-        if closest_interpolated_point.y < p.y:
-            distance = -distance
-        efficiency = float(self.efficiency_as_function_of_rate(closest_interpolated_point.x))
-        return distance, efficiency
+        points = shapely.points(rates, heads)
+
+        distances = shapely.distance(points, head_linestring)
+        closest_interpolated_points = shapely.line_interpolate_point(
+            head_linestring, shapely.line_locate_point(head_linestring, points)
+        )
+        distances = np.where(shapely.get_y(closest_interpolated_points) < heads, -distances, distances)
+        efficiencies = np.asarray(
+            self.efficiency_as_function_of_rate(shapely.get_x(closest_interpolated_points)), dtype=np.float64
+        )
+        return distances, efficiencies
 
     def deep_copy(self) -> Self:
         """Create a (deep) copy of the ChartCurve."""
@@ -417,35 +417,31 @@ class Chart:
             for curve in self.curves
         ]
 
-        for i, rate in enumerate(scaled_rates):
-            q = rate
-            h = scaled_heads[i]
-
-            distance_above = np.inf
-            distance_below = -np.inf
-            efficiency_above = 1
-            efficiency_below = 1
-
-            for scaled_chart_curve in scaled_chart_curves:
-                distance, efficiency = ChartCurve(
-                    rate_actual_m3_hour=scaled_chart_curve.rate_actual_m3_hour,
-                    polytropic_head_joule_per_kg=scaled_chart_curve.polytropic_head_joule_per_kg,
-                    efficiency_fraction=scaled_chart_curve.efficiency_fraction,
-                    speed_rpm=scaled_chart_curve.speed_rpm,
-                ).get_distance_and_efficiency_from_closest_point_on_curve(rate=q, head=h)
-
-                if 0 <= distance < distance_above:  # Curve is above this point
-                    distance_above, efficiency_above = distance, efficiency
-                elif distance_below < distance < 0:  # Curve is below this point
-                    distance_below, efficiency_below = distance, efficiency
-
-            alpha = self._get_alpha_from_distances(
-                distance_above=distance_above,
-                distance_below=distance_below,
+        distances_above = np.full_like(scaled_rates, fill_value=np.inf, dtype=float)
+        distances_below = np.full_like(scaled_rates, fill_value=-np.inf, dtype=float)
+        efficiencies_above = np.ones_like(scaled_rates, dtype=float)
+        efficiencies_below = np.ones_like(scaled_rates, dtype=float)
+
+        for scaled_chart_curve in scaled_chart_curves:
+            distances, curve_efficiencies = (
+                scaled_chart_curve.get_distances_and_efficiencies_from_closest_points_on_curve(
+                    rates=scaled_rates, heads=scaled_heads
+                )
             )
 
-            efficiency = alpha * efficiency_below + (1.0 - alpha) * efficiency_above
-            efficiencies[i] = efficiency
+            is_above = (0 <= distances) & (distances < distances_above)  # Curve is above this point
+            is_below = ~is_above & (distances_below < distances) & (distances < 0)  # Curve is below this point
+            distances_above = np.where(is_above, distances, distances_above)
+            efficiencies_above = np.where(is_above, curve_efficiencies, efficiencies_above)
+            distances_below = np.where(is_below, distances, distances_below)
+            efficiencies_below = np.where(is_below, curve_efficiencies, efficiencies_below)
+
+        alpha = self._get_alphas_from_distances(
+            distances_above=distances_above,
+            distances_below=distances_below,
+        )
+
+        efficiencies[:] = alpha * efficiencies_below + (1.0 - alpha) * efficiencies_above
 
         return efficiencies
 
@@ -465,6 +461,15 @@ class Chart:
         else:
             return abs(distance_above) / (abs(distance_above) + abs(distance_below))
 
+    @staticmethod
+    def _get_alphas_from_distances(
+        distances_above: NDArray[np.float64], distances_below: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        """Vectorized version of _get_alpha_from_distances."""
+        with np.errstate(invalid="ignore"):
+            alphas = np.abs(distances_above) / (np.abs(distances_above) + np.abs(distances_below))
+        return np.where(np.isinf(distances_above), 1.0, np.where(np.isinf(distances_below), 0.0, alphas))
+
     def closest_curve_below_speed(self, speed: float) -> ChartCurve | None:
         # High to low speed -> need to reverse the original list of curves
         filtered_curves = list(filter(lambda x: x.speed <= speed, self.curves[::-1]))
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Self
+
+import numpy as np
+import pandas as pd
+
+from libecalc.common.time_utils import Period, Periods
+from libecalc.infrastructure.file_utils import get_component_dataframes
+from libecalc.presentation.json_result.result import EcalcModelResult
+from libecalc.version import current_version
+
+_METADATA_FILE_NAME = "metadata.json"
+_PERIOD_START_FILE_NAME = "period_start.npy"
+_PERIOD_END_FILE_NAME = "period_end.npy"
+
+
+def _get_column_file_name(column_index: int) -> str:
+    # Column names contain characters not allowed in file names, e.g. '/'
+    return f"column_{column_index}.npy"
+
+
+def _to_typed_column(values: pd.Series) -> np.ndarray:
+    """Get the values of a column as a numpy array that can be saved without pickle and memory-mapped.
+
+    Numbers are given as float64, with missing values as NaN, booleans as bool and dates as datetime64[us]. Other
+    values, e.g. strings, are given as fixed width unicode strings, with missing values as empty strings.
+    """
+    if pd.api.types.is_bool_dtype(values):
+        return values.to_numpy(dtype=bool)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.to_numpy(dtype="datetime64[us]")
+    if pd.api.types.is_numeric_dtype(values):
+        return values.to_numpy(dtype=np.float64, na_value=np.nan)
+    try:
+        return pd.to_numeric(values).to_numpy(dtype=np.float64, na_value=np.nan)
+    except (ValueError, TypeError):
+        return np.asarray(values.fillna("").astype(str), dtype=str)
+
+
+class ColumnarResult:
+    """eCalc results as typed columns, one row per period and one column per component time series.
+
+    Columns are named as in the csv output, i.e. '<component name>.<attribute>[<unit>]'. Saved as a directory with one
+    uncompressed numpy .npy file per column, described by a metadata.json file, which can be read without eCalc
+    using numpy.load. Loaded columns are memory-mapped, so only the parts of the columns that are used are read from
+    file. Numbers are float64, with missing values as NaN, booleans are bool, dates are datetime64[us] and other
+    values are fixed width unicode strings.
+
+    Usage:
+        ColumnarResult.from_result(results).save("results")
+
+        with ColumnarResult.load("results") as result:
+            power = result.get_column("installation.power[MW (cd)]")
+    """
+
+    def __init__(
+        self,
+        periods: Periods,
+        columns: dict[str, np.ndarray],
+        metadata: dict,
+        directory: Path | None = None,
+    ):
+        """
+        Args:
+            periods: The periods of the rows
+            columns: The columns by name, the columns in metadata not given are loaded from the directory
+            metadata: The version and the columns of the result, with their file name and component
+            directory: The directory the result is loaded from, None if not loaded
+        """
+        self.periods = periods
+        self._columns = columns
+        self.metadata = metadata
+        self._directory = directory
+        self._column_metadata = {column["name"]: column for column in metadata["columns"]}
+
+    @classmethod
+    def from_result(cls, results: EcalcModelResult) -> Self:
+        columns: dict[str, np.ndarray] = {}
+        column_metadata = []
+        for component, component_df in zip(results.components, get_component_dataframes(results), strict=True):
+            for column_index, column_name in enumerate(component_df.columns):
+                key = column_name
+                duplicate_count = 1
+                while key in columns:
+                    # Duplicate component names, keep all columns
+                    duplicate_count += 1
+                    key = f"{column_name}#{duplicate_count}"
+                columns[key] = _to_typed_column(component_df.iloc[:, column_index])
+                column_metadata.append(
+                    {
+                        "name": key,
+                        "file_name": _get_column_file_name(len(column_metadata)),
+                        "component_id": component.id,
+                        "component_name": component.name,
+                        "component_type": str(component.componentType),
+                    }
+                )
+
+        return cls(
+            periods=results.periods,
+            columns=columns,
+            metadata={
+                "version": str(current_version()),
+                "columns": column_metadata,
+            },
+        )
+
+    @classmethod
+    def load(cls, directory: str | Path) -> Self:
+        """Load results saved with ColumnarResult.save. Columns are memory-mapped from file when accessed."""
+        directory = Path(directory)
+        metadata = json.loads((directory / _METADATA_FILE_NAME).read_text())
+        periods = Periods(
+            [
+                Period(start=start, end=end)
+                for start, end in zip(
+                    np.load(directory / _PERIOD_START_FILE_NAME, allow_pickle=False).astype(datetime),
+                    np.load(directory / _PERIOD_END_FILE_NAME, allow_pickle=False).astype(datetime),
+                    strict=True,
+                )
+            ]
+        )
+        return cls(periods=periods, columns={}, metadata=metadata, directory=directory)
+
+    def save(self, directory: str | Path) -> None:
+        """Save the result to a directory, created if it does not exist."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / _PERIOD_START_FILE_NAME, np.array(self.periods.start_dates, dtype="datetime64[us]"))
+        np.save(directory / _PERIOD_END_FILE_NAME, np.array(self.periods.end_dates, dtype="datetime64[us]"))
+        for column_name, column in self._column_metadata.items():
+            np.save(directory / column["file_name"], self.get_column(column_name), allow_pickle=False)
+        # Written last, a directory with metadata is complete
+        (directory / _METADATA_FILE_NAME).write_text(json.dumps(self.metadata))
+
+    @property
+    def column_names(self) -> list[str]:
+        return list(self._column_metadata)
+
+    def get_column(self, column_name: str) -> np.ndarray:
+        if column_name not in self._column_metadata:
+            raise KeyError(f"Column '{column_name}' not found in result.")
+        if column_name not in self._columns:
+            assert self._directory is not None
+            self._columns[column_name] = np.load(
+                self._directory / self._column_metadata[column_name]["file_name"], mmap_mode="r", allow_pickle=False
+            )
+        return self._columns[column_name]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {column_name: self.get_column(column_name) for column_name in self._column_metadata},
+            index=pd.DatetimeIndex(self.periods.start_dates),
+        )
+
+    def close(self) -> None:
+        """Release the memory-mapped columns of a loaded result."""
+        if self._directory is not None:
+            self._columns.clear()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
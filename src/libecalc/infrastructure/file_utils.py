@@ -1,16 +1,22 @@
 import enum
+import io
 from collections.abc import Callable
 from datetime import datetime
-from typing import Any
+from typing import Any, TextIO
 
 import numpy as np
 import pandas as pd
 from orjson import orjson
+from pandas.api.types import is_numeric_dtype
+from pydantic import BaseModel
 
 from ecalc_cli.emission_intensity import EmissionIntensityResults
 from libecalc.common.datetime.utils import DateTimeFormats
 from libecalc.common.logger import logger
+from libecalc.common.time_utils import Periods
+from libecalc.common.utils.rates import TimeSeriesBoolean
 from libecalc.presentation.json_result.result import ComponentResult, EcalcModelResult
+from libecalc.presentation.json_result.result.tabular_time_series import TabularColumn
 from libecalc.presentation.simple_result import SimpleResultData
 
 
@@ -31,6 +37,7 @@ def dataframe_to_csv(
     show_index: bool = True,
     float_formatter: Callable | str | None = "%20.5f",
     date_format: str | None = None,
+    header: bool = True,
 ) -> str:
     """Dump pandas dataframe to csv file
 
@@ -42,6 +49,7 @@ def dataframe_to_csv(
         show_index: if true, will include index in dump
         float_formatter:
         date_format:
+        header: if true, will include column names in dump
 
     Returns:
 
@@ -53,25 +61,40 @@ def dataframe_to_csv(
         encoding="utf-8",
         sep=separator,
         date_format=date_format,
+        header=header,
     )
 
 
-def to_json(
-    result: ComponentResult | EcalcModelResult | EmissionIntensityResults | SimpleResultData, date_format_option: int
-) -> str:
-    """Dump result classes to json file
+def _get_json_options(compact: bool) -> int:
+    option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+    if not compact:
+        option |= orjson.OPT_INDENT_2
+    return option
+
+
+def dump_json(
+    result: ComponentResult | EcalcModelResult | EmissionIntensityResults | SimpleResultData,
+    fp: TextIO,
+    date_format_option: int,
+    compact: bool = False,
+) -> None:
+    """Write result classes as json to a file handle
+
+    Lists of results, i.e. components and models, are serialized and written one item at a time, so only a single
+    item is held in memory as python objects in addition to the result itself.
 
     Args:
         result: eCalc result data class
-        simple_output: If true, will provide a simplified output format
+        fp: Text file handle to write to
         date_format_option:
+        compact: If true, json is written without indentation and newlines
 
     Returns:
-        String dump of json output
 
     """
-    data = result.model_dump(exclude_none=True, context={"include_timesteps": True})
     date_format = DateTimeFormats.get_format(date_format_option)
+    context = {"include_timesteps": True}
+    option = _get_json_options(compact)
 
     def default_serializer(x: Any):
         if isinstance(x, datetime):
@@ -81,54 +104,254 @@ def to_json(
 
         raise ValueError(f"Unable to serialize '{type(x)}'")
 
-    # Using orjson to both allow custom date format and convert nan to null.
-    # NaN to null is not supported by json module.
-    # Custom date format is not supported by pydantic -> https://github.com/pydantic/pydantic/issues/7143
-    return orjson.dumps(
-        data,
-        default=default_serializer,
-        option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
-    ).decode()
+    def dumps(data: Any, depth: int) -> str:
+        # Using orjson to both allow custom date format and convert nan to null.
+        # NaN to null is not supported by json module.
+        # Custom date format is not supported by pydantic -> https://github.com/pydantic/pydantic/issues/7143
+        serialized = orjson.dumps(data, default=default_serializer, option=option).decode()
+        if compact or depth == 0:
+            return serialized
+        # Indent nested values as if they were serialized together with their parent. Newlines in strings are
+        # escaped by orjson, so every line break is structural.
+        return serialized.replace("\n", "\n" + "  " * depth)
 
+    newline, indent, key_separator = ("", "", ":") if compact else ("\n", "  ", ": ")
 
-def get_result_output(
+    fp.write("{")
+    is_first_field = True
+    for field_name in type(result).model_fields:
+        value = getattr(result, field_name)
+        if value is None:
+            continue
+
+        fp.write(("" if is_first_field else ",") + newline + indent + orjson.dumps(field_name).decode() + key_separator)
+        is_first_field = False
+
+        if isinstance(value, list) and len(value) > 0 and all(isinstance(item, BaseModel) for item in value):
+            fp.write("[")
+            for index, item in enumerate(value):
+                item_data = item.model_dump(exclude_none=True, context=context)
+                fp.write(("" if index == 0 else ",") + newline + indent * 2 + dumps(item_data, depth=2))
+            fp.write(newline + indent + "]")
+        else:
+            field_data = result.model_dump(include={field_name}, exclude_none=True, context=context)[field_name]
+            fp.write(dumps(field_data, depth=1))
+
+    fp.write(newline + "}" if not is_first_field else "}")
+
+
+def to_json(
+    result: ComponentResult | EcalcModelResult | EmissionIntensityResults | SimpleResultData,
+    date_format_option: int,
+    compact: bool = False,
+) -> str:
+    """Dump result classes to json string
+
+    Args:
+        result: eCalc result data class
+        date_format_option:
+        compact: If true, json is dumped without indentation and newlines
+
+    Returns:
+        String dump of json output
+
+    """
+    buffer = io.StringIO()
+    dump_json(result, fp=buffer, date_format_option=date_format_option, compact=compact)
+    return buffer.getvalue()
+
+
+def get_component_dataframes(results: EcalcModelResult) -> list[pd.DataFrame]:
+    """Get the time series of each component as a dataframe, indexed by the start dates of the result periods
+
+    Column names are prefixed with the component name. Duplicate component names give duplicate column names.
+
+    Args:
+        results: eCalc model results
+
+    Returns:
+        One dataframe per component, in the same order as results.components
+
+    """
+    index = pd.DatetimeIndex(results.periods.start_dates)
+    component_dfs = []
+    column_names: set[str] = set()
+    for component in results.components:
+        component_df = component.to_dataframe(
+            prefix=component.name,
+        )
+        if not column_names.isdisjoint(component_df.columns):
+            logger.warning(
+                f"Duplicate component names in result detected. Component name '{component.name}', "
+                f"component type '{component.componentType}'."
+            )
+        column_names.update(component_df.columns)
+        component_dfs.append(component_df.reindex(index))
+    return component_dfs
+
+
+class _CsvColumn:
+    """A column of the csv, referring to the values of a result time series without copying them.
+
+    Rows of the result without a value in the time series, e.g. outside the periods of the component, are missing.
+    """
+
+    def __init__(self, column: TabularColumn, index: pd.DatetimeIndex, get_date_positions: Callable):
+        self.name = column.name
+        self._time_series = column.time_series
+        positions = get_date_positions(column.time_series.periods)
+        for row_periods in column.row_periods:
+            positions = np.where(get_date_positions(row_periods) >= 0, positions, -1)
+        # Positions of the values of each row, None when the rows are the values of the time series
+        self._positions = None if np.array_equal(positions, np.arange(len(index))) else positions
+
+        values = column.get_values()
+        self.has_missing_values = bool((positions < 0).any() or pd.isna(values).any())
+        dtype = pd.Series(values).dtype
+        # As in a column of a joined dataframe, missing values turn numeric values into floats
+        self._dtype = np.dtype(np.float64) if self.has_missing_values and is_numeric_dtype(dtype) else dtype
+        self._is_boolean = isinstance(column.time_series, TimeSeriesBoolean)
+
+    def get_values(self, rows: slice) -> pd.Series:
+        """The values of the given rows, missing values are NaN."""
+        values = self._time_series.values
+        if self._positions is None:
+            chunk_values = values[rows]
+        else:
+            chunk_values = [values[position] if position >= 0 else np.nan for position in self._positions[rows]]
+        if self._is_boolean:
+            chunk_values = [int(v) if not pd.isna(v) else v for v in chunk_values]
+        return pd.Series(chunk_values, dtype=self._dtype)
+
+
+def _get_csv_columns(results: EcalcModelResult, index: pd.DatetimeIndex) -> list[_CsvColumn]:
+    date_positions: dict[int, tuple[Periods, np.ndarray]] = {}
+
+    def get_date_positions(periods: Periods) -> np.ndarray:
+        # Time series of a component usually share periods, keep the periods to make sure the id is not reused
+        if id(periods) not in date_positions:
+            date_positions[id(periods)] = (periods, pd.DatetimeIndex(periods.start_dates).get_indexer(index))
+        return date_positions[id(periods)][1]
+
+    columns = []
+    column_names: set[str] = set()
+    for component in results.components:
+        component_columns = [
+            _CsvColumn(column, index=index, get_date_positions=get_date_positions)
+            for column in component.iter_columns(prefix=component.name)
+        ]
+        component_column_names = {column.name for column in component_columns}
+        if not column_names.isdisjoint(component_column_names):
+            logger.warning(
+                f"Duplicate component names in result detected. Component name '{component.name}', "
+                f"component type '{component.componentType}'."
+            )
+        column_names.update(component_column_names)
+        columns.extend(component_columns)
+    return columns
+
+
+def dump_csv(
     results: EcalcModelResult,
+    fp: TextIO,
+    date_format_option: int,
+    chunk_size: int = 1000,
+) -> None:
+    """Write results as csv to a file handle, one column per time series and one row per time step
+
+    Rows are written in chunks. The columns refer to the time series of the results, and only the values of a chunk
+    are converted into a dataframe and text at a time.
+
+    Args:
+        results: eCalc model results
+        fp: Text file handle to write to
+        date_format_option:
+        chunk_size: Number of rows to write at a time
+
+    Returns:
+
+    """
+    index = pd.DatetimeIndex(results.periods.start_dates)
+    columns = _get_csv_columns(results, index=index)
+    date_format = DateTimeFormats.get_format(date_format_option)
+
+    for chunk_start in range(0, max(len(index), 1), chunk_size):
+        rows = slice(chunk_start, chunk_start + chunk_size)
+        chunk = pd.DataFrame(
+            {column_index: column.get_values(rows).to_numpy() for column_index, column in enumerate(columns)},
+            index=index[rows],
+        )
+        chunk.columns = [column.name for column in columns]
+        # Columns with missing values anywhere are written as text, which must be decided for the whole column
+        # to give the same formatting in all chunks.
+        for column_index, column in enumerate(columns):
+            if column.has_missing_values:
+                chunk.isetitem(column_index, chunk.iloc[:, column_index].astype(object).fillna("nan"))
+        fp.write(dataframe_to_csv(chunk, date_format=date_format, header=chunk_start == 0))
+
+
+def dump_result_output(
+    results: EcalcModelResult,
+    fp: TextIO,
     output_format: OutputFormat,
     simple_output: bool,
     date_format_option: int,
-) -> str:
+    compact: bool = False,
+) -> None:
     """Result output controller
 
-    Output eCalc results in desired format and
+    Write eCalc results in desired format to a file handle
 
     Args:
         results:
+        fp: Text file handle to write to
         output_format:
         simple_output: If true, will provide a simplified output format. Only supported for json format
         date_format_option:
+        compact: If true, json is written without indentation and newlines. Only supported for json format
 
     Returns:
 
     """
     if output_format == OutputFormat.JSON:
         result_to_serialize = SimpleResultData.from_dto(results) if simple_output else results
-        return to_json(result_to_serialize, date_format_option=date_format_option)
+        dump_json(result_to_serialize, fp=fp, date_format_option=date_format_option, compact=compact)
     elif output_format == OutputFormat.CSV:
-        df = pd.DataFrame(index=results.periods.start_dates)
-        for component in results.components:
-            component_df = component.to_dataframe(
-                prefix=component.name,
-            )
-            try:
-                df = df.join(component_df)
-            except ValueError:
-                logger.warning(
-                    f"Duplicate component names in result detected. Component name '{component.name}', "
-                    f"component type '{component.componentType}'."
-                )
-                df = pd.concat([df, component_df], axis=1)
-        return dataframe_to_csv(df.fillna("nan"), date_format=DateTimeFormats.get_format(date_format_option))
+        dump_csv(results, fp=fp, date_format_option=date_format_option)
     else:
         raise ValueError(
             f"Invalid output format. Expected {OutputFormat.CSV} or {OutputFormat.JSON}, got '{output_format}'"
         )
+
+
+def get_result_output(
+    results: EcalcModelResult,
+    output_format: OutputFormat,
+    simple_output: bool,
+    date_format_option: int,
+    compact: bool = False,
+) -> str:
+    """Result output controller
+
+    Output eCalc results in desired format and
+
+    Args:
+        results:
+        output_format:
+        simple_output: If true, will provide a simplified output format. Only supported for json format
+        date_format_option:
+        compact: If true, json is dumped without indentation and newlines. Only supported for json format
+
+    Returns:
+
+    """
+    buffer = io.StringIO()
+    dump_result_output(
+        results,
+        fp=buffer,
+        output_format=output_format,
+        simple_output=simple_output,
+        date_format_option=date_format_option,
+        compact=compact,
+    )
+    return buffer.getvalue()
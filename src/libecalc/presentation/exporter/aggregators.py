@@ -3,6 +3,7 @@ import abc
 from libecalc.common.logger import logger
 from libecalc.common.time_utils import Frequency
 from libecalc.presentation.exporter.appliers import Applier
+from libecalc.presentation.exporter.attribute_matrix import AttributeMatrixExportable
 from libecalc.presentation.exporter.domain.exportable import ExportableSet, ExportableType
 from libecalc.presentation.exporter.dto.dtos import GroupedQueryResult, QueryResult
 
@@ -70,6 +71,8 @@ class InstallationAggregator(Aggregator):
         """
         aggregated_installation_results: list[GroupedQueryResult] = []
         for installation in energy_calculator_result.get_from_type(ExportableType.INSTALLATION):
+            # Build the attributes of the installation once, and reuse them for all appliers
+            installation = AttributeMatrixExportable(installation)
             installation_name = installation.get_name()
             single_results: list[QueryResult] = []
             for applier in self.appliers:
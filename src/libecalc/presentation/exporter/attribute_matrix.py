@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from enum import StrEnum
+from typing import assert_never
+
+import numpy as np
+from numpy.typing import NDArray
+
+from libecalc.common.time_utils import Period, Periods
+from libecalc.common.units import Unit
+from libecalc.presentation.exporter.domain.exportable import AttributeMeta, AttributeSet, Exportable
+
+
+class AttributeType(StrEnum):
+    FUEL_CONSUMPTION = "FUEL_CONSUMPTION"
+    POWER_CONSUMPTION = "POWER_CONSUMPTION"
+    EMISSIONS = "EMISSIONS"
+    ELECTRICITY_PRODUCTION = "ELECTRICITY_PRODUCTION"
+    MAXIMUM_ELECTRICITY_PRODUCTION = "MAXIMUM_ELECTRICITY_PRODUCTION"
+    STORAGE_VOLUMES = "STORAGE_VOLUMES"
+
+
+class AttributeMatrix:
+    """The attributes of an exportable as a matrix, one row per attribute and one column per period.
+
+    The attribute metadata is kept as one array per field, so that a query is a mask on the metadata and a sum of
+    the masked rows.
+    """
+
+    def __init__(self, attribute_set: AttributeSet, periods: Periods):
+        attributes = list(attribute_set)
+        column_index: dict[Period, int] = {period: index for index, period in enumerate(periods)}
+        # Periods not in the exportable periods are kept in separate columns after the exportable periods
+        extra_periods = sorted(
+            {period for attribute in attributes for period, _ in attribute.datapoints() if period not in column_index}
+        )
+        for period in extra_periods:
+            column_index[period] = len(column_index)
+
+        self._number_of_periods = len(periods)
+        self._periods = list(column_index.keys())
+        self._values = np.zeros((len(attributes), len(self._periods)), dtype=np.float64)
+        self._is_defined = np.zeros((len(attributes), len(self._periods)), dtype=bool)
+        for row, attribute in enumerate(attributes):
+            for period, value in attribute.datapoints():
+                column = column_index[period]
+                self._values[row, column] += value
+                self._is_defined[row, column] = True
+
+        metas: list[AttributeMeta] = [attribute.get_meta() for attribute in attributes]
+        self._fuel_categories = np.array([meta.fuel_category for meta in metas], dtype=object)
+        self._consumer_categories = np.array([meta.consumer_category for meta in metas], dtype=object)
+        self._producer_categories = np.array([meta.producer_category for meta in metas], dtype=object)
+        self._emission_types = np.array([meta.emission_type for meta in metas], dtype=object)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @staticmethod
+    def _is_in(values: NDArray, allowed_values: list[str]) -> NDArray[np.bool_]:
+        is_in = np.zeros(len(values), dtype=bool)
+        for allowed_value in allowed_values:
+            is_in |= values == allowed_value
+        return is_in
+
+    def mask(
+        self,
+        fuel_category: str | None = None,
+        consumer_categories: list[str] | None = None,
+        producer_categories: list[str] | None = None,
+        emission_type: str | None = None,
+    ) -> NDArray[np.bool_]:
+        """Select the attributes matching all the given filters. A filter that is None selects all attributes."""
+        mask = np.ones(len(self), dtype=bool)
+        if fuel_category is not None:
+            mask &= self._fuel_categories == fuel_category
+        if consumer_categories is not None:
+            mask &= self._is_in(self._consumer_categories, consumer_categories)
+        if producer_categories is not None:
+            mask &= self._is_in(self._producer_categories, producer_categories)
+        if emission_type is not None:
+            mask &= self._emission_types == emission_type
+        return mask
+
+    def sum(self, mask: NDArray[np.bool_]) -> tuple[Periods, list[float]]:
+        """Sum the selected attributes per period.
+
+        Returns all the exportable periods, zero where no attribute is defined, followed by any other periods the
+        selected attributes are defined for.
+        """
+        # Summing row by row from zero, as when adding the attributes one at a time
+        values = np.sum(self._values[mask], axis=0, initial=0.0)
+        is_exportable_period = np.arange(len(self._periods)) < self._number_of_periods
+        columns = np.flatnonzero(is_exportable_period | np.any(self._is_defined[mask], axis=0))
+        return Periods([self._periods[column] for column in columns]), values[columns].tolist()
+
+
+class AttributeMatrixExportable(Exportable):
+    """Exportable building each of its attribute sets once, and keeping them as attribute matrices.
+
+    Used when running many queries against the same exportable, e.g. all the columns of an export.
+    """
+
+    def __init__(self, exportable: Exportable):
+        self._exportable = exportable
+        self._attribute_matrices: dict[tuple[AttributeType, Unit | None], AttributeMatrix] = {}
+
+    def get_name(self) -> str:
+        return self._exportable.get_name()
+
+    def get_category(self) -> str | None:
+        return self._exportable.get_category()
+
+    def get_periods(self) -> Periods:
+        return self._exportable.get_periods()
+
+    def get_fuel_consumption(self) -> AttributeSet:
+        return self._exportable.get_fuel_consumption()
+
+    def get_power_consumption(self, unit: Unit) -> AttributeSet:
+        return self._exportable.get_power_consumption(unit)
+
+    def get_emissions(self, unit: Unit) -> AttributeSet:
+        return self._exportable.get_emissions(unit)
+
+    def get_electricity_production(self, unit: Unit) -> AttributeSet:
+        return self._exportable.get_electricity_production(unit)
+
+    def get_maximum_electricity_production(self, unit: Unit) -> AttributeSet:
+        return self._exportable.get_maximum_electricity_production(unit)
+
+    def get_storage_volumes(self, unit: Unit) -> AttributeSet:
+        return self._exportable.get_storage_volumes(unit)
+
+    def _get_attribute_set(self, attribute_type: AttributeType, unit: Unit) -> AttributeSet:
+        match attribute_type:
+            case AttributeType.FUEL_CONSUMPTION:
+                return self.get_fuel_consumption()
+            case AttributeType.POWER_CONSUMPTION:
+                return self.get_power_consumption(unit)
+            case AttributeType.EMISSIONS:
+                return self.get_emissions(unit)
+            case AttributeType.ELECTRICITY_PRODUCTION:
+                return self.get_electricity_production(unit)
+            case AttributeType.MAXIMUM_ELECTRICITY_PRODUCTION:
+                return self.get_maximum_electricity_production(unit)
+            case AttributeType.STORAGE_VOLUMES:
+                return self.get_storage_volumes(unit)
+            case _:
+                assert_never(attribute_type)
+
+    def get_attribute_matrix(self, attribute_type: AttributeType, unit: Unit) -> AttributeMatrix:
+        # Fuel consumption is not converted, i.e. the same for all units
+        key = (attribute_type, None if attribute_type == AttributeType.FUEL_CONSUMPTION else unit)
+        attribute_matrix = self._attribute_matrices.get(key)
+        if attribute_matrix is None:
+            attribute_matrix = AttributeMatrix(self._get_attribute_set(attribute_type, unit), self.get_periods())
+            self._attribute_matrices[key] = attribute_matrix
+        return attribute_matrix
+
+    @classmethod
+    def get_attribute_matrix_for(
+        cls, exportable: Exportable, attribute_type: AttributeType, unit: Unit
+    ) -> AttributeMatrix:
+        """Get the attribute matrix, reusing the matrices of the exportable if it is an AttributeMatrixExportable."""
+        if not isinstance(exportable, AttributeMatrixExportable):
+            exportable = cls(exportable)
+        return exportable.get_attribute_matrix(attribute_type, unit)
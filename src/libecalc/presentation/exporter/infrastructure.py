@@ -1,6 +1,5 @@
 import math
 from collections.abc import Iterable
-from datetime import datetime
 from typing import TypeVar, assert_never
 
 from libecalc.common.errors.exceptions import ProgrammingError
@@ -145,39 +144,36 @@ class InstallationExportable(Exportable):
 
         periods = Periods.create_periods(sorted(timesteps), include_before=False, include_after=False)
 
-        def _get_category(
-            temporal_category: TemporalModel[TCategory] | None, period: Period | datetime
-        ) -> TCategory | None:
+        def _get_categories(temporal_category: TemporalModel[TCategory] | None) -> list[TCategory | None]:
             """
-            Get category for a timestep, returning None if temporal category is None or not defined for timestep
+            Get category for each period, None if temporal category is None or not defined for the period
             Args:
                 temporal_category: temporal category
-                period: the period to get category for
 
-            Returns: category or None
+            Returns: category or None for each period
             """
             if temporal_category is None:
-                return None
-
-            try:
-                return temporal_category.get_model(period)
-            except ValueError:
-                # category not defined for timestep
-                return None
-
-        combined = []
-        for period in periods:
-            combined.append(
-                (
-                    period,
-                    AttributeMeta(
-                        fuel_category=_get_category(fuel_category, period),
-                        consumer_category=_get_category(consumer_category, period),
-                        producer_category=_get_category(producer_category, period),
-                    ),
-                )
+                return [None] * len(periods)
+
+            return temporal_category.get_models_for_periods(periods)
+
+        return [
+            (
+                period,
+                AttributeMeta(
+                    fuel_category=period_fuel_category,
+                    consumer_category=period_consumer_category,
+                    producer_category=period_producer_category,
+                ),
+            )
+            for period, period_fuel_category, period_consumer_category, period_producer_category in zip(
+                periods,
+                _get_categories(fuel_category),
+                _get_categories(consumer_category),
+                _get_categories(producer_category),
+                strict=True,
             )
-        return combined
+        ]
 
     def _get_temporal_fuel_category(self, temporal_fuel: TemporalModel[Fuel]) -> TemporalModel[str | None]:
         """
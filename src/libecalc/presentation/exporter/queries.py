@@ -1,9 +1,9 @@
 import abc
-from collections import defaultdict
 
-from libecalc.common.time_utils import Frequency, Period, Periods, resample_periods
+from libecalc.common.time_utils import Frequency, Period, resample_periods
 from libecalc.common.units import Unit
 from libecalc.common.utils.rates import TimeSeriesFloat, TimeSeriesVolumes
+from libecalc.presentation.exporter.attribute_matrix import AttributeMatrixExportable, AttributeType
 from libecalc.presentation.exporter.domain.exportable import Exportable
 
 
@@ -73,30 +73,17 @@ class FuelQuery(Query):
         if self.installation_category is not None and self.installation_category != installation_graph.get_category():
             return None
 
-        aggregated_result: defaultdict[Period, float] = defaultdict(float)
-        for attribute in installation_graph.get_fuel_consumption():
-            meta = attribute.get_meta()
-            if self.fuel_type_category is not None and meta.fuel_category != self.fuel_type_category:
-                continue
-
-            if self.consumer_categories is not None and meta.consumer_category not in self.consumer_categories:
-                continue
-
-            for period, fuel_volume in attribute.datapoints():
-                aggregated_result[period] += fuel_volume
-
-        sorted_result = dict(
-            sorted(zip(aggregated_result.keys(), aggregated_result.values()))
-        )  # Sort tuple with datetime and values, basically means sort on date since dates are unique?
-        sorted_result = {
-            **dict.fromkeys(installation_graph.get_periods(), 0.0),
-            **sorted_result,
-        }  # Fill missing periods with zeroes, also keep sort?
-        period_keys = list(sorted_result.keys())
+        attribute_matrix = AttributeMatrixExportable.get_attribute_matrix_for(
+            installation_graph, AttributeType.FUEL_CONSUMPTION, unit
+        )
+        periods, values = attribute_matrix.sum(
+            attribute_matrix.mask(
+                fuel_category=self.fuel_type_category,
+                consumer_categories=self.consumer_categories,
+            )
+        )
         resampled_results = (
-            TimeSeriesVolumes(periods=Periods(period_keys), values=list(sorted_result.values()), unit=unit)
-            .resample(freq=frequency)
-            .fill_nan(0)
+            TimeSeriesVolumes(periods=periods, values=values, unit=unit).resample(freq=frequency).fill_nan(0)
         )
         return {
             resampled_results.periods.periods[i]: resampled_results.values[i] for i in range(len(resampled_results))
@@ -121,23 +108,12 @@ class StorageVolumeQuery(Query):
         if self.installation_category is not None and self.installation_category != installation_graph.get_category():
             return None
 
-        aggregated_result: defaultdict[Period, float] = defaultdict(float)
-        for attribute in installation_graph.get_storage_volumes(unit):
-            meta = attribute.get_meta()
-
-            if self.consumer_categories is not None and meta.consumer_category not in self.consumer_categories:
-                continue
-
-            for period, fuel_volume in attribute.datapoints():
-                aggregated_result[period] += fuel_volume
-
-        sorted_result = dict(dict(sorted(zip(aggregated_result.keys(), aggregated_result.values()))).items())
-        sorted_result = {**dict.fromkeys(installation_graph.get_periods(), 0.0), **sorted_result}
-        period_keys = list(sorted_result.keys())
+        attribute_matrix = AttributeMatrixExportable.get_attribute_matrix_for(
+            installation_graph, AttributeType.STORAGE_VOLUMES, unit
+        )
+        periods, values = attribute_matrix.sum(attribute_matrix.mask(consumer_categories=self.consumer_categories))
         resampled_results = (
-            TimeSeriesVolumes(periods=Periods(period_keys), values=list(sorted_result.values()), unit=unit)
-            .resample(freq=frequency)
-            .fill_nan(0)
+            TimeSeriesVolumes(periods=periods, values=values, unit=unit).resample(freq=frequency).fill_nan(0)
         )
         return {
             resampled_results.periods.periods[i]: resampled_results.values[i] for i in range(len(resampled_results))
@@ -166,27 +142,19 @@ class EmissionQuery(Query):
         if self.installation_category is not None and self.installation_category != installation_graph.get_category():
             return None
 
-        aggregated_result: defaultdict[Period, float] = defaultdict(float)
-        for attribute in installation_graph.get_emissions(unit):
-            meta = attribute.get_meta()
-            if self.fuel_type_category is not None and meta.fuel_category != self.fuel_type_category:
-                continue
-
-            if self.consumer_categories is not None and meta.consumer_category not in self.consumer_categories:
-                continue
-
-            if self.emission_type is not None and meta.emission_type != self.emission_type:
-                continue
-
-            for period, emission_volume in attribute.datapoints():
-                aggregated_result[period] += emission_volume
-
-        sorted_result = dict(dict(sorted(zip(aggregated_result.keys(), aggregated_result.values()))).items())
-        sorted_result = {**dict.fromkeys(installation_graph.get_periods(), 0.0), **sorted_result}
-        period_keys = list(sorted_result.keys())
+        attribute_matrix = AttributeMatrixExportable.get_attribute_matrix_for(
+            installation_graph, AttributeType.EMISSIONS, unit
+        )
+        periods, values = attribute_matrix.sum(
+            attribute_matrix.mask(
+                fuel_category=self.fuel_type_category,
+                consumer_categories=self.consumer_categories,
+                emission_type=self.emission_type,
+            )
+        )
 
         resampled_result = (
-            TimeSeriesVolumes(periods=Periods(period_keys), values=list(sorted_result.values()), unit=unit)
+            TimeSeriesVolumes(periods=periods, values=values, unit=unit)
             .resample(freq=frequency)
             .to_unit(Unit.KILO)
             .to_unit(unit)
@@ -212,24 +180,13 @@ class ElectricityGeneratedQuery(Query):
         if self.installation_category is not None and self.installation_category != installation_graph.get_category():
             return None
 
-        aggregated_result: defaultdict[Period, float] = defaultdict(float)
-        for attribute in installation_graph.get_electricity_production(unit):
-            meta = attribute.get_meta()
-
-            if self.producer_categories is not None and meta.producer_category not in self.producer_categories:
-                continue
-
-            for period, production_volume in attribute.datapoints():
-                aggregated_result[period] += production_volume
-
-        sorted_result = dict(dict(sorted(zip(aggregated_result.keys(), aggregated_result.values()))).items())
-        sorted_result = {**dict.fromkeys(installation_graph.get_periods(), 0.0), **sorted_result}
-        period_keys = list(sorted_result.keys())
+        attribute_matrix = AttributeMatrixExportable.get_attribute_matrix_for(
+            installation_graph, AttributeType.ELECTRICITY_PRODUCTION, unit
+        )
+        periods, values = attribute_matrix.sum(attribute_matrix.mask(producer_categories=self.producer_categories))
 
         resampled_result = (
-            TimeSeriesVolumes(periods=Periods(period_keys), values=list(sorted_result.values()), unit=unit)
-            .resample(freq=frequency)
-            .fill_nan(0)
+            TimeSeriesVolumes(periods=periods, values=values, unit=unit).resample(freq=frequency).fill_nan(0)
         )
 
         return {resampled_result.periods.periods[i]: resampled_result.values[i] for i in range(len(resampled_result))}
@@ -251,28 +208,17 @@ class MaxUsageFromShoreQuery(Query):
         if self.installation_category is not None and self.installation_category != installation_graph.get_category():
             return None
 
-        aggregated_result: defaultdict[Period, float] = defaultdict(float)
-        for attribute in installation_graph.get_maximum_electricity_production(unit):
-            meta = attribute.get_meta()
-
-            if self.producer_categories is not None and meta.producer_category not in self.producer_categories:
-                continue
-
-            for period, production_volume in attribute.datapoints():
-                aggregated_result[period] += production_volume
-
-        sorted_result = dict(dict(sorted(zip(aggregated_result.keys(), aggregated_result.values()))).items())
-        sorted_result = {**dict.fromkeys(installation_graph.get_periods(), 0.0), **sorted_result}
-        period_keys = list(sorted_result.keys())
+        attribute_matrix = AttributeMatrixExportable.get_attribute_matrix_for(
+            installation_graph, AttributeType.MAXIMUM_ELECTRICITY_PRODUCTION, unit
+        )
+        periods, values = attribute_matrix.sum(attribute_matrix.mask(producer_categories=self.producer_categories))
 
         # Max usage from shore is time series float (values)
         # The maximum value with in each period in sorted_results should be found for the new periods
+        resampled_result = TimeSeriesFloat(periods=periods, values=values, unit=unit).resample(freq=frequency)
 
         return {
-            period: TimeSeriesFloat(periods=Periods(period_keys), values=list(sorted_result.values()), unit=unit)
-            .resample(freq=frequency)
-            .for_period(period)
-            .max
+            period: resampled_result.for_period(period).max
             for period in resample_periods(periods=installation_graph.get_periods(), frequency=frequency)
         }
 
@@ -297,27 +243,18 @@ class PowerConsumptionQuery(Query):
         if self.installation_category is not None and self.installation_category != installation_graph.get_category():
             return None
 
-        aggregated_result: defaultdict[Period, float] = defaultdict(float)
-        for attribute in installation_graph.get_power_consumption(unit):
-            meta = attribute.get_meta()
-
-            if self.producer_categories is not None and meta.producer_category not in self.producer_categories:
-                continue
-
-            if self.consumer_categories is not None and meta.consumer_category not in self.consumer_categories:
-                continue
-
-            for period, consumption_volume in attribute.datapoints():
-                aggregated_result[period] += consumption_volume
-
-        sorted_result = dict(dict(sorted(zip(aggregated_result.keys(), aggregated_result.values()))).items())
-        sorted_result = {**dict.fromkeys(installation_graph.get_periods(), 0.0), **sorted_result}
-        period_keys = list(sorted_result.keys())
+        attribute_matrix = AttributeMatrixExportable.get_attribute_matrix_for(
+            installation_graph, AttributeType.POWER_CONSUMPTION, unit
+        )
+        periods, values = attribute_matrix.sum(
+            attribute_matrix.mask(
+                producer_categories=self.producer_categories,
+                consumer_categories=self.consumer_categories,
+            )
+        )
 
         resampled_result = (
-            TimeSeriesVolumes(periods=Periods(period_keys), values=list(sorted_result.values()), unit=unit)
-            .resample(freq=frequency)
-            .fill_nan(0)
+            TimeSeriesVolumes(periods=periods, values=values, unit=unit).resample(freq=frequency).fill_nan(0)
         )
 
         return {resampled_result.periods.periods[i]: resampled_result.values[i] for i in range(len(resampled_result))}
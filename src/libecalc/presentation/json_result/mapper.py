@@ -1,7 +1,6 @@
 import math
-import operator
 from collections.abc import Sequence
-from functools import reduce
+from dataclasses import dataclass
 from typing import assert_never, cast
 
 import numpy as np
@@ -24,7 +23,7 @@ from libecalc.common.utils.rates import (
 from libecalc.core.result.results import CompressorResult, PumpResult
 from libecalc.core.result.results import ConsumerSystemResult as CoreConsumerSystemResult
 from libecalc.core.result.results import GenericComponentResult as CoreGenericComponentResult
-from libecalc.domain.energy import Emitter, EnergyModel
+from libecalc.domain.energy import EnergyModel
 from libecalc.domain.energy.energy_component import EnergyContainerID
 from libecalc.domain.infrastructure.energy_components.electricity_consumer.electricity_consumer import (
     ElectricityConsumer,
@@ -32,7 +31,6 @@ from libecalc.domain.infrastructure.energy_components.electricity_consumer.elect
 from libecalc.domain.infrastructure.energy_components.fuel_consumer.fuel_consumer import FuelConsumerComponent
 from libecalc.domain.infrastructure.energy_components.installation.installation import InstallationComponent
 from libecalc.domain.infrastructure.energy_components.legacy_consumer.system import ConsumerSystemConsumerFunction
-from libecalc.domain.installation import FuelConsumer, PowerConsumer
 from libecalc.domain.process.compressor.core.base import CompressorWithTurbineModel
 from libecalc.domain.process.compressor.core.sampled import CompressorModelSampled
 from libecalc.domain.process.compressor.core.train.base import CompressorTrainModel
@@ -978,6 +976,20 @@ class TimeSeriesHelper:
         return timeseries.to_volumes().to_unit(unit).cumulative() if timeseries else None
 
 
+@dataclass
+class InstallationRates:
+    """
+    The rates of the consumers and emitters of an installation, in the units used in the results. Collected once per
+    installation, and summed for both the installation and the asset.
+    """
+
+    electrical_power: list[TimeSeriesRate]
+    mechanical_power: list[TimeSeriesRate]
+    fuel_consumption: list[TimeSeriesRate]
+    emissions: list[dict[str, TimeSeriesRate]]
+    hydrocarbon_export_rate: TimeSeriesRate
+
+
 class InstallationMapper:
     """
     A helper class for evaluating and aggregating installation results.
@@ -1223,16 +1235,43 @@ class InstallationMapper:
             rate_exceeds_maximum=rate_exceeds_maximum,
         )
 
-    def map_installation(self, installation: InstallationComponent, parent_name: str) -> InstallationResult | None:
+    @staticmethod
+    def get_installation_rates(installation: InstallationComponent) -> InstallationRates:
+        return InstallationRates(
+            electrical_power=[
+                consumer.get_power_consumption().to_unit(Unit.MEGA_WATT)
+                for consumer in installation.get_electrical_power_consumers()
+            ],
+            mechanical_power=[
+                consumer.get_power_consumption().to_unit(Unit.MEGA_WATT)
+                for consumer in installation.get_mechanical_power_consumers()
+            ],
+            fuel_consumption=[
+                consumer.get_fuel_consumption().rate.to_unit(Unit.STANDARD_CUBIC_METER_PER_DAY).to_calendar_day()
+                for consumer in installation.get_fuel_consumers()
+            ],
+            emissions=[
+                {
+                    emission_name: emission_rate.to_calendar_day()
+                    for emission_name, emission_rate in emitter.get_emissions().items()
+                }
+                for emitter in installation.get_emitters()
+            ],
+            hydrocarbon_export_rate=installation.hydrocarbon_export.time_series,
+        )
+
+    def map_installation(
+        self, installation: InstallationComponent, parent_name: str, installation_rates: InstallationRates
+    ) -> InstallationResult | None:
         expression_evaluator = installation.expression_evaluator
         regularity = installation.regularity
-        hydrocarbon_export_rate = installation.hydrocarbon_export.time_series
+        hydrocarbon_export_rate = installation_rates.hydrocarbon_export_rate
 
         installation_node_info = self._model.get_container_info(installation.get_id())
 
-        power_electrical = self.aggregate_power_consumption(installation.get_electrical_power_consumers())
+        power_electrical = self.aggregate_power_consumption(installation_rates.electrical_power)
 
-        power_mechanical = self.aggregate_power_consumption(installation.get_mechanical_power_consumers())
+        power_mechanical = self.aggregate_power_consumption(installation_rates.mechanical_power)
 
         power = (
             power_electrical + power_mechanical
@@ -1240,7 +1279,7 @@ class InstallationMapper:
             else (power_mechanical or power_electrical)
         )
 
-        fuel_consumption = self.aggregate_fuel_consumption(installation.get_fuel_consumers())
+        fuel_consumption = self.aggregate_fuel_consumption(installation_rates.fuel_consumption)
 
         return libecalc.presentation.json_result.result.InstallationResult(
             id=installation_node_info.name,
@@ -1263,7 +1302,7 @@ class InstallationMapper:
             energy_usage=fuel_consumption,
             energy_usage_cumulative=fuel_consumption.to_volumes().cumulative(),
             hydrocarbon_export_rate=hydrocarbon_export_rate,
-            emissions=EmissionHelper.to_full_result(self.aggregate_emissions(installation.get_emitters())),
+            emissions=EmissionHelper.to_full_result(self.aggregate_emissions(installation_rates.emissions)),
             regularity=regularity.time_series,
         )
 
@@ -1378,43 +1417,25 @@ class InstallationMapper:
             assert_never(process_type)
 
     @staticmethod
-    def aggregate_emissions(emitters: list[Emitter]) -> dict[str, TimeSeriesRate]:
-        emission_rates: dict[str, TimeSeriesRate] = {}
-        for emitter in emitters:
-            emissions = emitter.get_emissions()
-            for emission_name, emission_rate in emissions.items():
-                if emission_name not in emission_rates:
-                    emission_rates[emission_name] = emission_rate.to_calendar_day()
-                else:
-                    emission_rates[emission_name] += emission_rate.to_calendar_day()
-        return emission_rates
+    def aggregate_emissions(emissions: list[dict[str, TimeSeriesRate]]) -> dict[str, TimeSeriesRate]:
+        emission_rates: dict[str, list[TimeSeriesRate]] = {}
+        for emitter_emissions in emissions:
+            for emission_name, emission_rate in emitter_emissions.items():
+                emission_rates.setdefault(emission_name, []).append(emission_rate)
+        return {emission_name: TimeSeriesRate.sum(rates) for emission_name, rates in emission_rates.items()}
 
     @staticmethod
-    def aggregate_power_consumption(
-        power_consumers: list[PowerConsumer],
-    ) -> TimeSeriesRate | None:
-        if len(power_consumers) == 0:
+    def aggregate_power_consumption(power_consumption: list[TimeSeriesRate]) -> TimeSeriesRate | None:
+        if len(power_consumption) == 0:
             return None
 
-        return reduce(
-            operator.add,
-            [consumer.get_power_consumption().to_unit(Unit.MEGA_WATT) for consumer in power_consumers],
-        )
+        return TimeSeriesRate.sum(power_consumption)
 
-    def aggregate_fuel_consumption(
-        self,
-        fuel_consumers: list[FuelConsumer],
-    ) -> TimeSeriesRate | None:
-        if len(fuel_consumers) == 0:
+    def aggregate_fuel_consumption(self, fuel_consumption: list[TimeSeriesRate]) -> TimeSeriesRate:
+        if len(fuel_consumption) == 0:
             return self.get_zero_fuel_consumption_rate()
 
-        return reduce(
-            operator.add,
-            [
-                consumer.get_fuel_consumption().rate.to_unit(Unit.STANDARD_CUBIC_METER_PER_DAY).to_calendar_day()
-                for consumer in fuel_consumers
-            ],
-        )
+        return TimeSeriesRate.sum(fuel_consumption)
 
 
 class OperationalSettingHelper:
@@ -1431,27 +1452,19 @@ def get_asset_result(model: YamlModel) -> libecalc.presentation.json_result.resu
     installation_mapper = InstallationMapper(model)
     energy_model = model.get_energy_model()
 
-    hydrocarbon_export_rates: list[TimeSeriesRate] = []
-
-    fuel_consumers = []
-    mechanical_power_consumers = []
-    electrical_power_consumers = []
-    emitters = []
+    installation_rates: list[InstallationRates] = []
 
     sub_components: list[JsonResultComponentResult] = []
     models: list[CompressorModelResult | PumpModelResult | GenericModelResult] = []
     for installation in model.get_installations():
         assert isinstance(installation, InstallationComponent)
 
-        hydrocarbon_export_rates.append(installation.hydrocarbon_export.time_series)
+        rates = installation_mapper.get_installation_rates(installation)
+        installation_rates.append(rates)
 
-        fuel_consumers.extend(installation.get_fuel_consumers())
-        mechanical_power_consumers.extend(installation.get_mechanical_power_consumers())
-        electrical_power_consumers.extend(installation.get_electrical_power_consumers())
-
-        emitters.extend(installation.get_emitters())
-
-        mapped_installation = installation_mapper.map_installation(installation, parent_name=model.get_name())
+        mapped_installation = installation_mapper.map_installation(
+            installation, parent_name=model.get_name(), installation_rates=rates
+        )
         if mapped_installation is not None:
             sub_components.append(mapped_installation)
 
@@ -1464,14 +1477,18 @@ def get_asset_result(model: YamlModel) -> libecalc.presentation.json_result.resu
             models.extend(ecalc_model_result.models)
 
     # Summing hydrocarbon export rates from all installations
-    asset_hydrocarbon_export_rate_core = reduce(
-        operator.add,
-        hydrocarbon_export_rates,
+    asset_hydrocarbon_export_rate_core = TimeSeriesRate.sum(
+        [rates.hydrocarbon_export_rate for rates in installation_rates]
     )
 
     # Summing power values from all installations
-    asset_power_electrical_core = installation_mapper.aggregate_power_consumption(electrical_power_consumers)
-    asset_power_mechanical_core = installation_mapper.aggregate_power_consumption(mechanical_power_consumers)
+    # Summing the rates of all consumers, not the installation totals, as if adding the rates one at a time
+    asset_power_electrical_core = installation_mapper.aggregate_power_consumption(
+        [rate for rates in installation_rates for rate in rates.electrical_power]
+    )
+    asset_power_mechanical_core = installation_mapper.aggregate_power_consumption(
+        [rate for rates in installation_rates for rate in rates.mechanical_power]
+    )
 
     asset_power_core = (
         asset_power_mechanical_core + asset_power_electrical_core
@@ -1489,7 +1506,9 @@ def get_asset_result(model: YamlModel) -> libecalc.presentation.json_result.resu
     )
 
     # Summing energy usage from all installations
-    asset_energy_usage_core = installation_mapper.aggregate_fuel_consumption(fuel_consumers=fuel_consumers)
+    asset_energy_usage_core = installation_mapper.aggregate_fuel_consumption(
+        [rate for rates in installation_rates for rate in rates.fuel_consumption]
+    )
 
     # Converting total energy usage to cumulative values
     asset_energy_usage_cumulative = asset_energy_usage_core.to_volumes().cumulative()
@@ -1512,7 +1531,11 @@ def get_asset_result(model: YamlModel) -> libecalc.presentation.json_result.resu
         energy_usage=asset_energy_usage_core,
         energy_usage_cumulative=asset_energy_usage_cumulative,
         hydrocarbon_export_rate=asset_hydrocarbon_export_rate_core,
-        emissions=EmissionHelper.to_full_result(InstallationMapper.aggregate_emissions(emitters)),
+        emissions=EmissionHelper.to_full_result(
+            InstallationMapper.aggregate_emissions(
+                [emissions for rates in installation_rates for emissions in rates.emissions]
+            )
+        ),
     )
 
     return libecalc.presentation.json_result.result.results.EcalcModelResult(
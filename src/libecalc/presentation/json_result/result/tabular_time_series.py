@@ -1,4 +1,7 @@
 from abc import ABC
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Annotated, Self
 
@@ -6,7 +9,7 @@ import pandas as pd
 from pydantic import TypeAdapter, WrapSerializer
 from pydantic_core.core_schema import SerializationInfo
 
-from libecalc.common.time_utils import Frequency, Periods, resample_periods
+from libecalc.common.time_utils import Frequency, Period, Periods
 from libecalc.common.units import Unit
 from libecalc.common.utils.rates import (
     RateType,
@@ -14,6 +17,7 @@ from libecalc.common.utils.rates import (
     TimeSeriesBoolean,
     TimeSeriesRate,
     TimeSeriesVolumesCumulative,
+    get_resampling,
 )
 from libecalc.presentation.json_result.result.base import EcalcResultBaseModel
 
@@ -37,6 +41,46 @@ def with_timesteps(v: Periods, handler, info: SerializationInfo):
 PeriodsWithTimesteps = Annotated[Periods, WrapSerializer(with_timesteps)]
 
 
+def _get_column_name(attribute_name: str, time_series: TimeSeries) -> str:
+    unit_value = time_series.unit
+    if isinstance(time_series, TimeSeriesRate):
+        unit_extension = "sd" if time_series.rate_type == RateType.STREAM_DAY else "cd"
+        if time_series.unit == Unit.MEGA_WATT:
+            unit_value = unit_value.replace(Unit.MEGA_WATT, f"{Unit.MEGA_WATT} ({unit_extension})")
+        else:
+            unit_value = unit_value.replace("/d", f"/{unit_extension}")
+    elif isinstance(time_series, TimeSeriesVolumesCumulative):
+        unit_value = unit_value.replace(time_series.unit, f"{time_series.unit} (cd)")
+
+    return f"{attribute_name}[{unit_value}]"
+
+
+def _get_column_values(time_series: TimeSeries) -> list:
+    if isinstance(time_series, TimeSeriesBoolean):
+        return [int(v) for v in time_series.values]
+    return time_series.values
+
+
+@dataclass(frozen=True)
+class TabularColumn:
+    """A column in the dataframe of a TabularTimeSeries, see TabularTimeSeries.iter_columns.
+
+    Attributes:
+        name: Name of the column, including the prefixes.
+        time_series: The time series giving the values of the column.
+        row_periods: The periods of the TabularTimeSeries containing the time series, outermost first. As in the
+            dataframe, the column only has values for the start dates found in all of them.
+    """
+
+    name: str
+    time_series: TimeSeries
+    row_periods: tuple[Periods, ...]
+
+    def get_values(self) -> list:
+        """The values of the time series, TimeSeriesBoolean is converted into ints."""
+        return _get_column_values(self.time_series)
+
+
 class TabularTimeSeries(ABC, EcalcResultBaseModel):
     name: str
     periods: PeriodsWithTimesteps
@@ -61,24 +105,10 @@ class TabularTimeSeries(ABC, EcalcResultBaseModel):
 
         for attribute_name, attribute_value in self.__dict__.items():
             if isinstance(attribute_value, TimeSeries):
-                unit_value = attribute_value.unit
-                if isinstance(attribute_value, TimeSeriesRate):
-                    unit_extension = "sd" if attribute_value.rate_type == RateType.STREAM_DAY else "cd"
-                    if attribute_value.unit == Unit.MEGA_WATT:
-                        unit_value = unit_value.replace(Unit.MEGA_WATT, f"{Unit.MEGA_WATT} ({unit_extension})")
-                    else:
-                        unit_value = unit_value.replace("/d", f"/{unit_extension}")
-                elif isinstance(attribute_value, TimeSeriesVolumesCumulative):
-                    unit_value = unit_value.replace(attribute_value.unit, f"{attribute_value.unit} (cd)")
-
-                column_name = f"{attribute_name}[{unit_value}]"
-
-                if isinstance(attribute_value, TimeSeriesBoolean):
-                    values = [int(v) for v in attribute_value.values]
-                else:
-                    values = attribute_value.values
-
-                timeseries_df = pd.DataFrame({column_name: values}, index=attribute_value.periods.start_dates)
+                timeseries_df = pd.DataFrame(
+                    {_get_column_name(attribute_name, attribute_value): _get_column_values(attribute_value)},
+                    index=attribute_value.periods.start_dates,
+                )
                 df = df.join(timeseries_df)
             elif isinstance(attribute_value, list):
                 if len(attribute_value) > 0 and all(isinstance(item, TabularTimeSeries) for item in attribute_value):
@@ -100,6 +130,38 @@ class TabularTimeSeries(ABC, EcalcResultBaseModel):
 
         return df
 
+    def iter_columns(self, prefix: str | None = None, row_periods: tuple[Periods, ...] = ()) -> Iterator[TabularColumn]:
+        """
+        Iterate the columns of the dataframe given by to_dataframe, in the same order, without creating the dataframe.
+
+        Args:
+            prefix: prefix for all column names
+            row_periods: periods of the TabularTimeSeries containing this one, outermost first
+
+        Returns:
+
+        """
+        row_periods = (*row_periods, self.periods)
+        column_prefix = f"{prefix}." if prefix is not None else ""
+        for attribute_name, attribute_value in self.__dict__.items():
+            if isinstance(attribute_value, TimeSeries):
+                yield TabularColumn(
+                    name=column_prefix + _get_column_name(attribute_name, attribute_value),
+                    time_series=attribute_value,
+                    row_periods=row_periods,
+                )
+            elif isinstance(attribute_value, list):
+                if len(attribute_value) > 0 and all(isinstance(item, TabularTimeSeries) for item in attribute_value):
+                    for item in attribute_value:
+                        yield from item.iter_columns(prefix=column_prefix + item.name, row_periods=row_periods)
+            elif (
+                isinstance(attribute_value, dict)
+                and len(attribute_value) > 0
+                and all(isinstance(item, TabularTimeSeries) for item in attribute_value.values())
+            ):
+                for item in attribute_value.values():
+                    yield from item.iter_columns(prefix=column_prefix + item.name, row_periods=row_periods)
+
     def resample(self, freq: Frequency) -> Self:
         """
         Immutable - returns a copy of itself
@@ -107,6 +169,9 @@ class TabularTimeSeries(ABC, EcalcResultBaseModel):
         Resample the given time series to the new Frequency given. Only data
         that is defined as a timeseries will be resampled.
 
+        The time series of this and the nested TabularTimeSeries are grouped by type and periods, and each group is
+        resampled at once with the values stacked in a 2D array, see TimeSeries.resample_stacked.
+
         Args:
             freq: which frequency to resample to
 
@@ -115,18 +180,60 @@ class TabularTimeSeries(ABC, EcalcResultBaseModel):
         """
         if freq == freq.NONE:
             return self.model_copy()
+
+        groups: dict[tuple[type[TimeSeries], tuple[Period, ...]], list[TimeSeries]] = defaultdict(list)
+        for time_series in self._iter_time_series():
+            groups[(type(time_series), tuple(time_series.periods.periods))].append(time_series)
+
+        resampled_time_series: dict[int, TimeSeries] = {}
+        for (time_series_type, _), group in groups.items():
+            for time_series, resampled in zip(group, time_series_type.resample_stacked(group, freq=freq), strict=True):
+                resampled_time_series[id(time_series)] = resampled
+
+        return self._with_resampled_time_series(freq, resampled_time_series)
+
+    def _iter_time_series(self) -> Iterator[TimeSeries]:
+        """The time series resampled by resample, including those of nested TabularTimeSeries."""
+        for values in self.__dict__.values():
+            if isinstance(values, TimeSeries):
+                yield values
+            elif isinstance(values, TabularTimeSeries):
+                yield from values._iter_time_series()
+            elif isinstance(values, list):
+                if len(values) > 0 and all(isinstance(item, TabularTimeSeries) for item in values):
+                    for item in values:
+                        yield from item._iter_time_series()
+            elif isinstance(values, dict):
+                if len(values) > 0 and all(isinstance(item, TabularTimeSeries) for item in values.values()):
+                    for item in values.values():
+                        yield from item._iter_time_series()
+
+    def _with_resampled_time_series(self, freq: Frequency, resampled_time_series: dict[int, TimeSeries]) -> Self:
+        """A copy of itself using the resampled time series, by id of the original time series."""
         resampled = self.model_copy()
         for attribute, values in self.__dict__.items():
-            if isinstance(values, TimeSeries) or isinstance(values, TabularTimeSeries):
-                resampled.__setattr__(attribute, values.resample(freq=freq))
+            if isinstance(values, TimeSeries):
+                resampled.__setattr__(attribute, resampled_time_series[id(values)])
+
+            elif isinstance(values, TabularTimeSeries):
+                resampled.__setattr__(attribute, values._with_resampled_time_series(freq, resampled_time_series))
 
             elif isinstance(values, list):
                 if len(values) > 0 and all(isinstance(item, TabularTimeSeries) for item in values):
-                    resampled.__setattr__(attribute, [item.resample(freq) for item in values])
+                    resampled.__setattr__(
+                        attribute,
+                        [item._with_resampled_time_series(freq, resampled_time_series) for item in values],
+                    )
 
             elif isinstance(values, dict):
                 if len(values) > 0 and all(isinstance(item, TabularTimeSeries) for item in values.values()):
-                    resampled.__setattr__(attribute, {key: item.resample(freq) for key, item in values.items()})
+                    resampled.__setattr__(
+                        attribute,
+                        {
+                            key: item._with_resampled_time_series(freq, resampled_time_series)
+                            for key, item in values.items()
+                        },
+                    )
                 else:
                     # NOTE: Operational settings are not resampled. Should add support?
                     pass
@@ -135,5 +242,5 @@ class TabularTimeSeries(ABC, EcalcResultBaseModel):
                 # NOTE: turbine_result is not resampled. Should add support?
                 pass
 
-        resampled.periods = resample_periods(self.periods, frequency=freq)
+        resampled.periods = get_resampling(self.periods, freq=freq).periods
         return resampled
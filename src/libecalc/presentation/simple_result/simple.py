@@ -1,5 +1,8 @@
+from collections.abc import Sequence
+from datetime import datetime
 from typing import NamedTuple
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, model_validator
 
 from libecalc.common.component_info.component_level import ComponentLevel
@@ -7,7 +10,7 @@ from libecalc.common.component_type import ComponentType
 from libecalc.common.errors.exceptions import EcalcError
 from libecalc.common.logger import logger
 from libecalc.common.string.string_utils import to_camel_case
-from libecalc.common.time_utils import Period, Periods
+from libecalc.common.time_utils import Periods
 from libecalc.common.units import Unit
 from libecalc.presentation.json_result.result import ComponentResult, EcalcModelResult
 
@@ -56,16 +59,46 @@ class ComponentID(NamedTuple):
         return f"(type: '{self.componentType}', name: '{self.name}')"
 
 
-def _subtract_list(first: list[float], second: list[float]):
-    subtracted = []
-    for f, s in zip(first, second):
-        if f is None:
-            f = 0
-        if s is None:
-            s = 0
-        subtracted.append(f - s)
+def _to_float_matrix(rows: Sequence[Sequence[float | None]]) -> np.ndarray:
+    """Stack rows of equal length into a float matrix, treating missing values (None) as zero."""
+    matrix = np.array(rows, dtype=object).reshape(len(rows), -1)
+    matrix[np.equal(matrix, None)] = 0
+    return matrix.astype(float)
 
-    return subtracted
+
+def _subtract_list(first: list[float], second: list[float]) -> list[float]:
+    return (_to_float_matrix([first]) - _to_float_matrix([second]))[0].tolist()
+
+
+def _to_datetime64(dates: Sequence[datetime]) -> np.ndarray:
+    return np.array(dates, dtype="datetime64[us]")
+
+
+def _get_date_indices(dates: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Find the index of each target in the sorted dates. All targets must be in dates."""
+    indices = np.minimum(np.searchsorted(dates, targets), len(dates) - 1)
+    if np.any(dates[indices] != targets):
+        raise ValueError(f"{targets[dates[indices] != targets][0]} is not in list")
+    return indices
+
+
+def _get_period_indices(component_periods: Periods, periods: Periods) -> np.ndarray:
+    """Find the index of the component period covering each of the given periods.
+
+    Component periods outside the given periods are skipped, and component periods spanning several of the given
+    periods are repeated once for each of them.
+    """
+    start_dates = _to_datetime64(periods.start_dates)
+    end_dates = _to_datetime64(periods.end_dates)
+
+    # Intersection between each component period and the common period
+    intersection_start = np.maximum(_to_datetime64(component_periods.start_dates), start_dates[0])
+    intersection_end = np.minimum(_to_datetime64(component_periods.end_dates), end_dates[-1])
+    intersects = intersection_start < intersection_end
+
+    start_indices = _get_date_indices(start_dates, intersection_start[intersects])
+    end_indices = _get_date_indices(end_dates, intersection_end[intersects])
+    return np.repeat(np.flatnonzero(intersects), end_indices - start_indices + 1)
 
 
 class SimpleComponentResult(SimpleBase):
@@ -136,37 +169,32 @@ class SimpleComponentResult(SimpleBase):
         Returns:
             SimpleComponentResult: The component with the new periods, ie. start and end will be trimmed, and mid-periods will be added if the component has a longer period than the global period.
         """
-        power = []
-        energy_usage = []
-        is_valid = []
-        emissions: dict[str, SimpleEmissionResult] = {
-            emission.name: SimpleEmissionResult(name=emission.name, rate=[])
-            for emission in component.emissions.values()
+        # Index of the component period to use for each of the given periods. In case we have a longer period in
+        # component than the global period, e.g. if the common period has 2022-2023, but the component has 2022-2024,
+        # the index is repeated to extrapolate the missing period with same values as the bigger period.
+        period_indices = _get_period_indices(component.periods, periods)
+
+        # We do not trim extraneous periods in beginning and end for a component. We only try to fit to the common global period.
+        for period_index in sorted(set(range(len(component.periods))).difference(period_indices.tolist())):
+            logger.warning(
+                f"Period {component.periods[period_index]} from {component.name} not in {periods.period}. Skipping."
+            )
+
+        # Select the values of all time series in one go, keeping the values as is (object dtype)
+        rows = [component.energy_usage, component.is_valid]
+        if component.power is not None:
+            rows.append(component.power)
+        # Assume index exist if emission exist
+        rows.extend(emission.rate for emission in component.emissions.values())
+        fitted_rows = np.array(rows, dtype=object).reshape(len(rows), -1)[:, period_indices].tolist()
+
+        energy_usage, is_valid = fitted_rows[0], fitted_rows[1]
+        power = fitted_rows[2] if component.power is not None else []
+        emission_rates = fitted_rows[3:] if component.power is not None else fitted_rows[2:]
+        emissions = {
+            emission.name: SimpleEmissionResult(name=emission.name, rate=rate)
+            for emission, rate in zip(component.emissions.values(), emission_rates)
         }
-        # We loop through a components periods and try to fit it to the common global period.
-        for period_index, _period in enumerate(component.periods):
-            period = Period.intersection(_period, periods.period)
-            # If the period is not in the global period, we skip it. ie before or after the global common period.
-            if period:
-                start = periods.start_dates.index(period.start)
-                end = periods.end_dates.index(period.end)
-
-                # In case we have a longer period in component than the global period, we have to add missing steps/periods
-                # e.g. if the common period has 2022-2023, but the component has 2022-2024, we have to loop twice to extrapolate the missing period with same values as the bigger period.
-                # Usually this will only loop once.
-                for _ in range(start, end + 1):
-                    if component.power is not None:
-                        power.append(component.power[period_index])
-                    energy_usage.append(component.energy_usage[period_index])
-                    is_valid.append(component.is_valid[period_index])
-                    for emission in emissions.values():
-                        # Assume index exist if emission exist
-                        emission.rate.append(component.emissions[emission.name].rate[period_index])
-            else:
-                # We do not trim extraneous periods in beginning and end for a component. We only try to fit to the common global period.
-                logger.warning(
-                    f"Period {component.periods[period_index]} from {component.name} not in {periods.period}. Skipping."
-                )
 
         return cls(
             componentType=component.componentType,
@@ -202,22 +230,46 @@ class SimpleComponentResult(SimpleBase):
                 f"{reference_component.id} with unit '{reference_component.energy_usage_unit}'."
             )
 
+        emission_names = sorted(self.emissions)
+        for emission_name, reference_emission_name in zip(emission_names, sorted(reference_component.emissions)):
+            if emission_name != reference_emission_name:
+                raise ValueError(
+                    f"Can not subtract different emissions: '{emission_name}' and '{reference_emission_name}'"
+                )
+        emission_names = emission_names[: len(reference_component.emissions)]
+
+        # Subtract energy usage, power and all emissions as one matrix, rows in that order. Components without power
+        # on both sides have no power delta, a missing power on one side is treated as zero.
+        has_power = self.power is not None or reference_component.power is not None
+        number_of_periods = len(self.periods)
+
+        def get_time_series(component: SimpleComponentResult) -> list:
+            time_series = [component.energy_usage]
+            if has_power:
+                time_series.append(component.power if component.power is not None else [0] * number_of_periods)
+            time_series.extend(component.emissions[emission_name].rate for emission_name in emission_names)
+            return time_series
+
+        delta = (
+            _to_float_matrix(get_time_series(self)) - _to_float_matrix(get_time_series(reference_component))
+        ).tolist()
+        energy_usage = delta.pop(0)
+        power = delta.pop(0) if has_power else None
+        emission_rates = delta
+
         return SimpleComponentResult(
             name=self.name,
             parent=self.parent if self.parent == reference_component.parent else None,
             componentType=self.componentType,
             component_level=self.component_level,
             periods=self.periods,
-            is_valid=[changed and reference for changed, reference in zip(self.is_valid, reference_component.is_valid)],
-            energy_usage=_subtract_list(self.energy_usage, reference_component.energy_usage),
+            is_valid=np.logical_and(self.is_valid, reference_component.is_valid).tolist(),
+            energy_usage=energy_usage,
             energy_usage_unit=self.energy_usage_unit,
-            power=_subtract_list(self.power, reference_component.power),  # type: ignore[arg-type]
+            power=power,
             emissions={
-                self_e.name: self_e - reference_e
-                for self_e, reference_e in zip(
-                    sorted(self.emissions.values(), key=lambda emission: emission.name),
-                    sorted(reference_component.emissions.values(), key=lambda emission: emission.name),
-                )
+                emission_name: SimpleEmissionResult(name=emission_name, rate=rate)
+                for emission_name, rate in zip(emission_names, emission_rates)
             },
         )
 
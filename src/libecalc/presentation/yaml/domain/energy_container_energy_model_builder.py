@@ -55,6 +55,6 @@ class EnergyContainerEnergyModelBuilder:
             graph.add_edge(from_id, to_id)
 
         return EnergyContainerEnergyModel(
-            graph=graph,
+            graph=graph.freeze(),
             nodes=self._nodes,
         )
@@ -5,6 +5,9 @@ from libecalc.domain.time_series_cable_loss import TimeSeriesCableLoss
 from libecalc.presentation.yaml.consumer_category import ConsumerUserDefinedCategoryType
 from libecalc.presentation.yaml.domain.time_series_expression import TimeSeriesExpression
 
+# Category of periods not covered by the temporal model, distinct from a category that is None
+_NO_CATEGORY = object()
+
 
 class ExpressionTimeSeriesCableLoss(TimeSeriesCableLoss):
     """
@@ -25,17 +28,18 @@ class ExpressionTimeSeriesCableLoss(TimeSeriesCableLoss):
 
         result = []
 
-        for period, cable_loss in zip(periods, cable_loss_values):
-            try:
-                if self._category.get_model(period) == ConsumerUserDefinedCategoryType.POWER_FROM_SHORE:
-                    result.append(cable_loss)
-                else:
-                    result.append(0.0)
-            except ValueError:
+        for period, cable_loss, category in zip(
+            periods, cable_loss_values, self._category.get_models_for_periods(periods, default=_NO_CATEGORY)
+        ):
+            if category is _NO_CATEGORY:
                 logger.warning(
                     f"Temporal model for generator set category is not defined for period {period}. Assuming 0.0 cable loss."
                 )
                 result.append(0.0)
+            elif category == ConsumerUserDefinedCategoryType.POWER_FROM_SHORE:
+                result.append(cable_loss)
+            else:
+                result.append(0.0)
         return result
 
     def get_periods(self) -> Periods:
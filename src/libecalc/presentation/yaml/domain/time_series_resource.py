@@ -1,6 +1,8 @@
 import logging
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Self
 
 import numpy as np
@@ -8,11 +10,15 @@ import pandas as pd
 
 from libecalc.common.errors.exceptions import InvalidColumnException, InvalidResourceException, NoColumnsException
 from libecalc.common.string.string_utils import get_duplicates
+from libecalc.common.time_utils import Period
 from libecalc.domain.resource import Resource
+from libecalc.presentation.yaml.yaml_entities import CSV_READ_OPTIONS, MemoryResource
 from libecalc.presentation.yaml.yaml_keywords import EcalcYamlKeywords
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CHUNK_SIZE = 100_000
+
 
 class InvalidTimeSeriesResourceException(InvalidResourceException):
     def __init__(self, message):
@@ -42,17 +48,11 @@ class TimeSeriesResource(Resource):
         if len(headers) == 0:
             raise InvalidResourceException("Invalid resource", "Resource must at least have one column")
 
-        if EcalcYamlKeywords.date in headers:
-            # Find the column named "DATE" and use that as time vector
-            time_vector = resource.get_column(EcalcYamlKeywords.date)
-            headers = [header for header in headers if header != EcalcYamlKeywords.date]
-        elif EcalcYamlKeywords.dates in headers:
-            # Find the column named "DATES" and use that as time vector
-            time_vector = resource.get_column(EcalcYamlKeywords.dates)
-            headers = [header for header in headers if header != EcalcYamlKeywords.dates]
+        time_vector_header = self._get_time_vector_header(headers)
+        time_vector = resource.get_column(time_vector_header)
+        if time_vector_header in (EcalcYamlKeywords.date, EcalcYamlKeywords.dates):
+            headers = [header for header in headers if header != time_vector_header]
         else:
-            # Legacy: support random names for time vector as long as it is the first column
-            time_vector = resource.get_column(headers[0])
             headers = headers[1:]
 
         try:
@@ -70,6 +70,107 @@ class TimeSeriesResource(Resource):
 
         self._headers = headers
 
+    @staticmethod
+    def _get_time_vector_header(headers: list[str]) -> str:
+        if EcalcYamlKeywords.date in headers:
+            # Find the column named "DATE" and use that as time vector
+            return EcalcYamlKeywords.date
+        elif EcalcYamlKeywords.dates in headers:
+            # Find the column named "DATES" and use that as time vector
+            return EcalcYamlKeywords.dates
+        else:
+            # Legacy: support random names for time vector as long as it is the first column
+            return headers[0]
+
+    @classmethod
+    def from_path_in_period(cls, path: Path | str, period: Period, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Self:
+        """Read the rows of a csv file needed to evaluate a period, reading the file in chunks of rows.
+
+        Only the rows within the period are kept, together with the last row before and the first row after the
+        period. The values of the time series within the period, for any interpolation and extrapolation, are then the
+        same as when reading the whole file, while the memory used is bounded by the period and the chunk size.
+
+        If the dates of the file are increasing, as they normally are, the file is only read until the first row after
+        the period. Whether they are is checked once for each version of the file, by reading only the dates.
+
+        Args:
+            path: Path to csv file, read with the same settings as MemoryResource.from_string.
+            period: The period to read the rows for.
+            chunk_size: Number of rows to parse at a time.
+
+        Returns:
+            TimeSeriesResource with the rows needed for the period.
+        """
+        path = Path(path).resolve()
+        has_increasing_dates = _has_increasing_dates(path, path.stat().st_mtime_ns, chunk_size)
+
+        rows_in_period: list[pd.DataFrame] = []
+        row_before: pd.DataFrame | None = None
+        row_after: pd.DataFrame | None = None
+        for chunk, dates in cls._read_chunks(path, chunk_size=chunk_size):
+            rows_in_period.append(chunk[(dates >= period.start) & (dates < period.end)])
+            # Keep the closest rows outside the period, possibly found in different chunks
+            row_before = cls._get_closest_row(row_before, chunk, dates, dates < period.start, latest=True)
+            row_after = cls._get_closest_row(row_after, chunk, dates, dates >= period.end, latest=False)
+            if has_increasing_dates and row_after is not None:
+                # The remaining rows are all after the period
+                break
+
+        rows = pd.concat([row for row in (row_before, *rows_in_period, row_after) if row is not None])
+        return cls(MemoryResource.from_data_frame(rows.drop(columns="_date", errors="ignore"), allow_nans=True))
+
+    @classmethod
+    def _read_chunks(
+        cls, path: Path, chunk_size: int, dates_only: bool = False
+    ) -> Iterator[tuple[pd.DataFrame, pd.DatetimeIndex]]:
+        """Read a csv file in chunks of rows, giving each chunk with its parsed dates.
+
+        Args:
+            path: Path to csv file, read with the same settings as MemoryResource.from_string.
+            chunk_size: Number of rows to parse at a time.
+            dates_only: Only read the time vector column.
+        """
+        try:
+            headers = pd.read_csv(path, nrows=0, **CSV_READ_OPTIONS).columns.str.strip().tolist()
+            time_vector_header = cls._get_time_vector_header(headers)
+            usecols = [headers.index(time_vector_header)] if dates_only else None
+            with pd.read_csv(path, chunksize=chunk_size, usecols=usecols, **CSV_READ_OPTIONS) as chunks:
+                for chunk in chunks:
+                    chunk.columns = chunk.columns.str.strip()
+                    try:
+                        dates = pd.DatetimeIndex(cls._parse_time_vector(chunk[time_vector_header].tolist()))
+                    except ValueError as e:
+                        raise InvalidTimeSeriesResourceException(f"Could not parse time vector: {str(e)}") from e
+                    yield chunk, dates
+        except pd.errors.ParserError as e:
+            msg = str(e)
+            if "Expected" in msg:
+                msg = "Expected" + msg.split("Expected", 1)[1]
+            raise InvalidResourceException(title="Invalid CSV data", message=msg) from e
+        except InvalidResourceException:
+            raise
+        except ValueError as e:
+            raise InvalidResourceException(title="Invalid resource", message=str(e)) from e
+
+    @staticmethod
+    def _get_closest_row(
+        closest_row: pd.DataFrame | None, chunk: pd.DataFrame, dates: pd.DatetimeIndex, mask: np.ndarray, latest: bool
+    ) -> pd.DataFrame | None:
+        """Get the row with the latest (or earliest) date among the closest row so far and the masked rows of a chunk.
+
+        The date of the row is kept in the column '_date'.
+        """
+        if not mask.any():
+            return closest_row
+        positions = np.flatnonzero(mask)
+        position = positions[np.argmax(dates[mask]) if latest else np.argmin(dates[mask])]
+        row = chunk.iloc[[position]].assign(_date=dates[position])
+        if closest_row is None:
+            return row
+        date, closest_date = row["_date"].iloc[0], closest_row["_date"].iloc[0]
+        is_closer = date > closest_date if latest else date < closest_date
+        return row if is_closer else closest_row
+
     def _validate_time_vector(self) -> None:
         if len(self._time_vector) == 0:
             raise EmptyTimeVectorException()
@@ -243,3 +344,16 @@ class TimeSeriesResource(Resource):
     def get_column(self, header: str) -> list[float | int | str]:
         # TODO: Add validation on column so that we can remove 'str' from return type
         return self._resource.get_column(header)
+
+
+@lru_cache(maxsize=32)
+def _has_increasing_dates(path: Path, modified_time_ns: int, chunk_size: int) -> bool:
+    """Check if the dates of a csv file are increasing, for the version of the file modified at the given time."""
+    last_date: datetime | None = None
+    for _, dates in TimeSeriesResource._read_chunks(path, chunk_size=chunk_size, dates_only=True):
+        if len(dates) == 0:
+            continue
+        if not dates.is_monotonic_increasing or (last_date is not None and dates[0] < last_date):
+            return False
+        last_date = dates[-1]
+    return True
@@ -11,6 +11,7 @@ from libecalc.domain.process.value_objects.chart.chart import ChartData
 from libecalc.domain.process.value_objects.chart.compressor.chart_creator import CompressorChartCreator
 from libecalc.process.fluid_stream.fluid_model import FluidModel
 from libecalc.process.fluid_stream.fluid_service import FluidService
+from libecalc.process.fluid_stream.fluid_stream_batch import FluidStreamBatch
 
 
 class GenericFromInputChartData(ChartData):
@@ -34,15 +35,17 @@ class GenericFromInputChartData(ChartData):
 
     @cached_property
     def _chart(self) -> ChartData:
-        inlet_streams = [
-            self._fluid_service.create_stream_from_standard_rate(
-                fluid_model=self._fluid_model,
-                pressure_bara=inlet_pressure,
-                temperature_kelvin=self._inlet_temperature,
-                standard_rate_m3_per_day=inlet_rate,
-            )
-            for inlet_rate, inlet_pressure in zip(self._standard_rates, self._inlet_pressure)
-        ]
+        inlet_streams = FluidStreamBatch.from_streams(
+            [
+                self._fluid_service.create_stream_from_standard_rate(
+                    fluid_model=self._fluid_model,
+                    pressure_bara=inlet_pressure,
+                    temperature_kelvin=self._inlet_temperature,
+                    standard_rate_m3_per_day=inlet_rate,
+                )
+                for inlet_rate, inlet_pressure in zip(self._standard_rates, self._inlet_pressure)
+            ]
+        )
 
         # Static efficiency regardless of rate and head
         def efficiency_as_function_of_rate_and_head(rates, heads):
@@ -56,7 +59,7 @@ class GenericFromInputChartData(ChartData):
         )
 
         head_joule_per_kg = polytropic_enthalpy_change_joule_per_kg * polytropic_efficiency
-        inlet_actual_rate_m3_per_hour = np.asarray([stream.volumetric_rate_m3_per_hour for stream in inlet_streams])
+        inlet_actual_rate_m3_per_hour = inlet_streams.volumetric_rate_m3_per_hour
 
         # Convert numpy arrays to lists for proper type annotation
         actual_rates_list: list[float] = inlet_actual_rate_m3_per_hour.astype(float).tolist()
@@ -1,13 +1,19 @@
 import operator
 import uuid
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from contextlib import AbstractContextManager
 from datetime import datetime
 from functools import cached_property, reduce
 from typing import Any, Self
 
+import numpy as np
+from numpy.typing import NDArray
+
 from ecalc_neqsim_wrapper.fluid_service import NeqSimFluidService
 from libecalc.common.component_type import ComponentType
 from libecalc.common.errors.ecalc_validation_error import EcalcValidationException
+from libecalc.common.logger import logger
+from libecalc.common.profiling import Profiler, ProfileRecord
 from libecalc.common.time_utils import Period, Periods
 from libecalc.common.units import Unit
 from libecalc.common.utils.rates import TimeSeriesBoolean, TimeSeriesFloat, TimeSeriesInt, TimeSeriesStreamDayRate
@@ -27,6 +33,12 @@ from libecalc.domain.installation import (
 from libecalc.domain.process.compressor.core.base import CompressorWithTurbineModel
 from libecalc.domain.process.compressor.core.sampled import CompressorModelSampled
 from libecalc.domain.process.compressor.core.train.base import CompressorTrainModel
+from libecalc.domain.process.compressor.core.train.surrogate import (
+    CompressorTrainSurrogate,
+    CompressorTrainSurrogateModel,
+    get_fingerprint,
+    supports_surrogate,
+)
 from libecalc.domain.process.core.results import CompressorTrainResult, PumpModelResult
 from libecalc.domain.process.evaluation_input import (
     CompressorEvaluationInput,
@@ -73,6 +85,7 @@ from libecalc.presentation.yaml.yaml_validation_context import (
     YamlModelValidationContext,
     YamlModelValidationContextNames,
 )
+from libecalc.process.fluid_stream.fluid_model import FluidModel
 from libecalc.process.process_pipeline.process_pipeline import ProcessPipeline
 from libecalc.process.pump.pump_process_simulation import (
     PumpOperatingInput,
@@ -82,6 +95,14 @@ from libecalc.process.pump.pump_process_simulation import (
 DEFAULT_START_TIME = datetime(1900, 1, 1)
 
 
+def _get_grid_values(values: NDArray[np.float64], number_of_points: int) -> NDArray[np.float64]:
+    """Get evenly spaced grid values spanning the values, widened by 5 % if all values are equal."""
+    minimum, maximum = float(np.min(values)), float(np.max(values))
+    if maximum <= minimum:
+        minimum, maximum = minimum * 0.95, maximum * 1.05
+    return np.linspace(minimum, maximum, number_of_points)
+
+
 class Context(ComponentEnergyContext):
     def __init__(
         self,
@@ -137,9 +158,18 @@ class YamlModel:
         self,
         configuration: YamlValidator,
         resource_service: ResourceService,
+        compressor_train_surrogates: Mapping[str, CompressorTrainSurrogate] | None = None,
     ) -> None:
+        """
+        Args:
+            configuration: The model configuration
+            resource_service: Gives the resources referenced by the configuration
+            compressor_train_surrogates: Surrogates by compressor train model name, used in place of the compressor
+                trains they are fitted for, see fit_compressor_train_surrogates
+        """
         self._configuration = configuration
         self._resource_service = resource_service
+        self._compressor_train_surrogates = dict(compressor_train_surrogates or {})
 
         self._is_validated = False
         self._input: Asset | None = None
@@ -205,34 +235,58 @@ class YamlModel:
         self.validate_for_run()
         return self._global_periods
 
-    def get_emitter(self, container_id: uuid.UUID) -> Emitter | None:
-        for installation in self.get_installations():
-            for emitter in installation.get_emitters():
-                if emitter.get_id() == container_id:
-                    return emitter
+    @staticmethod
+    def _index_by_id[TComponent: Emitter | ElectricityProducer | FuelConsumer | PowerConsumer](
+        components: Iterable[TComponent],
+    ) -> dict[EnergyContainerID, TComponent]:
+        index: dict[EnergyContainerID, TComponent] = {}
+        for component in components:
+            # Keep the first component for an id, same as searching the installations in order
+            index.setdefault(component.get_id(), component)
+        return index
+
+    @cached_property
+    def _emitters(self) -> dict[EnergyContainerID, Emitter]:
+        return self._index_by_id(
+            emitter for installation in self.get_installations() for emitter in installation.get_emitters()
+        )
+
+    @cached_property
+    def _electricity_producers(self) -> dict[EnergyContainerID, ElectricityProducer]:
+        return self._index_by_id(
+            electricity_producer
+            for installation in self.get_installations()
+            for electricity_producer in installation.get_electricity_producers()
+        )
+
+    @cached_property
+    def _fuel_consumers(self) -> dict[EnergyContainerID, FuelConsumer]:
+        return self._index_by_id(
+            fuel_consumer
+            for installation in self.get_installations()
+            for fuel_consumer in installation.get_fuel_consumers()
+        )
+
+    @cached_property
+    def _power_consumers(self) -> dict[EnergyContainerID, PowerConsumer]:
+        # Power consumers are created from the consumer results, the index is reset by evaluate_energy_usage
+        return self._index_by_id(
+            power_consumer
+            for installation in self.get_installations()
+            for power_consumer in installation.get_power_consumers()
+        )
 
-        return None
+    def get_emitter(self, container_id: uuid.UUID) -> Emitter | None:
+        return self._emitters.get(container_id)
 
     def get_electricity_producer(self, sub_container_id: EnergyContainerID) -> ElectricityProducer | None:
-        for installation in self.get_installations():
-            for electricity_producer in installation.get_electricity_producers():
-                if electricity_producer.get_id() == sub_container_id:
-                    return electricity_producer
-        return None
+        return self._electricity_producers.get(sub_container_id)
 
     def get_fuel_consumer(self, container_id: EnergyContainerID) -> FuelConsumer | None:
-        for installation in self.get_installations():
-            for fuel_consumer in installation.get_fuel_consumers():
-                if fuel_consumer.get_id() == container_id:
-                    return fuel_consumer
-        return None
+        return self._fuel_consumers.get(container_id)
 
     def get_power_consumer(self, container_id: EnergyContainerID) -> PowerConsumer | None:
-        for installation in self.get_installations():
-            for power_consumer in installation.get_power_consumers():
-                if power_consumer.get_id() == container_id:
-                    return power_consumer
-        return None
+        return self._power_consumers.get(container_id)
 
     def get_regularity(self, container_id: EnergyContainerID) -> Regularity:
         return self._mapping_context.get_regularity(container_id)
@@ -298,12 +352,12 @@ class YamlModel:
         return self._time_series_collections
 
     def _get_periods(self, time_series_time_vector: Iterable[datetime]) -> Periods:
-        assert self._configuration.end is not None
+        assert self.end is not None
         try:
             time_vector = get_global_time_vector(
                 time_series_time_vector=time_series_time_vector,
-                start=self._configuration.start,
-                end=self._configuration.end,
+                start=self.start,
+                end=self.end,
                 additional_dates=set(self._configuration.dates),
             )
             periods = Periods.create_periods(time_vector, include_before=False, include_after=False)
@@ -477,10 +531,16 @@ class YamlModel:
                     energy_component._consumer_result = consumer_result
                 else:
                     # For other energy components (e.g. direct consumer function, tabular consumer function, consumer systems) evaluate energy usage using consumer functions
-                    consumer_result = energy_component.evaluate_energy_usage(context=context)
+                    with Profiler.measure(
+                        name=energy_component.get_name(), type=energy_component.get_component_process_type().value
+                    ) as profile_record:
+                        consumer_result = energy_component.evaluate_energy_usage(context=context)
+                        profile_record.number_of_time_steps = len(consumer_result.periods)
 
                 self._consumer_results[energy_component.get_id()] = consumer_result
 
+        self.__dict__.pop("_power_consumers", None)
+
     def get_validity(self, component_id: EnergyContainerID) -> TimeSeriesBoolean:
         energy_model = self.get_energy_model()
         component = energy_model.get_energy_container(component_id)
@@ -515,6 +575,21 @@ class YamlModel:
     def get_process_service(self) -> DefaultProcessService:
         return self._mapping_context._process_service
 
+    def _measure_model(self, model_id: uuid.UUID) -> AbstractContextManager[ProfileRecord]:
+        """Measure the evaluation of a model when profiling, see Profiler."""
+        process_service = self.get_process_service()
+        ecalc_component = process_service.ecalc_components[model_id]
+        component_name = None
+        if Profiler.is_enabled():
+            consumer_ids = [
+                consumer_id
+                for (consumer_id, _period), mapped_model_id in process_service.consumer_to_model_map.items()
+                if mapped_model_id == model_id
+            ]
+            if consumer_ids:
+                component_name = self.get_energy_model().get_energy_container(consumer_ids[0]).get_name()
+        return Profiler.measure(name=ecalc_component.name, type=str(ecalc_component.type), component=component_name)
+
     def _evaluate_compressor_process_systems(self) -> dict[uuid.UUID, CompressorTrainResult]:
         process_service = self.get_process_service()
         compressor_process_systems = process_service.compressor_process_systems
@@ -524,11 +599,113 @@ class YamlModel:
             evaluation_input = process_service.get_evaluation_input(model_id=id)
             assert isinstance(evaluation_input, CompressorEvaluationInput)
             assert isinstance(process_system, CompressorTrainModel | CompressorWithTurbineModel)
-            evaluation_input.apply_to_model(process_system)
-            model_result = process_system.evaluate()
+            process_system = self._get_compressor_train_surrogate_model(
+                name=process_service.ecalc_components[id].name,
+                compressor_train=process_system,
+                evaluation_input=evaluation_input,
+            )
+            with self._measure_model(id) as profile_record:
+                evaluation_input.apply_to_model(process_system)
+                model_result = process_system.evaluate()
+                profile_record.number_of_time_steps = len(evaluation_input.periods)
             evaluated_systems[id] = model_result
         return evaluated_systems
 
+    def _get_compressor_train_surrogate_model(
+        self,
+        name: str,
+        compressor_train: CompressorTrainModel | CompressorWithTurbineModel,
+        evaluation_input: CompressorEvaluationInput,
+    ) -> CompressorTrainModel | CompressorWithTurbineModel | CompressorTrainSurrogateModel:
+        """Use the surrogate of a compressor train model, if given and fitted for the train and fluid model."""
+        surrogate = self._compressor_train_surrogates.get(name)
+        if surrogate is None or not isinstance(compressor_train, CompressorTrainModel):
+            return compressor_train
+        fluid_model = evaluation_input.fluid_model
+        if isinstance(fluid_model, list) or not supports_surrogate(compressor_train):
+            logger.warning(f"Surrogates are not supported for compressor train '{name}', evaluating the train.")
+            return compressor_train
+        if not surrogate.is_fitted_for(compressor_train, fluid_model):
+            logger.warning(
+                f"Surrogate of compressor train '{name}' is not fitted for the train and fluid model of the model, "
+                f"evaluating the train. Fit the surrogate again to use it."
+            )
+            return compressor_train
+        return CompressorTrainSurrogateModel(compressor_train=compressor_train, surrogate=surrogate)
+
+    def fit_compressor_train_surrogates(
+        self,
+        number_of_points: int = 10,
+        relative_error_tolerance: float | None = None,
+    ) -> dict[str, CompressorTrainSurrogate]:
+        """Fit surrogates for the compressor train models of the model, see CompressorTrainSurrogate.fit.
+
+        The grid of each surrogate spans the rates and pressures the train is given in the model, for the periods with
+        a positive rate. Trains not supported by surrogates, and trains used with different fluid models, are skipped.
+
+        Args:
+            number_of_points: Number of grid points along the rate, suction pressure and discharge pressure axes
+            relative_error_tolerance: Max relative error at the cell centers for a cell to be used, None to use all
+                cells where the train is valid
+
+        Returns:
+            The surrogates by compressor train model name, to be given to the model when created
+        """
+        self.validate_for_run()
+        process_service = self.get_process_service()
+
+        operating_points: dict[str, list[tuple[CompressorTrainModel, FluidModel, CompressorEvaluationInput]]] = {}
+        for id, process_system in process_service.compressor_process_systems.items():
+            evaluation_input = process_service.get_evaluation_input(model_id=id)
+            if (
+                not isinstance(process_system, CompressorTrainModel)
+                or not isinstance(evaluation_input, CompressorEvaluationInput)
+                or isinstance(evaluation_input.fluid_model, list)
+                or not supports_surrogate(process_system)
+            ):
+                continue
+            operating_points.setdefault(process_service.ecalc_components[id].name, []).append(
+                (process_system, evaluation_input.fluid_model, evaluation_input)
+            )
+
+        surrogates: dict[str, CompressorTrainSurrogate] = {}
+        for name, usages in operating_points.items():
+            if len({get_fingerprint(compressor_train, fluid_model) for compressor_train, fluid_model, _ in usages}) > 1:
+                logger.warning(
+                    f"Compressor train '{name}' is used with different fluid models, or stages prepared from different "
+                    f"data, no surrogate is fitted."
+                )
+                continue
+
+            rates, suction_pressures, discharge_pressures = [], [], []
+            for _, _, evaluation_input in usages:
+                rate, suction_pressure, discharge_pressure = evaluation_input.get_operating_points()
+                rates.append(rate.sum(axis=0))
+                suction_pressures.append(suction_pressure)
+                discharge_pressures.append(discharge_pressure)
+            rate, suction_pressure, discharge_pressure = (
+                np.concatenate(rates),
+                np.concatenate(suction_pressures),
+                np.concatenate(discharge_pressures),
+            )
+            is_operating = (
+                (rate > 0) & np.isfinite(rate) & np.isfinite(suction_pressure) & np.isfinite(discharge_pressure)
+            )
+            if not np.any(is_operating):
+                continue
+
+            compressor_train, fluid_model, _ = usages[0]
+            logger.info(f"Fitting surrogate for compressor train '{name}'")
+            surrogates[name] = CompressorTrainSurrogate.fit(
+                compressor_train=compressor_train,
+                fluid_model=fluid_model,
+                rate_values=_get_grid_values(rate[is_operating], number_of_points),
+                suction_pressure_values=_get_grid_values(suction_pressure[is_operating], number_of_points),
+                discharge_pressure_values=_get_grid_values(discharge_pressure[is_operating], number_of_points),
+                relative_error_tolerance=relative_error_tolerance,
+            )
+        return surrogates
+
     def _evaluate_pump_process_systems(self) -> dict[uuid.UUID, PumpModelResult]:
         process_service = self.get_process_service()
         pump_process_systems = process_service.pump_process_systems
@@ -538,8 +715,10 @@ class YamlModel:
             evaluation_input = process_service.get_evaluation_input(model_id=id)
             assert isinstance(evaluation_input, PumpEvaluationInput)
             assert isinstance(process_system, PumpModel)
-            evaluation_input.apply_to_model(process_system)
-            model_result = process_system.evaluate()
+            with self._measure_model(id) as profile_record:
+                evaluation_input.apply_to_model(process_system)
+                model_result = process_system.evaluate()
+                profile_record.number_of_time_steps = len(evaluation_input.periods)
             evaluated_systems[id] = model_result
         return evaluated_systems
 
@@ -552,8 +731,10 @@ class YamlModel:
             evaluation_input = process_service.get_evaluation_input(model_id=id)
             assert isinstance(evaluation_input, CompressorSampledEvaluationInput)
             assert isinstance(compressor_sampled, CompressorModelSampled | CompressorWithTurbineModel)
-            evaluation_input.apply_to_model(compressor_sampled)
-            model_result = compressor_sampled.evaluate()
+            with self._measure_model(id) as profile_record:
+                evaluation_input.apply_to_model(compressor_sampled)
+                model_result = compressor_sampled.evaluate()
+                profile_record.number_of_time_steps = len(evaluation_input.periods)
             evaluated_compressors_sampled[id] = model_result
         return evaluated_compressors_sampled
 
@@ -0,0 +1,211 @@
+"""Run the same model for many scenarios, i.e. variations of the time series input of the model.
+
+The configuration is parsed and the resources are read once, and are then shared by the YamlModel of each scenario. A
+scenario replaces time series resources by name, all other input is the same for all scenarios.
+
+Scenarios are evaluated according to the ParallelEvaluationConfig given to the ScenarioRunner:
+
+- SERIAL evaluates the scenarios one at a time in this process, sharing the NeqSim service and its caches.
+- THREADS is not supported. Whole scenarios would be evaluated concurrently in this process, sharing the NeqSim
+  service and the global caches, which are not thread-safe.
+- PROCESSES starts a pool of worker processes for each call to ScenarioRunner.run. Each worker parses the
+  configuration once, and keeps its NeqSim service (started by the worker initializer) and caches warm between the
+  scenarios it evaluates.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property, partial
+
+from libecalc.common.errors.exceptions import InvalidResourceException
+from libecalc.common.parallel_evaluation import ParallelEvaluationConfig, ParallelEvaluationMode, ParallelEvaluator
+from libecalc.domain.resource import Resource
+from libecalc.presentation.json_result.mapper import get_asset_result
+from libecalc.presentation.json_result.result import EcalcModelResult
+from libecalc.presentation.yaml.configuration_service import ConfigurationService
+from libecalc.presentation.yaml.domain.time_series_resource import TimeSeriesResource
+from libecalc.presentation.yaml.file_context import FileContext, FileMark
+from libecalc.presentation.yaml.model import YamlModel
+from libecalc.presentation.yaml.resource_service import InvalidResource, ResourceService, TupleWithError
+from libecalc.presentation.yaml.yaml_models.yaml_model import YamlValidator
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A variation of the input of a model.
+
+    Attributes:
+        name: Name of the scenario, e.g. used to name the result files of the scenario.
+        time_series_resources: Time series resources replacing the resources of the model with the same name, i.e.
+            the name used for the resource in the model file.
+    """
+
+    name: str
+    time_series_resources: dict[str, Resource] = field(default_factory=dict)
+
+
+class ScenarioResourceService(ResourceService):
+    """The resources of a model, with the time series resources of a scenario replacing those with the same name."""
+
+    def __init__(
+        self,
+        time_series_resources: TupleWithError[dict[str, TimeSeriesResource]],
+        facility_resources: TupleWithError[dict[str, Resource]],
+        scenario: Scenario,
+    ):
+        self._time_series_resources = time_series_resources
+        self._facility_resources = facility_resources
+        self._scenario = scenario
+
+    def get_time_series_resources(self) -> TupleWithError[dict[str, TimeSeriesResource]]:
+        model_resources, model_errors = self._time_series_resources
+        resources = dict(model_resources)
+        errors = [error for error in model_errors if error.resource_name not in self._scenario.time_series_resources]
+        for resource_name, resource in self._scenario.time_series_resources.items():
+            resources.pop(resource_name, None)
+            try:
+                resources[resource_name] = TimeSeriesResource(resource).validate()
+            except InvalidResourceException as e:
+                if e.file_mark is not None:
+                    start_file_mark = FileMark(
+                        line_number=e.file_mark.row,
+                        column=e.file_mark.column,
+                    )
+                else:
+                    start_file_mark = None
+                file_context = FileContext(
+                    name=f"{resource_name} (scenario '{self._scenario.name}')",
+                    start=start_file_mark,
+                )
+                errors.append(InvalidResource(message=str(e), resource_name=resource_name, file_context=file_context))
+        return resources, errors
+
+    def get_facility_resources(self) -> TupleWithError[dict[str, Resource]]:
+        return self._facility_resources
+
+
+def evaluate_scenario(model: YamlModel, scenario: Scenario) -> EcalcModelResult:
+    """Evaluate the model of a scenario, giving the same result as a single run of the model."""
+    model.evaluate_energy_usage()
+    return get_asset_result(model)
+
+
+# The scenario runner of a worker process, set by the worker initializer
+_worker_scenario_runner: ScenarioRunner | None = None
+
+
+def _initialize_worker(scenario_runner: ScenarioRunner, worker_initializer: Callable[[], None] | None) -> None:
+    global _worker_scenario_runner
+    _worker_scenario_runner = scenario_runner
+    if worker_initializer is not None:
+        worker_initializer()
+
+
+def _run_scenario_in_worker[TResult](scenario: Scenario, evaluate: Callable[[YamlModel, Scenario], TResult]) -> TResult:
+    assert _worker_scenario_runner is not None
+    return _worker_scenario_runner.run_scenario(scenario, evaluate=evaluate)
+
+
+class ScenarioRunner:
+    """Run a model for many scenarios, parsing the configuration and reading the resources of the model once.
+
+    Usage:
+        runner = ScenarioRunner(
+            configuration_service=FileConfigurationService(model_path),
+            resource_service_factory=lambda configuration: FileResourceService(model_path.parent, configuration),
+        )
+        results = runner.run([Scenario(name="low", time_series_resources={"production.csv": low_production})])
+    """
+
+    def __init__(
+        self,
+        configuration_service: ConfigurationService,
+        resource_service_factory: Callable[[YamlValidator], ResourceService],
+        parallel_evaluation_config: ParallelEvaluationConfig | None = None,
+    ):
+        """
+        Args:
+            configuration_service: Gives the configuration of the model. Must be picklable in PROCESSES mode, since
+                each worker parses the configuration.
+            resource_service_factory: Creates the service giving the resources of the model. Only called once, in
+                this process.
+            parallel_evaluation_config: How to evaluate the scenarios, SERIAL or PROCESSES. Defaults to SERIAL, the
+                configuration given to ParallelEvaluator is not used.
+
+        Raises:
+            ValueError: If the parallel evaluation mode is THREADS.
+        """
+        parallel_evaluation_config = parallel_evaluation_config or ParallelEvaluationConfig.default()
+        if parallel_evaluation_config.mode == ParallelEvaluationMode.THREADS:
+            raise ValueError(
+                "THREADS mode is not supported, scenarios share the NeqSim service and caches. Use PROCESSES instead."
+            )
+        self._configuration_service = configuration_service
+        self._parallel_evaluation_config = parallel_evaluation_config
+        resource_service = resource_service_factory(self.configuration)
+        self._time_series_resources = resource_service.get_time_series_resources()
+        self._facility_resources = resource_service.get_facility_resources()
+
+    @cached_property
+    def configuration(self) -> YamlValidator:
+        return self._configuration_service.get_configuration()
+
+    def __getstate__(self) -> dict:
+        # The parsed configuration can not be pickled, it is parsed again in the worker process
+        state = self.__dict__.copy()
+        state.pop("configuration", None)
+        return state
+
+    def get_model(self, scenario: Scenario) -> YamlModel:
+        """Get the validated model of a scenario.
+
+        Raises:
+            ModelValidationException: If the model is invalid for the scenario, e.g. invalid time series resources.
+        """
+        return YamlModel(
+            configuration=self.configuration,
+            resource_service=ScenarioResourceService(
+                time_series_resources=self._time_series_resources,
+                facility_resources=self._facility_resources,
+                scenario=scenario,
+            ),
+        ).validate_for_run()
+
+    def run_scenario[TResult](
+        self,
+        scenario: Scenario,
+        evaluate: Callable[[YamlModel, Scenario], TResult] = evaluate_scenario,
+    ) -> TResult:
+        return evaluate(self.get_model(scenario), scenario)
+
+    def run[TResult](
+        self,
+        scenarios: Iterable[Scenario],
+        evaluate: Callable[[YamlModel, Scenario], TResult] = evaluate_scenario,
+    ) -> list[TResult]:
+        """Run all scenarios, returning the results in the same order as the scenarios.
+
+        Exceptions raised when running a scenario are re-raised.
+
+        Args:
+            scenarios: The scenarios to run. Must be picklable in PROCESSES mode.
+            evaluate: Evaluates the validated model of a scenario, e.g. writing the results to file. Defaults to
+                giving the result of the model. Must be picklable in PROCESSES mode, and return a picklable result.
+        """
+        scenarios = list(scenarios)
+        config = self._parallel_evaluation_config
+        if config.mode != ParallelEvaluationMode.PROCESSES or not config.is_concurrent or len(scenarios) <= 1:
+            return ParallelEvaluator.map(partial(self.run_scenario, evaluate=evaluate), scenarios, config=config)
+
+        # Spawn rather than fork, a forked worker would share the parent's JVM connection and caches
+        with ProcessPoolExecutor(
+            max_workers=min(config.max_workers, len(scenarios)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(self, config.worker_initializer),
+        ) as executor:
+            return list(executor.map(partial(_run_scenario_in_worker, evaluate=evaluate), scenarios))
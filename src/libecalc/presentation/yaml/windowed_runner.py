@@ -0,0 +1,238 @@
+"""Run a model window by window, to bound the memory used by long, high resolution time series.
+
+The model period is split into consecutive windows, and the model is evaluated for one window at a time. Each window
+only reads the rows of the time series resources needed for the window, see TimeSeriesResource.from_path_in_period,
+and only keeps the variables and results of the window in memory. The results are given one window at a time, e.g.
+to be appended to a file, and are then free to be released.
+
+The periods of a model are evaluated independently. State is carried between windows in two ways:
+
+- The time series rows closest to each window are read with the window, which gives the same interpolated and
+  extrapolated values as reading the whole resource.
+- The cumulative time series of the results, e.g. energy_usage_cumulative, power_cumulative and the cumulative of
+  each emission, continue from the totals of the previous windows, see CumulativeCarry.
+
+The result of a window is therefore the part of the result of a single run for the periods of the window, except for
+the ids of the components, and the parent references, which are created for each window. Components are matched
+between windows by type and name. Values computed from a whole result, e.g. yearly emission intensities, must be
+computed from the results of all windows. A window boundary that is not a date of the model splits a period of the
+model in two.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from datetime import datetime
+from functools import cached_property
+from typing import Any
+
+from pydantic import BaseModel
+
+from libecalc.common.time_utils import Period
+from libecalc.common.utils.rates import TimeSeries, TimeSeriesVolumesCumulative
+from libecalc.domain.resource import Resource
+from libecalc.presentation.json_result.mapper import get_asset_result
+from libecalc.presentation.json_result.result import EcalcModelResult
+from libecalc.presentation.yaml.configuration_service import ConfigurationService
+from libecalc.presentation.yaml.domain.time_series_resource import TimeSeriesResource
+from libecalc.presentation.yaml.model import YamlModel
+from libecalc.presentation.yaml.resource_service import ResourceService, TupleWithError
+from libecalc.presentation.yaml.yaml_models.yaml_model import YamlValidator
+
+
+def create_windows(period: Period, years: int) -> list[Period]:
+    """Split a period into windows starting at the first of January every given number of years.
+
+    Args:
+        period: The period to split, e.g. the period of the model.
+        years: The number of years in each window, the first and last window may be shorter.
+    """
+    if years < 1:
+        raise ValueError(f"Invalid number of years '{years}'. Must be at least 1.")
+
+    boundaries = [period.start]
+    year = period.start.year + years
+    while (boundary := datetime(year, 1, 1)) < period.end:
+        boundaries.append(boundary)
+        year += years
+    boundaries.append(period.end)
+    return [Period(start=start, end=end) for start, end in zip(boundaries[:-1], boundaries[1:])]
+
+
+class WindowedYamlModel(YamlModel):
+    """A model evaluated for a window of the model period."""
+
+    def __init__(
+        self,
+        configuration: YamlValidator,
+        resource_service: ResourceService,
+        window: Period,
+    ):
+        # Set before initializing the model, the period of the model is used when initializing
+        self._window = window
+        super().__init__(configuration=configuration, resource_service=resource_service)
+
+    @property
+    def start(self) -> datetime | None:
+        return self._window.start
+
+    @property
+    def end(self) -> datetime | None:
+        return self._window.end
+
+
+class WindowResourceService(ResourceService):
+    """The time series resources of a window, with the facility resources shared by all windows."""
+
+    def __init__(
+        self,
+        resource_service: ResourceService,
+        facility_resources: TupleWithError[dict[str, Resource]],
+    ):
+        self._resource_service = resource_service
+        self._facility_resources = facility_resources
+
+    def get_time_series_resources(self) -> TupleWithError[dict[str, TimeSeriesResource]]:
+        return self._resource_service.get_time_series_resources()
+
+    def get_facility_resources(self) -> TupleWithError[dict[str, Resource]]:
+        return self._facility_resources
+
+
+def evaluate_window(model: YamlModel, window: Period) -> EcalcModelResult:
+    """Evaluate the model of a window, giving the result of a single run of the model for the window.
+
+    The cumulative time series of the result start at zero, see CumulativeCarry.
+    """
+    model.evaluate_energy_usage()
+    return get_asset_result(model)
+
+
+class CumulativeCarry:
+    """Continue the cumulative time series of the results of consecutive windows from the totals of earlier windows.
+
+    Usage:
+        cumulative_carry = CumulativeCarry()
+        for window in windows:
+            result = cumulative_carry.carry(evaluate_window(model_of_window, window))
+    """
+
+    def __init__(self):
+        self._totals: dict[tuple[Hashable, ...], float] = {}
+
+    def carry(self, result: EcalcModelResult) -> EcalcModelResult:
+        """Add the totals of the earlier windows to the cumulative time series of the result, in place.
+
+        Args:
+            result: The result of the next window, after the windows given earlier.
+        """
+        # Ids are created for each window, components are matched by type and name
+        occurrences: Counter[tuple[str, str]] = Counter()
+        for item in [*result.components, *result.models]:
+            key = (str(item.componentType), item.name)
+            self._carry(item, path=(*key, occurrences[key]))
+            occurrences[key] += 1
+        return result
+
+    def _carry(self, value: Any, path: tuple[Hashable, ...]) -> Any:
+        if isinstance(value, TimeSeriesVolumesCumulative):
+            total = self._totals.get(path, 0.0)
+            carried = value.model_copy(update={"values": [cumulative + total for cumulative in value.values]})
+            if carried.values and not math.isnan(carried.values[-1]):
+                self._totals[path] = carried.values[-1]
+            return carried
+        elif isinstance(value, TimeSeries):
+            return value
+        elif isinstance(value, BaseModel):
+            for name, attribute_value in value.__dict__.items():
+                carried_value = self._carry(attribute_value, path=(*path, name))
+                if carried_value is not attribute_value:
+                    setattr(value, name, carried_value)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                value[key] = self._carry(item, path=(*path, key))
+        elif isinstance(value, list) and len(value) > 0 and isinstance(value[0], BaseModel):
+            for index, item in enumerate(value):
+                value[index] = self._carry(item, path=(*path, index))
+        return value
+
+
+class WindowedModelRunner:
+    """Run a model one window at a time, reading only the time series rows needed for each window.
+
+    The results of the windows can be appended to give the result of a single run, see the module docstring for the
+    fields that differ.
+
+    Usage:
+        runner = WindowedModelRunner(
+            configuration_service=FileConfigurationService(model_path),
+            resource_service_factory=lambda configuration, window: FileResourceService(
+                model_path.parent, configuration, period=window
+            ),
+        )
+        for result in runner.run(runner.get_windows(years=5)):
+            ...  # Append the result of the window
+    """
+
+    def __init__(
+        self,
+        configuration_service: ConfigurationService,
+        resource_service_factory: Callable[[YamlValidator, Period | None], ResourceService],
+    ):
+        """
+        Args:
+            configuration_service: Gives the configuration of the model.
+            resource_service_factory: Creates the service giving the resources of the model, reading only the time
+                series needed for the given window. Called once for each window, and once without a window to read
+                the facility resources shared by all windows.
+        """
+        self._configuration_service = configuration_service
+        self._resource_service_factory = resource_service_factory
+
+    @cached_property
+    def configuration(self) -> YamlValidator:
+        return self._configuration_service.get_configuration()
+
+    @cached_property
+    def _facility_resources(self) -> TupleWithError[dict[str, Resource]]:
+        return self._resource_service_factory(self.configuration, None).get_facility_resources()
+
+    def get_windows(self, years: int) -> list[Period]:
+        """Split the model period into windows, see create_windows.
+
+        Raises:
+            ValueError: If the model does not have both a start and an end date.
+        """
+        start, end = self.configuration.start, self.configuration.end
+        if start is None or end is None:
+            raise ValueError("The model must have both a start and an end date to be evaluated in windows.")
+        return create_windows(Period(start=start, end=end), years=years)
+
+    def get_model(self, window: Period) -> YamlModel:
+        """Get the validated model of a window.
+
+        Raises:
+            ModelValidationException: If the model is invalid for the window.
+        """
+        return WindowedYamlModel(
+            configuration=self.configuration,
+            resource_service=WindowResourceService(
+                resource_service=self._resource_service_factory(self.configuration, window),
+                facility_resources=self._facility_resources,
+            ),
+            window=window,
+        ).validate_for_run()
+
+    def run(self, windows: Iterable[Period]) -> Iterator[EcalcModelResult]:
+        """Run the windows in order, giving the result of each window when it has been evaluated.
+
+        The cumulative time series of each result continue from the previous windows, see CumulativeCarry.
+
+        Args:
+            windows: Consecutive windows of the model period, in order, see get_windows.
+        """
+        cumulative_carry = CumulativeCarry()
+        for window in windows:
+            yield cumulative_carry.carry(evaluate_window(self.get_model(window), window))
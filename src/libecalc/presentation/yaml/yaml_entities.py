@@ -16,6 +16,9 @@ from libecalc.common.errors.exceptions import (
 )
 from libecalc.domain.resource import Resource
 
+# Settings used to read csv resources with pandas.read_csv, see MemoryResource.from_string
+CSV_READ_OPTIONS = {"comment": "#", "float_precision": "round_trip", "skipinitialspace": True, "thousands": " "}
+
 
 @dataclass
 class MemoryResource(Resource):
@@ -74,9 +77,7 @@ class MemoryResource(Resource):
             MemoryResource.
         """
         try:
-            df_resource = pd.read_csv(
-                StringIO(csv_data), comment="#", float_precision="round_trip", skipinitialspace=True, thousands=" "
-            )
+            df_resource = pd.read_csv(StringIO(csv_data), **CSV_READ_OPTIONS)
         except pd.errors.ParserError as e:
             msg = str(e)
             if "Expected" in msg:
@@ -85,6 +86,19 @@ class MemoryResource(Resource):
         except ValueError as e:
             raise InvalidResourceException(title="Invalid resource", message=str(e)) from e
 
+        return cls.from_data_frame(df_resource, allow_nans=allow_nans)
+
+    @classmethod
+    def from_data_frame(cls, df_resource: pd.DataFrame, allow_nans: bool) -> Self:
+        """Create resource from csv data already read by pandas, see `from_string`.
+
+        Args:
+            df_resource: Data frame with one column per header.
+            allow_nans: Whether to fail validation on nan values.
+
+        Returns:
+            MemoryResource.
+        """
         headers = df_resource.columns.str.strip().tolist()
         cls._validate_headers(headers)
 
@@ -0,0 +1,225 @@
+"""FluidStreamBatch: many fluid streams of the same fluid model.
+
+This module defines FluidPropertiesBatch and FluidStreamBatch, holding the thermodynamic states and rates of many
+streams as numpy columns, one value per stream, rather than one FluidProperties/Fluid/FluidStream object per stream.
+Used where the same calculation is done for many streams, e.g. one stream per time step.
+
+Like FluidStream, these are pure data holders - flash operations are performed via the FluidService interface, one
+state at a time, and the resulting FluidProperties collected with FluidPropertiesBatch.from_properties.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Iterator, Sequence
+from functools import cached_property
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from libecalc.common.units import UnitConstants
+from libecalc.process.fluid_stream.exceptions import NegativeMassRateException
+from libecalc.process.fluid_stream.fluid import Fluid
+from libecalc.process.fluid_stream.fluid_model import FluidModel
+from libecalc.process.fluid_stream.fluid_properties import FluidProperties
+from libecalc.process.fluid_stream.fluid_stream import FluidStream
+
+
+def _as_column(values: ArrayLike) -> NDArray[np.float64]:
+    column = np.array(values, dtype=np.float64, ndmin=1)
+    column.flags.writeable = False
+    return column
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class FluidPropertiesBatch:
+    """The thermodynamic properties of many states, one column per property of FluidProperties.
+
+    Attributes are read-only numpy arrays of equal length, see FluidProperties for units.
+    """
+
+    temperature_kelvin: NDArray[np.float64]
+    pressure_bara: NDArray[np.float64]
+    density: NDArray[np.float64]
+    enthalpy_joule_per_kg: NDArray[np.float64]
+    z: NDArray[np.float64]
+    kappa: NDArray[np.float64]
+    vapor_fraction_molar: NDArray[np.float64]
+    molar_mass: NDArray[np.float64]
+    standard_density: NDArray[np.float64]
+
+    def __post_init__(self):
+        lengths = set()
+        for field in dataclasses.fields(self):
+            column = _as_column(getattr(self, field.name))
+            object.__setattr__(self, field.name, column)
+            lengths.add(len(column))
+        if len(lengths) > 1:
+            raise ValueError(f"All properties must have the same number of values, got lengths {sorted(lengths)}")
+
+    def __len__(self) -> int:
+        return len(self.temperature_kelvin)
+
+    def __getitem__(self, index: int) -> FluidProperties:
+        return FluidProperties(
+            **{field.name: float(getattr(self, field.name)[index]) for field in dataclasses.fields(self)}
+        )
+
+    @classmethod
+    def from_properties(cls, properties: Sequence[FluidProperties]) -> FluidPropertiesBatch:
+        return cls(
+            **{
+                field.name: [getattr(state, field.name) for state in properties]
+                for field in dataclasses.fields(FluidProperties)
+            }
+        )
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class FluidStreamBatch:
+    """Many fluid streams of the same fluid model, with the states and rates held as numpy columns.
+
+    The batch counterpart of FluidStream: the properties and derived rates are arrays with one value per stream,
+    and with_mass_rate/with_standard_rate take one rate per stream. FluidStream objects are only created when
+    indexing or iterating the batch.
+
+    Attributes:
+        fluid_model: FluidModel shared by all streams
+        properties: FluidPropertiesBatch with the state of each stream
+        mass_rate_kg_per_h: Mass flow rate of each stream [kg/h]
+    """
+
+    fluid_model: FluidModel
+    properties: FluidPropertiesBatch
+    mass_rate_kg_per_h: NDArray[np.float64]
+
+    def __post_init__(self):
+        mass_rate_kg_per_h = _as_column(self.mass_rate_kg_per_h)
+        if len(mass_rate_kg_per_h) != len(self.properties):
+            raise ValueError(
+                f"Number of mass rates ({len(mass_rate_kg_per_h)}) does not match number of states"
+                f" ({len(self.properties)})"
+            )
+        if np.any(mass_rate_kg_per_h < 0):
+            raise NegativeMassRateException(float(np.min(mass_rate_kg_per_h)))
+        object.__setattr__(self, "mass_rate_kg_per_h", mass_rate_kg_per_h)
+
+    def __len__(self) -> int:
+        return len(self.mass_rate_kg_per_h)
+
+    def __getitem__(self, index: int) -> FluidStream:
+        return FluidStream(
+            fluid=Fluid(fluid_model=self.fluid_model, properties=self.properties[index]),
+            mass_rate_kg_per_h=float(self.mass_rate_kg_per_h[index]),
+        )
+
+    def __iter__(self) -> Iterator[FluidStream]:
+        return (self[index] for index in range(len(self)))
+
+    @property
+    def temperature_kelvin(self) -> NDArray[np.float64]:
+        """Get stream temperatures [K]."""
+        return self.properties.temperature_kelvin
+
+    @property
+    def pressure_bara(self) -> NDArray[np.float64]:
+        """Get stream pressures [bara]."""
+        return self.properties.pressure_bara
+
+    @property
+    def density(self) -> NDArray[np.float64]:
+        """Get densities [kg/m3]."""
+        return self.properties.density
+
+    @property
+    def molar_mass(self) -> NDArray[np.float64]:
+        """Get molar masses of the fluid [kg/mol]."""
+        return self.properties.molar_mass
+
+    @property
+    def standard_density_gas_phase_after_flash(self) -> NDArray[np.float64]:
+        """Get gas phase densities at standard conditions [kg/Sm3]."""
+        return self.properties.standard_density
+
+    @property
+    def enthalpy_joule_per_kg(self) -> NDArray[np.float64]:
+        """Get specific enthalpies [J/kg]."""
+        return self.properties.enthalpy_joule_per_kg
+
+    @property
+    def z(self) -> NDArray[np.float64]:
+        """Get compressibility factors [-]."""
+        return self.properties.z
+
+    @property
+    def kappa(self) -> NDArray[np.float64]:
+        """Get isentropic exponents [-]."""
+        return self.properties.kappa
+
+    @property
+    def vapor_fraction_molar(self) -> NDArray[np.float64]:
+        """Get molar vapor fractions [0-1]."""
+        return self.properties.vapor_fraction_molar
+
+    @cached_property
+    def volumetric_rate_m3_per_hour(self) -> NDArray[np.float64]:
+        """Calculate actual volumetric flow rates [m3/h]."""
+        return self.mass_rate_kg_per_h / self.density
+
+    @cached_property
+    def standard_rate_sm3_per_day(self) -> NDArray[np.float64]:
+        """Calculate standard volumetric flow rates [Sm3/day]."""
+        return self.mass_rate_kg_per_h / self.standard_density_gas_phase_after_flash * UnitConstants.HOURS_PER_DAY
+
+    def with_mass_rate(self, mass_rate_kg_per_h: ArrayLike) -> FluidStreamBatch:
+        """Create new batch with the same states but different rates, one rate per stream or one for all streams."""
+        return dataclasses.replace(
+            self, mass_rate_kg_per_h=np.broadcast_to(np.asarray(mass_rate_kg_per_h, dtype=np.float64), len(self))
+        )
+
+    def with_standard_rate(self, standard_rate_sm3_per_day: ArrayLike) -> FluidStreamBatch:
+        """Create new batch with the same states but different standard rates, one rate per stream or one for all
+        streams.
+        """
+        return self.with_mass_rate(
+            np.asarray(standard_rate_sm3_per_day, dtype=np.float64)
+            * self.standard_density_gas_phase_after_flash
+            / UnitConstants.HOURS_PER_DAY
+        )
+
+    def with_new_properties(self, properties: FluidPropertiesBatch) -> FluidStreamBatch:
+        """Create new batch with updated states but the same mass rates, e.g. after flashing each stream."""
+        return dataclasses.replace(self, properties=properties)
+
+    @classmethod
+    def from_streams(cls, streams: Sequence[FluidStream]) -> FluidStreamBatch:
+        """Create a batch from streams of the same fluid model.
+
+        Raises:
+            ValueError: If there are no streams, or the streams have different fluid models
+        """
+        if len(streams) == 0:
+            raise ValueError("Cannot create a batch without streams")
+        fluid_model = streams[0].fluid_model
+        if any(stream.fluid_model != fluid_model for stream in streams[1:]):
+            raise ValueError("All streams in a batch must have the same fluid model")
+        return cls(
+            fluid_model=fluid_model,
+            properties=FluidPropertiesBatch.from_properties([stream.fluid_properties for stream in streams]),
+            mass_rate_kg_per_h=[stream.mass_rate_kg_per_h for stream in streams],
+        )
+
+    @classmethod
+    def from_standard_rate(
+        cls,
+        standard_rate_m3_per_day: ArrayLike,
+        fluid_model: FluidModel,
+        fluid_properties: FluidPropertiesBatch,
+    ) -> FluidStreamBatch:
+        """Create a batch from standard volumetric flow rates [Sm3/day], one per state."""
+        mass_rate_kg_per_h = (
+            np.asarray(standard_rate_m3_per_day, dtype=np.float64)
+            * fluid_properties.standard_density
+            / UnitConstants.HOURS_PER_DAY
+        )
+        return cls(fluid_model=fluid_model, properties=fluid_properties, mass_rate_kg_per_h=mass_rate_kg_per_h)
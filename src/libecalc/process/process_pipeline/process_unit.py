@@ -1,4 +1,5 @@
 import abc
+from collections.abc import Hashable
 from typing import NewType, Self
 from uuid import UUID
 
@@ -13,6 +14,15 @@ class ProcessUnit(Entity[ProcessUnitId], StreamPropagator, abc.ABC):
     @abc.abstractmethod
     def get_id(self) -> ProcessUnitId: ...
 
+    def get_propagation_state(self) -> Hashable | None:
+        """The settings of the unit the outlet stream depends on, in addition to the inlet stream, e.g. the speed of
+        a compressor.
+
+        Units giving the same outlet stream for the same inlet stream and state lets ProcessPipelineRunner reuse the
+        outlet stream. None, the default, means the state is unknown and the outlet stream is never reused.
+        """
+        return None
+
     @classmethod
     def _create_id(cls: type[Self]) -> ProcessUnitId:
         return ProcessUnitId(ecalc_id_generator())
@@ -18,6 +18,11 @@ class FeasibilitySolver:
 
     Orchestrates PipelineSectionSolver and queries compressor charts to find
     the feasible rate — the excess is redirected via stream distribution.
+
+    The feasible rate is bracketed by the chart envelope at maximum speed before
+    any full solve, see PipelineSectionSolver.can_reach_at_maximum_speed. When
+    the envelope limits the capacity, one or two full solves confirm it.
+    Otherwise the full solves search below the envelope rate.
     """
 
     def __init__(
@@ -58,6 +63,19 @@ class FeasibilitySolver:
         upper_bound_sm3_per_day: float,
     ) -> float:
         boundary = Boundary(min=0.0, max=upper_bound_sm3_per_day)
+        envelope_rate = self._largest_rate_within_envelope(inlet_stream, target_pressure, boundary)
+        if envelope_rate is None:
+            return 0.0
+
+        # The capacity is usually limited by the envelope, i.e. the stonewall or the maximum speed curve. The envelope
+        # rate is then feasible, or the rate just below it within the search tolerance, as no higher rate is within
+        # the envelope.
+        for rate in (envelope_rate, envelope_rate * (1 - _RATE_SEARCH_TOLERANCE)):
+            if self._is_feasible(inlet_stream.with_standard_rate(rate), target_pressure):
+                return rate
+
+        boundary = Boundary(min=0.0, max=envelope_rate * (1 - _RATE_SEARCH_TOLERANCE))
+
         try:
             return self._search_strategy.search(
                 boundary=boundary,
@@ -69,5 +87,29 @@ class FeasibilitySolver:
         except DidNotConvergeError:
             return 0.0
 
+    def _largest_rate_within_envelope(
+        self,
+        inlet_stream: FluidStream,
+        target_pressure: FloatConstraint,
+        boundary: Boundary,
+    ) -> float | None:
+        """Largest rate the train can take at maximum speed while reaching the target pressure, an upper bound for
+        the feasible rate given by the stonewall and maximum speed curves of the compressor charts.
+
+        Each probe is a single run of the train rather than a full solve. Returns None if no rate in the boundary is
+        within the envelope, i.e. no rate is feasible.
+        """
+
+        def probe(rate: float) -> BisectResult:
+            is_within_envelope = self._solver.can_reach_at_maximum_speed(
+                target_pressure, inlet_stream.with_standard_rate(rate)
+            )
+            return BisectResult(higher=is_within_envelope, accepted=is_within_envelope)
+
+        try:
+            return self._search_strategy.search(boundary=boundary, func=probe)
+        except DidNotConvergeError:
+            return None
+
     def _is_feasible(self, inlet_stream: FluidStream, target_pressure: FloatConstraint) -> bool:
         return self._solver.find_solution([target_pressure], inlet_stream).success
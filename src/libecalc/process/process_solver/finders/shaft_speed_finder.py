@@ -31,9 +31,22 @@ class ShaftSpeedFinder(Finder[SpeedConfiguration]):
         root_finding_strategy: RootFindingStrategy,
         boundary: Boundary,
         target_pressure: float,
+        speed_hint: float | None = None,
     ):
+        """
+
+        Args:
+            search_strategy: Bisection used to locate the valid speed range at the boundaries.
+            root_finding_strategy: Root finder used to hit the target pressure within the valid speed range.
+            boundary: The speed boundary to search within.
+            target_pressure: The outlet pressure to reach [bara].
+            speed_hint: Optional speed expected to be close to the solution, typically the speed found for the
+                previous time step. Used to narrow the root finding bracket, does not affect the result beyond
+                the root finding tolerance.
+        """
         self._boundary = boundary
         self._target_pressure = target_pressure
+        self._speed_hint = speed_hint
         self._search_strategy = search_strategy
         self._root_finding_strategy = root_finding_strategy
 
@@ -64,6 +77,7 @@ class ShaftSpeedFinder(Finder[SpeedConfiguration]):
                 root_finding_strategy=self._root_finding_strategy,
                 boundary=Boundary(min=self._boundary.min, max=valid_max),
                 target_pressure=self._target_pressure,
+                speed_hint=self._speed_hint,
             ).find(func)
         except InsufficientInletPressureError as e:
             logger.debug(f"Insufficient inlet pressure at maximum speed: {max_speed_configuration}")
@@ -123,12 +137,43 @@ class ShaftSpeedFinder(Finder[SpeedConfiguration]):
             out = func(SpeedConfiguration(speed=x))
             return out.pressure_bara - self._target_pressure
 
-        speed = self._root_finding_strategy.find_root(
+        root_boundary = self._narrow_boundary_with_hint(
             boundary=Boundary(min=minimum_speed_configuration.speed, max=self._boundary.max),
             func=root_speed_func,
         )
+        if root_boundary.min == root_boundary.max:
+            return Finding(configuration=SpeedConfiguration(speed=root_boundary.min))
+
+        speed = self._root_finding_strategy.find_root(
+            boundary=root_boundary,
+            func=root_speed_func,
+        )
         return Finding(configuration=SpeedConfiguration(speed=speed))
 
+    def _narrow_boundary_with_hint(self, boundary: Boundary, func: Callable[[float], float]) -> Boundary:
+        """Split the root bracket at the speed hint, keeping the half that contains the root.
+
+        A hint outside the bracket, or a hint where the process cannot be evaluated, leaves the bracket unchanged.
+        Returns a zero-width boundary if the hint hits the target exactly.
+        """
+        hint = self._speed_hint
+        if hint is None or not boundary.min < hint < boundary.max:
+            return boundary
+        try:
+            residual = func(hint)
+        except (
+            CompressorThermodynamicCalculationError,
+            CompressorStonewallError,
+            CompressorSurgeError,
+            InsufficientInletPressureError,
+        ):
+            return boundary
+        if residual == 0.0:
+            return Boundary(min=hint, max=hint)
+        if residual > 0.0:
+            return Boundary(min=boundary.min, max=hint)
+        return Boundary(min=hint, max=boundary.max)
+
     @staticmethod
     def _eos_ok(func: Callable[[SpeedConfiguration], FluidStream], speed: float) -> bool:
         try:
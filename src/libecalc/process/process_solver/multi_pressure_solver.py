@@ -8,7 +8,7 @@ from libecalc.process.process_solver.configuration import Configuration, Operati
 from libecalc.process.process_solver.float_constraint import FloatConstraint
 from libecalc.process.process_solver.pipeline_section import Pipeline, PipelineSection
 from libecalc.process.process_solver.pipeline_section_solver import PipelineSectionSolver
-from libecalc.process.process_solver.pipeline_solver import PipelineSolver
+from libecalc.process.process_solver.pipeline_solver import PipelineSolver, PipelineSolverInput
 from libecalc.process.process_solver.pressure_control.downstream_choke import DownstreamChokePressureControlStrategy
 from libecalc.process.process_solver.pressure_control.upstream_choke import UpstreamChokePressureControlStrategy
 from libecalc.process.process_solver.search_strategies import DidNotConvergeError
@@ -47,6 +47,9 @@ class MultiPressureSolver(PipelineSolver):
         self._shaft_id: Final = next(iter(shaft_ids))
         self._validate_pressure_control_placement(pipeline_sections)
         self._pipeline_sections: Final = pipeline_sections
+        self._pipeline_section_solvers: Final = [
+            PipelineSectionSolver(pipeline_section) for pipeline_section in pipeline_sections
+        ]
 
     @staticmethod
     def _validate_pressure_control_placement(pipeline_sections: list[PipelineSection]) -> None:
@@ -70,30 +73,61 @@ class MultiPressureSolver(PipelineSolver):
         self,
         pressure_targets: list[FloatConstraint],
         inlet_stream: FluidStream,
+        speed_hint: float | None = None,
     ) -> Solution[Sequence[Configuration]]:
+        """
+        Args:
+            pressure_targets: One outlet pressure target per pipeline section.
+            inlet_stream: The stream entering the first pipeline section.
+            speed_hint: Optional shaft speed close to the expected solution, e.g. from the previous time step.
+                Used as starting point for the individual speed search of each pipeline section.
+        """
         if len(pressure_targets) != len(self._pipeline_sections):
             raise EcalcValidationException(
                 f"Number of pressure targets ({len(pressure_targets)}) must match "
                 f"number of pipeline sections ({len(self._pipeline_sections)})."
             )
         try:
-            return self._find_solution(pressure_targets, inlet_stream)
+            return self._find_solution(pressure_targets, inlet_stream, speed_hint=speed_hint)
         except DidNotConvergeError as e:
             return Solution(configuration=[], failure=ConvergenceFailure.from_error(e))
         except ProcessError as e:
             return Solution(configuration=[], failure=process_error_to_failure(e))
 
+    def find_solutions(
+        self,
+        solver_inputs: Sequence[PipelineSolverInput],
+    ) -> list[Solution[Sequence[Configuration]]]:
+        """Solve consecutive problems, using the shaft speed of the last successful solution as hint for the next."""
+        solutions: list[Solution[Sequence[Configuration]]] = []
+        speed_hint: float | None = None
+        for solver_input in solver_inputs:
+            solution = self.find_solution(
+                pressure_targets=list(solver_input.pressure_targets),
+                inlet_stream=solver_input.inlet_stream,
+                speed_hint=speed_hint,
+            )
+            solutions.append(solution)
+            if solution.success:
+                speed_configuration = solution.get_configuration(self._shaft_id)
+                assert isinstance(speed_configuration, SpeedConfiguration)
+                speed_hint = speed_configuration.speed
+        return solutions
+
     def _find_solution(
         self,
         pressure_targets: list[FloatConstraint],
         inlet_stream: FluidStream,
+        speed_hint: float | None = None,
     ) -> Solution[Sequence[Configuration]]:
 
         speed_configurations: list[SpeedConfiguration] = []
         current_inlet = inlet_stream
-        for pipeline_section, target in zip(self._pipeline_sections, pressure_targets, strict=True):
-            solution_for_pipeline_section = PipelineSectionSolver(pipeline_section).find_solution(
-                pressure_targets=[target], inlet_stream=current_inlet
+        for pipeline_section, pipeline_section_solver, target in zip(
+            self._pipeline_sections, self._pipeline_section_solvers, pressure_targets, strict=True
+        ):
+            solution_for_pipeline_section = pipeline_section_solver.find_solution(
+                pressure_targets=[target], inlet_stream=current_inlet, speed_hint=speed_hint
             )
             if not solution_for_pipeline_section.success:
                 return solution_for_pipeline_section
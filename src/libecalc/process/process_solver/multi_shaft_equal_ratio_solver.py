@@ -9,7 +9,7 @@ from libecalc.process.process_solver.configuration import Configuration
 from libecalc.process.process_solver.float_constraint import FloatConstraint
 from libecalc.process.process_solver.multi_shaft_solver import MultiShaftSolver
 from libecalc.process.process_solver.pipeline_section import PipelineSection
-from libecalc.process.process_solver.pipeline_solver import PipelineSolver
+from libecalc.process.process_solver.pipeline_solver import PipelineSolver, PipelineSolverInput
 from libecalc.process.process_solver.solver import Solution
 
 
@@ -32,10 +32,40 @@ class MultiShaftEqualRatioSolver(PipelineSolver):
         pressure_target: FloatConstraint = pressure_targets[0]
 
         """Split overall pressure target into equal per-pipeline section ratios and delegate."""
-        n = len(self._pipeline_sections)
-        if n == 0:
+        if len(self._pipeline_sections) == 0:
             return Solution(configuration=[], failure=None)
 
+        return self._solver.find_solution(
+            self._get_pipeline_section_targets(pressure_target, inlet_stream), inlet_stream
+        )
+
+    def find_solutions(
+        self,
+        solver_inputs: Sequence[PipelineSolverInput],
+    ) -> list[Solution[Sequence[Configuration]]]:
+        """Split each overall pressure target into per-pipeline section targets and solve them as one batch."""
+        if len(self._pipeline_sections) == 0:
+            return [Solution(configuration=[], failure=None) for _ in solver_inputs]
+
+        pipeline_section_solver_inputs = []
+        for solver_input in solver_inputs:
+            assert len(solver_input.pressure_targets) == 1
+            pipeline_section_solver_inputs.append(
+                PipelineSolverInput(
+                    pressure_targets=self._get_pipeline_section_targets(
+                        solver_input.pressure_targets[0], solver_input.inlet_stream
+                    ),
+                    inlet_stream=solver_input.inlet_stream,
+                )
+            )
+        return self._solver.find_solutions(pipeline_section_solver_inputs)
+
+    def _get_pipeline_section_targets(
+        self,
+        pressure_target: FloatConstraint,
+        inlet_stream: FluidStream,
+    ) -> list[FloatConstraint]:
+        n = len(self._pipeline_sections)
         pressure_ratio = (pressure_target.value / inlet_stream.pressure_bara) ** (1.0 / n)
 
         # Rolling targets: each pipeline section targets its actual inlet × ratio.
@@ -46,5 +76,4 @@ class MultiShaftEqualRatioSolver(PipelineSolver):
             current_p *= pressure_ratio
             targets.append(FloatConstraint(current_p, abs_tol=pressure_target.abs_tol))
         targets[-1] = pressure_target
-
-        return self._solver.find_solution(targets, inlet_stream)
+        return targets
@@ -7,11 +7,15 @@ from collections.abc import Sequence
 
 from libecalc.process.fluid_stream.fluid_stream import FluidStream
 from libecalc.process.process_pipeline.process_error import ProcessError
-from libecalc.process.process_solver.configuration import Configuration, OperatingConfiguration
+from libecalc.process.process_solver.configuration import (
+    Configuration,
+    OperatingConfiguration,
+    SpeedConfiguration,
+)
 from libecalc.process.process_solver.float_constraint import FloatConstraint
 from libecalc.process.process_solver.pipeline_section import PipelineSection
 from libecalc.process.process_solver.pipeline_section_solver import PipelineSectionSolver
-from libecalc.process.process_solver.pipeline_solver import PipelineSolver
+from libecalc.process.process_solver.pipeline_solver import PipelineSolver, PipelineSolverInput
 from libecalc.process.process_solver.search_strategies import DidNotConvergeError
 from libecalc.process.process_solver.solver import (
     ConvergenceFailure,
@@ -29,28 +33,74 @@ class MultiShaftSolver(PipelineSolver):
 
     def __init__(self, pipeline_sections: Sequence[PipelineSection]) -> None:
         self._pipeline_sections = list(pipeline_sections)
+        self._pipeline_section_solvers = [
+            PipelineSectionSolver(pipeline_section) for pipeline_section in self._pipeline_sections
+        ]
 
     def find_solution(
         self,
         pressure_targets: Sequence[FloatConstraint],
         inlet_stream: FluidStream,
+        speed_hints: Sequence[float | None] | None = None,
     ) -> Solution[Sequence[Configuration]]:
-        """Run each pipeline section in flow order against its supplied pressure target."""
+        """Run each pipeline section in flow order against its supplied pressure target.
+
+        Args:
+            pressure_targets: One outlet pressure target per pipeline section.
+            inlet_stream: The stream entering the first pipeline section.
+            speed_hints: Optional speed hint per pipeline section, see PipelineSectionSolver.find_solution.
+        """
         assert len(pressure_targets) == len(self._pipeline_sections), (
             f"Number of pressure targets ({len(pressure_targets)}) must match "
             f"number of pipeline sections ({len(self._pipeline_sections)})."
         )
+        if speed_hints is None:
+            speed_hints = [None] * len(self._pipeline_sections)
         try:
-            return self._find_solution(pressure_targets, inlet_stream)
+            return self._find_solution(pressure_targets, inlet_stream, speed_hints)
         except DidNotConvergeError as e:
             return Solution(configuration=[], failure=ConvergenceFailure.from_error(e))
         except ProcessError as e:
             return Solution(configuration=[], failure=process_error_to_failure(e))
 
+    def find_solutions(
+        self,
+        solver_inputs: Sequence[PipelineSolverInput],
+    ) -> list[Solution[Sequence[Configuration]]]:
+        """Solve consecutive problems, using the last successful speed of each pipeline section as hint for the next."""
+        solutions: list[Solution[Sequence[Configuration]]] = []
+        speed_hints: list[float | None] = [None] * len(self._pipeline_sections)
+        for solver_input in solver_inputs:
+            solution = self.find_solution(
+                pressure_targets=solver_input.pressure_targets,
+                inlet_stream=solver_input.inlet_stream,
+                speed_hints=speed_hints,
+            )
+            solutions.append(solution)
+            speed_hints = self._get_speed_hints(solution, previous_speed_hints=speed_hints)
+        return solutions
+
+    def _get_speed_hints(
+        self,
+        solution: Solution[Sequence[Configuration]],
+        previous_speed_hints: Sequence[float | None],
+    ) -> list[float | None]:
+        """Shaft speed per pipeline section in the solution, keeping the previous hint for sections not solved."""
+        speeds = {
+            configuration.configuration_handler_id: configuration.value.speed
+            for configuration in solution.configuration
+            if isinstance(configuration.value, SpeedConfiguration)
+        }
+        return [
+            speeds.get(pipeline_section.get_shaft_id(), previous_speed_hint)
+            for pipeline_section, previous_speed_hint in zip(self._pipeline_sections, previous_speed_hints, strict=True)
+        ]
+
     def _find_solution(
         self,
         pressure_targets: Sequence[FloatConstraint],
         inlet_stream: FluidStream,
+        speed_hints: Sequence[float | None],
     ) -> Solution[Sequence[Configuration[OperatingConfiguration]]]:
         if not self._pipeline_sections:
             return Solution(configuration=[])
@@ -58,8 +108,10 @@ class MultiShaftSolver(PipelineSolver):
         current_inlet = inlet_stream
         all_configurations: list[Configuration[OperatingConfiguration]] = []
 
-        for i, (pipeline_section, target) in enumerate(zip(self._pipeline_sections, pressure_targets, strict=True)):
-            solution = PipelineSectionSolver(pipeline_section).find_solution([target], current_inlet)
+        for i, (pipeline_section, pipeline_section_solver, target, speed_hint) in enumerate(
+            zip(self._pipeline_sections, self._pipeline_section_solvers, pressure_targets, speed_hints, strict=True)
+        ):
+            solution = pipeline_section_solver.find_solution([target], current_inlet, speed_hint=speed_hint)
             all_configurations.extend(solution.configuration)
 
             if not solution.success:
@@ -0,0 +1,96 @@
+"""Solver evaluating the time steps of a process simulation in chunks, optionally in worker processes."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from functools import partial
+
+from libecalc.common.parallel_evaluation import ParallelEvaluationConfig, ParallelEvaluationMode, ParallelEvaluator
+from libecalc.process.fluid_stream.fluid_stream import FluidStream
+from libecalc.process.process_solver.configuration import Configuration
+from libecalc.process.process_solver.float_constraint import FloatConstraint
+from libecalc.process.process_solver.pipeline_solver import PipelineSolver, PipelineSolverInput
+from libecalc.process.process_solver.solver import Solution
+
+DEFAULT_CHUNK_SIZE = 50
+
+
+def _find_solutions(
+    solver: PipelineSolver, solver_inputs: Sequence[PipelineSolverInput]
+) -> list[Solution[Sequence[Configuration]]]:
+    return solver.find_solutions(solver_inputs)
+
+
+class ParallelPipelineSolver(PipelineSolver):
+    """Spreads consecutive problems, e.g. the time steps or periods of a process simulation, over workers.
+
+    Time steps are independent once the configurations are fixed, but solvers may reuse information between
+    consecutive problems, e.g. starting the search from the previous speed. The problems are therefore always split
+    into the same chunks of consecutive problems, whether they are evaluated serially or in processes, so that the
+    solutions are identical for both modes.
+
+    Solvers are stateful, they apply the configurations to the shared process units and update the stream cache of
+    the runner while solving. THREADS mode is therefore not supported, chunks solved concurrently in threads would
+    overwrite each other's state. In PROCESSES mode the solver is sent to the workers with each chunk, so each chunk
+    is solved by its own copy of the solver, and the configurations applied by the workers are not seen by the
+    caller. Solvers using NeqSim need a worker initializer starting NeqSim in each worker, see
+    NeqsimWorkerInitializer.
+    """
+
+    def __init__(
+        self,
+        solver: PipelineSolver,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        parallel_evaluation_config: ParallelEvaluationConfig | None = None,
+    ):
+        """
+        Args:
+            solver: Solver for each chunk of problems
+            chunk_size: Max number of consecutive problems solved by one worker at a time
+            parallel_evaluation_config: How to evaluate the chunks, SERIAL or PROCESSES. Defaults to SERIAL, the
+                configuration given to ParallelEvaluator is not used.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Invalid chunk_size '{chunk_size}'. Must be at least 1.")
+        parallel_evaluation_config = parallel_evaluation_config or ParallelEvaluationConfig.default()
+        if parallel_evaluation_config.mode == ParallelEvaluationMode.THREADS:
+            raise ValueError(
+                "THREADS mode is not supported, the solver state is shared between the chunks. Use PROCESSES instead."
+            )
+        self._solver = solver
+        self._chunk_size = chunk_size
+        self._parallel_evaluation_config = parallel_evaluation_config
+
+    def find_solution(
+        self,
+        pressure_targets: Sequence[FloatConstraint],
+        inlet_stream: FluidStream,
+    ) -> Solution[Sequence[Configuration]]:
+        return self._solver.find_solution(pressure_targets=pressure_targets, inlet_stream=inlet_stream)
+
+    def find_solutions(
+        self,
+        solver_inputs: Sequence[PipelineSolverInput],
+    ) -> list[Solution[Sequence[Configuration]]]:
+        """Solve the problems in chunks of consecutive problems, returning the solutions in the same order."""
+        chunks = [
+            solver_inputs[start : start + self._chunk_size] for start in range(0, len(solver_inputs), self._chunk_size)
+        ]
+        return [solution for chunk_solutions in self._find_solutions_per_chunk(chunks) for solution in chunk_solutions]
+
+    def find_solutions_per_period(
+        self,
+        solver_inputs_per_period: Sequence[Sequence[PipelineSolverInput]],
+    ) -> list[list[Solution[Sequence[Configuration]]]]:
+        """Solve the problems of each period as one chunk, returning the solutions of each period in the same order."""
+        return self._find_solutions_per_chunk(solver_inputs_per_period)
+
+    def _find_solutions_per_chunk(
+        self,
+        chunks: Sequence[Sequence[PipelineSolverInput]],
+    ) -> list[list[Solution[Sequence[Configuration]]]]:
+        return ParallelEvaluator.map(
+            partial(_find_solutions, self._solver),
+            chunks,
+            config=self._parallel_evaluation_config,
+        )
@@ -12,7 +12,7 @@ from libecalc.process.process_solver.finder import Finding
 from libecalc.process.process_solver.finders.shaft_speed_finder import ShaftSpeedFinder
 from libecalc.process.process_solver.float_constraint import FloatConstraint
 from libecalc.process.process_solver.pipeline_section import PipelineSection
-from libecalc.process.process_solver.pipeline_solver import PipelineSolver
+from libecalc.process.process_solver.pipeline_solver import PipelineSolver, PipelineSolverInput
 from libecalc.process.process_solver.search_strategies import Bisect, DidNotConvergeError
 from libecalc.process.process_solver.solver import (
     CompressorStonewallFailure,
@@ -43,6 +43,7 @@ class PipelineSectionSolver(PipelineSolver):
         self,
         pressure_constraint: FloatConstraint,
         inlet_stream: FluidStream,
+        speed_hint: float | None = None,
     ) -> Finding[SpeedConfiguration]:
         # The speed search evaluates the train with pressure control disengaged
         self._pipeline_section.get_pressure_control_strategy().reset()
@@ -51,22 +52,47 @@ class PipelineSectionSolver(PipelineSolver):
             root_finding_strategy=self._pipeline_section.get_root_finding_strategy(),
             boundary=self._get_initial_speed_boundary(),
             target_pressure=pressure_constraint.value,
+            speed_hint=speed_hint,
         )
 
         def speed_func(configuration: SpeedConfiguration) -> FluidStream:
-            self._pipeline_section.get_anti_surge_strategy().reset()
-            self._pipeline_section.get_runner().apply_configuration(
-                Configuration(configuration_handler_id=self._pipeline_section.get_shaft_id(), value=configuration),
-            )
-            try:
-                return self._pipeline_section.get_runner().run(inlet_stream=inlet_stream)
-            except CompressorSurgeError:
-                solution = self._pipeline_section.get_anti_surge_strategy().apply(inlet_stream=inlet_stream)
-                self._pipeline_section.get_runner().apply_configurations(solution.configuration)
-                return self._pipeline_section.get_runner().run(inlet_stream=inlet_stream)
+            return self._get_outlet_stream_at_speed(inlet_stream=inlet_stream, speed_configuration=configuration)
 
         return shaft_speed_finder.find(speed_func)
 
+    def _get_outlet_stream_at_speed(
+        self, inlet_stream: FluidStream, speed_configuration: SpeedConfiguration
+    ) -> FluidStream:
+        """Outlet stream at the given speed, with anti-surge recirculation if the train is in surge at that speed."""
+        self._pipeline_section.get_anti_surge_strategy().reset()
+        self._pipeline_section.get_runner().apply_configuration(
+            Configuration(configuration_handler_id=self._pipeline_section.get_shaft_id(), value=speed_configuration),
+        )
+        try:
+            return self._pipeline_section.get_runner().run(inlet_stream=inlet_stream)
+        except CompressorSurgeError:
+            solution = self._pipeline_section.get_anti_surge_strategy().apply(inlet_stream=inlet_stream)
+            self._pipeline_section.get_runner().apply_configurations(solution.configuration)
+            return self._pipeline_section.get_runner().run(inlet_stream=inlet_stream)
+
+    def can_reach_at_maximum_speed(self, pressure_target: FloatConstraint, inlet_stream: FluidStream) -> bool:
+        """Whether the section handles the inlet stream at maximum speed, i.e. within the stonewall of the compressor
+        charts, with an outlet pressure at or above the target.
+
+        A necessary condition for find_solution to succeed, since pressure control can only lower the outlet pressure,
+        checked with a single run of the section instead of a speed search.
+        """
+        # Evaluated with pressure control disengaged, as the speed search
+        self._pipeline_section.get_pressure_control_strategy().reset()
+        try:
+            outlet_stream = self._get_outlet_stream_at_speed(
+                inlet_stream=inlet_stream,
+                speed_configuration=SpeedConfiguration(speed=self._get_initial_speed_boundary().max),
+            )
+        except (ProcessError, DidNotConvergeError):
+            return False
+        return outlet_stream.pressure_bara >= pressure_target
+
     def _get_outlet_stream(self, inlet_stream: FluidStream, configurations: Sequence[Configuration]):
         self._pipeline_section.get_runner().apply_configurations(configurations)
         return self._pipeline_section.get_runner().run(inlet_stream=inlet_stream)
@@ -77,9 +103,16 @@ class PipelineSectionSolver(PipelineSolver):
             FloatConstraint
         ],  # NOTE: In order to fit interface signature, but may only have one item for now
         inlet_stream: FluidStream,
+        speed_hint: float | None = None,
     ) -> Solution[Sequence[Configuration]]:
         """
         Finds the speed and recirculation rates for each compressor to meet the pressure constraint.
+
+        Args:
+            pressure_targets: The outlet pressure target, exactly one.
+            inlet_stream: The stream entering the pipeline section.
+            speed_hint: Optional speed close to the expected solution, e.g. from the previous time step. Only
+                used to narrow the speed search.
         """
         assert len(pressure_targets) == 1
         pressure_target = pressure_targets[0]
@@ -91,7 +124,7 @@ class PipelineSectionSolver(PipelineSolver):
             ),  # TODO: Min or max? Or nothing because we dont know? Last x we tried?
         )
         try:
-            return self._find_solution(pressure_target, inlet_stream)
+            return self._find_solution(pressure_target, inlet_stream, speed_hint=speed_hint)
         except DidNotConvergeError as e:
             return Solution(
                 configuration=[shaft_config],
@@ -100,12 +133,44 @@ class PipelineSectionSolver(PipelineSolver):
         except ProcessError as e:
             return Solution(configuration=[shaft_config], failure=process_error_to_failure(e))
 
+    def find_solutions(
+        self,
+        solver_inputs: Sequence[PipelineSolverInput],
+    ) -> list[Solution[Sequence[Configuration]]]:
+        """Solve consecutive problems, using the speed of the last successful solution as hint for the next."""
+        solutions: list[Solution[Sequence[Configuration]]] = []
+        speed_hint: float | None = None
+        for solver_input in solver_inputs:
+            solution = self.find_solution(
+                pressure_targets=solver_input.pressure_targets,
+                inlet_stream=solver_input.inlet_stream,
+                speed_hint=speed_hint,
+            )
+            solutions.append(solution)
+            solution_speed = self.get_solution_speed(solution)
+            if solution_speed is not None:
+                speed_hint = solution_speed
+        return solutions
+
+    def get_solution_speed(self, solution: Solution[Sequence[Configuration]]) -> float | None:
+        """The shaft speed of a successful solution, or None if the solution failed."""
+        if not solution.success:
+            return None
+        speed_configuration = solution.get_configuration(self._pipeline_section.get_shaft_id())
+        assert isinstance(speed_configuration, SpeedConfiguration)
+        return speed_configuration.speed
+
     def _find_solution(
         self,
         pressure_target: FloatConstraint,
         inlet_stream: FluidStream,
+        speed_hint: float | None = None,
     ) -> Solution[Sequence[Configuration]]:
-        speed_finding = self._find_speed_solution(pressure_constraint=pressure_target, inlet_stream=inlet_stream)
+        speed_finding = self._find_speed_solution(
+            pressure_constraint=pressure_target,
+            inlet_stream=inlet_stream,
+            speed_hint=speed_hint,
+        )
 
         shaft_config = Configuration(
             configuration_handler_id=self._pipeline_section.get_shaft_id(),
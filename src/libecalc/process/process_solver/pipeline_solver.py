@@ -1,5 +1,6 @@
 import abc
 from collections.abc import Sequence
+from dataclasses import dataclass
 
 from libecalc.process.fluid_stream.fluid_stream import FluidStream
 from libecalc.process.process_solver.configuration import Configuration
@@ -7,6 +8,14 @@ from libecalc.process.process_solver.float_constraint import FloatConstraint
 from libecalc.process.process_solver.solver import Solution
 
 
+@dataclass(frozen=True)
+class PipelineSolverInput:
+    """One problem to solve, typically one time step: the pressure targets to meet for a given inlet stream."""
+
+    pressure_targets: Sequence[FloatConstraint]
+    inlet_stream: FluidStream
+
+
 class PipelineSolver(abc.ABC):
     """
     So, we have a hierarchy or a collection of different types of solvers for different purposes, or to
@@ -20,3 +29,21 @@ class PipelineSolver(abc.ABC):
         pressure_targets: Sequence[FloatConstraint],
         inlet_stream: FluidStream,
     ) -> Solution[Sequence[Configuration]]: ...
+
+    def find_solutions(
+        self,
+        solver_inputs: Sequence[PipelineSolverInput],
+    ) -> list[Solution[Sequence[Configuration]]]:
+        """Solve a sequence of problems, e.g. all time steps of a simulation, in order.
+
+        Subclasses may override this to reuse information between consecutive problems, such as starting
+        the search from the previous solution. The solutions must match what ``find_solution`` gives for each
+        problem, within the solver tolerances.
+        """
+        return [
+            self.find_solution(
+                pressure_targets=solver_input.pressure_targets,
+                inlet_stream=solver_input.inlet_stream,
+            )
+            for solver_input in solver_inputs
+        ]
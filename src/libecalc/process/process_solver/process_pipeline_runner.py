@@ -1,4 +1,4 @@
-from collections.abc import Iterable, Sequence
+from collections.abc import Hashable, Sequence
 
 from libecalc.process.fluid_stream.fluid_stream import FluidStream
 from libecalc.process.process_pipeline.process_unit import ProcessUnit, ProcessUnitId
@@ -15,9 +15,23 @@ def propagate_stream_many(process_units: Sequence[ProcessUnit], inlet_stream: Fl
 
 
 class ProcessPipelineRunner(ProcessRunner):
+    """Runs streams through a pipeline of process units.
+
+    The streams between the units of the last run are kept, together with the state of the units they were
+    propagated with, see ProcessUnit.get_propagation_state. A run with the same inlet stream is propagated from the
+    first unit with a changed state, e.g. when a solver probes the speed of a shaft, the streams through the units
+    upstream of the shaft's compressors are reused.
+    """
+
     def __init__(self, configuration_handlers: Sequence[ConfigurationHandler], units: Sequence[ProcessUnit]):
         self._configuration_handlers = {handler.get_id(): handler for handler in configuration_handlers}
         self._units = {unit.get_id(): unit for unit in units}
+        self._unit_indices = {unit_id: index for index, unit_id in enumerate(self._units)}
+
+        # The stream entering each unit in the last run, and the state of each unit when propagating its inlet stream,
+        # i.e. the stream entering unit i + 1 is propagated by unit i in state _unit_states[i].
+        self._streams: list[FluidStream] = []
+        self._unit_states: list[Hashable | None] = []
 
     @staticmethod
     def _apply_config_for_unit(configuration_handler: ConfigurationHandler, configuration: Configuration):
@@ -33,26 +47,42 @@ class ProcessPipelineRunner(ProcessRunner):
     def _get_configuration_handler(self, configuration_handler_id: ConfigurationHandlerId) -> ConfigurationHandler:
         return self._configuration_handlers[configuration_handler_id]
 
-    def _propagate_stream_to_id(
-        self,
-        inlet_stream: FluidStream,
-        units: Iterable[ProcessUnit],
-        to_id: ProcessUnitId,
-    ) -> tuple[FluidStream, bool]:
-        current_stream = inlet_stream
-        for unit in units:
-            if unit.get_id() == to_id:
-                return current_stream, True
-            current_stream = unit.propagate_stream(inlet_stream=current_stream)
+    def _get_number_of_reusable_streams(self, inlet_stream: FluidStream, unit_states: list[Hashable | None]) -> int:
+        """The number of streams from the last run that are the same in this run, counted from the inlet stream."""
+        if len(self._streams) == 0 or not (self._streams[0] is inlet_stream or self._streams[0] == inlet_stream):
+            return 0
+        number_of_reusable_streams = 1
+        for previous_state, state in zip(self._unit_states, unit_states):
+            if state is None or previous_state != state:
+                break
+            number_of_reusable_streams += 1
+        return number_of_reusable_streams
+
+    def _propagate_stream(self, inlet_stream: FluidStream, number_of_units: int) -> FluidStream:
+        """Propagate the inlet stream through the given number of units, from the start of the pipeline."""
+        units = list(self._units.values())[:number_of_units]
+        unit_states = [unit.get_propagation_state() for unit in units]
+        number_of_reusable_streams = self._get_number_of_reusable_streams(inlet_stream, unit_states)
+        if number_of_reusable_streams > number_of_units:
+            return self._streams[number_of_units]
+
+        if number_of_reusable_streams == 0:
+            self._streams = [inlet_stream]
+            self._unit_states = []
+        else:
+            del self._streams[number_of_reusable_streams:]
+            del self._unit_states[number_of_reusable_streams - 1 :]
+
+        for index in range(len(self._unit_states), number_of_units):
+            # Stored as propagated, so that an error in a unit keeps the streams up to the unit
+            self._streams.append(units[index].propagate_stream(inlet_stream=self._streams[index]))
+            self._unit_states.append(unit_states[index])
 
-        return current_stream, False
+        return self._streams[number_of_units]
 
     def run(self, inlet_stream: FluidStream, to_id: ProcessUnitId | None = None) -> FluidStream:
         if to_id is not None:
-            current_stream, found = self._propagate_stream_to_id(
-                inlet_stream=inlet_stream, units=self._units.values(), to_id=to_id
-            )
-            assert found, f"Did not find unit with id '{to_id}'"
-            return current_stream
+            assert to_id in self._unit_indices, f"Did not find unit with id '{to_id}'"
+            return self._propagate_stream(inlet_stream=inlet_stream, number_of_units=self._unit_indices[to_id])
         else:
-            return propagate_stream_many(process_units=list(self._units.values()), inlet_stream=inlet_stream)
+            return self._propagate_stream(inlet_stream=inlet_stream, number_of_units=len(self._units))
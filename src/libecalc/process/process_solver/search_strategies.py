@@ -5,6 +5,7 @@ from typing import NamedTuple
 from scipy.optimize import root_scalar
 
 from libecalc.common.errors.exceptions import EcalcError
+from libecalc.common.profiling import ProfileCounter, Profiler
 from libecalc.process.process_solver.boundary import Boundary
 
 CONVERGENCE_TOLERANCE = 1e-5
@@ -59,6 +60,7 @@ class Bisect:
         x0, x1 = boundary.min, boundary.max
         last_accepted: float | None = None
         for _ in range(self._max_iterations):
+            Profiler.count(ProfileCounter.ROOT_FINDER_ITERATIONS)
             x2 = (x0 + x1) / 2
             higher, accepted = probe(x2)
             if accepted:
@@ -172,6 +174,7 @@ class ScipyRootFindingStrategy(RootFindingStrategy):
             method="brenth",
             rtol=self._tolerance,
         )
+        Profiler.count(ProfileCounter.ROOT_FINDER_ITERATIONS, result.iterations)
         if not result.converged:
             raise DidNotConvergeError(
                 boundary=boundary,
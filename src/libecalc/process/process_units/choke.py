@@ -1,3 +1,4 @@
+from collections.abc import Hashable
 from typing import Final
 
 from libecalc.process.fluid_stream.fluid_service import FluidService
@@ -20,6 +21,9 @@ class Choke(ProcessUnit):
     def get_id(self) -> ProcessUnitId:
         return self._id
 
+    def get_propagation_state(self) -> Hashable | None:
+        return self._pressure_change
+
     @property
     def pressure_change(self) -> float:
         return self._pressure_change
@@ -1,3 +1,4 @@
+from collections.abc import Hashable
 from typing import Final
 
 from libecalc.common.ddd import value_object
@@ -41,6 +42,9 @@ class Compressor(ProcessUnit):
     def get_id(self) -> ProcessUnitId:
         return self._id
 
+    def get_propagation_state(self) -> Hashable | None:
+        return self._speed
+
     def propagate_stream(self, inlet_stream: FluidStream) -> FluidStream:
         if inlet_stream.vapor_fraction_molar < ThermodynamicConstants.PURE_VAPOR_THRESHOLD:
             raise LiquidAtInletError(
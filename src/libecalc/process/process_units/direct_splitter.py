@@ -1,3 +1,4 @@
+from collections.abc import Hashable
 from typing import Final
 
 from libecalc.common.units import UnitConstants
@@ -13,6 +14,9 @@ class DirectSplitter(ProcessUnit):
     def get_id(self) -> ProcessUnitId:
         return self._id
 
+    def get_propagation_state(self) -> Hashable | None:
+        return self._split_rate
+
     def propagate_stream(self, inlet_stream: FluidStream) -> FluidStream:
         removed_mass_kg_per_h = (
             self._split_rate * inlet_stream.standard_density_gas_phase_after_flash / UnitConstants.HOURS_PER_DAY
@@ -1,3 +1,4 @@
+from collections.abc import Hashable
 from typing import Final
 
 from libecalc.process.fluid_stream.fluid_stream import FluidStream
@@ -18,5 +19,8 @@ class Inlet(ProcessUnit):
     def get_id(self) -> ProcessUnitId:
         return self._id
 
+    def get_propagation_state(self) -> Hashable | None:
+        return ()
+
     def propagate_stream(self, inlet_stream: FluidStream) -> FluidStream:
         return inlet_stream  # TODO: Copy?
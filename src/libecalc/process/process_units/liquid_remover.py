@@ -1,3 +1,4 @@
+from collections.abc import Hashable
 from typing import Final
 
 from libecalc.process.fluid_stream.constants import ThermodynamicConstants
@@ -14,6 +15,9 @@ class LiquidRemover(ProcessUnit):
     def get_id(self) -> ProcessUnitId:
         return self._id
 
+    def get_propagation_state(self) -> Hashable | None:
+        return ()
+
     def propagate_stream(self, inlet_stream: FluidStream) -> FluidStream:
         """
         Removes liquid from the fluid stream. The new stream's mass rate is scaled
@@ -1,3 +1,4 @@
+from collections.abc import Hashable
 from typing import Final
 
 from libecalc.process.fluid_stream.fluid_service import FluidService
@@ -25,6 +26,9 @@ class Mixer(ProcessUnit):
     def get_id(self) -> ProcessUnitId:
         return self._id
 
+    def get_propagation_state(self) -> Hashable | None:
+        return self._external_stream
+
     def set_stream(self, stream: FluidStream) -> None:
         self._external_stream = stream
 
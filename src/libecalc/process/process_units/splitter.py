@@ -1,3 +1,4 @@
+from collections.abc import Hashable
 from typing import Final
 
 from libecalc.process.fluid_stream.fluid_service import FluidService
@@ -22,6 +23,9 @@ class Splitter(ProcessUnit):
     def get_id(self) -> ProcessUnitId:
         return self._id
 
+    def get_propagation_state(self) -> Hashable | None:
+        return self._rate
+
     def set_rate(self, rate: float) -> None:
         self._rate = rate
 
@@ -1,3 +1,4 @@
+from collections.abc import Hashable
 from typing import Final
 
 from libecalc.process.fluid_stream.fluid_service import FluidService
@@ -19,6 +20,9 @@ class TemperatureSetter(ProcessUnit):
     def get_id(self) -> ProcessUnitId:
         return self._id
 
+    def get_propagation_state(self) -> Hashable | None:
+        return self._required_temperature_kelvin
+
     def set_temperature(self, temperature_kelvin: float) -> None:
         self._required_temperature_kelvin = temperature_kelvin
 
@@ -1,4 +1,9 @@
-from libecalc.common.version import Version
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from libecalc.common.version import Version
 
 # DO NOT EDIT - replaced in CI with release please
 __version__ = "13.11.0"  # x-release-please-version
@@ -10,4 +15,7 @@ def current_version() -> Version:
     built in the CICD pipeline.
     :return:
     """
+    # Imported here to keep 'ecalc --version' fast, Version depends on pydantic
+    from libecalc.common.version import Version
+
     return Version.from_string(__version__)
@@ -1,4 +1,5 @@
 import json
+import shutil
 from datetime import date
 from io import StringIO
 from os.path import getsize
@@ -11,6 +12,7 @@ import yaml
 from typer.testing import CliRunner
 
 from ecalc_cli import main
+from ecalc_cli.errors import EcalcCLIError
 from libecalc.common.run_info import RunInfo
 from libecalc.dto.utils.validators import COMPONENT_NAME_ALLOWED_CHARS
 from libecalc.presentation.yaml.model_validation_exception import ModelValidationException
@@ -35,6 +37,7 @@ def _get_args(
     date_format_option: int = None,
     logs_folder: Path = None,
     log_level: str = "INFO",
+    profile: bool = False,
 ):
     args = []
 
@@ -80,6 +83,9 @@ def _get_args(
         args.append("--date-format-option")
         args.append(str(date_format_option))
 
+    if profile:
+        args.append("--profile")
+
     return args
 
 
@@ -415,6 +421,204 @@ class TestFlowDiagramOutput:
         )
 
 
+class TestProfileOutput:
+    def test_profile_false(self, simple_yaml_path, tmp_path):
+        runner.invoke(
+            main.app,
+            _get_args(model_file=simple_yaml_path, output_folder=tmp_path, name_prefix="test"),
+            catch_exceptions=False,
+        )
+        assert not (tmp_path / "test_profile.json").is_file()
+
+    def test_profile_true(self, advanced_yaml_sampled_path, tmp_path):
+        runner.invoke(
+            main.app,
+            _get_args(
+                model_file=advanced_yaml_sampled_path / "model.yaml",
+                output_folder=tmp_path,
+                name_prefix="test",
+                profile=True,
+            ),
+            catch_exceptions=False,
+        )
+
+        profile_path = tmp_path / "test_profile.json"
+        assert profile_path.is_file()
+        profile = json.loads(profile_path.read_text())
+        assert RunInfo.model_validate(profile["run_info"])
+
+        records = profile["records"]
+        assert records[-1]["type"] == "RUN"
+        assert sum(record["wall_time_seconds"] for record in records[:-1]) <= records[-1]["wall_time_seconds"]
+
+        model_records = [record for record in records if record["component"] is not None]
+        assert len(model_records) > 0
+        for record in records[:-1]:
+            assert record["number_of_time_steps"] > 0
+            assert record["root_finder_iterations"] >= 0
+            assert record["neqsim_flash_calls"] >= 0
+
+
+class TestRunScenarios:
+    def test_run_scenarios(self, simple_yaml_path, tmp_path):
+        scenarios_folder = tmp_path / "scenarios"
+        (scenarios_folder / "base").mkdir(parents=True)
+        (scenarios_folder / "high").mkdir()
+        header, units, *rows = (simple_yaml_path.parent / "production_data.csv").read_text().splitlines()
+        high_rows = []
+        for row in rows:
+            date, *values = row.split(",")
+            high_rows.append(",".join([date, *[str(float(value) * 1.5) for value in values]]))
+        (scenarios_folder / "high" / "production_data.csv").write_text("\n".join([header, units, *high_rows]))
+
+        scenarios_output_folder = tmp_path / "scenarios_output"
+        runner.invoke(
+            main.app,
+            [
+                "run-scenarios",
+                str(simple_yaml_path),
+                str(scenarios_folder),
+                "--output-folder",
+                str(scenarios_output_folder),
+                "--name-prefix",
+                "test",
+            ],
+            catch_exceptions=False,
+        )
+        run_output_folder = tmp_path / "run_output"
+        runner.invoke(
+            main.app,
+            _get_args(model_file=simple_yaml_path, output_folder=run_output_folder, name_prefix="test", csv=True),
+            catch_exceptions=False,
+        )
+
+        base_csv = (scenarios_output_folder / "base" / "test.csv").read_text()
+        high_csv = (scenarios_output_folder / "high" / "test.csv").read_text()
+        assert base_csv == (run_output_folder / "test.csv").read_text()
+        assert high_csv != base_csv
+
+    def test_no_scenarios(self, simple_yaml_path, tmp_path):
+        scenarios_folder = tmp_path / "scenarios"
+        scenarios_folder.mkdir()
+        with pytest.raises(EcalcCLIError, match="No scenarios found"):
+            runner.invoke(
+                main.app,
+                ["run-scenarios", str(simple_yaml_path), str(scenarios_folder), "--output-folder", str(tmp_path)],
+                catch_exceptions=False,
+            )
+
+    def test_shared_flash_cache(self, simple_yaml_path, tmp_path, monkeypatch):
+        import ecalc_neqsim_wrapper
+        from ecalc_neqsim_wrapper import CacheConfig, NeqSimFluidService
+
+        scenarios_folder = tmp_path / "scenarios"
+        (scenarios_folder / "base").mkdir(parents=True)
+        shared_flash_cache = tmp_path / "flash_cache.db"
+
+        configured_caches = []
+        monkeypatch.setattr(NeqSimFluidService, "configure", configured_caches.append)
+        worker_initializers = []
+        worker_initializer_class = ecalc_neqsim_wrapper.NeqsimWorkerInitializer
+
+        def create_worker_initializer(**kwargs):
+            worker_initializers.append(worker_initializer_class(**kwargs))
+            return worker_initializers[-1]
+
+        monkeypatch.setattr(ecalc_neqsim_wrapper, "NeqsimWorkerInitializer", create_worker_initializer)
+
+        runner.invoke(
+            main.app,
+            [
+                "run-scenarios",
+                str(simple_yaml_path),
+                str(scenarios_folder),
+                "--output-folder",
+                str(tmp_path / "output"),
+                "--shared-flash-cache",
+                str(shared_flash_cache),
+            ],
+            catch_exceptions=False,
+        )
+
+        assert configured_caches == [CacheConfig(shared_flash_cache_path=shared_flash_cache)]
+        assert [initializer.cache_config for initializer in worker_initializers] == configured_caches
+        assert (tmp_path / "output" / "base").is_dir()
+
+    def test_threads_not_supported(self, simple_yaml_path, tmp_path):
+        scenarios_folder = tmp_path / "scenarios"
+        (scenarios_folder / "base").mkdir(parents=True)
+        with pytest.raises(EcalcCLIError, match="THREADS is not supported"):
+            runner.invoke(
+                main.app,
+                [
+                    "run-scenarios",
+                    str(simple_yaml_path),
+                    str(scenarios_folder),
+                    "--output-folder",
+                    str(tmp_path),
+                    "--parallel-evaluation",
+                    "THREADS",
+                ],
+                catch_exceptions=False,
+            )
+
+
+class TestFitSurrogates:
+    def test_run_with_surrogates(self, drogon_yaml_path, tmp_path):
+        # The emission intensity of a run needs a co2 emission
+        model_folder = tmp_path / "drogon"
+        shutil.copytree(drogon_yaml_path.parent, model_folder)
+        model_file = model_folder / drogon_yaml_path.name
+        model_file.write_text(model_file.read_text().replace("NAME: co2_fuel_gas", "NAME: co2"))
+
+        surrogates_folder = tmp_path / "surrogates"
+        runner.invoke(
+            main.app,
+            [
+                "fit-surrogates",
+                str(model_file),
+                "--output-folder",
+                str(surrogates_folder),
+                "--number-of-points",
+                "3",
+            ],
+            catch_exceptions=False,
+        )
+        assert (surrogates_folder / "simplified_compressor_train_model.npz").is_file()
+
+        run_output_folder = tmp_path / "run_output"
+        runner.invoke(
+            main.app,
+            [
+                *_get_args(model_file=model_file, output_folder=run_output_folder, name_prefix="test", csv=True),
+                "--compressor-train-surrogates",
+                str(surrogates_folder),
+            ],
+            catch_exceptions=False,
+        )
+        assert (run_output_folder / "test.csv").is_file()
+
+    def test_surrogates_folder_not_found(self, simple_yaml_path, tmp_path):
+        with pytest.raises(EcalcCLIError, match="no such folder"):
+            runner.invoke(
+                main.app,
+                [
+                    *_get_args(model_file=simple_yaml_path, output_folder=tmp_path),
+                    "--compressor-train-surrogates",
+                    str(tmp_path / "surrogates"),
+                ],
+                catch_exceptions=False,
+            )
+
+    def test_no_supported_compressor_trains(self, simple_yaml_path, tmp_path):
+        with pytest.raises(EcalcCLIError, match="No compressor trains"):
+            runner.invoke(
+                main.app,
+                ["fit-surrogates", str(simple_yaml_path), "--output-folder", str(tmp_path / "surrogates")],
+                catch_exceptions=False,
+            )
+
+
 class TestLogFileOutput:
     def test_save_logs(self, simple_yaml_path, tmp_path, snapshot):
         run_name_prefix = "test"
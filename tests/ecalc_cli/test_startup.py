@@ -0,0 +1,75 @@
+import subprocess
+import sys
+
+import pytest
+
+# Budget for the number of modules imported by the lightweight commands, currently about 330 taking about 0.3s in
+# total. Counting modules rather than measuring time makes the check independent of how busy the machine is, while
+# catching heavy dependencies being imported at startup again, e.g. pandas alone adds about 500 modules.
+STARTUP_IMPORTED_MODULES_BUDGET = 400
+
+# Dependencies that should only be imported when a model is run
+HEAVY_MODULES = [
+    "pandas",
+    "scipy",
+    "shapely",
+    "networkx",
+    "jpype",
+    "py4j",
+    "ecalc_neqsim_wrapper",
+    "libecalc.presentation",
+    "libecalc.domain",
+]
+
+
+def _get_imports(*args: str) -> list[str]:
+    """Run the CLI with the given arguments in a new interpreter, and get the imported modules using
+    python -X importtime.
+    """
+    completed_process = subprocess.run(  # noqa: S603 - runs the CLI with fixed arguments
+        [sys.executable, "-X", "importtime", "-m", "ecalc_cli.main", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports: list[str] = []
+    for line in completed_process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, _, module_name = line.removeprefix("import time:").split("|")
+        imports.append(module_name.strip())
+    return imports
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--version"],
+        ["--help"],
+        ["show", "--help"],
+        ["run", "--help"],
+    ],
+)
+def test_lightweight_commands_do_not_import_heavy_dependencies(args):
+    imported_modules = _get_imports(*args)
+
+    heavy_modules = [
+        module_name
+        for module_name in imported_modules
+        if any(module_name == heavy or module_name.startswith(f"{heavy}.") for heavy in HEAVY_MODULES)
+    ]
+    assert heavy_modules == []
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--version"],
+        ["run", "--help"],
+    ],
+)
+def test_startup_imports_within_budget(args):
+    imported_modules = _get_imports(*args)
+
+    assert len(imported_modules) < STARTUP_IMPORTED_MODULES_BUDGET
@@ -0,0 +1,215 @@
+"""Tests for caches shared between processes."""
+
+import multiprocessing
+import pickle
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from ecalc_neqsim_wrapper import shared_cache_store
+from ecalc_neqsim_wrapper.cache_service import CacheConfig, CacheName, CacheService, SharedLRUCache
+from ecalc_neqsim_wrapper.fluid_service import FlashCacheCodec, NeqSimFluidService
+from ecalc_neqsim_wrapper.shared_cache_store import SharedCacheCodec, SharedCacheStore
+from libecalc.process.fluid_stream.fluid_model import EoSModel
+from libecalc.process.fluid_stream.fluid_properties import FluidProperties
+
+
+class StringCodec(SharedCacheCodec[str, str]):
+    def encode_key(self, key: str) -> str:
+        return key
+
+    def encode_value(self, value: str) -> bytes:
+        return value.encode()
+
+    def decode_value(self, data: bytes) -> str:
+        try:
+            return data.decode()
+        except UnicodeDecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return tmp_path / "flash_cache.db"
+
+
+def _create_shared_cache(store_path) -> SharedLRUCache:
+    return SharedLRUCache(name="flash", shared_store=SharedCacheStore(store_path), codec=StringCodec())
+
+
+class TestSharedCacheStore:
+    def test_entries_are_shared_between_stores_using_same_file(self, store_path):
+        other_store = SharedCacheStore(store_path)
+        other_store.put("flash", "TP|10.0", b"value")
+        other_store.flush()
+
+        store = SharedCacheStore(store_path)
+
+        assert store.get("flash", "TP|10.0") == b"value"
+        assert store.get("flash", "TP|20.0") is None
+        assert store.get("other", "TP|10.0") is None
+
+    def test_entries_written_by_other_process(self, store_path):
+        store = SharedCacheStore(store_path)
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            executor.submit(store.put, "flash", "TP|10.0", b"value").result()
+
+        assert store.get("flash", "TP|10.0") == b"value"
+
+    def test_unpickled_store_uses_same_file(self, store_path):
+        store = SharedCacheStore(store_path)
+        store.put("flash", "key", b"value")
+        store.flush()
+
+        unpickled_store = pickle.loads(pickle.dumps(store))  # noqa: S301
+
+        assert unpickled_store.path == store_path
+        assert unpickled_store.get("flash", "key") == b"value"
+
+    def test_entries_removed_when_used_by_other_version(self, store_path, monkeypatch):
+        other_store = SharedCacheStore(store_path)
+        other_store.put("flash", "key", b"value")
+        other_store.close()
+
+        monkeypatch.setattr(shared_cache_store, "_get_version", lambda: "0.0.0")
+        store = SharedCacheStore(store_path)
+
+        assert store.get("flash", "key") is None
+        assert len(store) == 0
+
+    def test_entries_are_written_in_batches(self, store_path):
+        store = SharedCacheStore(store_path, batch_size=3)
+        other_store = SharedCacheStore(store_path)
+
+        store.put("flash", "key 1", b"value 1")
+        store.put("flash", "key 2", b"value 2")
+        assert store.get("flash", "key 1") == b"value 1"
+        assert other_store.get("flash", "key 1") is None
+
+        store.put("flash", "key 3", b"value 3")
+        assert [other_store.get("flash", f"key {i}") for i in range(1, 4)] == [b"value 1", b"value 2", b"value 3"]
+
+    def test_pending_entries_are_written_on_close(self, store_path):
+        store = SharedCacheStore(store_path)
+        store.put("flash", "key", b"value")
+        store.close()
+
+        assert SharedCacheStore(store_path).get("flash", "key") == b"value"
+
+    def test_failing_store_is_a_cache_miss(self, store_path):
+        store = SharedCacheStore(store_path)
+        store.put("flash", "key", b"value")
+        store.flush()
+        store._get_connection().execute("DROP TABLE entries")
+
+        store.put("flash", "key", b"value")
+        store.flush()
+        assert store.get("flash", "key") is None
+
+    def test_not_a_database_is_a_cache_miss(self, store_path):
+        store_path.write_text("not a database")
+        store = SharedCacheStore(store_path)
+
+        store.put("flash", "key", b"value")
+        store.flush()
+        assert store.get("flash", "key") is None
+        with pytest.raises(sqlite3.DatabaseError):
+            len(store)
+
+
+class TestSharedLRUCache:
+    def test_gets_entries_put_by_other_cache(self, store_path):
+        other_cache = _create_shared_cache(store_path)
+        other_cache.put("key", "value")
+        other_cache.shared_store.flush()
+        cache = _create_shared_cache(store_path)
+
+        assert cache.get("key") == "value"
+        assert cache.get("key") == "value"
+        assert cache.get("other key") is None
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["shared_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+    def test_clear_keeps_shared_entries(self, store_path):
+        cache = _create_shared_cache(store_path)
+        cache.put("key", "value")
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get_stats()["shared_hits"] == 0
+        assert cache.get("key") == "value"
+
+    def test_invalid_shared_entry_is_a_miss(self, store_path):
+        store = SharedCacheStore(store_path)
+        store.put("flash", "key", b"\xff")
+        store.flush()
+        cache = _create_shared_cache(store_path)
+
+        assert cache.get("key") is None
+        assert cache.get_stats()["misses"] == 1
+
+    def test_shared_store_needs_codec(self, store_path):
+        with pytest.raises(ValueError, match="codec"):
+            CacheService.create_cache("needs_codec", shared_store=SharedCacheStore(store_path))
+
+
+class TestFlashCacheCodec:
+    def test_equal_keys_give_equal_encoded_keys(self):
+        codec = FlashCacheCodec()
+        key = ("TP", (("CO2", 0.1), ("methane", 0.9)), EoSModel.SRK, 50.0, 300.0)
+        equal_key = ("TP", (("CO2", 0.1), ("methane", 0.9)), EoSModel("SRK"), 50, 300.0)
+
+        assert codec.encode_key(key) == codec.encode_key(equal_key) == "TP|SRK|CO2=0.1,methane=0.9|50.0|300.0"
+        assert codec.encode_key(key) != codec.encode_key(("PH", *key[1:]))
+        assert codec.encode_key(key) != codec.encode_key((*key[:3], 50.000001, 300.0))
+
+    def test_value_round_trip(self):
+        codec = FlashCacheCodec()
+        value = FluidProperties(
+            temperature_kelvin=300.0,
+            pressure_bara=50.0,
+            density=40.123456789,
+            enthalpy_joule_per_kg=-1234.5,
+            z=0.9,
+            kappa=1.3,
+            vapor_fraction_molar=1.0,
+            molar_mass=0.018,
+            standard_density=0.8,
+        )
+
+        assert codec.decode_value(codec.encode_value(value)) == value
+
+    def test_invalid_value(self):
+        with pytest.raises(ValueError):
+            FlashCacheCodec().decode_value(b"not flash properties")
+
+
+class TestFluidServiceSharedFlashCache:
+    def setup_method(self):
+        NeqSimFluidService.reset_instance()
+        CacheService._caches.clear()
+
+    def teardown_method(self):
+        NeqSimFluidService.reset_instance()
+        CacheService._caches.clear()
+
+    def test_flash_results_shared_between_services(self, store_path, fluid_model_medium):
+        NeqSimFluidService.configure(CacheConfig(shared_flash_cache_path=store_path))
+        expected = NeqSimFluidService.instance().flash_pt(fluid_model_medium, 50.0, 300.0)
+        NeqSimFluidService.instance()._flash_cache.shared_store.flush()
+
+        # Fresh service and caches, as in another process using the same file
+        NeqSimFluidService.reset_instance()
+        CacheService._caches.clear()
+        NeqSimFluidService.configure(CacheConfig(shared_flash_cache_path=store_path))
+        service = NeqSimFluidService.instance()
+
+        assert isinstance(service._flash_cache, SharedLRUCache)
+        assert service.flash_pt(fluid_model_medium, 50.0, 300.0) == expected
+        assert CacheService.get_cache(CacheName.FLUID_SERVICE_FLASH).get_stats()["shared_hits"] == 1
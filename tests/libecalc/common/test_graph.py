@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 import pytest
 
+from libecalc.common.errors.exceptions import ProgrammingError
 from libecalc.common.graph import Graph, NodeID
 
 
@@ -100,3 +101,46 @@ class TestGraph:
         # reveal_type(node)
         assert isinstance(node, Node)
         assert node.some_data == "test"
+
+
+class TestFrozenGraph:
+    @pytest.fixture
+    def graph(self):
+        """
+        1 -> 2 -> 4
+          -> 3 -> 4
+               -> 5
+        """
+        graph = Graph()
+        for node_id in ["1", "2", "3", "4", "5"]:
+            graph.add_node(Node(node_id=node_id))
+        for from_id, to_id in [("1", "2"), ("1", "3"), ("2", "4"), ("3", "4"), ("3", "5")]:
+            graph.add_edge(from_id, to_id)
+        return graph
+
+    def test_same_topology_as_unfrozen(self, graph):
+        node_ids = list(graph.nodes)
+        successors = {node_id: graph.get_successors(node_id) for node_id in node_ids}
+        recursive_successors = {node_id: graph.get_successors(node_id, recursively=True) for node_id in node_ids}
+        sorted_node_ids = graph.sorted_node_ids
+        root = graph.root
+
+        graph.freeze()
+
+        assert graph.is_frozen
+        assert {node_id: graph.get_successors(node_id) for node_id in node_ids} == successors
+        assert {
+            node_id: graph.get_successors(node_id, recursively=True) for node_id in node_ids
+        } == recursive_successors
+        assert recursive_successors["1"] == ["2", "4", "3", "5"]
+        assert graph.sorted_node_ids == sorted_node_ids
+        assert graph.root == root == "1"
+        assert graph.get_predecessor("5") == "3"
+
+    def test_can_not_change_frozen_graph(self, graph):
+        graph.freeze()
+        with pytest.raises(ProgrammingError):
+            graph.add_node(Node(node_id="6"))
+        with pytest.raises(ProgrammingError):
+            graph.add_edge("1", "5")
+        assert graph.get_successors("1") == ["2", "3"]
@@ -0,0 +1,48 @@
+import threading
+
+import pytest
+
+from libecalc.common.parallel_evaluation import (
+    ParallelEvaluationConfig,
+    ParallelEvaluationMode,
+    ParallelEvaluator,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_parallel_evaluator():
+    yield
+    ParallelEvaluator.reset()
+
+
+def _square(x: int) -> int:
+    return x * x
+
+
+class TestParallelEvaluator:
+    @pytest.mark.parametrize("mode", list(ParallelEvaluationMode))
+    def test_map_preserves_order(self, mode):
+        config = ParallelEvaluationConfig(mode=mode, max_workers=2)
+
+        assert ParallelEvaluator.map(_square, range(10), config=config) == [x * x for x in range(10)]
+
+    def test_map_uses_configured_default(self):
+        ParallelEvaluator.configure(ParallelEvaluationConfig(mode=ParallelEvaluationMode.THREADS, max_workers=2))
+
+        thread_names = ParallelEvaluator.map(lambda _: threading.current_thread().name, range(4))
+
+        assert all(name.startswith("ecalc-evaluation") for name in thread_names)
+
+    def test_map_reraises_exception(self):
+        def fail_on_three(x: int) -> int:
+            if x == 3:
+                raise ValueError("three")
+            return x
+
+        config = ParallelEvaluationConfig(mode=ParallelEvaluationMode.THREADS, max_workers=2)
+        with pytest.raises(ValueError, match="three"):
+            ParallelEvaluator.map(fail_on_three, range(6), config=config)
+
+    def test_invalid_max_workers(self):
+        with pytest.raises(ValueError):
+            ParallelEvaluationConfig(mode=ParallelEvaluationMode.THREADS, max_workers=0)
@@ -0,0 +1,57 @@
+import pytest
+
+from libecalc.common.profiling import CacheCounts, ProfileCounter, Profiler
+
+
+@pytest.fixture(autouse=True)
+def reset_profiler():
+    yield
+    Profiler.reset()
+
+
+class TestProfiler:
+    def test_disabled_by_default(self):
+        with Profiler.measure(name="consumer", type="CONSUMER") as record:
+            Profiler.count(ProfileCounter.ROOT_FINDER_ITERATIONS, 10)
+            record.number_of_time_steps = 3
+
+        assert Profiler.get_records() == []
+
+    def test_measure_records_counters_incremented_in_block(self):
+        Profiler.enable()
+        Profiler.count(ProfileCounter.NEQSIM_FLASH_CALLS, 5)
+
+        with Profiler.measure(name="train", type="COMPRESSOR_TRAIN", component="compressor") as record:
+            Profiler.count(ProfileCounter.NEQSIM_FLASH_CALLS, 2)
+            Profiler.count(ProfileCounter.ROOT_FINDER_ITERATIONS)
+            record.number_of_time_steps = 3
+
+        assert Profiler.get_records() == [record]
+        assert record.wall_time_seconds > 0
+        assert record.counters == {
+            ProfileCounter.NEQSIM_FLASH_CALLS: 2,
+            ProfileCounter.ROOT_FINDER_ITERATIONS: 1,
+        }
+        assert Profiler.get_report()["records"][0] == {
+            "name": "train",
+            "type": "COMPRESSOR_TRAIN",
+            "component": "compressor",
+            "wall_time_seconds": record.wall_time_seconds,
+            "number_of_time_steps": 3,
+            "root_finder_iterations": 1,
+            "neqsim_flash_calls": 2,
+            "caches": {},
+        }
+
+    def test_measure_records_cache_counts_in_block(self, monkeypatch):
+        monkeypatch.setattr(Profiler, "_cache_counts_providers", [])
+        cache_counts = {"flash": CacheCounts(hits=10, misses=5)}
+        Profiler.register_cache_counts_provider(lambda: dict(cache_counts))
+        Profiler.enable()
+
+        with Profiler.measure(name="train", type="COMPRESSOR_TRAIN") as record:
+            cache_counts["flash"] = CacheCounts(hits=13, misses=6)
+
+        assert record.caches == {"flash": CacheCounts(hits=3, misses=1)}
+        assert record.caches["flash"].hit_rate == 0.75
+        assert CacheCounts().hit_rate is None
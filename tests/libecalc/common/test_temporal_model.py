@@ -1,7 +1,9 @@
 from datetime import datetime
 
+import pytest
+
 from libecalc.common.temporal_model import TemporalModel
-from libecalc.common.time_utils import Period
+from libecalc.common.time_utils import Period, Periods
 from libecalc.expression import Expression
 
 
@@ -75,3 +77,94 @@ class TestTemporalExpression:
                 }
             )
         ).tolist() == [0, 1, 1, 5, 5]
+
+
+class TestTemporalModelLookup:
+    @pytest.fixture
+    def temporal_model(self) -> TemporalModel[str]:
+        return TemporalModel(
+            {
+                Period(datetime(2020, 1, 1), datetime(2021, 1, 1)): "first",
+                Period(datetime(2021, 1, 1), datetime(2022, 1, 1)): "second",
+                # Gap in 2022
+                Period(datetime(2023, 1, 1), datetime(2024, 1, 1)): "third",
+            }
+        )
+
+    def test_get_model_for_date(self, temporal_model):
+        assert temporal_model.get_model(datetime(2020, 1, 1)) == "first"
+        assert temporal_model.get_model(datetime(2020, 12, 31)) == "first"
+        assert temporal_model.get_model(datetime(2021, 1, 1)) == "second"
+        assert temporal_model.get_model(datetime(2023, 6, 1)) == "third"
+
+    def test_get_model_for_period(self, temporal_model):
+        assert temporal_model.get_model(Period(datetime(2020, 1, 1), datetime(2021, 1, 1))) == "first"
+        assert temporal_model.get_model(Period(datetime(2021, 6, 1), datetime(2021, 7, 1))) == "second"
+
+    @pytest.mark.parametrize(
+        "period",
+        [
+            datetime(2019, 1, 1),
+            datetime(2022, 6, 1),
+            datetime(2024, 1, 1),
+            Period(datetime(2020, 6, 1), datetime(2021, 6, 1)),  # Spans two models
+            Period(datetime(2021, 6, 1), datetime(2023, 6, 1)),  # Spans gap
+        ],
+    )
+    def test_get_model_not_found(self, temporal_model, period):
+        with pytest.raises(ValueError):
+            temporal_model.get_model(period)
+
+    def test_get_model_indices(self, temporal_model):
+        periods = Periods.create_periods(
+            [
+                datetime(2019, 1, 1),
+                datetime(2020, 1, 1),
+                datetime(2020, 7, 1),
+                datetime(2021, 1, 1),
+                datetime(2022, 1, 1),
+                datetime(2023, 1, 1),
+                datetime(2024, 1, 1),
+            ],
+            include_before=False,
+            include_after=True,
+        )
+        assert temporal_model.get_model_indices(periods) == [None, 0, 0, 1, None, 2, None]
+        assert temporal_model.get_models_for_periods(periods) == [
+            None,
+            "first",
+            "first",
+            "second",
+            None,
+            "third",
+            None,
+        ]
+        no_model = object()
+        assert temporal_model.get_models_for_periods(periods, default=no_model) == [
+            no_model,
+            "first",
+            "first",
+            "second",
+            no_model,
+            "third",
+            no_model,
+        ]
+
+    def test_get_model_indices_unsorted_periods(self, temporal_model):
+        periods = Periods(
+            [
+                Period(datetime(2023, 1, 1), datetime(2023, 2, 1)),
+                Period(datetime(2020, 1, 1), datetime(2020, 2, 1)),
+            ]
+        )
+        assert temporal_model.get_model_indices(periods) == [2, 0]
+
+    def test_get_model_overlapping_periods_returns_first_match(self):
+        temporal_model = TemporalModel(
+            {
+                Period(datetime(2020, 1, 1), datetime(2025, 1, 1)): "first",
+                Period(datetime(2021, 1, 1), datetime(2022, 1, 1)): "second",
+            }
+        )
+        assert temporal_model.get_model(datetime(2023, 1, 1)) == "first"
+        assert temporal_model.get_model(datetime(2021, 6, 1)) == "first"
@@ -1,6 +1,8 @@
+import math
 from datetime import datetime
 
 import numpy as np
+import pandas as pd
 import pytest
 from pydantic import ValidationError
 
@@ -14,6 +16,7 @@ from libecalc.common.utils.rates import (
     TimeSeriesRate,
     TimeSeriesVolumes,
     TimeSeriesVolumesCumulative,
+    get_resampling,
 )
 
 
@@ -342,6 +345,49 @@ class TestTimeSeriesRate:
         assert sum_of_rates.values == expected_values
         assert sum_of_rates.regularity == expected_regularity
 
+    @pytest.mark.parametrize("rate_type", [RateType.STREAM_DAY, RateType.CALENDAR_DAY])
+    def test_sum_same_as_adding_one_by_one(self, rate_type):
+        periods = Periods.create_periods(
+            times=[datetime(2023, 1, 1), datetime(2023, 1, 4), datetime(2023, 1, 7)],
+            include_before=False,
+            include_after=False,
+        )
+        rates = [
+            TimeSeriesRate(
+                periods=periods,
+                values=values,
+                regularity=regularity,
+                unit=Unit.STANDARD_CUBIC_METER_PER_DAY,
+                rate_type=rate_type,
+            )
+            for values, regularity in [
+                ([10.0, 0.1], [1.0, 0.9]),
+                ([3.3, float("nan")], [1.0, 0.9]),
+                ([7.0, 2.2], [0.5, 0.0]),
+                ([1.1, 4.0], [0.5, 0.3]),
+            ]
+        ]
+
+        sum_of_rates = TimeSeriesRate.sum(rates)
+
+        assert sum_of_rates == rates[0] + rates[1] + rates[2] + rates[3]
+        assert sum_of_rates.values == pytest.approx([21.4, 6.3])
+        assert TimeSeriesRate.sum(rates[:2]).regularity == [1.0, 0.9]
+        assert TimeSeriesRate.sum(rates[:1]) is rates[0]
+
+    def test_sum_mismatching_units(self):
+        periods = Periods.create_periods(
+            times=[datetime(2023, 1, 1), datetime(2023, 1, 4)],
+            include_before=False,
+            include_after=False,
+        )
+        rates = [
+            TimeSeriesRate(periods=periods, values=[1.0], regularity=[1.0], unit=unit, rate_type=RateType.STREAM_DAY)
+            for unit in [Unit.STANDARD_CUBIC_METER_PER_DAY, Unit.MEGA_WATT]
+        ]
+        with pytest.raises(ValueError, match="Mismatching units"):
+            TimeSeriesRate.sum(rates)
+
     def test_mismatch_timesteps_values(self):
         with pytest.raises(ValidationError) as exc_info:
             TimeSeriesRate(
@@ -637,6 +683,109 @@ class TestTimeSeriesFloat:
         assert rates_monthly.values[::12] == [10, 20]
 
 
+class TestResampling:
+    periods = Periods.create_periods(
+        times=[datetime(2023, 1, 1), datetime(2023, 3, 15), datetime(2023, 7, 1), datetime(2024, 2, 1)],
+        include_before=False,
+        include_after=False,
+    )
+
+    def test_resampling_is_cached_per_periods_and_frequency(self):
+        same_periods = Periods(list(self.periods.periods))
+        assert get_resampling(self.periods, Frequency.YEAR) is get_resampling(same_periods, Frequency.YEAR)
+        assert get_resampling(self.periods, Frequency.YEAR) is not get_resampling(self.periods, Frequency.MONTH)
+
+    def test_forward_fill_same_as_pandas(self):
+        values = np.array([[1.0, np.nan, 3.0], [4.0, 5.0, 6.0]])
+        resampling = get_resampling(self.periods, Frequency.MONTH)
+
+        for row in values:
+            expected = pd.Series(index=self.periods.start_dates, data=row).reindex(resampling.periods.start_dates)
+            assert resampling.forward_fill(row).tolist() == expected.ffill().tolist()
+
+        # Stacked time series are resampled row by row
+        assert resampling.forward_fill(values).tolist() == [resampling.forward_fill(row).tolist() for row in values]
+
+    def test_interpolate_same_as_pandas(self):
+        values = np.array([[0.0, 1.0, 3.5, 7.25], [0.0, 1e6, 1e6, 2e6]])
+        resampling = get_resampling(self.periods, Frequency.MONTH)
+        new_dates = resampling.periods.all_dates
+
+        for row in values:
+            ds = pd.Series(index=self.periods.all_dates, data=row)
+            expected = ds.reindex(ds.index.union(new_dates)).interpolate("time").reindex(new_dates)
+            assert resampling.interpolate(row).tolist() == expected.tolist()
+
+        assert resampling.interpolate(values).tolist() == [resampling.interpolate(row).tolist() for row in values]
+
+    def test_all(self):
+        resampling = get_resampling(self.periods, Frequency.YEAR)
+        assert resampling.periods.start_dates == [datetime(2023, 1, 1), datetime(2024, 1, 1)]
+        assert resampling.all(np.array([True, False, True])).tolist() == [False, True]
+        assert resampling.all(np.array([True, True, False])).tolist() == [False, False]
+        assert resampling.all(np.array([True, True, True])).tolist() == [True, True]
+
+        values = np.array([[True, False, True], [True, True, False]])
+        assert resampling.all(values).tolist() == [resampling.all(row).tolist() for row in values]
+
+    def test_periods_are_not_shared(self):
+        resampling = get_resampling(self.periods, Frequency.YEAR)
+        periods = resampling.periods
+        periods.periods.pop()
+
+        assert periods is not resampling.periods
+        assert len(get_resampling(self.periods, Frequency.YEAR).periods) == 2
+
+    @pytest.mark.parametrize(
+        "time_series",
+        [
+            [
+                TimeSeriesFloat(periods=periods, values=[1.0, math.nan, 3.0], unit=Unit.NONE),
+                TimeSeriesFloat(periods=periods, values=[4.0, 5.0, 6.0], unit=Unit.NONE),
+            ],
+            [
+                TimeSeriesBoolean(periods=periods, values=[True, False, True], unit=Unit.NONE),
+                TimeSeriesBoolean(periods=periods, values=[True, True, True], unit=Unit.NONE),
+            ],
+            [
+                TimeSeriesVolumesCumulative(periods=periods, values=[1.0, 3.0, 6.0], unit=Unit.STANDARD_CUBIC_METER),
+                TimeSeriesVolumesCumulative(periods=periods, values=[1.0, math.nan, 6.0], unit=Unit.KILO),
+            ],
+            [
+                TimeSeriesVolumes(periods=periods, values=[1.0, 2.0, 3.0], unit=Unit.STANDARD_CUBIC_METER),
+                TimeSeriesVolumes(periods=periods, values=[4.0, 5.0, 6.0], unit=Unit.STANDARD_CUBIC_METER),
+            ],
+            [
+                TimeSeriesRate(
+                    periods=periods,
+                    values=[1.0, 2.0, 3.0],
+                    regularity=[1.0, 0.5, 0.9],
+                    unit=Unit.STANDARD_CUBIC_METER_PER_DAY,
+                    rate_type=RateType.STREAM_DAY,
+                ),
+                TimeSeriesRate(
+                    periods=periods,
+                    values=[4.0, 0.0, 6.0],
+                    regularity=[0.8, 1.0, 0.0],
+                    unit=Unit.STANDARD_CUBIC_METER_PER_DAY,
+                    rate_type=RateType.CALENDAR_DAY,
+                ),
+            ],
+        ],
+    )
+    @pytest.mark.parametrize("include_start_date", [True, False])
+    def test_resample_stacked_same_as_one_by_one(self, time_series, include_start_date):
+        resampled = type(time_series[0]).resample_stacked(
+            time_series, Frequency.YEAR, include_start_date=include_start_date
+        )
+
+        assert [item.model_dump_json() for item in resampled] == [
+            item.resample(Frequency.YEAR, include_start_date=include_start_date).model_dump_json()
+            for item in time_series
+        ]
+        assert resampled[0].periods is not resampled[1].periods
+
+
 class TestTimeSeriesMerge:
     def test_merge_time_series_float_overlapping_periods(self):
         """
@@ -2,6 +2,7 @@ from datetime import datetime
 
 import pytest
 
+from libecalc.common.parallel_evaluation import ParallelEvaluationConfig, ParallelEvaluationMode
 from libecalc.domain.infrastructure.energy_components.legacy_consumer.system import ConsumerSystemConsumerFunction
 from libecalc.domain.infrastructure.energy_components.legacy_consumer.system.operational_setting import (
     ConsumerSystemOperationalSettingExpressions,
@@ -189,3 +190,36 @@ class TestConsumerSystemConsumerFunction:
         assert result is not None
         assert len(result.consumer_results) == 2
         assert result.cross_over_used[0] in [True, False]  # Cross-over calculated successfully
+
+    @pytest.mark.parametrize("mode", [ParallelEvaluationMode.THREADS, ParallelEvaluationMode.PROCESSES])
+    def test_parallel_evaluation_gives_same_result_as_serial(
+        self,
+        system_component_factory,
+        operational_settings_factory,
+        system_factory,
+        mode,
+    ):
+        operational_settings = [
+            operational_settings_factory(
+                rates=rates,
+                suction_pressures=[1, 1],
+                discharge_pressures=[100, 100],
+                cross_overs=[0, 0],
+                fluid_densities=[1000, 1000],
+            )
+            for rates in [[[101, 50], [99, 50]], [[99, 101], [101, 99]], [[50, 50], [50, 50]]]
+        ]
+        system_components = [system_component_factory(name=str(i), max_rate=[100, 100]) for i in range(2)]
+
+        serial_result = system_factory(
+            system_components=system_components, operational_settings=operational_settings
+        ).evaluate()
+        parallel_result = ConsumerSystemConsumerFunction(
+            consumer_components=system_components,
+            operational_settings_expressions=operational_settings,
+            power_loss_factor=None,
+            parallel_evaluation=ParallelEvaluationConfig(mode=mode, max_workers=2),
+        ).evaluate()
+
+        assert parallel_result.operational_setting_used.tolist() == serial_result.operational_setting_used.tolist()
+        assert parallel_result.is_valid.tolist() == serial_result.is_valid.tolist()
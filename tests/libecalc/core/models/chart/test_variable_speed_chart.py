@@ -452,3 +452,23 @@ def test_setup_minimum_and_maximum_rate_as_functions_of_speed(
         variable_speed_chart.maximum_rate_as_function_of_speed([0, 1, 1.1, 1.5, 1.9, 2, 3]),
         [5.5, 5.5, 5.65, 6.25, 6.85, 7.0, 7.0],
     )
+
+
+def test_efficiency_as_function_of_rate_and_head_is_pointwise(variable_speed_chart_multiple_speeds):
+    rng = np.random.default_rng(seed=1)
+    rates = rng.uniform(2000, 8000, 100)
+    heads = rng.uniform(50000, 200000, 100)
+
+    efficiencies = variable_speed_chart_multiple_speeds.efficiency_as_function_of_rate_and_head(
+        rates=rates, heads=heads
+    )
+
+    np.testing.assert_array_equal(
+        efficiencies,
+        [
+            variable_speed_chart_multiple_speeds.efficiency_as_function_of_rate_and_head(
+                rates=np.asarray([rate]), heads=np.asarray([head])
+            )[0]
+            for rate, head in zip(rates, heads)
+        ],
+    )
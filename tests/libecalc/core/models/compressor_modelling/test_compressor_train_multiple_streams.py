@@ -269,9 +269,9 @@ def test_variable_speed_vs_variable_speed_multiple_streams_and_pressures(
         energy_result_variable_speed_compressor_train_one_compressor.energy_usage.values
         == energy_result_variable_speed_compressor_train_one_compressor_one_stream.energy_usage.values
     )
-    assert (
-        result_variable_speed_compressor_train_one_compressor.stage_results[0].speed
-        == result_variable_speed_compressor_train_one_compressor_one_stream.stage_results[0].speed
+    np.testing.assert_array_equal(
+        result_variable_speed_compressor_train_one_compressor.stage_results[0].speed,
+        result_variable_speed_compressor_train_one_compressor_one_stream.stage_results[0].speed,
     )
     energy_result_variable_speed_compressor_train_two_compressors = (
         result_variable_speed_compressor_train_two_compressors.get_energy_result()
@@ -283,9 +283,9 @@ def test_variable_speed_vs_variable_speed_multiple_streams_and_pressures(
         energy_result_variable_speed_compressor_train_two_compressors.energy_usage.values[1]
         == energy_result_variable_speed_compressor_train_two_compressors_one_stream.energy_usage.values[1]
     )
-    assert (
-        result_variable_speed_compressor_train_two_compressors.stage_results[1].speed
-        == result_variable_speed_compressor_train_two_compressors_one_stream.stage_results[1].speed
+    np.testing.assert_array_equal(
+        result_variable_speed_compressor_train_two_compressors.stage_results[1].speed,
+        result_variable_speed_compressor_train_two_compressors_one_stream.stage_results[1].speed,
     )
 
 
@@ -508,7 +508,7 @@ def test_evaluate_variable_speed_compressor_train_multiple_streams_and_pressures
     assert result_first_stage.speed == pytest.approx([10825.77, 11100.32, 11313.25], abs=0.01)
     assert result_first_stage.outlet_stream_condition.pressure == pytest.approx([30.0, 30.0, 30.0], abs=0.01)
     assert result_last_stage.asv_recirculation_loss_mw == pytest.approx([4.22, 4.39, 4.46], abs=0.01)
-    assert result_first_stage.speed == result_last_stage.speed
+    np.testing.assert_array_equal(result_first_stage.speed, result_last_stage.speed)
 
 
 @pytest.mark.parametrize("energy_usage_adjustment_constant", [1, 2, 3, 5, 10])
@@ -0,0 +1,199 @@
+import numpy as np
+import pytest
+
+from libecalc.common.errors.ecalc_validation_error import EcalcValidationException
+from libecalc.domain.process.compressor.core.train.compressor_train_common_shaft import CompressorTrainCommonShaft
+from libecalc.domain.process.compressor.core.train.surrogate import (
+    CompressorTrainSurrogate,
+    CompressorTrainSurrogateModel,
+)
+from libecalc.process.fluid_stream.fluid_model import EoSModel, FluidComposition, FluidModel
+
+
+@pytest.fixture
+def methane() -> FluidModel:
+    return FluidModel(composition=FluidComposition(methane=1), eos_model=EoSModel.SRK)
+
+
+@pytest.fixture
+def ethane() -> FluidModel:
+    return FluidModel(composition=FluidComposition(ethane=1), eos_model=EoSModel.SRK)
+
+
+@pytest.fixture
+def surrogate(variable_speed_compressor_train_unisim_methane, methane) -> CompressorTrainSurrogate:
+    return CompressorTrainSurrogate.fit(
+        compressor_train=variable_speed_compressor_train_unisim_methane,
+        fluid_model=methane,
+        rate_values=[4_000_000, 5_000_000, 6_000_000],
+        suction_pressure_values=[40, 45],
+        discharge_pressure_values=[80, 90, 100],
+    )
+
+
+def _evaluate_train_power(compressor_train, fluid_model, rate, suction_pressure, discharge_pressure) -> np.ndarray:
+    compressor_train.set_evaluation_input(
+        rate=np.asarray(rate, dtype=float),
+        fluid_model=fluid_model,
+        suction_pressure=np.asarray(suction_pressure, dtype=float),
+        discharge_pressure=np.asarray(discharge_pressure, dtype=float),
+    )
+    return np.asarray(compressor_train.evaluate().get_energy_result().power.values)
+
+
+class TestCompressorTrainSurrogate:
+    def test_power_within_measured_error_bound(
+        self, surrogate, variable_speed_compressor_train_unisim_methane, methane
+    ):
+        rate = [4_500_000, 5_200_000, 5_800_000]
+        suction_pressure = [42, 41, 44]
+        discharge_pressure = [95, 85, 98]
+
+        assert np.all(surrogate.usable_cells)
+        assert 0 < surrogate.max_relative_error < 0.05
+        expected = _evaluate_train_power(
+            variable_speed_compressor_train_unisim_methane, methane, rate, suction_pressure, discharge_pressure
+        )
+        np.testing.assert_allclose(
+            surrogate.evaluate(rate, suction_pressure, discharge_pressure),
+            expected,
+            rtol=surrogate.max_relative_error,
+        )
+
+    def test_points_outside_grid_not_covered(self, surrogate):
+        rate = [3_000_000, 5_000_000, 5_000_000, 5_000_000]
+        suction_pressure = [42, 50, 42, 40]
+        discharge_pressure = [90, 90, 120, 100]
+
+        np.testing.assert_array_equal(
+            surrogate.is_covered(rate, suction_pressure, discharge_pressure), [False, False, False, True]
+        )
+        assert np.isnan(surrogate.evaluate(rate, suction_pressure, discharge_pressure)[:3]).all()
+
+    def test_cells_above_tolerance_not_used(self, variable_speed_compressor_train_unisim_methane, methane):
+        surrogate = CompressorTrainSurrogate.fit(
+            compressor_train=variable_speed_compressor_train_unisim_methane,
+            fluid_model=methane,
+            rate_values=[4_000_000, 6_000_000],
+            suction_pressure_values=[40, 45],
+            discharge_pressure_values=[80, 100],
+            relative_error_tolerance=0.0,
+        )
+
+        assert not np.any(surrogate.usable_cells)
+        assert surrogate.max_relative_error == 0.0
+        assert not surrogate.is_covered(5_000_000, 42, 90)
+
+    def test_save_and_load(self, surrogate, tmp_path):
+        path = tmp_path / "surrogate.npz"
+        surrogate.save(path)
+
+        loaded = CompressorTrainSurrogate.load(path)
+
+        np.testing.assert_array_equal(loaded.power_megawatt, surrogate.power_megawatt)
+        np.testing.assert_array_equal(loaded.usable_cells, surrogate.usable_cells)
+        assert loaded.max_relative_error == surrogate.max_relative_error
+        assert loaded.evaluate(5_200_000, 41, 85) == surrogate.evaluate(5_200_000, 41, 85)
+        assert loaded.fingerprint == surrogate.fingerprint
+
+    def test_load_without_fingerprint(self, surrogate, tmp_path):
+        path = tmp_path / "surrogate.npz"
+        np.savez(
+            path,
+            rate_values=surrogate.rate_values,
+            suction_pressure_values=surrogate.suction_pressure_values,
+            discharge_pressure_values=surrogate.discharge_pressure_values,
+            power_megawatt=surrogate.power_megawatt,
+            usable_cells=surrogate.usable_cells,
+            max_absolute_error_megawatt=surrogate.max_absolute_error_megawatt,
+            max_relative_error=surrogate.max_relative_error,
+            version="9.0.0",
+        )
+
+        with pytest.raises(ValueError, match="fingerprint"):
+            CompressorTrainSurrogate.load(path)
+
+    def test_is_fitted_for(
+        self,
+        surrogate,
+        variable_speed_compressor_train_unisim_methane,
+        single_speed_compressor_train_unisim_methane,
+        methane,
+        ethane,
+    ):
+        assert surrogate.is_fitted_for(variable_speed_compressor_train_unisim_methane, methane)
+        assert not surrogate.is_fitted_for(variable_speed_compressor_train_unisim_methane, ethane)
+        assert not surrogate.is_fitted_for(single_speed_compressor_train_unisim_methane, methane)
+
+    def test_invalid_grid(self):
+        with pytest.raises(ValueError, match="increasing"):
+            CompressorTrainSurrogate(
+                rate_values=[2, 1],
+                suction_pressure_values=[1, 2],
+                discharge_pressure_values=[1, 2],
+                power_megawatt=np.zeros((2, 2, 2)),
+                usable_cells=np.ones((1, 1, 1)),
+                max_absolute_error_megawatt=0.0,
+                max_relative_error=0.0,
+                fingerprint="",
+            )
+
+
+class TestCompressorTrainSurrogateModel:
+    def test_evaluates_train_only_for_points_not_covered(
+        self, surrogate, variable_speed_compressor_train_unisim_methane, methane, monkeypatch
+    ):
+        rate = np.asarray([[4_500_000, 0, 3_000_000, 5_800_000]])
+        suction_pressure = np.asarray([42, 42, 42, 44])
+        discharge_pressure = np.asarray([95, 95, 95, 98])
+        expected = _evaluate_train_power(
+            variable_speed_compressor_train_unisim_methane, methane, rate, suction_pressure, discharge_pressure
+        )
+
+        number_of_train_evaluations = 0
+        evaluate_given_constraints = CompressorTrainCommonShaft.evaluate_given_constraints
+
+        def counting_evaluate_given_constraints(self, constraints):
+            nonlocal number_of_train_evaluations
+            number_of_train_evaluations += 1
+            return evaluate_given_constraints(self, constraints)
+
+        monkeypatch.setattr(
+            CompressorTrainCommonShaft, "evaluate_given_constraints", counting_evaluate_given_constraints
+        )
+        model = CompressorTrainSurrogateModel(
+            compressor_train=variable_speed_compressor_train_unisim_methane, surrogate=surrogate
+        )
+        model.set_evaluation_input(
+            rate=rate, fluid_model=methane, suction_pressure=suction_pressure, discharge_pressure=discharge_pressure
+        )
+        result = model.evaluate()
+
+        # Zero rate and rate outside the grid
+        assert number_of_train_evaluations == 2
+        power = np.asarray(result.get_energy_result().power.values)
+        np.testing.assert_allclose(power, expected, rtol=surrogate.max_relative_error)
+        np.testing.assert_array_equal(power[[1, 2]], expected[[1, 2]])
+        assert result.get_energy_result().is_valid == [True, True, True, True]
+        np.testing.assert_array_equal(model.get_requested_inlet_pressure(), suction_pressure)
+
+    def test_other_fluid_not_supported(self, surrogate, variable_speed_compressor_train_unisim_methane, ethane):
+        model = CompressorTrainSurrogateModel(
+            compressor_train=variable_speed_compressor_train_unisim_methane, surrogate=surrogate
+        )
+
+        with pytest.raises(EcalcValidationException, match="not fitted"):
+            model.set_evaluation_input(
+                rate=np.asarray([5_000_000.0]),
+                fluid_model=ethane,
+                suction_pressure=np.asarray([42.0]),
+                discharge_pressure=np.asarray([90.0]),
+            )
+
+    def test_train_with_interstage_pressure_not_supported(
+        self, surrogate, variable_speed_compressor_train_two_compressors_one_stream
+    ):
+        with pytest.raises(EcalcValidationException):
+            CompressorTrainSurrogateModel(
+                compressor_train=variable_speed_compressor_train_two_compressors_one_stream, surrogate=surrogate
+            )
@@ -1,7 +1,9 @@
 import numpy as np
 import pytest
 
+from libecalc.common.numeric_methods import find_root
 from libecalc.domain.process.compressor.core.base import CompressorWithTurbineModel
+from libecalc.domain.process.compressor.core.train.utils.common import POWER_CALCULATION_TOLERANCE
 from libecalc.process.fluid_stream.fluid_model import EoSModel, FluidComposition, FluidModel
 
 
@@ -73,3 +75,58 @@ def test_turbine_max_rate(turbine_factory, single_speed_compressor_train_unisim_
             suction_pressures=suction_pressure, discharge_pressures=discharge_pressure, fluid_model=fluid_model
         ).tolist()
     )
+
+
+def test_turbine_max_rate_limited_by_turbine_capacity(turbine_factory, single_speed_compressor_train_unisim_methane):
+    """
+    Test that max rate is reduced to the rate where the train power equals the turbine max power, for the time steps
+    where the train needs more power than the turbine can deliver at its max rate.
+
+    All time steps are searched at once, verify that the result is the same as searching them one by one.
+    """
+    fluid_model = FluidModel(composition=FluidComposition(methane=1.0), eos_model=EoSModel.SRK)
+    compressor_with_turbine_model = CompressorWithTurbineModel(
+        turbine_model=turbine_factory(loads=[1, 11], efficiency_fractions=[0.5, 0.5]),
+        compressor_energy_function=single_speed_compressor_train_unisim_methane,
+        energy_usage_adjustment_constant=0,
+        energy_usage_adjustment_factor=1,
+    )
+    suction_pressure = np.asarray([40, 60, 35, 65, 50, 30])
+    discharge_pressure = np.asarray([80, 120, 60, 125, 100, 50])
+    max_rate_without_turbine = single_speed_compressor_train_unisim_methane.get_max_standard_rate(
+        suction_pressures=suction_pressure, discharge_pressures=discharge_pressure, fluid_model=fluid_model
+    )
+
+    max_rate = compressor_with_turbine_model.get_max_standard_rate(
+        suction_pressures=suction_pressure,
+        discharge_pressures=discharge_pressure,
+        fluid_model=fluid_model,
+    )
+
+    is_limited_by_turbine = np.asarray([False, True, False, True, False, False])
+    assert np.all(max_rate[is_limited_by_turbine] < max_rate_without_turbine[is_limited_by_turbine])
+    assert max_rate[~is_limited_by_turbine].tolist() == max_rate_without_turbine[~is_limited_by_turbine].tolist()
+
+    single_speed_compressor_train_unisim_methane.set_evaluation_input(
+        fluid_model=fluid_model,
+        rate=max_rate,
+        suction_pressure=suction_pressure,
+        discharge_pressure=discharge_pressure,
+    )
+    power = np.asarray(single_speed_compressor_train_unisim_methane.evaluate().get_energy_result().power.values)
+    assert power[is_limited_by_turbine] == pytest.approx(11 - POWER_CALCULATION_TOLERANCE, rel=1e-4)
+
+    for i in np.flatnonzero(is_limited_by_turbine):
+        expected_max_rate = find_root(
+            lower_bound=0,
+            upper_bound=max_rate_without_turbine[i],
+            func=lambda rate, i=i: (
+                compressor_with_turbine_model._calculate_remaining_capacity_in_train_given_standard_rates(
+                    standard_rates=np.asarray([rate]),
+                    suction_pressures=suction_pressure[[i]],
+                    discharge_pressures=discharge_pressure[[i]],
+                    max_power=11,
+                )[0]
+            ),
+        )
+        assert max_rate[i] == expected_max_rate
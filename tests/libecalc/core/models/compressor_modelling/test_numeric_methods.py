@@ -1,9 +1,11 @@
+import numpy as np
 import pytest
 
 from libecalc.common.numeric_methods import (
     DampState,
     adaptive_pressure_update,
     find_root,
+    find_roots,
     maximize_x_given_boolean_condition_function,
     secant_method,
 )
@@ -54,6 +56,46 @@ def test_root_finding_method_func_quadratic():
     assert result_scipy == pytest.approx(result_custom, rel=0.01)
 
 
+def test_find_roots_same_as_find_root_one_by_one():
+    offsets = np.asarray([4, 0.5, 27, 100, 0.001])
+
+    def batch_func(x, indices):
+        return x**3 - offsets[indices]
+
+    roots = find_roots(lower_bounds=np.zeros(len(offsets)), upper_bounds=np.full(len(offsets), 10.0), func=batch_func)
+
+    expected_roots = [find_root(lower_bound=0, upper_bound=10, func=lambda x, o=o: x**3 - o) for o in offsets]
+    assert roots.tolist() == expected_roots
+    assert roots == pytest.approx(np.cbrt(offsets), rel=1e-4)
+
+
+def test_find_roots_evaluates_all_problems_at_once():
+    offsets = np.linspace(1, 50, 100)
+    number_of_calls = 0
+
+    def batch_func(x, indices):
+        nonlocal number_of_calls
+        number_of_calls += 1
+        return x**2 - offsets[indices]
+
+    roots = find_roots(lower_bounds=np.zeros(len(offsets)), upper_bounds=np.full(len(offsets), 10.0), func=batch_func)
+
+    assert roots == pytest.approx(np.sqrt(offsets), rel=1e-4)
+    assert number_of_calls < len(offsets)
+
+
+def test_find_roots_without_sign_change_falls_back_to_find_root():
+    roots = find_roots(
+        lower_bounds=np.asarray([0.0, 0.0]),
+        upper_bounds=np.asarray([10.0, 10.0]),
+        func=lambda x, indices: np.where(indices == 0, x**3 - 4, func_quadratic(x)),
+    )
+    assert roots.tolist() == [
+        find_root(lower_bound=0, upper_bound=10, func=func),
+        find_root(lower_bound=0, upper_bound=10, func=func_quadratic),
+    ]
+
+
 @pytest.mark.skip("deactivate caplog tests for now")
 def test_root_finding_solution_out_of_bounds(caplog):
     """SciPy's standard Brent method does not throw exceptions for solutions outside bounds. Check that error is logged when solution is out of bounds."""
@@ -774,3 +774,24 @@ def test_calculate_enthalpy_change_head_iteration_and_outlet_stream(fluid_servic
     np.testing.assert_allclose(expected_inlet_kappa, [s.kappa for s in inlet_streams], rtol=1e-5)
     np.testing.assert_allclose(expected_outlet_kappa, [s.kappa for s in outlet_streams], rtol=1e-5)
     np.testing.assert_allclose(expected_enthalpy_change, enthalpy_change_joule_per_kg, rtol=1e-4)
+
+    # A single stream gives scalars, as for a list of one stream
+    def efficiency_function(rates, heads):
+        return np.full_like(rates, 0.75)
+
+    for inlet_stream, stream_outlet_pressure in zip(inlet_streams, outlet_pressure):
+        enthalpy_change, polytropic_efficiency = calculate_enthalpy_change_head_iteration(
+            polytropic_efficiency_vs_rate_and_head_function=efficiency_function,
+            outlet_pressure=float(stream_outlet_pressure),
+            inlet_streams=inlet_stream,
+            fluid_service=fluid_service,
+        )
+        expected_enthalpy_changes, expected_efficiencies = calculate_enthalpy_change_head_iteration(
+            polytropic_efficiency_vs_rate_and_head_function=efficiency_function,
+            outlet_pressure=np.array([stream_outlet_pressure]),
+            inlet_streams=[inlet_stream],
+            fluid_service=fluid_service,
+        )
+        assert isinstance(enthalpy_change, float)
+        assert enthalpy_change == expected_enthalpy_changes[0]
+        assert polytropic_efficiency == expected_efficiencies[0]
@@ -423,3 +423,50 @@ def test_variable_speed_pump_pt2(vsd_pump_test_variable_speed_chart_curves, capl
     energy_result_head_too_high = result_head_too_high.get_energy_result()
     assert energy_result_head_too_high.energy_usage.values[0] == pytest.approx(3.9573, abs=0.001)
     assert not energy_result_head_too_high.is_valid[0]
+
+
+@pytest.mark.parametrize("head_margin", [0.0, 98.1])
+def test_variable_speed_pump_vectorized_equals_simulate(vsd_pump_test_variable_speed_chart_curves, head_margin):
+    pump = PumpModel(
+        pump_chart=vsd_pump_test_variable_speed_chart_curves,
+        head_margin=head_margin,
+    )
+    rng = np.random.default_rng(seed=1)
+    number_of_timesteps = 200
+    rates = rng.uniform(-1000, 30000, number_of_timesteps)
+    rates[::10] = 0
+    suction_pressures = rng.uniform(1, 50, number_of_timesteps)
+    discharge_pressures = suction_pressures + rng.uniform(-5, 200, number_of_timesteps)
+    fluid_densities = rng.uniform(900, 1100, number_of_timesteps)
+
+    result = pump.evaluate_rate_ps_pd_density(
+        rates=rates,
+        suction_pressures=suction_pressures,
+        discharge_pressures=discharge_pressures,
+        fluid_densities=fluid_densities,
+    )
+    power_values = result.get_energy_result().power.values
+
+    for i in range(number_of_timesteps):
+        power, operational_head, failure_status = pump.simulate(
+            rate=rates[i],
+            suction_pressure=suction_pressures[i],
+            discharge_pressure=discharge_pressures[i],
+            fluid_density=fluid_densities[i],
+        )
+        assert power_values[i] == power
+        assert result.operational_head[i] == operational_head
+        assert result.failure_status[i] == failure_status
+
+    max_rates = pump.get_max_standard_rates(
+        suction_pressures=suction_pressures,
+        discharge_pressures=discharge_pressures,
+        fluid_densities=fluid_densities,
+    )
+    np.testing.assert_array_equal(
+        max_rates,
+        [
+            pump.get_max_standard_rate(suction_pressure=ps, discharge_pressure=pd, fluid_density=density)
+            for ps, pd, density in zip(suction_pressures, discharge_pressures, fluid_densities)
+        ],
+    )
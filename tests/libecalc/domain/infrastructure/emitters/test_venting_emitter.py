@@ -208,3 +208,46 @@ def test_oil_venting_emitter_with_conditions():
     result = emitter.get_emissions()
 
     assert result["CH4"].values == expected_result
+
+
+def test_direct_venting_emitter_with_mixed_units_and_rate_types():
+    expression_evaluator = VariablesMap(
+        variables={"venting_emissions": [10, 100], "regularity": [0.5, 0]},
+        periods=create_expression_evaluator("venting_emissions", [10, 100]).get_periods(),
+    )
+    regularity = Regularity(
+        expression_evaluator, target_period=Period(start=datetime(2022, 1, 1)), expression_input="regularity"
+    )
+
+    def create_emission(name: str, unit: Unit, rate_type: RateType) -> VentingEmission:
+        return VentingEmission(
+            name=name,
+            emission_rate=EmissionRate(
+                time_series_expression=TimeSeriesExpression(
+                    expression="venting_emissions", expression_evaluator=expression_evaluator
+                ),
+                unit=unit,
+                rate_type=rate_type,
+                regularity=regularity,
+            ),
+        )
+
+    emitter = DirectVentingEmitter(
+        id=uuid4(),
+        name="TestEmitter",
+        emitter_type=VentingType.DIRECT_EMISSION,
+        component_type=ComponentType.VENTING_EMITTER,
+        regularity=regularity,
+        emissions=[
+            create_emission("CO2", Unit.KILO_PER_DAY, RateType.STREAM_DAY),
+            create_emission("CH4", Unit.TONS_PER_DAY, RateType.CALENDAR_DAY),
+            create_emission("NMVOC", Unit.KILO_PER_DAY, RateType.CALENDAR_DAY),
+        ],
+    )
+
+    result = emitter._get_emissions()
+
+    # Calendar day rates are set to zero where the regularity is zero
+    assert result["CO2"].values == [0.01, 0.1]
+    assert result["CH4"].values == [20, 0]
+    assert result["NMVOC"].values == [0.02, 0]
@@ -0,0 +1,84 @@
+import numpy as np
+
+from libecalc.common.units import Unit
+from libecalc.domain.process.core.results.compressor import (
+    CompressorStageResult,
+    CompressorStreamCondition,
+    CompressorTrainCommonShaftFailureStatus,
+    CompressorTrainResult,
+)
+
+
+def _create_stage_result(
+    asv_recirculation_loss_mw: list[float], pressure_is_choked: list[bool], rate_exceeds_maximum: list[bool]
+) -> CompressorStageResult:
+    stage_result = CompressorStageResult.create_empty(number_of_periods=2)
+    stage_result.asv_recirculation_loss_mw = asv_recirculation_loss_mw
+    stage_result.pressure_is_choked = pressure_is_choked
+    stage_result.rate_exceeds_maximum = rate_exceeds_maximum
+    return stage_result
+
+
+class TestCompressorStageResult:
+    def test_time_series_are_typed_arrays(self):
+        stage_result = CompressorStageResult.create_empty(number_of_periods=3)
+        stage_result.polytropic_efficiency = [np.float64(0.7), 0.75, np.array(0.8)]
+        stage_result.is_valid = [1, 0, 1]
+
+        assert stage_result.polytropic_efficiency.dtype == np.float64
+        np.testing.assert_array_equal(stage_result.polytropic_efficiency, [0.7, 0.75, 0.8])
+        assert stage_result.is_valid.dtype == np.bool_
+        np.testing.assert_array_equal(stage_result.is_valid, [True, False, True])
+        assert np.isnan(stage_result.power).all()
+        assert not stage_result.head_exceeds_maximum.any()
+
+    def test_arrays_are_not_copied(self):
+        pressure = np.array([10.0, 20.0])
+        stream_condition = CompressorStreamCondition.create_empty(number_of_periods=2)
+        stream_condition.pressure = pressure
+
+        assert stream_condition.pressure is pressure
+
+
+def _create_train_result(stage_results: list[CompressorStageResult]) -> CompressorTrainResult:
+    return CompressorTrainResult(
+        rate_sm3_day=[1.0, 2.0],
+        max_standard_rate=None,
+        inlet_stream_condition=CompressorStreamCondition.create_empty(number_of_periods=2),
+        outlet_stream_condition=CompressorStreamCondition.create_empty(number_of_periods=2),
+        stage_results=stage_results,
+        failure_status=[CompressorTrainCommonShaftFailureStatus.NO_FAILURE] * 2,
+        turbine_result=None,
+        energy_usage=[1.0, 1.0],
+        energy_usage_unit=Unit.MEGA_WATT,
+        power=[1.0, 1.0],
+        power_unit=Unit.MEGA_WATT,
+    )
+
+
+class TestCompressorTrainResult:
+    def test_aggregated_stage_results(self):
+        result = _create_train_result(
+            [
+                _create_stage_result([1.0, 2.0], pressure_is_choked=[True, False], rate_exceeds_maximum=[False, False]),
+                _create_stage_result([0.5, 0.0], pressure_is_choked=[False, False], rate_exceeds_maximum=[False, True]),
+            ]
+        )
+
+        assert result.recirculation_loss == [1.5, 2.0]
+        assert result.pressure_is_choked == [True, False]
+        assert result.rate_exceeds_maximum == [False, True]
+        # Computed once
+        assert result.recirculation_loss is result.recirculation_loss
+
+    def test_nan_recirculation_loss_is_ignored(self):
+        result = _create_train_result(
+            [
+                CompressorStageResult.create_empty(number_of_periods=2),
+                _create_stage_result(
+                    [np.nan, 0.5], pressure_is_choked=[False, False], rate_exceeds_maximum=[False, False]
+                ),
+            ]
+        )
+
+        assert result.recirculation_loss == [0.0, 0.5]
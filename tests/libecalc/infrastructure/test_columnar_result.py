@@ -0,0 +1,90 @@
+import io
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from libecalc.fixtures import YamlCase
+from libecalc.infrastructure.columnar_result import ColumnarResult, _to_typed_column
+from libecalc.infrastructure.file_utils import OutputFormat, get_result_output
+from libecalc.presentation.json_result.mapper import get_asset_result
+from libecalc.presentation.json_result.result import EcalcModelResult
+
+
+@pytest.fixture
+def simple_result(simple_yaml: YamlCase) -> EcalcModelResult:
+    model = simple_yaml.get_yaml_model().validate_for_run()
+    model.evaluate_energy_usage()
+    return get_asset_result(model)
+
+
+def test_save_and_load(simple_result, tmp_path):
+    columnar_result = ColumnarResult.from_result(simple_result)
+    columnar_result.save(tmp_path / "result")
+
+    with ColumnarResult.load(tmp_path / "result") as loaded_result:
+        assert loaded_result.periods == simple_result.periods
+        assert loaded_result.column_names == columnar_result.column_names
+        assert loaded_result.metadata == columnar_result.metadata
+        for column_name in columnar_result.column_names:
+            loaded_column = loaded_result.get_column(column_name)
+            assert isinstance(loaded_column, np.memmap)
+            assert loaded_column.dtype == columnar_result.get_column(column_name).dtype
+            np.testing.assert_array_equal(loaded_column, columnar_result.get_column(column_name))
+
+
+def test_columns_can_be_loaded_with_numpy(simple_result, tmp_path):
+    columnar_result = ColumnarResult.from_result(simple_result)
+    columnar_result.save(tmp_path)
+
+    metadata = json.loads((tmp_path / "metadata.json").read_text())
+    for column in metadata["columns"]:
+        np.testing.assert_array_equal(
+            np.load(tmp_path / column["file_name"], allow_pickle=False), columnar_result.get_column(column["name"])
+        )
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        (pd.Series([1.0, None, 2.0], dtype=object), np.array([1.0, np.nan, 2.0])),
+        (pd.Series([1, 2, 3]), np.array([1.0, 2.0, 3.0])),
+        (pd.Series([True, False, True]), np.array([True, False, True])),
+        (
+            pd.Series(pd.to_datetime(["2020-01-01", "2021-01-01", "2022-01-01"])),
+            np.array(["2020-01-01", "2021-01-01", "2022-01-01"], dtype="datetime64[us]"),
+        ),
+        (pd.Series(["a", None, "bc"], dtype=object), np.array(["a", "", "bc"])),
+    ],
+)
+def test_typed_columns(values, expected, tmp_path):
+    typed_column = _to_typed_column(values)
+    assert typed_column.dtype == expected.dtype
+    np.testing.assert_array_equal(typed_column, expected)
+
+    # No object columns, can be saved and loaded without pickle
+    np.save(tmp_path / "column.npy", typed_column, allow_pickle=False)
+    np.testing.assert_array_equal(np.load(tmp_path / "column.npy", mmap_mode="r", allow_pickle=False), expected)
+
+
+def test_columns_match_csv_output(simple_result):
+    df = ColumnarResult.from_result(simple_result).to_dataframe()
+    csv = get_result_output(simple_result, output_format=OutputFormat.CSV, simple_output=False, date_format_option=0)
+    csv_df = pd.read_csv(io.StringIO(csv), index_col="timesteps", parse_dates=True)
+    csv_df.index.name = None
+
+    assert list(df.columns) == list(csv_df.columns)
+    pd.testing.assert_frame_equal(df, csv_df, check_dtype=False, check_index_type=False, check_freq=False, atol=1e-5)
+
+
+def test_metadata_refers_to_components(simple_result):
+    columnar_result = ColumnarResult.from_result(simple_result)
+    component_ids = {component.id for component in simple_result.components}
+
+    assert {column["component_id"] for column in columnar_result.metadata["columns"]} == component_ids
+
+
+def test_get_unknown_column_raises(simple_result):
+    with pytest.raises(KeyError):
+        ColumnarResult.from_result(simple_result).get_column("unknown")
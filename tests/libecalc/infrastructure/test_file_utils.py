@@ -0,0 +1,82 @@
+import io
+import json
+
+import pandas as pd
+import pytest
+
+from libecalc.common.datetime.utils import DateTimeFormats
+from libecalc.fixtures import YamlCase
+from libecalc.infrastructure.file_utils import (
+    OutputFormat,
+    dataframe_to_csv,
+    dump_csv,
+    get_component_dataframes,
+    get_result_output,
+)
+from libecalc.presentation.json_result.mapper import get_asset_result
+from libecalc.presentation.json_result.result import EcalcModelResult
+
+
+def _get_result(yaml_case: YamlCase) -> EcalcModelResult:
+    model = yaml_case.get_yaml_model().validate_for_run()
+    model.evaluate_energy_usage()
+    return get_asset_result(model)
+
+
+@pytest.fixture
+def simple_result(simple_yaml: YamlCase) -> EcalcModelResult:
+    return _get_result(simple_yaml)
+
+
+class TestJsonOutput:
+    @pytest.mark.parametrize("simple_output", [True, False])
+    def test_compact_json_has_same_content_as_indented_json(self, simple_result, simple_output):
+        indented = get_result_output(
+            simple_result, output_format=OutputFormat.JSON, simple_output=simple_output, date_format_option=0
+        )
+        compact = get_result_output(
+            simple_result,
+            output_format=OutputFormat.JSON,
+            simple_output=simple_output,
+            date_format_option=0,
+            compact=True,
+        )
+
+        assert "\n" not in compact
+        assert len(compact) < len(indented)
+        assert json.loads(compact) == json.loads(indented)
+
+    def test_indented_json_is_formatted_as_a_single_dump(self, simple_result):
+        indented = get_result_output(
+            simple_result, output_format=OutputFormat.JSON, simple_output=False, date_format_option=0
+        )
+
+        assert indented == json.dumps(json.loads(indented), indent=2, ensure_ascii=False, separators=(",", ": "))
+
+
+class TestCsvOutput:
+    def test_chunked_csv_is_equal_to_unchunked_csv(self, simple_result):
+        unchunked = get_result_output(
+            simple_result, output_format=OutputFormat.CSV, simple_output=False, date_format_option=0
+        )
+        chunked = io.StringIO()
+        dump_csv(simple_result, fp=chunked, date_format_option=0, chunk_size=2)
+
+        assert len(unchunked.splitlines()) == len(simple_result.periods) + 1
+        assert chunked.getvalue() == unchunked
+
+    @pytest.mark.parametrize(
+        "yaml_case_fixture_name", ["simple_yaml", "ltp_export_yaml", "all_energy_usage_models_yaml"]
+    )
+    def test_csv_is_equal_to_csv_of_joined_component_dataframes(self, yaml_case_fixture_name, request):
+        result = _get_result(request.getfixturevalue(yaml_case_fixture_name))
+        joined_df = pd.concat(
+            [pd.DataFrame(index=pd.DatetimeIndex(result.periods.start_dates)), *get_component_dataframes(result)],
+            axis=1,
+        )
+        expected = dataframe_to_csv(joined_df.fillna("nan"), date_format=DateTimeFormats.get_format(0))
+
+        csv = io.StringIO()
+        dump_csv(result, fp=csv, date_format_option=0, chunk_size=3)
+
+        assert csv.getvalue() == expected
@@ -0,0 +1,136 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from libecalc.common.time_utils import Period, Periods
+from libecalc.common.units import Unit
+from libecalc.common.utils.rates import TimeSeriesVolumes
+from libecalc.presentation.exporter.attribute_matrix import AttributeMatrix, AttributeMatrixExportable, AttributeType
+from libecalc.presentation.exporter.domain.exportable import AttributeMeta, AttributeSet, Exportable
+from libecalc.presentation.exporter.infrastructure import TimeSeriesAttribute
+
+periods = Periods.create_periods(
+    [datetime(2020, 1, 1), datetime(2021, 1, 1), datetime(2022, 1, 1), datetime(2023, 1, 1)],
+    include_before=False,
+    include_after=False,
+)
+
+
+def attribute(values: list[float], meta: AttributeMeta, attribute_periods: Periods = periods) -> TimeSeriesAttribute:
+    return TimeSeriesAttribute(
+        time_series=TimeSeriesVolumes(periods=attribute_periods, values=values, unit=Unit.STANDARD_CUBIC_METER),
+        attribute_meta=meta,
+    )
+
+
+@pytest.fixture
+def attribute_matrix() -> AttributeMatrix:
+    return AttributeMatrix(
+        AttributeSet(
+            [
+                attribute([1, 2, 3], AttributeMeta(fuel_category="FUEL-GAS", consumer_category="TURBINE-GENERATOR")),
+                attribute([10, 20, 30], AttributeMeta(fuel_category="DIESEL", consumer_category="TURBINE-GENERATOR")),
+                attribute(
+                    [100],
+                    AttributeMeta(fuel_category="FUEL-GAS", consumer_category="BOILER"),
+                    attribute_periods=Periods([periods.periods[1]]),
+                ),
+            ]
+        ),
+        periods=periods,
+    )
+
+
+class TestAttributeMatrix:
+    def test_sum_all(self, attribute_matrix):
+        result_periods, values = attribute_matrix.sum(attribute_matrix.mask())
+        assert result_periods == periods
+        assert values == [11, 122, 33]
+
+    def test_sum_filtered(self, attribute_matrix):
+        assert attribute_matrix.sum(attribute_matrix.mask(fuel_category="FUEL-GAS"))[1] == [1, 102, 3]
+        assert attribute_matrix.sum(attribute_matrix.mask(consumer_categories=["BOILER"]))[1] == [0, 100, 0]
+        assert attribute_matrix.sum(
+            attribute_matrix.mask(fuel_category="FUEL-GAS", consumer_categories=["TURBINE-GENERATOR", "HEATER"])
+        )[1] == [1, 2, 3]
+
+    def test_sum_no_match_gives_zeros(self, attribute_matrix):
+        result_periods, values = attribute_matrix.sum(attribute_matrix.mask(emission_type="co2"))
+        assert result_periods == periods
+        assert values == [0, 0, 0]
+
+    def test_periods_outside_exportable_periods_are_kept_last(self):
+        after = Period(datetime(2023, 1, 1), datetime(2024, 1, 1))
+        attribute_matrix = AttributeMatrix(
+            AttributeSet(
+                [
+                    attribute([1, 2, 3], AttributeMeta(fuel_category=None, consumer_category="BOILER")),
+                    attribute(
+                        [5],
+                        AttributeMeta(fuel_category=None, consumer_category="HEATER"),
+                        attribute_periods=Periods([after]),
+                    ),
+                ]
+            ),
+            periods=periods,
+        )
+        assert attribute_matrix.sum(attribute_matrix.mask(consumer_categories=["BOILER"])) == (periods, [1, 2, 3])
+        assert attribute_matrix.sum(attribute_matrix.mask()) == (Periods(periods.periods + [after]), [1, 2, 3, 5])
+
+    def test_nan_is_propagated(self):
+        attribute_matrix = AttributeMatrix(
+            AttributeSet([attribute([1, np.nan, 3], AttributeMeta(fuel_category=None, consumer_category="BOILER"))]),
+            periods=periods,
+        )
+        values = attribute_matrix.sum(attribute_matrix.mask())[1]
+        assert values[0] == 1
+        assert np.isnan(values[1])
+
+
+class CountingExportable(Exportable):
+    def __init__(self):
+        self.number_of_calls = 0
+
+    def get_name(self) -> str:
+        return "installation"
+
+    def get_category(self) -> str | None:
+        return "FIXED"
+
+    def get_periods(self) -> Periods:
+        return periods
+
+    def get_fuel_consumption(self) -> AttributeSet:
+        self.number_of_calls += 1
+        return AttributeSet([attribute([1, 2, 3], AttributeMeta(fuel_category=None, consumer_category="BOILER"))])
+
+    def get_power_consumption(self, unit: Unit) -> AttributeSet:
+        raise NotImplementedError
+
+    def get_emissions(self, unit: Unit) -> AttributeSet:
+        self.number_of_calls += 1
+        return AttributeSet([])
+
+    def get_electricity_production(self, unit: Unit) -> AttributeSet:
+        raise NotImplementedError
+
+    def get_maximum_electricity_production(self, unit: Unit) -> AttributeSet:
+        raise NotImplementedError
+
+    def get_storage_volumes(self, unit: Unit) -> AttributeSet:
+        raise NotImplementedError
+
+
+def test_attribute_matrix_exportable_builds_attributes_once():
+    exportable = CountingExportable()
+    attribute_matrix_exportable = AttributeMatrixExportable(exportable)
+
+    for _ in range(3):
+        attribute_matrix_exportable.get_attribute_matrix(AttributeType.FUEL_CONSUMPTION, Unit.STANDARD_CUBIC_METER)
+        attribute_matrix_exportable.get_attribute_matrix(AttributeType.FUEL_CONSUMPTION, Unit.KILO)
+    assert exportable.number_of_calls == 1
+
+    attribute_matrix_exportable.get_attribute_matrix(AttributeType.EMISSIONS, Unit.KILO)
+    attribute_matrix_exportable.get_attribute_matrix(AttributeType.EMISSIONS, Unit.TONS)
+    assert exportable.number_of_calls == 3
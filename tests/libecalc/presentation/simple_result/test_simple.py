@@ -1,6 +1,8 @@
 from copy import deepcopy
 from datetime import datetime
 
+import pytest
+
 from libecalc.common.component_info.component_level import ComponentLevel
 from libecalc.common.component_type import ComponentType
 from libecalc.common.time_utils import Periods
@@ -467,3 +469,105 @@ class TestDeltaProfile:
                 )
             ],
         )
+
+
+class TestSimpleComponentResult:
+    @staticmethod
+    def _create_component(periods: Periods, **kwargs) -> SimpleComponentResult:
+        return SimpleComponentResult(
+            name="component1",
+            componentType=ComponentType.COMPRESSOR,
+            component_level=ComponentLevel.CONSUMER,
+            periods=periods,
+            energy_usage_unit=Unit.STANDARD_CUBIC_METER_PER_DAY,
+            **kwargs,
+        )
+
+    def test_fit_to_periods_trims_and_splits_periods(self):
+        component = self._create_component(
+            periods=Periods.create_periods(
+                times=[datetime(2019, 1, 1), datetime(2020, 1, 1), datetime(2022, 1, 1), datetime(2025, 1, 1)],
+                include_before=False,
+                include_after=False,
+            ),
+            emissions={"co2": SimpleEmissionResult(name="co2", rate=[1, 2, 3])},
+            energy_usage=[10, 20, 30],
+            power=None,
+            is_valid=[True, False, True],
+        )
+        periods = Periods.create_periods(
+            times=[datetime(2020, 1, 1), datetime(2021, 1, 1), datetime(2022, 1, 1), datetime(2023, 1, 1)],
+            include_before=False,
+            include_after=False,
+        )
+
+        fitted_component = SimpleComponentResult.fit_to_periods(component, periods)
+
+        assert fitted_component.periods == periods
+        assert fitted_component.energy_usage == [20, 20, 30]
+        assert fitted_component.is_valid == [False, False, True]
+        assert fitted_component.power == []
+        assert fitted_component.emissions["co2"].rate == [2, 2, 3]
+
+    def test_subtract_all_time_series(self):
+        periods = Periods.create_periods(
+            times=[datetime(2020, 1, 1), datetime(2021, 1, 1), datetime(2022, 1, 1)],
+            include_before=False,
+            include_after=False,
+        )
+        changed_component = self._create_component(
+            periods=periods,
+            emissions={
+                "co2": SimpleEmissionResult(name="co2", rate=[0, 4]),
+                "ch4": SimpleEmissionResult(name="ch4", rate=[1, 1]),
+            },
+            energy_usage=[5, 0],
+            power=[3, 3],
+            is_valid=[True, True],
+        )
+        reference_component = self._create_component(
+            periods=periods,
+            emissions={
+                "ch4": SimpleEmissionResult(name="ch4", rate=[2, 0.5]),
+                "co2": SimpleEmissionResult(name="co2", rate=[1, 0]),
+            },
+            energy_usage=[2, 3],
+            power=[1, 2],
+            is_valid=[False, True],
+        )
+
+        delta = changed_component - reference_component
+
+        assert delta.energy_usage == [3, -3]
+        assert delta.power == [2, 1]
+        assert delta.is_valid == [False, True]
+        assert delta.emissions == {
+            "ch4": SimpleEmissionResult(name="ch4", rate=[-1, 0.5]),
+            "co2": SimpleEmissionResult(name="co2", rate=[-1, 4]),
+        }
+
+    @pytest.mark.parametrize(
+        "power, reference_power, expected_power",
+        [
+            (None, None, None),
+            ([3, 3], None, [3, 3]),
+            (None, [1, 2], [-1, -2]),
+        ],
+    )
+    def test_subtract_missing_power(self, power, reference_power, expected_power):
+        periods = Periods.create_periods(
+            times=[datetime(2020, 1, 1), datetime(2021, 1, 1), datetime(2022, 1, 1)],
+            include_before=False,
+            include_after=False,
+        )
+        changed_component = self._create_component(
+            periods=periods, emissions={}, energy_usage=[5, 0], power=power, is_valid=[True, True]
+        )
+        reference_component = self._create_component(
+            periods=periods, emissions={}, energy_usage=[2, 3], power=reference_power, is_valid=[True, True]
+        )
+
+        delta = changed_component - reference_component
+
+        assert delta.power == expected_power
+        assert delta.energy_usage == [3, -3]
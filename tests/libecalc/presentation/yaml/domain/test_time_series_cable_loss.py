@@ -83,3 +83,35 @@ def test_temporal_category_switch_back(expression_evaluator_factory):
         category=TemporalModel.create(category_model, target_period=evaluator.get_period()),
     )
     assert cable_loss.get_values() == [0.1, 0.0, 0.0]
+
+
+def test_category_none(expression_evaluator_factory, caplog):
+    """Cable loss is zero without warnings when the category is None, as for other categories."""
+    category_model = {
+        periods[0].start: None,
+        periods[1].start: ConsumerUserDefinedCategoryType.POWER_FROM_SHORE,
+    }
+    evaluator = expression_evaluator_factory.from_periods(
+        periods=periods, variables={"SIM1;CABLE_LOSS": [0.1, 0.2, 0.3]}
+    )
+    cable_loss_expr = TimeSeriesExpression(expression="SIM1;CABLE_LOSS", expression_evaluator=evaluator)
+    cable_loss = ExpressionTimeSeriesCableLoss(
+        time_series_expression=cable_loss_expr,
+        category=TemporalModel.create(category_model, target_period=evaluator.get_period()),
+    )
+    assert cable_loss.get_values() == [0.0, 0.2, 0.3]
+    assert "not defined for period" not in caplog.text
+
+
+def test_category_not_defined_for_period(expression_evaluator_factory, caplog):
+    """Cable loss is zero, with a warning, for periods not covered by the temporal category."""
+    evaluator = expression_evaluator_factory.from_periods(
+        periods=periods, variables={"SIM1;CABLE_LOSS": [0.1, 0.2, 0.3]}
+    )
+    cable_loss_expr = TimeSeriesExpression(expression="SIM1;CABLE_LOSS", expression_evaluator=evaluator)
+    cable_loss = ExpressionTimeSeriesCableLoss(
+        time_series_expression=cable_loss_expr,
+        category=TemporalModel({periods[1].start: ConsumerUserDefinedCategoryType.POWER_FROM_SHORE}),
+    )
+    assert cable_loss.get_values() == [0.0, 0.2, 0.3]
+    assert f"not defined for period {periods[0]}" in caplog.text
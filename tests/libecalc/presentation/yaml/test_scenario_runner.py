@@ -0,0 +1,120 @@
+import shutil
+
+import pytest
+
+from ecalc_cli.infrastructure.file_resource_service import FileResourceService
+from libecalc.common.parallel_evaluation import ParallelEvaluationConfig, ParallelEvaluationMode
+from libecalc.presentation.json_result.mapper import get_asset_result
+from libecalc.presentation.json_result.result import EcalcModelResult
+from libecalc.presentation.yaml.file_configuration_service import FileConfigurationService
+from libecalc.presentation.yaml.model import YamlModel
+from libecalc.presentation.yaml.model_validation_exception import ModelValidationException
+from libecalc.presentation.yaml.scenario_runner import Scenario, ScenarioRunner
+from libecalc.presentation.yaml.yaml_entities import MemoryResource
+
+
+def _get_scenario_runner(model_path, parallel_evaluation_config=None) -> ScenarioRunner:
+    return ScenarioRunner(
+        configuration_service=FileConfigurationService(configuration_path=model_path),
+        resource_service_factory=lambda configuration: FileResourceService(
+            working_directory=model_path.parent, configuration=configuration
+        ),
+        parallel_evaluation_config=parallel_evaluation_config,
+    )
+
+
+def _run_model(model_path) -> EcalcModelResult:
+    configuration = FileConfigurationService(configuration_path=model_path).get_configuration()
+    model = YamlModel(
+        configuration=configuration,
+        resource_service=FileResourceService(working_directory=model_path.parent, configuration=configuration),
+    ).validate_for_run()
+    model.evaluate_energy_usage()
+    return get_asset_result(model)
+
+
+def _get_energy_usage(result: EcalcModelResult) -> dict[str, list[float]]:
+    return {component.name: component.energy_usage.values for component in result.components}
+
+
+def _get_production_data(model_path, factor: float) -> MemoryResource:
+    production_data = MemoryResource.from_path(model_path.parent / "production_data.csv", allow_nans=True)
+    return MemoryResource(
+        headers=production_data.headers,
+        data=[
+            column if header.lower() == "dates" else [value * factor for value in column]
+            for header, column in zip(production_data.headers, production_data.data, strict=True)
+        ],
+    )
+
+
+@pytest.fixture
+def simple_model_copy_path(simple_yaml_path, tmp_path):
+    model_folder = tmp_path / "simple"
+    shutil.copytree(simple_yaml_path.parent, model_folder, ignore=shutil.ignore_patterns("output", "__pycache__"))
+    return model_folder / simple_yaml_path.name
+
+
+class TestScenarioRunner:
+    def test_scenario_without_resources_gives_model_result(self, simple_yaml_path):
+        runner = _get_scenario_runner(simple_yaml_path)
+
+        [result] = runner.run([Scenario(name="base")])
+
+        assert _get_energy_usage(result) == _get_energy_usage(_run_model(simple_yaml_path))
+
+    def test_scenario_replaces_time_series_resource(self, simple_model_copy_path):
+        runner = _get_scenario_runner(simple_model_copy_path)
+        production_data = _get_production_data(simple_model_copy_path, factor=0.5)
+
+        base_result, scenario_result = runner.run(
+            [
+                Scenario(name="base"),
+                Scenario(name="half", time_series_resources={"production_data.csv": production_data}),
+            ]
+        )
+
+        # Same result as running a model with the scenario input
+        production_data_csv = "\n".join(
+            ",".join(str(value) for value in row) for row in [production_data.headers, *zip(*production_data.data)]
+        )
+        (simple_model_copy_path.parent / "production_data.csv").write_text(production_data_csv)
+        assert _get_energy_usage(scenario_result) == _get_energy_usage(_run_model(simple_model_copy_path))
+        assert _get_energy_usage(scenario_result) != _get_energy_usage(base_result)
+
+    def test_invalid_scenario_resource(self, simple_yaml_path):
+        runner = _get_scenario_runner(simple_yaml_path)
+        invalid_production_data = MemoryResource(
+            headers=["DATE", "OIL_PROD"], data=[["2020-01-01", "2020-01-01"], [1, 2]]
+        )
+
+        with pytest.raises(ModelValidationException):
+            runner.run(
+                [Scenario(name="invalid", time_series_resources={"production_data.csv": invalid_production_data})]
+            )
+
+    def test_processes_give_same_results_as_serial(self, simple_yaml_path):
+        scenarios = [
+            Scenario(
+                name=f"scenario {factor}",
+                time_series_resources={"production_data.csv": _get_production_data(simple_yaml_path, factor=factor)},
+            )
+            for factor in [0.5, 1.0, 1.5]
+        ]
+
+        serial_results = _get_scenario_runner(simple_yaml_path).run(scenarios)
+        process_results = _get_scenario_runner(
+            simple_yaml_path,
+            parallel_evaluation_config=ParallelEvaluationConfig(mode=ParallelEvaluationMode.PROCESSES, max_workers=2),
+        ).run(scenarios)
+
+        assert [_get_energy_usage(result) for result in process_results] == [
+            _get_energy_usage(result) for result in serial_results
+        ]
+
+    def test_threads_not_supported(self, simple_yaml_path):
+        with pytest.raises(ValueError, match="THREADS"):
+            _get_scenario_runner(
+                simple_yaml_path,
+                parallel_evaluation_config=ParallelEvaluationConfig(mode=ParallelEvaluationMode.THREADS, max_workers=2),
+            )
@@ -0,0 +1,138 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from ecalc_cli.infrastructure.file_resource_service import FileResourceService
+from libecalc.common.time_utils import Period
+from libecalc.presentation.json_result.mapper import get_asset_result
+from libecalc.presentation.json_result.result import EcalcModelResult
+from libecalc.presentation.yaml.domain.time_series_resource import TimeSeriesResource
+from libecalc.presentation.yaml.file_configuration_service import FileConfigurationService
+from libecalc.presentation.yaml.model import YamlModel
+from libecalc.presentation.yaml.windowed_runner import WindowedModelRunner, create_windows
+
+
+def _get_windowed_runner(model_path) -> WindowedModelRunner:
+    return WindowedModelRunner(
+        configuration_service=FileConfigurationService(configuration_path=model_path),
+        resource_service_factory=lambda configuration, window: FileResourceService(
+            working_directory=model_path.parent, configuration=configuration, period=window
+        ),
+    )
+
+
+def _run_model(model_path) -> EcalcModelResult:
+    configuration = FileConfigurationService(configuration_path=model_path).get_configuration()
+    model = YamlModel(
+        configuration=configuration,
+        resource_service=FileResourceService(working_directory=model_path.parent, configuration=configuration),
+    ).validate_for_run()
+    model.evaluate_energy_usage()
+    return get_asset_result(model)
+
+
+def _get_dataframe(results: list[EcalcModelResult]) -> pd.DataFrame:
+    """Get the time series of the components and models of consecutive results as one dataframe."""
+    return pd.concat(
+        [
+            pd.concat(
+                [
+                    item.to_dataframe(prefix=f"{item.componentType}:{item.name}").reindex(
+                        pd.DatetimeIndex(result.periods.start_dates)
+                    )
+                    for item in [*result.components, *result.models]
+                ],
+                axis=1,
+            )
+            for result in results
+        ],
+        axis=0,
+    )
+
+
+class TestCreateWindows:
+    def test_windows_start_at_new_year(self):
+        windows = create_windows(Period(datetime(2020, 6, 1), datetime(2026, 1, 1)), years=2)
+
+        assert windows == [
+            Period(datetime(2020, 6, 1), datetime(2022, 1, 1)),
+            Period(datetime(2022, 1, 1), datetime(2024, 1, 1)),
+            Period(datetime(2024, 1, 1), datetime(2026, 1, 1)),
+        ]
+
+    def test_invalid_years(self):
+        with pytest.raises(ValueError):
+            create_windows(Period(datetime(2020, 1, 1), datetime(2026, 1, 1)), years=0)
+
+
+class TestWindowedModelRunner:
+    def test_windows_give_same_result_as_full_model(self, simple_yaml_path):
+        runner = _get_windowed_runner(simple_yaml_path)
+        windows = runner.get_windows(years=3)
+
+        results = list(runner.run(windows))
+
+        assert len(windows) > 1
+        windowed_df = _get_dataframe(results)
+        full_df = _get_dataframe([_run_model(simple_yaml_path)])
+        cumulative_columns = [column for column in full_df.columns if "cumulative" in column]
+        assert len(cumulative_columns) > 0
+        assert windowed_df[cumulative_columns].iloc[-1].max() > 0
+        pd.testing.assert_frame_equal(windowed_df[cumulative_columns], full_df[cumulative_columns])
+        pd.testing.assert_frame_equal(windowed_df, full_df)
+
+
+class TestTimeSeriesResourceInPeriod:
+    @pytest.fixture
+    def time_series_path(self, tmp_path):
+        path = tmp_path / "time_series.csv"
+        path.write_text("DATE,OIL_PROD\n" + "\n".join(f"{year}-01-01,{year - 2000}" for year in range(2000, 2020)))
+        return path
+
+    def test_keeps_rows_in_period_and_closest_rows(self, time_series_path):
+        resource = TimeSeriesResource.from_path_in_period(
+            time_series_path, period=Period(datetime(2005, 6, 1), datetime(2008, 1, 1)), chunk_size=3
+        )
+
+        assert resource.get_time_vector() == [datetime(year, 1, 1) for year in range(2005, 2009)]
+        assert resource.get_column("OIL_PROD") == [5, 6, 7, 8]
+
+    def test_period_outside_time_series(self, time_series_path):
+        resource = TimeSeriesResource.from_path_in_period(
+            time_series_path, period=Period(datetime(2030, 1, 1), datetime(2031, 1, 1)), chunk_size=3
+        )
+
+        assert resource.get_time_vector() == [datetime(2019, 1, 1)]
+        assert resource.get_column("OIL_PROD") == [19]
+
+    def test_stops_reading_after_period(self, time_series_path, monkeypatch):
+        read_chunks = TimeSeriesResource._read_chunks.__func__
+        number_of_rows_read = 0
+
+        def counting_read_chunks(cls, path, chunk_size, dates_only=False):
+            nonlocal number_of_rows_read
+            for chunk, dates in read_chunks(cls, path, chunk_size=chunk_size, dates_only=dates_only):
+                if not dates_only:
+                    number_of_rows_read += len(chunk)
+                yield chunk, dates
+
+        monkeypatch.setattr(TimeSeriesResource, "_read_chunks", classmethod(counting_read_chunks))
+        resource = TimeSeriesResource.from_path_in_period(
+            time_series_path, period=Period(datetime(2005, 6, 1), datetime(2008, 1, 1)), chunk_size=3
+        )
+
+        assert resource.get_time_vector() == [datetime(year, 1, 1) for year in range(2005, 2009)]
+        # Up to the chunk with the first row after the period
+        assert number_of_rows_read == 9
+
+    def test_dates_not_increasing(self, tmp_path):
+        path = tmp_path / "time_series.csv"
+        years = [*range(2010, 2020), *range(2000, 2010)]
+        path.write_text("DATE,OIL_PROD\n" + "\n".join(f"{year}-01-01,{year - 2000}" for year in years))
+
+        resource = TimeSeriesResource.from_path_in_period(
+            path, period=Period(datetime(2005, 6, 1), datetime(2008, 1, 1)), chunk_size=3
+        )
+
+        assert sorted(resource.get_time_vector()) == [datetime(year, 1, 1) for year in range(2005, 2009)]
@@ -1,10 +1,13 @@
 from datetime import datetime
 from io import StringIO
 
+import numpy as np
 import pytest
 from inline_snapshot import snapshot
 
 from ecalc_cli.infrastructure.file_resource_service import FileResourceService
+from libecalc.domain.process.compressor.core.train.surrogate import CompressorTrainSurrogate
+from libecalc.presentation.json_result.mapper import get_asset_result
 from libecalc.presentation.yaml.file_configuration_service import FileConfigurationService
 from libecalc.presentation.yaml.model import YamlModel
 from libecalc.presentation.yaml.model_validation_exception import ModelValidationException
@@ -248,3 +251,80 @@ Validation error
 	Location: installations.installation_name.FUELCONSUMERS.my error model
 	Message: Fuel definition does not cover the full operational period. Make sure fuel is defined for the full period 2019-01-01;2024-01-01, current period is 2020-01-01;2024-01-01.
 """)
+
+
+class TestYamlModelComponentLookup:
+    def test_get_components_by_id(self, simple_yaml):
+        model = simple_yaml.get_yaml_model().validate_for_run()
+        model.evaluate_energy_usage()
+
+        for installation in model.get_installations():
+            for emitter in installation.get_emitters():
+                assert model.get_emitter(emitter.get_id()) is emitter
+            for fuel_consumer in installation.get_fuel_consumers():
+                assert model.get_fuel_consumer(fuel_consumer.get_id()) is fuel_consumer
+            for electricity_producer in installation.get_electricity_producers():
+                assert model.get_electricity_producer(electricity_producer.get_id()) is electricity_producer
+            for power_consumer in installation.get_power_consumers():
+                found_power_consumer = model.get_power_consumer(power_consumer.get_id())
+                assert found_power_consumer.get_producer_id() == power_consumer.get_producer_id()
+                assert found_power_consumer.get_power_consumption() == power_consumer.get_power_consumption()
+
+        unknown_id = model.get_installations()[0].get_id()
+        assert model.get_emitter(unknown_id) is None
+        assert model.get_fuel_consumer(unknown_id) is None
+        assert model.get_electricity_producer(unknown_id) is None
+        assert model.get_power_consumer(unknown_id) is None
+
+
+def _create_file_yaml_model(model_path, compressor_train_surrogates=None) -> YamlModel:
+    configuration = FileConfigurationService(configuration_path=model_path).get_configuration()
+    return YamlModel(
+        configuration=configuration,
+        resource_service=FileResourceService(working_directory=model_path.parent, configuration=configuration),
+        compressor_train_surrogates=compressor_train_surrogates,
+    ).validate_for_run()
+
+
+def _get_energy_usage(model: YamlModel) -> dict[str, list[float]]:
+    model.evaluate_energy_usage()
+    return {component.name: component.energy_usage.values for component in get_asset_result(model).components}
+
+
+@pytest.fixture(scope="module")
+def surrogates(drogon_yaml_path) -> dict[str, CompressorTrainSurrogate]:
+    return _create_file_yaml_model(drogon_yaml_path).fit_compressor_train_surrogates(
+        number_of_points=5, relative_error_tolerance=0.02
+    )
+
+
+class TestYamlModelCompressorTrainSurrogates:
+    def test_surrogates_used_for_trains_they_are_fitted_for(self, drogon_yaml_path, surrogates):
+        surrogate = surrogates["simplified_compressor_train_model"]
+        assert surrogate.usable_cells.any()
+
+        expected = _get_energy_usage(_create_file_yaml_model(drogon_yaml_path))
+        energy_usage = _get_energy_usage(_create_file_yaml_model(drogon_yaml_path, surrogates))
+
+        assert energy_usage != expected
+        for name, values in energy_usage.items():
+            np.testing.assert_allclose(values, expected[name], rtol=surrogate.max_relative_error)
+
+    def test_surrogate_not_used_for_other_train(self, drogon_yaml_path, surrogates):
+        surrogate = surrogates["simplified_compressor_train_model"]
+        other_train_surrogate = CompressorTrainSurrogate(
+            rate_values=surrogate.rate_values,
+            suction_pressure_values=surrogate.suction_pressure_values,
+            discharge_pressure_values=surrogate.discharge_pressure_values,
+            power_megawatt=np.zeros_like(surrogate.power_megawatt),
+            usable_cells=surrogate.usable_cells,
+            max_absolute_error_megawatt=0.0,
+            max_relative_error=0.0,
+            fingerprint="other train",
+        )
+
+        energy_usage = _get_energy_usage(
+            _create_file_yaml_model(drogon_yaml_path, {"simplified_compressor_train_model": other_train_surrogate})
+        )
+
+        assert energy_usage == _get_energy_usage(_create_file_yaml_model(drogon_yaml_path))
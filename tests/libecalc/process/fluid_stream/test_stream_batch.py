@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from libecalc.common.units import UnitConstants
+from libecalc.process.fluid_stream.exceptions import NegativeMassRateException
+from libecalc.process.fluid_stream.fluid import Fluid
+from libecalc.process.fluid_stream.fluid_model import EoSModel, FluidModel
+from libecalc.process.fluid_stream.fluid_stream import FluidStream
+from libecalc.process.fluid_stream.fluid_stream_batch import FluidPropertiesBatch, FluidStreamBatch
+
+
+@pytest.fixture
+def streams(mock_fluid_model, mock_fluid_properties_factory) -> list[FluidStream]:
+    return [
+        FluidStream(
+            fluid=Fluid(
+                fluid_model=mock_fluid_model,
+                properties=mock_fluid_properties_factory(pressure_bara=pressure, temperature_kelvin=300.0),
+            ),
+            mass_rate_kg_per_h=mass_rate,
+        )
+        for pressure, mass_rate in [(10.0, 100.0), (20.0, 200.0), (30.0, 0.0)]
+    ]
+
+
+class TestFluidStreamBatch:
+    def test_from_streams_gives_same_properties_and_rates(self, streams):
+        batch = FluidStreamBatch.from_streams(streams)
+
+        assert len(batch) == 3
+        assert batch.fluid_model == streams[0].fluid_model
+        np.testing.assert_array_equal(batch.pressure_bara, [stream.pressure_bara for stream in streams])
+        np.testing.assert_array_equal(batch.density, [stream.density for stream in streams])
+        np.testing.assert_array_equal(batch.mass_rate_kg_per_h, [stream.mass_rate_kg_per_h for stream in streams])
+        np.testing.assert_array_equal(
+            batch.standard_rate_sm3_per_day, [stream.standard_rate_sm3_per_day for stream in streams]
+        )
+        np.testing.assert_array_equal(
+            batch.volumetric_rate_m3_per_hour, [stream.volumetric_rate_m3_per_hour for stream in streams]
+        )
+
+    def test_round_trip_to_streams(self, streams):
+        assert list(FluidStreamBatch.from_streams(streams)) == streams
+
+    def test_with_standard_rate(self, streams):
+        batch = FluidStreamBatch.from_streams(streams)
+        standard_rates = np.array([1000.0, 2000.0, 3000.0])
+
+        updated = batch.with_standard_rate(standard_rates)
+
+        np.testing.assert_allclose(updated.standard_rate_sm3_per_day, standard_rates)
+        assert [stream.mass_rate_kg_per_h for stream in updated] == [
+            stream.with_standard_rate(standard_rate).mass_rate_kg_per_h
+            for stream, standard_rate in zip(streams, standard_rates)
+        ]
+        # Original batch unchanged
+        np.testing.assert_array_equal(batch.mass_rate_kg_per_h, [100.0, 200.0, 0.0])
+
+    def test_with_mass_rate_for_all_streams(self, streams):
+        batch = FluidStreamBatch.from_streams(streams).with_mass_rate(50.0)
+
+        np.testing.assert_array_equal(batch.mass_rate_kg_per_h, [50.0, 50.0, 50.0])
+
+    def test_from_standard_rate(self, mock_fluid_model, streams):
+        properties = FluidPropertiesBatch.from_properties([stream.fluid_properties for stream in streams])
+
+        batch = FluidStreamBatch.from_standard_rate(
+            standard_rate_m3_per_day=[2400.0, 2400.0, 2400.0], fluid_model=mock_fluid_model, fluid_properties=properties
+        )
+
+        np.testing.assert_allclose(batch.mass_rate_kg_per_h, 2400.0 * 0.8 / UnitConstants.HOURS_PER_DAY)
+
+    def test_columns_are_read_only(self, streams):
+        batch = FluidStreamBatch.from_streams(streams)
+
+        with pytest.raises(ValueError):
+            batch.pressure_bara[0] = 1.0
+
+    def test_negative_mass_rate_exception(self, streams):
+        batch = FluidStreamBatch.from_streams(streams)
+
+        with pytest.raises(NegativeMassRateException):
+            batch.with_mass_rate([1.0, -1.0, 1.0])
+
+    def test_mismatching_number_of_rates(self, streams):
+        batch = FluidStreamBatch.from_streams(streams)
+
+        with pytest.raises(ValueError):
+            batch.with_mass_rate([1.0, 1.0])
+
+    def test_different_fluid_models_not_allowed(self, streams, medium_composition):
+        other_fluid_model = FluidModel(eos_model=EoSModel.PR, composition=medium_composition)
+        other_stream = FluidStream(
+            fluid=Fluid(fluid_model=other_fluid_model, properties=streams[0].fluid_properties),
+            mass_rate_kg_per_h=100.0,
+        )
+
+        with pytest.raises(ValueError):
+            FluidStreamBatch.from_streams([streams[0], other_stream])
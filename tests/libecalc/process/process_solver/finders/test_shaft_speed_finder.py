@@ -82,3 +82,38 @@ def test_shaft_speed_finder(
     assert result.configuration.speed == expected_speed
     outlet_stream = speed_func(result.configuration)
     assert outlet_stream.pressure_bara == expected_pressure
+
+
+@pytest.mark.parametrize("speed_hint", [250.0, 300.0, 450.0])
+def test_shaft_speed_finder_with_speed_hint(
+    search_strategy_factory,
+    root_finding_strategy,
+    stream_factory,
+    shaft,
+    fluid_service,
+    speed_hint,
+):
+    inlet_stream = stream_factory(standard_rate_m3_per_day=1000, pressure_bara=100)
+    process_units = [SpeedProcessUnit(shaft=shaft, fluid_service=fluid_service)]
+    evaluated_speeds = []
+
+    def speed_func(configuration: SpeedConfiguration):
+        evaluated_speeds.append(configuration.speed)
+        shaft.set_speed(configuration.speed)
+        return propagate_stream_many(process_units=process_units, inlet_stream=inlet_stream)
+
+    def create_finder(hint: float | None) -> ShaftSpeedFinder:
+        return ShaftSpeedFinder(
+            search_strategy=search_strategy_factory(),
+            root_finding_strategy=root_finding_strategy,
+            boundary=Boundary(min=200, max=600),
+            target_pressure=400,
+            speed_hint=hint,
+        )
+
+    result_without_hint = create_finder(hint=None).find(speed_func)
+    result_with_hint = create_finder(hint=speed_hint).find(speed_func)
+
+    assert result_with_hint.configuration.speed == pytest.approx(300)
+    assert result_with_hint.configuration.speed == pytest.approx(result_without_hint.configuration.speed)
+    assert speed_hint in evaluated_speeds
@@ -6,6 +6,7 @@ from libecalc.domain.process.value_objects.chart import ChartCurve
 from libecalc.process.process_pipeline.process_unit import ProcessUnitId
 from libecalc.process.process_solver.feasibility_solver import FeasibilitySolver
 from libecalc.process.process_solver.float_constraint import FloatConstraint
+from libecalc.process.process_solver.pipeline_section_solver import PipelineSectionSolver
 from libecalc.process.process_units.compressor import Compressor
 from libecalc.process.shaft import VariableSpeedShaft
 from libecalc.testing.chart_data_factory import ChartDataFactory
@@ -20,6 +21,7 @@ _LOW_HEAD_INSIDE = 3_507_473  # mid-range, well inside chart
 _LOW_HEAD_OUTSIDE = 4_500_000  # above capacity limit (~3 961 319 sm³/day)
 _HIGH_HEAD_INSIDE = 3_783_164  # mid-range, well inside chart
 _HIGH_HEAD_OUTSIDE = 5_200_000  # above capacity limit (~4 702 856 sm³/day)
+_HIGH_HEAD_CAPACITY = 4_702_856
 
 # ── Head-axis constants ──────────────────────────────────────────────────────
 # Low rate: ~3 500 m³/h (2 710 050 sm³/day), feasible 49–116 bara
@@ -262,6 +264,27 @@ class TestRateAxisHighHead:
         inlet = stream_factory(standard_rate_m3_per_day=_HIGH_HEAD_OUTSIDE, pressure_bara=30.0)
         assert solver.get_excess_rate(inlet, FloatConstraint(_HIGH_HEAD_TARGET)) > 0.0
 
+    def test_capacity_limited_by_envelope_needs_few_full_solves(
+        self, feasibility_solver_setup, compressor, stream_factory, monkeypatch
+    ):
+        """Capacity limited by the chart envelope → found by the envelope search, confirmed by a single full solve
+        in addition to the one at the full rate."""
+        find_solution = PipelineSectionSolver.find_solution
+        number_of_full_solves = 0
+
+        def count_full_solves(self, *args, **kwargs):
+            nonlocal number_of_full_solves
+            number_of_full_solves += 1
+            return find_solution(self, *args, **kwargs)
+
+        monkeypatch.setattr(PipelineSectionSolver, "find_solution", count_full_solves)
+        solver = feasibility_solver_setup(compressor)
+        inlet = stream_factory(standard_rate_m3_per_day=_HIGH_HEAD_OUTSIDE, pressure_bara=30.0)
+        excess = solver.get_excess_rate(inlet, FloatConstraint(_HIGH_HEAD_TARGET))
+
+        assert _HIGH_HEAD_OUTSIDE - excess == pytest.approx(_HIGH_HEAD_CAPACITY, rel=1e-3)
+        assert number_of_full_solves == 2
+
 
 class TestHeadAxisLowRate:
     """Constant-rate path at ~3 500 m³/h — sweep target pressure bottom to top.
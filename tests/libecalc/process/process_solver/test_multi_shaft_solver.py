@@ -4,6 +4,7 @@ import pytest
 
 from libecalc.process.process_solver.float_constraint import FloatConstraint
 from libecalc.process.process_solver.multi_shaft_solver import MultiShaftSolver
+from libecalc.process.process_solver.pipeline_solver import PipelineSolverInput
 
 
 def test_mismatched_targets_raises(single_compressor_pipeline_section_factory, stream_factory):
@@ -83,3 +84,38 @@ def test_second_pipeline_failure_preserves_first_failure(single_compressor_pipel
     assert solution.failure is not None
     # Configurations are still collected (best-effort from each pipeline)
     assert len(solution.configuration) > 0
+
+
+def test_find_solutions_matches_find_solution(single_compressor_pipeline_section_factory, stream_factory):
+    """Solving all time steps as a batch gives the same solutions as solving them one by one."""
+    pipelines = [
+        single_compressor_pipeline_section_factory(
+            min_rate=200,
+            max_rate=5000,
+            head_hi=200_000,
+            head_lo=140_000,
+            inlet_temperature_kelvin=303.15,
+        )
+        for _ in range(2)
+    ]
+    solver = MultiShaftSolver(pipeline_sections=pipelines)
+    solver_inputs = [
+        PipelineSolverInput(
+            pressure_targets=[FloatConstraint(50.0), FloatConstraint(80.0)],
+            inlet_stream=stream_factory(standard_rate_m3_per_day=rate, pressure_bara=30.0, temperature_kelvin=303.15),
+        )
+        for rate in [1_000_000.0, 1_200_000.0, 1_500_000.0, 1_400_000.0]
+    ]
+
+    batch_solutions = solver.find_solutions(solver_inputs)
+    single_solutions = [
+        solver.find_solution(solver_input.pressure_targets, solver_input.inlet_stream) for solver_input in solver_inputs
+    ]
+
+    assert len(batch_solutions) == len(solver_inputs)
+    for batch_solution, single_solution in zip(batch_solutions, single_solutions, strict=True):
+        assert batch_solution.success == single_solution.success
+        for pipeline in pipelines:
+            assert batch_solution.get_configuration(pipeline.get_shaft_id()).speed == pytest.approx(
+                single_solution.get_configuration(pipeline.get_shaft_id()).speed, rel=1e-4
+            )
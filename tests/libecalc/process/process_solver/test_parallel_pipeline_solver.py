@@ -0,0 +1,119 @@
+import pytest
+
+from ecalc_neqsim_wrapper import NeqsimWorkerInitializer
+from libecalc.common.parallel_evaluation import ParallelEvaluationConfig, ParallelEvaluationMode, ParallelEvaluator
+from libecalc.process.process_solver.float_constraint import FloatConstraint
+from libecalc.process.process_solver.multi_shaft_solver import MultiShaftSolver
+from libecalc.process.process_solver.parallel_pipeline_solver import ParallelPipelineSolver
+from libecalc.process.process_solver.pipeline_solver import PipelineSolverInput
+
+
+@pytest.fixture
+def solver(single_compressor_pipeline_section_factory) -> MultiShaftSolver:
+    return MultiShaftSolver(
+        pipeline_sections=[
+            single_compressor_pipeline_section_factory(
+                min_rate=200,
+                max_rate=5000,
+                head_hi=200_000,
+                head_lo=140_000,
+                inlet_temperature_kelvin=303.15,
+            )
+        ]
+    )
+
+
+@pytest.fixture
+def solver_inputs(stream_factory) -> list[PipelineSolverInput]:
+    return [
+        PipelineSolverInput(
+            pressure_targets=[FloatConstraint(outlet_pressure)],
+            inlet_stream=stream_factory(
+                standard_rate_m3_per_day=standard_rate, pressure_bara=30.0, temperature_kelvin=303.15
+            ),
+        )
+        for standard_rate, outlet_pressure in [
+            (1_500_000.0, 80.0),
+            (1_400_000.0, 75.0),
+            (1_600_000.0, 85.0),
+            (1_500_000.0, 9000.0),
+            (1_300_000.0, 70.0),
+        ]
+    ]
+
+
+def _get_configuration_values(solutions) -> list[tuple]:
+    return [
+        (solution.success, [configuration.value for configuration in solution.configuration]) for solution in solutions
+    ]
+
+
+def test_solutions_in_order_of_chunks(solver, solver_inputs):
+    parallel_solver = ParallelPipelineSolver(solver=solver, chunk_size=2)
+
+    solutions = parallel_solver.find_solutions(solver_inputs)
+
+    expected = [
+        *solver.find_solutions(solver_inputs[0:2]),
+        *solver.find_solutions(solver_inputs[2:4]),
+        *solver.find_solutions(solver_inputs[4:5]),
+    ]
+    assert _get_configuration_values(solutions) == _get_configuration_values(expected)
+    assert [solution.success for solution in solutions] == [True, True, True, False, True]
+
+
+def test_solutions_per_period(solver, solver_inputs):
+    parallel_solver = ParallelPipelineSolver(solver=solver)
+
+    solutions_per_period = parallel_solver.find_solutions_per_period([solver_inputs[:3], [], solver_inputs[3:]])
+
+    assert [len(solutions) for solutions in solutions_per_period] == [3, 0, 2]
+    assert _get_configuration_values(solutions_per_period[2]) == _get_configuration_values(
+        solver.find_solutions(solver_inputs[3:])
+    )
+
+
+def test_processes_give_same_solutions_as_serial(solver, solver_inputs):
+    serial_solutions = ParallelPipelineSolver(solver=solver, chunk_size=2).find_solutions(solver_inputs)
+    process_solutions = ParallelPipelineSolver(
+        solver=solver,
+        chunk_size=2,
+        parallel_evaluation_config=ParallelEvaluationConfig(
+            mode=ParallelEvaluationMode.PROCESSES,
+            max_workers=2,
+            worker_initializer=NeqsimWorkerInitializer(),
+        ),
+    ).find_solutions(solver_inputs)
+
+    assert [solution.success for solution in process_solutions] == [solution.success for solution in serial_solutions]
+    for process_solution, serial_solution in zip(process_solutions, serial_solutions):
+        for process_configuration, serial_configuration in zip(
+            process_solution.configuration, serial_solution.configuration, strict=True
+        ):
+            assert process_configuration.configuration_handler_id == serial_configuration.configuration_handler_id
+            assert process_configuration.value == pytest.approx(serial_configuration.value)
+
+
+def test_invalid_chunk_size(solver):
+    with pytest.raises(ValueError):
+        ParallelPipelineSolver(solver=solver, chunk_size=0)
+
+
+def test_threads_not_supported(solver):
+    with pytest.raises(ValueError, match="THREADS"):
+        ParallelPipelineSolver(
+            solver=solver,
+            parallel_evaluation_config=ParallelEvaluationConfig(mode=ParallelEvaluationMode.THREADS, max_workers=2),
+        )
+
+
+def test_configured_threads_not_used(solver, solver_inputs):
+    serial_solutions = ParallelPipelineSolver(solver=solver, chunk_size=2).find_solutions(solver_inputs)
+
+    ParallelEvaluator.configure(ParallelEvaluationConfig(mode=ParallelEvaluationMode.THREADS, max_workers=2))
+    try:
+        solutions = ParallelPipelineSolver(solver=solver, chunk_size=2).find_solutions(solver_inputs)
+    finally:
+        ParallelEvaluator.reset()
+
+    assert _get_configuration_values(solutions) == _get_configuration_values(serial_solutions)
@@ -0,0 +1,84 @@
+import pytest
+
+from libecalc.process.fluid_stream.fluid_stream import FluidStream
+from libecalc.process.process_solver.choke_configuration_handler import ChokeConfigurationHandler
+from libecalc.process.process_solver.configuration import ChokeConfiguration, Configuration
+from libecalc.process.process_solver.process_pipeline_runner import ProcessPipelineRunner, propagate_stream_many
+from libecalc.process.process_units.choke import Choke
+
+
+class CountingChoke(Choke):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.number_of_propagations = 0
+
+    def propagate_stream(self, inlet_stream: FluidStream) -> FluidStream:
+        self.number_of_propagations += 1
+        return super().propagate_stream(inlet_stream)
+
+
+@pytest.fixture
+def chokes(fluid_service) -> list[CountingChoke]:
+    return [CountingChoke(fluid_service=fluid_service, pressure_change=1.0) for _ in range(3)]
+
+
+@pytest.fixture
+def inlet_stream(stream_factory) -> FluidStream:
+    return stream_factory(standard_rate_m3_per_day=500_000.0, pressure_bara=30.0)
+
+
+def _get_number_of_propagations(chokes: list[CountingChoke]) -> list[int]:
+    return [choke.number_of_propagations for choke in chokes]
+
+
+def test_run_reuses_streams_upstream_of_changed_unit(chokes, inlet_stream):
+    handler = ChokeConfigurationHandler(choke=chokes[2])
+    runner = ProcessPipelineRunner(configuration_handlers=[handler], units=chokes)
+    runner.run(inlet_stream=inlet_stream)
+
+    runner.apply_configuration(
+        Configuration(configuration_handler_id=handler.get_id(), value=ChokeConfiguration(delta_pressure=5.0))
+    )
+    outlet_stream = runner.run(inlet_stream=inlet_stream)
+
+    assert _get_number_of_propagations(chokes) == [1, 1, 2]
+    assert outlet_stream.pressure_bara == pytest.approx(30.0 - 1.0 - 1.0 - 5.0)
+
+
+def test_run_gives_same_result_as_propagating_all_units(chokes, inlet_stream, stream_factory):
+    runner = ProcessPipelineRunner(configuration_handlers=[], units=chokes)
+    runner.run(inlet_stream=inlet_stream)
+
+    chokes[1].set_pressure_change(2.0)
+    assert runner.run(inlet_stream=inlet_stream) == propagate_stream_many(chokes, inlet_stream)
+
+    other_inlet_stream = stream_factory(standard_rate_m3_per_day=500_000.0, pressure_bara=40.0)
+    assert runner.run(inlet_stream=other_inlet_stream) == propagate_stream_many(chokes, other_inlet_stream)
+
+
+def test_run_propagates_all_units_when_inlet_stream_changes(chokes, inlet_stream, stream_factory):
+    runner = ProcessPipelineRunner(configuration_handlers=[], units=chokes)
+    runner.run(inlet_stream=inlet_stream)
+    runner.run(inlet_stream=stream_factory(standard_rate_m3_per_day=400_000.0, pressure_bara=30.0))
+
+    assert _get_number_of_propagations(chokes) == [2, 2, 2]
+
+
+def test_run_to_id_reuses_streams_of_full_run(chokes, inlet_stream):
+    runner = ProcessPipelineRunner(configuration_handlers=[], units=chokes)
+    outlet_stream = runner.run(inlet_stream=inlet_stream)
+
+    stream_into_last_choke = runner.run(inlet_stream=inlet_stream, to_id=chokes[2].get_id())
+
+    assert _get_number_of_propagations(chokes) == [1, 1, 1]
+    assert stream_into_last_choke.pressure_bara == pytest.approx(30.0 - 1.0 - 1.0)
+    assert runner.run(inlet_stream=inlet_stream) is outlet_stream
+
+
+def test_run_always_propagates_units_with_unknown_state(chokes, inlet_stream, simple_process_unit_factory):
+    unit_with_unknown_state = simple_process_unit_factory(pressure_multiplier=2.0)
+    runner = ProcessPipelineRunner(configuration_handlers=[], units=[chokes[0], unit_with_unknown_state, chokes[1]])
+    runner.run(inlet_stream=inlet_stream)
+    runner.run(inlet_stream=inlet_stream)
+
+    assert _get_number_of_propagations(chokes[:2]) == [1, 2]